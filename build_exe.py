@@ -102,6 +102,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('resources', 'resources'),
+        ('calculation/data', 'calculation/data'),
         ('templates', 'templates'),
     ],
     hiddenimports=[
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+土层模量反分析模块
+根据路基沉降监测数据反演各土层压缩模量（固定已知模量的土层时可同时反演桩长、桩径修正系数）：
+正演模型即沉降计算公式（SettlementCalculator 的双桩Boussinesq解，取计算点所在土层模量，
+乘修正系数及桩间相互作用系数），沉降与所在土层模量成反比，雅可比矩阵解析计算，
+采用Levenberg-Marquardt法求解加权最小二乘问题，多个监测时段可分批同时反演
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional, Sequence
+
+from .settlement import SettlementCalculator
+from .correction import CorrectionCoefficients, get_correction_coefficients
+
+
+OBSERVATION_COLUMNS = ('x', 'y', 'z', 'settlement_mm', 'epoch', 'weight')
+
+
+def correction_coefficient_names(coefficients: CorrectionCoefficients) -> List[str]:
+    """
+    修正系数名称：a_k 为桩长多项式 k 次项系数，b_k 为桩径多项式 k 次项系数
+
+    Args:
+        coefficients: 修正系数
+
+    Returns:
+        List[str]: 名称列表（桩长多项式在前，均按升幂）
+    """
+    return [f'a{k}' for k in range(len(coefficients.length))] + \
+        [f'b{k}' for k in range(len(coefficients.diameter))]
+
+
+class ModulusBackAnalyzer:
+    """土层压缩模量反分析类"""
+
+    def __init__(self, max_iterations: int = 100, tolerance: float = 1e-8, regularization: float = 1e-4,
+                 coefficients: Optional[CorrectionCoefficients] = None):
+        """
+        初始化反分析
+
+        Args:
+            max_iterations: Levenberg-Marquardt 最大迭代次数
+            tolerance: 目标函数相对下降量或参数步长小于该值时收敛
+            regularization: 参数偏离初值的正则化权重（对数模量、修正系数相对变化），
+                            保证模量与修正系数同时反演时问题适定
+            coefficients: 修正系数，缺省每次反演时取共享的系数文件（重新标定后自动生效）
+        """
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.regularization = regularization
+        self.coefficients = coefficients
+        self.calculator = SettlementCalculator()
+
+    def prepare_observations(self, observations) -> pd.DataFrame:
+        """
+        整理监测数据
+
+        Args:
+            observations: DataFrame 或字典，含 x、y、settlement_mm 列，可选 z（缺省0）、
+                          epoch（监测时段编号，缺省0）、weight（权重，缺省1）
+
+        Returns:
+            pd.DataFrame: 监测数据表
+        """
+        frame = pd.DataFrame(observations).copy()
+        missing = [column for column in ('x', 'y', 'settlement_mm') if column not in frame.columns]
+        if missing:
+            raise ValueError(f"监测数据缺少列: {missing}")
+
+        defaults = {'z': 0.0, 'epoch': 0, 'weight': 1.0}
+        for column, value in defaults.items():
+            if column not in frame.columns:
+                frame[column] = value
+        frame = frame.reset_index(drop=True)
+        return frame[list(OBSERVATION_COLUMNS)]
+
+    def calculate_kernels(self, params: Dict[str, Any], observations: pd.DataFrame) -> np.ndarray:
+        """
+        计算各桩（按计算参数中的桩荷载）、各土层在单位模量下对各监测点的沉降贡献
+
+        与沉降计算公式一致：各点取所在土层的泊松比，沉降与该层模量成反比，已乘桩间相互作用系数
+        （不含修正系数）
+
+        Args:
+            params: 沉降计算参数（同 SettlementCalculator.calculate_settlement）
+            observations: 监测数据表
+
+        Returns:
+            np.ndarray: 沉降核 (n_observations, 2, n_layers) (m·MPa)
+        """
+        soil_layers = params['soil_layers']
+        unit_params = dict(params, soil_layers=[dict(layer, compression_modulus=1.0) for layer in soil_layers])
+        z = observations['z'].to_numpy(dtype=float)
+
+        raw, interaction_factor = self.calculator.calculate_pile_fields(
+            unit_params, observations['x'].to_numpy(dtype=float), z, observations['y'].to_numpy(dtype=float)
+        )
+        layer = self.calculator.soil_layer_index(soil_layers, z)
+        in_layer = layer[:, np.newaxis, np.newaxis] == np.arange(len(soil_layers))
+        return raw[:, :, np.newaxis] * interaction_factor * in_layer
+
+    def calculate_corrections(self, piles: Sequence[Dict[str, float]], coefficients: np.ndarray,
+                              length_terms: int, fitted: Sequence[int]):
+        """
+        计算各桩综合修正系数 a·b 及其对修正系数的导数
+
+        Args:
+            piles: 桩参数列表，每根桩含 length、diameter
+            coefficients: 修正系数 (n_batch, n_coefficients)，顺序同 correction_coefficient_names
+            length_terms: 桩长多项式系数个数（其后为桩径多项式系数）
+            fitted: 参与反演的修正系数序号
+
+        Returns:
+            tuple: (综合修正系数 (n_batch, n_piles), 导数 (n_batch, n_piles, len(fitted)))
+        """
+        length = np.array([pile['length'] for pile in piles], dtype=float)
+        diameter = np.array([pile['diameter'] for pile in piles], dtype=float)
+        length_powers = length[:, np.newaxis] ** np.arange(length_terms)
+        diameter_powers = diameter[:, np.newaxis] ** np.arange(coefficients.shape[-1] - length_terms)
+
+        a = coefficients[:, :length_terms] @ length_powers.T
+        b = coefficients[:, length_terms:] @ diameter_powers.T
+        gradient = np.concatenate([
+            length_powers * b[..., np.newaxis],
+            a[..., np.newaxis] * diameter_powers
+        ], axis=-1)
+        return a * b, gradient[..., list(fitted)]
+
+    def analyze(self, params: Dict[str, Any], observations,
+                loads: Optional[Dict[Any, Sequence[float]]] = None, per_epoch: bool = False,
+                fit_correction: Sequence[str] = (), fixed_layers: Sequence[int] = ()) -> Dict[str, Any]:
+        """
+        反演土层压缩模量
+
+        修正系数按桩乘在沉降上，与模量（沉降与模量成反比）高度相关：全部土层模量同时反演时，
+        修正系数的变化可由模量整体缩放抵消，结果不唯一。因此反演修正系数时须以 fixed_layers
+        固定至少一个已知模量的土层（如由试验确定），否则抛出 ValueError
+
+        Args:
+            params: 沉降计算参数（同 SettlementCalculator.calculate_settlement），
+                    soil_layers 的 compression_modulus 为初值
+            observations: 监测数据，见 prepare_observations（坐标系同沉降计算）
+            loads: 各监测时段的桩荷载 {epoch: [桩1荷载, 桩2荷载]}，缺省取计算参数中的桩荷载
+            per_epoch: True 时各监测时段分别反演（分批同时求解），否则全部数据联合反演
+            fit_correction: 同时反演的修正系数名称，取自 correction_coefficient_names（如 'a0'）
+            fixed_layers: 模量已知、不参与反演的土层序号（取 soil_layers 中的模量）
+
+        Returns:
+            Dict: moduli（(n_batch, n_layers)，联合反演时 n_batch = 1）、correction_coefficients、
+                  correction_version（所用系数文件版本）、standard_errors（模量相对标准差）、
+                  rmse_mm、predicted_mm、iterations、converged、epochs，联合反演时另含更新后的 soil_layers
+        """
+        correction = self.coefficients or get_correction_coefficients()
+        names = correction_coefficient_names(correction)
+        unknown = [name for name in fit_correction if name not in names]
+        if unknown:
+            raise ValueError(f"未知的修正系数: {unknown}")
+
+        soil_layers = params['soil_layers']
+        n_layers = len(soil_layers)
+        fixed_layers = sorted(set(fixed_layers))
+        if any(not 0 <= layer < n_layers for layer in fixed_layers):
+            raise ValueError(f"土层序号超出范围: {fixed_layers}")
+        if fit_correction and not fixed_layers:
+            raise ValueError("修正系数与全部土层模量相关，不能同时反演，请以 fixed_layers 固定已知模量的土层")
+        piles = [params['pile1'], params['pile2']]
+        base_loads = np.array([pile['load'] for pile in piles], dtype=float)
+
+        frame = self.prepare_observations(observations)
+        epochs = np.unique(frame['epoch'].to_numpy())
+        load_table = np.array([(loads or {}).get(epoch, base_loads) for epoch in epochs], dtype=float)
+        epoch_index = np.searchsorted(epochs, frame['epoch'].to_numpy())
+
+        # 沉降核按各时段荷载缩放 (n_obs, n_piles, n_layers)
+        kernel = self.calculate_kernels(params, frame) * (load_table[epoch_index] / base_loads)[:, :, np.newaxis]
+        observed = frame['settlement_mm'].to_numpy(dtype=float)
+        weight = np.sqrt(frame['weight'].to_numpy(dtype=float))
+
+        # 组织为批 (n_batch, m, ...)，各时段观测数不同时以零权重补齐
+        groups = [np.flatnonzero(epoch_index == i) for i in range(len(epochs))] if per_epoch \
+            else [np.arange(len(frame))]
+        size = max(len(group) for group in groups)
+        index = np.zeros((len(groups), size), dtype=int)
+        mask = np.zeros((len(groups), size))
+        for i, group in enumerate(groups):
+            index[i, :len(group)] = group
+            mask[i, :len(group)] = 1.0
+        batch = {
+            'kernel': kernel[index],
+            'observed': observed[index],
+            'weight': weight[index] * mask
+        }
+
+        base_coefficients = np.array(correction.length + correction.diameter, dtype=float)
+        fitted = [names.index(name) for name in fit_correction]
+        initial = np.concatenate([
+            np.log([layer['compression_modulus'] for layer in soil_layers]),
+            np.zeros(len(fitted))
+        ])
+        theta = np.tile(initial, (len(groups), 1))
+        free = np.ones(len(initial))
+        free[fixed_layers] = 0.0
+
+        def unpack(theta):
+            coefficients = np.tile(base_coefficients, (len(theta), 1))
+            coefficients[:, fitted] *= 1 + theta[:, n_layers:]
+            return np.exp(theta[:, :n_layers]), coefficients
+
+        def residuals(theta):
+            moduli, coefficients = unpack(theta)
+            factors, gradient = self.calculate_corrections(piles, coefficients, len(correction.length), fitted)
+
+            # 各桩沉降 (n_batch, m, n_piles, n_layers) (mm)
+            layered = batch['kernel'] * (1000 / moduli)[:, np.newaxis, np.newaxis, :]
+            per_pile = layered.sum(axis=-1)
+            predicted = (per_pile * factors[:, np.newaxis, :]).sum(axis=-1)
+
+            jacobian_moduli = -(layered * factors[:, np.newaxis, :, np.newaxis]).sum(axis=2)
+            jacobian_correction = np.einsum('bmp,bpk->bmk', per_pile, gradient) * base_coefficients[fitted]
+            jacobian = np.concatenate([jacobian_moduli, jacobian_correction], axis=-1) * \
+                (batch['weight'][..., np.newaxis] * free)
+
+            scale = np.sqrt(self.regularization)
+            r = np.concatenate([batch['weight'] * (predicted - batch['observed']), scale * (theta - initial)], axis=1)
+            J = np.concatenate([jacobian, np.broadcast_to(scale * np.eye(len(initial)),
+                                                          (len(theta),) + (len(initial),) * 2)], axis=1)
+            return r, J, predicted
+
+        theta, r, J, predicted, iterations, converged = self._levenberg_marquardt(residuals, theta)
+
+        moduli, coefficients = unpack(theta)
+        moduli[:, fixed_layers] = [soil_layers[layer]['compression_modulus'] for layer in fixed_layers]
+        m = mask.sum(axis=1)
+        data_cost = (r[:, :size]**2).sum(axis=1)
+        dof = np.maximum(m - len(initial), 1)
+        covariance = np.linalg.pinv(np.einsum('bmi,bmj->bij', J, J)) * (data_cost / dof)[:, np.newaxis, np.newaxis]
+        standard_errors = np.sqrt(np.maximum(np.diagonal(covariance, axis1=1, axis2=2)[:, :n_layers], 0))
+        standard_errors[:, fixed_layers] = 0.0
+
+        predicted_all = np.empty(len(frame))
+        for i, group in enumerate(groups):
+            predicted_all[group] = predicted[i, :len(group)]
+        residual = predicted_all - observed
+
+        result = {
+            'moduli': moduli,
+            'correction_coefficients': [dict(zip(names, row)) for row in coefficients],
+            'correction_version': correction.version,
+            'standard_errors': standard_errors,
+            'rmse_mm': np.sqrt(np.array([np.mean(residual[group]**2) for group in groups])),
+            'predicted_mm': predicted_all,
+            'residual_mm': residual,
+            'iterations': iterations,
+            'converged': converged,
+            'epochs': epochs if per_epoch else None
+        }
+        if not per_epoch:
+            result['soil_layers'] = [dict(layer, compression_modulus=float(modulus))
+                                     for layer, modulus in zip(soil_layers, moduli[0])]
+        return result
+
+    def _levenberg_marquardt(self, residuals, theta: np.ndarray):
+        """
+        分批Levenberg-Marquardt迭代（各批阻尼系数独立调整）
+
+        Args:
+            residuals: 函数 theta -> (残差 (n_batch, m), 雅可比 (n_batch, m, n), 预测值)
+            theta: 参数初值 (n_batch, n)
+
+        Returns:
+            tuple: (参数, 残差, 雅可比, 预测值, 迭代次数, 各批是否收敛)
+        """
+        r, J, predicted = residuals(theta)
+        cost = (r**2).sum(axis=1)
+        damping = np.full(len(theta), 1e-3)
+        converged = np.zeros(len(theta), dtype=bool)
+        n = theta.shape[1]
+
+        iteration = 0
+        for iteration in range(1, self.max_iterations + 1):
+            JtJ = np.einsum('bmi,bmj->bij', J, J)
+            gradient = np.einsum('bmi,bm->bi', J, r)
+            diagonal = np.diagonal(JtJ, axis1=1, axis2=2)
+            system = JtJ + damping[:, np.newaxis, np.newaxis] * (np.eye(n) * np.maximum(diagonal, 1e-12)[:, np.newaxis, :])
+            step = -np.linalg.solve(system, gradient[..., np.newaxis])[..., 0]
+            step[converged] = 0.0
+
+            trial = theta + step
+            r_trial, J_trial, predicted_trial = residuals(trial)
+            cost_trial = (r_trial**2).sum(axis=1)
+            accepted = (cost_trial < cost) & ~converged
+
+            small = (np.abs(step).max(axis=1) < self.tolerance) | \
+                (accepted & (cost - cost_trial <= self.tolerance * np.maximum(cost, 1e-300)))
+            converged |= small
+
+            theta = np.where(accepted[:, np.newaxis], trial, theta)
+            r = np.where(accepted[:, np.newaxis], r_trial, r)
+            J = np.where(accepted[:, np.newaxis, np.newaxis], J_trial, J)
+            predicted = np.where(accepted[:, np.newaxis], predicted_trial, predicted)
+            cost = np.where(accepted, cost_trial, cost)
+            damping = np.where(accepted, damping / 3, damping * 4)
+
+            if converged.all():
+                break
+
+        return theta, r, J, predicted, iteration, converged
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+矩形基础双向偏心基底压力计算模块
+考虑基底部分脱开（地基土不承受拉应力），求解受压区范围与最大基底压力，
+支持多基础、多荷载组合数组批量计算
+"""
+
+import numpy as np
+from typing import Dict
+
+
+# 基础角点相对 (B, L) 的坐标（逆时针）及多边形下一顶点序号
+CORNER_OFFSETS = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+NEXT_CORNER = np.array([1, 2, 3, 0])
+NEXT_VERTEX = np.array([1, 2, 3, 4, 5, 6, 7, 0])
+
+
+class BasePressureSolver:
+    """矩形基础双向偏心基底压力求解器"""
+
+    def __init__(self, max_iterations: int = 100, tolerance: float = 1e-6):
+        """
+        初始化求解器
+
+        Args:
+            max_iterations: 一般脱开情况迭代次数上限
+            tolerance: 迭代收敛容差（角点压力变化量与最大角点压力之比）
+        """
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+    def solve(self, vertical, moment_x, moment_y, base_width, base_length,
+              iterate: bool = True) -> Dict[str, np.ndarray]:
+        """
+        计算矩形基础基底压力
+
+        坐标原点取基础形心，x沿基础宽度B，y沿基础长度L；
+        moment_x 为使合力沿x向偏心的弯矩 (ex = Mx/N)，moment_y 同理 (ey = My/N)
+
+        闭合解：
+        - 全截面受压 (6ex/B + 6ey/L ≤ 1)：P = N/A × (1 ± 6ex/B ± 6ey/L)
+        - 单向偏心部分脱开：Pmax = 2N / (3L(B/2 - ex))
+        - 角点三角形受压区 (ex ≥ B/4 且 ey ≥ L/4)：Pmax = 6N / (s·t)，s = 4(B/2 - ex)，t = 4(L/2 - ey)
+        其余情况迭代求解受压区：按当前受压多边形的面积矩和惯性矩解压力平面，
+        再以新压力平面裁剪基础底面，直至收敛；
+        不迭代时取角点三角形受压区闭合解作为最大压力上限（偏于安全，误差不超过 12.5%）
+
+        Args:
+            vertical: 竖向力 N (kN)
+            moment_x: x向偏心弯矩 (kN·m)
+            moment_y: y向偏心弯矩 (kN·m)
+            base_width: 基础宽度 B (m)
+            base_length: 基础长度 L (m)
+            iterate: 是否迭代求解一般部分脱开情况
+
+        Returns:
+            Dict: max_pressure、min_pressure、average_pressure (kPa)，
+                  contact_ratio (受压面积比)、stable (合力是否在基底范围内)、converged，
+                  exact (False 表示 max_pressure 为未迭代的上限值)
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                       (vertical, moment_x, moment_y, base_width, base_length)))
+        shape = arrays[0].shape
+        N, Mx, My, B, L = (array.ravel() for array in arrays)
+
+        area = B * L
+        average = N / area
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ex = np.where(N > 0, np.abs(Mx) / N, np.inf)
+            ey = np.where(N > 0, np.abs(My) / N, np.inf)
+        u = ex / B
+        v = ey / L
+
+        max_pressure = np.full(N.shape, np.inf)
+        min_pressure = np.zeros(N.shape)
+        contact_ratio = np.zeros(N.shape)
+        converged = np.ones(N.shape, dtype=bool)
+        exact = np.ones(N.shape, dtype=bool)
+
+        # 合力作用点须位于基底范围内
+        stable = (N > 0) & (u < 0.5) & (v < 0.5)
+        unloaded = (N == 0) & (Mx == 0) & (My == 0)
+        max_pressure[unloaded] = 0.0
+        contact_ratio[unloaded] = 1.0
+
+        # 全截面受压
+        full = stable & (6 * u + 6 * v <= 1)
+        max_pressure[full] = average[full] * (1 + 6 * u[full] + 6 * v[full])
+        min_pressure[full] = average[full] * (1 - 6 * u[full] - 6 * v[full])
+        contact_ratio[full] = 1.0
+
+        # 单向偏心部分脱开
+        uplift = stable & ~full
+        along_x = uplift & (v == 0)
+        contact_x = 3 * (B[along_x] / 2 - ex[along_x])
+        max_pressure[along_x] = 2 * N[along_x] / (L[along_x] * contact_x)
+        contact_ratio[along_x] = contact_x / B[along_x]
+
+        along_y = uplift & (u == 0)
+        contact_y = 3 * (L[along_y] / 2 - ey[along_y])
+        max_pressure[along_y] = 2 * N[along_y] / (B[along_y] * contact_y)
+        contact_ratio[along_y] = contact_y / L[along_y]
+
+        # 角点三角形受压区
+        triangle = uplift & ~along_x & ~along_y & (u >= 0.25) & (v >= 0.25)
+        s = 4 * (B[triangle] / 2 - ex[triangle])
+        t = 4 * (L[triangle] / 2 - ey[triangle])
+        max_pressure[triangle] = 6 * N[triangle] / (s * t)
+        contact_ratio[triangle] = s * t / 2 / area[triangle]
+
+        # 一般情况迭代求解
+        general = uplift & ~along_x & ~along_y & ~triangle
+        if general.any() and iterate:
+            pmax, ratio, ok = self._solve_general(N[general], ex[general], ey[general], B[general], L[general])
+            max_pressure[general] = pmax
+            contact_ratio[general] = ratio
+            converged[general] = ok
+        elif general.any():
+            pmax, ratio = self._corner_bound(N[general], ex[general], ey[general], B[general], L[general])
+            max_pressure[general] = pmax
+            contact_ratio[general] = ratio
+            exact[general] = False
+
+        return {
+            'max_pressure': max_pressure.reshape(shape),
+            'min_pressure': min_pressure.reshape(shape),
+            'average_pressure': average.reshape(shape),
+            'contact_ratio': contact_ratio.reshape(shape),
+            'stable': stable.reshape(shape) | unloaded.reshape(shape),
+            'converged': converged.reshape(shape),
+            'exact': exact.reshape(shape)
+        }
+
+    def _corner_bound(self, N, ex, ey, B, L):
+        """
+        一般部分脱开情况的角点三角形受压区上限解
+
+        三角形受压区超出基底的部分实际不承压，真实受压区更大，故 6N/(s·t) 为最大压力上限；
+        受压面积比取三角形被基底裁剪后的面积（一般情况下远角点不在三角形内，两侧超出部分不重叠）
+        """
+        s = 4 * (B / 2 - ex)
+        t = 4 * (L / 2 - ey)
+        area = s * t / 2
+        area -= np.where(s > B, t * (s - B)**2 / (2 * s), 0.0)
+        area -= np.where(t > L, s * (t - L)**2 / (2 * t), 0.0)
+        return 6 * N / (s * t), area / (B * L)
+
+    def _solve_general(self, N, ex, ey, B, L):
+        """迭代求解双向偏心部分脱开情况（ex、ey 取正值，受压角点位于第一象限）"""
+        corner_x = B[:, np.newaxis] * CORNER_OFFSETS[:, 0]
+        corner_y = L[:, np.newaxis] * CORNER_OFFSETS[:, 1]
+
+        # 初值取角点三角形受压区解 p = p0 + a·x + b·y（受压区超出基底时即为近似解）
+        s = 4 * (B / 2 - ex)
+        t = 4 * (L / 2 - ey)
+        peak = 6 * N / (s * t)
+        plane = np.stack([
+            peak * (1 - B / (2 * s) - L / (2 * t)),
+            peak / s,
+            peak / t
+        ], axis=-1)
+        rhs = np.stack([N, N * ex, N * ey], axis=-1)[..., np.newaxis]
+        corner_pressure = self._corner_pressure(corner_x, corner_y, plane)
+
+        converged = np.zeros(N.shape, dtype=bool)
+        idx = np.arange(N.size)
+        for _ in range(self.max_iterations):
+            if idx.size == 0:
+                break
+
+            A, Sx, Sy, Ixx, Iyy, Ixy = self._compression_zone_moments(corner_x[idx], corner_y[idx], plane[idx])
+            system = np.empty((idx.size, 3, 3))
+            system[:, 0, 0] = A
+            system[:, 0, 1] = system[:, 1, 0] = Sx
+            system[:, 0, 2] = system[:, 2, 0] = Sy
+            system[:, 1, 1] = Ixx
+            system[:, 1, 2] = system[:, 2, 1] = Ixy
+            system[:, 2, 2] = Iyy
+            new_plane = np.linalg.solve(system, rhs[idx])[..., 0]
+
+            # 以角点压力变化量相对最大角点压力判断收敛
+            new_pressure = self._corner_pressure(corner_x[idx], corner_y[idx], new_plane)
+            change = np.max(np.abs(new_pressure - corner_pressure[idx]), axis=-1) / np.max(new_pressure, axis=-1)
+            plane[idx] = new_plane
+            corner_pressure[idx] = new_pressure
+
+            done = change < self.tolerance
+            converged[idx[done]] = True
+            idx = idx[~done]
+
+        max_pressure = corner_pressure.max(axis=-1)
+        contact_ratio = self._compression_zone_moments(corner_x, corner_y, plane)[0] / (B * L)
+
+        return max_pressure, contact_ratio, converged
+
+    @staticmethod
+    def _corner_pressure(corner_x, corner_y, plane):
+        """压力平面在各角点的取值"""
+        return plane[:, 0:1] + plane[:, 1:2] * corner_x + plane[:, 2:3] * corner_y
+
+    def _compression_zone_moments(self, corner_x, corner_y, plane):
+        """
+        计算基础底面被压力平面裁剪后受压多边形的面积、面积矩和惯性矩
+
+        逐边裁剪得到至多8个候选顶点，无效顶点以前一个有效顶点填充（零长度边不影响积分），
+        再按格林公式求多边形积分
+
+        Args:
+            corner_x: 基础角点x坐标 (n, 4)，逆时针
+            corner_y: 基础角点y坐标 (n, 4)
+            plane: 压力平面参数 (n, 3)
+
+        Returns:
+            Tuple: A、Sx、Sy、Ixx(∫x²dA)、Iyy(∫y²dA)、Ixy(∫xy dA)
+        """
+        n = corner_x.shape[0]
+        pressure = self._corner_pressure(corner_x, corner_y, plane)
+        next_pressure = pressure[:, NEXT_CORNER]
+
+        inside = pressure >= 0
+        crossing = inside != (next_pressure >= 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(crossing, pressure / (pressure - next_pressure), 0.0)
+
+        # 角点与边上交点交替排列
+        points_x = np.empty((n, 8))
+        points_y = np.empty((n, 8))
+        valid = np.empty((n, 8), dtype=bool)
+        points_x[:, 0::2] = corner_x
+        points_y[:, 0::2] = corner_y
+        points_x[:, 1::2] = corner_x + t * (corner_x[:, NEXT_CORNER] - corner_x)
+        points_y[:, 1::2] = corner_y + t * (corner_y[:, NEXT_CORNER] - corner_y)
+        valid[:, 0::2] = inside
+        valid[:, 1::2] = crossing
+
+        # 循环向前填充无效顶点
+        slots = np.where(np.concatenate([valid, valid], axis=1), np.arange(16), -1)
+        fill = np.maximum.accumulate(slots, axis=1)[:, 8:] % 8
+        x0 = np.take_along_axis(points_x, fill, axis=1)
+        y0 = np.take_along_axis(points_y, fill, axis=1)
+        empty = ~valid.any(axis=1)
+        x0[empty] = 0.0
+        y0[empty] = 0.0
+
+        x1, y1 = x0[:, NEXT_VERTEX], y0[:, NEXT_VERTEX]
+        cross = x0 * y1 - x1 * y0
+
+        return (
+            np.sum(cross, axis=1) / 2,
+            np.sum((x0 + x1) * cross, axis=1) / 6,
+            np.sum((y0 + y1) * cross, axis=1) / 6,
+            np.sum((x0 * x0 + x0 * x1 + x1 * x1) * cross, axis=1) / 12,
+            np.sum((y0 * y0 + y0 * y1 + y1 * y1) * cross, axis=1) / 12,
+            np.sum((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross, axis=1) / 24
+        )
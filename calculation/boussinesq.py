@@ -142,6 +142,26 @@ class BoussinesqCalculator:
         
         return omega
     
+    def calculate_settlement_array(self, P, G, x, y, z, nu):
+        """
+        向量化计算Boussinesq垂直位移（与 calculate_settlement 逐点结果一致）
+
+        参数:
+        P: 集中力 (kN)
+        G: 剪切模量 (MPa)，标量或与坐标可广播的数组
+        x, y, z: 计算点坐标数组 (m)
+        nu: 泊松比，标量或与坐标可广播的数组
+
+        返回:
+        omega: 垂直位移数组 (m)，R=0 处为0
+        """
+        x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+        R = np.sqrt(x**2 + y**2 + z**2)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            omega = (P * 1000 / (4 * np.pi * np.asarray(G) * 1e6)) * (z**2 / R**3 + 2 * (1 - np.asarray(nu)) / R)
+        return np.where(R == 0, 0.0, omega)
+
     def calculate_multiple_points(self, P, G, nu, points, correction_a=1.0, correction_b=1.0):
         """
         计算多个点的沉降值
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Cerruti理论计算模块
+实现半无限空间弹性体表面作用水平集中力的三维位移计算，并与Boussinesq竖向集中力
+叠加计算斜向荷载（如临近道路的电线塔基础底面合力）引起的地基位移场
+"""
+
+import math
+import numpy as np
+from typing import Dict, Any, Optional, Sequence, Union
+
+from .settlement import SettlementCalculator
+
+
+# 荷载数组各列：作用点坐标 x、y (m)，水平分力 Qx、Qy (kN)，竖向分力 P (kN)
+LOAD_COLUMNS = ('x', 'y', 'Qx', 'Qy', 'P')
+
+
+class CerrutiCalculator:
+    """Cerruti理论计算器（向量化，可与Boussinesq竖向荷载叠加）"""
+
+    def __init__(self, chunk_size: int = 200000):
+        """
+        初始化计算器
+
+        Args:
+            chunk_size: 位移场分块计算时每块的 荷载数×计算点数 上限，控制内存占用
+        """
+        self.chunk_size = chunk_size
+
+    def calculate_displacement(self, Qx, Qy, P, G, x, y, z, nu):
+        """
+        计算表面集中力作用下的三维位移（坐标原点为荷载作用点，z向下为正）
+
+        水平分力按Cerruti解，竖向分力按Boussinesq解，各参数可为可广播的数组：
+        ux = 1/(4πG)·[Qx/R + x·s/R³ + (1-2ν)(Qx/(R+z) - x·s/(R(R+z)²))] + P/(4πG)·[xz/R³ - (1-2ν)x/(R(R+z))]
+        uz = 1/(4πG)·[s·z/R³ + (1-2ν)s/(R(R+z))] + P/(4πG)·[z²/R³ + 2(1-ν)/R]
+        其中 s = Qx·x + Qy·y，uy 与 ux 对称
+
+        Args:
+            Qx, Qy: 水平分力 (kN)
+            P: 竖向分力 (kN)，向下为正
+            G: 剪切模量 (MPa)
+            x, y, z: 计算点坐标 (m)
+            nu: 泊松比
+
+        Returns:
+            tuple: (ux, uy, uz) 位移 (m)，荷载作用点处取0
+        """
+        x, y, z = (np.asarray(value, dtype=float) for value in (x, y, z))
+        Qx, Qy, P = (np.asarray(value, dtype=float) * 1000 for value in (Qx, Qy, P))  # kN转N
+        factor = 1.0 / (4 * math.pi * np.asarray(G, dtype=float) * 1e6)                # MPa转Pa
+
+        R = np.sqrt(x**2 + y**2 + z**2)
+        singular = R == 0
+        R = np.where(singular, 1.0, R)
+        R3 = R**3
+        Rz = R + z
+        softening = 1 - 2 * np.asarray(nu, dtype=float)
+
+        s = Qx * x + Qy * y
+        horizontal = s / R3 - softening * s / (R * Rz**2)
+        vertical = P * (z / R3 - softening / (R * Rz))
+
+        ux = factor * (Qx / R + softening * Qx / Rz + x * horizontal + x * vertical)
+        uy = factor * (Qy / R + softening * Qy / Rz + y * horizontal + y * vertical)
+        uz = factor * (s * (z / R3 + softening / (R * Rz)) + P * (z**2 / R3 + 2 * (1 - np.asarray(nu)) / R))
+
+        return tuple(np.where(singular, 0.0, component) for component in (ux, uy, uz))
+
+    def calculate_horizontal_displacement(self, Q, G, x, y, z, nu, direction=0.0):
+        """
+        计算水平集中力（Cerruti解）作用下的三维位移
+
+        Args:
+            Q: 水平集中力 (kN)
+            G: 剪切模量 (MPa)
+            x, y, z: 计算点坐标 (m)
+            nu: 泊松比
+            direction: 水平力方向，自x轴逆时针 (°)
+
+        Returns:
+            tuple: (ux, uy, uz) 位移 (m)
+        """
+        theta = np.radians(direction)
+        return self.calculate_displacement(Q * np.cos(theta), Q * np.sin(theta), 0.0, G, x, y, z, nu)
+
+    def resolve_inclined_load(self, F, inclination, azimuth=0.0):
+        """
+        将斜向荷载分解为水平分力和竖向分力
+
+        Args:
+            F: 合力 (kN)
+            inclination: 合力与竖直方向夹角 (°)
+            azimuth: 水平分量方向，自x轴逆时针 (°)
+
+        Returns:
+            tuple: (Qx, Qy, P) (kN)
+        """
+        alpha = np.radians(inclination)
+        theta = np.radians(azimuth)
+        horizontal = F * np.sin(alpha)
+        return horizontal * np.cos(theta), horizontal * np.sin(theta), F * np.cos(alpha)
+
+    def as_load_array(self, loads: Union[np.ndarray, Sequence[Dict[str, float]]]) -> np.ndarray:
+        """
+        将荷载列表统一为 (n_loads, 5) 数组，列顺序见 LOAD_COLUMNS
+
+        Args:
+            loads: 荷载数组，或含 x、y、Qx、Qy、P 键的字典列表（缺省为0）
+
+        Returns:
+            np.ndarray: 荷载数组
+        """
+        if isinstance(loads, np.ndarray):
+            array = np.atleast_2d(loads).astype(float)
+        else:
+            array = np.array([[load.get(column, 0.0) for column in LOAD_COLUMNS] for load in loads], dtype=float)
+
+        if array.ndim != 2 or array.shape[1] != len(LOAD_COLUMNS):
+            raise ValueError(f"荷载数组应为 (n, {len(LOAD_COLUMNS)})，列为 {LOAD_COLUMNS}")
+        return array
+
+    def calculate_field(self, loads, G, nu, points) -> Dict[str, np.ndarray]:
+        """
+        计算多个表面荷载叠加后在计算点处的三维位移场
+
+        荷载与计算点两两广播计算后按荷载求和，计算点分块以限制中间数组大小
+
+        Args:
+            loads: 荷载数组或字典列表，见 as_load_array
+            G: 剪切模量 (MPa)
+            nu: 泊松比
+            points: 计算点坐标 (n_points, 3) (m)
+
+        Returns:
+            Dict: 'ux'、'uy'、'uz'、'total' 位移数组 (n_points,) (m)
+        """
+        loads = self.as_load_array(loads)
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n_points = len(points)
+        field = {key: np.zeros(n_points) for key in ('ux', 'uy', 'uz')}
+
+        step = max(1, self.chunk_size // max(1, len(loads)))
+        load_x, load_y, Qx, Qy, P = (loads[:, i:i + 1] for i in range(len(LOAD_COLUMNS)))
+        for start in range(0, n_points, step):
+            chunk = points[start:start + step]
+            ux, uy, uz = self.calculate_displacement(
+                Qx, Qy, P, G, chunk[:, 0] - load_x, chunk[:, 1] - load_y, chunk[:, 2], nu
+            )
+            field['ux'][start:start + step] = ux.sum(axis=0)
+            field['uy'][start:start + step] = uy.sum(axis=0)
+            field['uz'][start:start + step] = uz.sum(axis=0)
+
+        field['total'] = np.sqrt(field['ux']**2 + field['uy']**2 + field['uz']**2)
+        return field
+
+    def calculate_grid(self, loads, G, nu, x, y, z=0.0) -> Dict[str, np.ndarray]:
+        """
+        计算规则网格上的位移场
+
+        Args:
+            loads: 荷载数组或字典列表
+            G: 剪切模量 (MPa)
+            nu: 泊松比
+            x, y: 网格坐标一维数组 (m)
+            z: 计算深度 (m)，可为一维数组
+
+        Returns:
+            Dict: 网格坐标 'x'、'y'、'z' 及位移分量，形状为 (len(z), len(y), len(x))，z为标量时省略首维
+        """
+        depths = np.atleast_1d(np.asarray(z, dtype=float))
+        Z, Y, X = np.meshgrid(depths, np.asarray(y, dtype=float), np.asarray(x, dtype=float), indexing='ij')
+        field = self.calculate_field(loads, G, nu, np.column_stack([X.ravel(), Y.ravel(), Z.ravel()]))
+
+        grid = {'x': X, 'y': Y, 'z': Z}
+        grid.update({key: value.reshape(X.shape) for key, value in field.items()})
+        if np.ndim(z) == 0:
+            grid = {key: value[0] for key, value in grid.items()}
+        return grid
+
+    def evaluate_safety(self, points, field: Dict[str, np.ndarray], road_level: str = "一级公路",
+                        settlement_calculator: Optional[SettlementCalculator] = None) -> Dict[str, Any]:
+        """
+        按路基沉降限值评估位移场的工程安全性（沿用沉降计算模块的评估规则）
+
+        Args:
+            points: 计算点坐标 (n_points, 3) (m)
+            field: calculate_field 的计算结果
+            road_level: 路线等级
+            settlement_calculator: 沉降计算器，缺省新建
+
+        Returns:
+            Dict: 安全评估结果，竖向位移按沉降计
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        calculator = settlement_calculator or SettlementCalculator()
+        return calculator.evaluate_settlement_safety(points[:, 0], points[:, 1],
+                                                     np.asarray(field['uz']).ravel() * 1000, road_level)
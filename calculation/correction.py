@@ -2,66 +2,216 @@
 """
 参数修正模块
 实现桩基参数修正系数的计算
+修正系数多项式从版本化系数文件加载（进程内共享），按数组多项式求值
 """
 
-import math
+import os
+import json
+import threading
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple
+
+
+# 内置修正系数文件
+DEFAULT_CORRECTION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data',
+                                       'correction_coefficients.json')
+
+# 用户修正系数文件环境变量（由标定流程生成，存在时替代内置文件）
+CORRECTION_FILE_ENV = 'BRIDGE_CALC_CORRECTION_FILE'
+
+
+@dataclass
+class CorrectionCoefficients:
+    """修正系数多项式（系数按升幂排列）"""
+    length: Tuple[float, ...]                  # a = Σ length[k]·L^k
+    diameter: Tuple[float, ...]                # b = Σ diameter[k]·D^k
+    length_range: Tuple[float, float] = (0.0, np.inf)
+    diameter_range: Tuple[float, float] = (0.0, np.inf)
+    version: int = 1
+    source: str = ''
+    description: str = ''
+    calibrated_at: str = ''
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    path: Optional[str] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'CorrectionCoefficients':
+        """从系数文件加载"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for name in ('length', 'diameter'):
+            if not data.get(name, {}).get('coefficients'):
+                raise ValueError(f"修正系数文件缺少 {name} 多项式系数: {path}")
+
+        return cls(
+            length=tuple(float(c) for c in data['length']['coefficients']),
+            diameter=tuple(float(c) for c in data['diameter']['coefficients']),
+            length_range=tuple(data['length'].get('range', (0.0, np.inf))),
+            diameter_range=tuple(data['diameter'].get('range', (0.0, np.inf))),
+            version=int(data.get('version', 1)),
+            source=data.get('source', ''),
+            description=data.get('description', ''),
+            calibrated_at=data.get('calibrated_at', ''),
+            statistics=data.get('statistics', {}),
+            path=path
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为系数文件内容"""
+        return {
+            'version': self.version,
+            'source': self.source,
+            'description': self.description,
+            'calibrated_at': self.calibrated_at,
+            'length': {
+                'variable': 'pile_length',
+                'unit': 'm',
+                'coefficients': list(self.length),
+                'range': list(self.length_range)
+            },
+            'diameter': {
+                'variable': 'pile_diameter',
+                'unit': 'm',
+                'coefficients': list(self.diameter),
+                'range': list(self.diameter_range)
+            },
+            'statistics': self.statistics
+        }
+
+    def save(self, path: str):
+        """保存为系数文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        self.path = path
+
+
+_coefficients = None
+_coefficients_lock = threading.Lock()
+
+
+def get_correction_file() -> str:
+    """获取修正系数文件：环境变量指定的文件存在时使用该文件，否则使用内置文件"""
+    path = os.environ.get(CORRECTION_FILE_ENV, '').strip()
+    return path if path and os.path.exists(path) else DEFAULT_CORRECTION_FILE
+
+
+def get_correction_coefficients() -> CorrectionCoefficients:
+    """
+    获取进程内共享的修正系数
+
+    首次调用时从系数文件加载，之后直接返回缓存
+
+    Returns:
+        CorrectionCoefficients: 修正系数
+    """
+    global _coefficients
+    if _coefficients is None:
+        with _coefficients_lock:
+            if _coefficients is None:
+                _coefficients = CorrectionCoefficients.from_file(get_correction_file())
+    return _coefficients
+
+
+def reload_correction_coefficients(path: Optional[str] = None) -> CorrectionCoefficients:
+    """
+    重新加载修正系数（重新标定后调用）
+
+    Args:
+        path: 系数文件路径，默认使用 get_correction_file()
+
+    Returns:
+        CorrectionCoefficients: 新的修正系数
+    """
+    global _coefficients
+    with _coefficients_lock:
+        _coefficients = CorrectionCoefficients.from_file(path or get_correction_file())
+    return _coefficients
+
+
+def _evaluate(coefficients, value):
+    """按升幂系数求多项式值，标量输入返回 float"""
+    result = np.polynomial.polynomial.polyval(np.asarray(value, dtype=float), coefficients)
+    return float(result) if np.ndim(result) == 0 else result
 
 
 class CorrectionCalculator:
     """参数修正计算器"""
-    
-    def __init__(self):
-        """初始化修正计算器"""
-        pass
-    
+
+    def __init__(self, coefficients: Optional[CorrectionCoefficients] = None):
+        """
+        初始化修正计算器
+
+        参数:
+        coefficients: 修正系数，默认使用共享的系数文件
+        """
+        self.coefficients = coefficients or get_correction_coefficients()
+
     def calculate_length_correction(self, pile_length):
         """
         计算桩长修正系数
-        
-        根据文档：a = 0.985 - 0.00051 × (桩长)
-        
+
+        默认系数文件：a = 0.985 - 0.00051 × (桩长)
+
         参数:
-        pile_length: 桩长 (m)
-        
+        pile_length: 桩长 (m)，可为数组
+
         返回:
         a: 桩长修正系数
         """
-        a = 0.985 - (0.00051 * pile_length)
+        return _evaluate(self.coefficients.length, pile_length)
 
-        return a
-    
     def calculate_diameter_correction(self, pile_diameter):
         """
         计算桩径修正系数
-        
-        根据文档：
+
+        默认系数文件：
         b = 0.038 × (桩径)² - 0.206 × (桩径) + 1.159 (桩径小于2.5m时)
-        
+
         参数:
-        pile_diameter: 桩径 (m)
-        
+        pile_diameter: 桩径 (m)，可为数组
+
         返回:
         b: 桩径修正系数
         """
-        b = (0.038 * pile_diameter**2) - (0.206 * pile_diameter) + 1.159
-        
-        return b
-    
+        return _evaluate(self.coefficients.diameter, pile_diameter)
+
     def calculate_combined_correction(self, pile_length, pile_diameter):
         """
         计算综合修正系数 (a * b)
-        
+
         参数:
         pile_length: 桩长 (m)
         pile_diameter: 桩径 (m)
-        
+
         返回:
         combined: 综合修正系数 (a × b)
         """
         a = self.calculate_length_correction(pile_length)
         b = self.calculate_diameter_correction(pile_diameter)
         combined = a * b
-        
+
         return combined
 
- 
\ No newline at end of file
+    def validate_correction_parameters(self, pile_length, pile_diameter):
+        """
+        检查桩长、桩径是否在修正系数的标定范围内
+
+        参数:
+        pile_length: 桩长 (m)
+        pile_diameter: 桩径 (m)
+
+        返回:
+        (is_valid, message): 是否有效及说明
+        """
+        length_min, length_max = self.coefficients.length_range
+        diameter_min, diameter_max = self.coefficients.diameter_range
+
+        if pile_length <= 0 or pile_diameter <= 0:
+            return False, "桩长和桩径必须大于0"
+        if not length_min <= pile_length <= length_max:
+            return False, f"桩长超出修正系数标定范围 {length_min:g}~{length_max:g} m"
+        if not diameter_min <= pile_diameter <= diameter_max:
+            return False, f"桩径超出修正系数标定范围 {diameter_min:g}~{diameter_max:g} m"
+        return True, "参数在标定范围内"
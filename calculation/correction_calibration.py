@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+修正系数标定模块
+读取FLAC3D等数值模拟的沉降结果表，按桩长、桩径组合分块汇总数值解与Boussinesq理论解之比，
+以交替加权最小二乘拟合可分离修正曲面 a(桩长)·b(桩径)，生成版本化的修正系数文件
+"""
+
+import os
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, Iterable, Union
+
+from .boussinesq import BoussinesqCalculator
+from .correction import CorrectionCoefficients, get_correction_coefficients
+
+
+# 未给出理论沉降列时，由以下列按Boussinesq解计算
+BOUSSINESQ_COLUMNS = ('load', 'shear_modulus', 'poisson_ratio', 'x', 'y', 'z')
+
+
+class CorrectionCalibrator:
+    """修正系数标定类"""
+
+    def __init__(self, length_degree: int = 1, diameter_degree: int = 2, chunksize: int = 200000,
+                 max_iterations: int = 100, tolerance: float = 1e-12):
+        """
+        初始化标定
+
+        Args:
+            length_degree: 桩长修正多项式次数
+            diameter_degree: 桩径修正多项式次数
+            chunksize: 分块读取结果表的行数
+            max_iterations: 交替最小二乘最大迭代次数
+            tolerance: 修正系数相对变化小于该值时收敛
+        """
+        self.length_degree = length_degree
+        self.diameter_degree = diameter_degree
+        self.chunksize = chunksize
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.kernel = BoussinesqCalculator()
+
+    def read_chunks(self, sources: Iterable[Union[str, pd.DataFrame]]):
+        """
+        逐块读取数值模拟结果
+
+        Args:
+            sources: CSV 文件路径或 DataFrame 序列
+
+        Yields:
+            pd.DataFrame: 结果数据块
+        """
+        for source in sources:
+            if isinstance(source, pd.DataFrame):
+                for start in range(0, len(source), self.chunksize):
+                    yield source.iloc[start:start + self.chunksize]
+            else:
+                yield from pd.read_csv(source, chunksize=self.chunksize)
+
+    def calculate_ratios(self, chunk: pd.DataFrame) -> np.ndarray:
+        """
+        计算数值解与理论解之比
+
+        Args:
+            chunk: 含 numerical_settlement 列，以及 theoretical_settlement 列或 BOUSSINESQ_COLUMNS 各列
+
+        Returns:
+            np.ndarray: 沉降比
+        """
+        if 'theoretical_settlement' in chunk.columns:
+            theoretical = chunk['theoretical_settlement'].to_numpy(dtype=float)
+        else:
+            missing = [column for column in BOUSSINESQ_COLUMNS if column not in chunk.columns]
+            if missing:
+                raise ValueError(f"结果表缺少理论沉降列 theoretical_settlement 或计算所需列: {missing}")
+            values = {column: chunk[column].to_numpy(dtype=float) for column in BOUSSINESQ_COLUMNS}
+            theoretical = self.kernel.calculate_settlement_array(
+                values['load'], values['shear_modulus'], values['x'], values['y'], values['z'],
+                values['poisson_ratio']
+            )
+
+        return chunk['numerical_settlement'].to_numpy(dtype=float) / theoretical
+
+    def summarize(self, sources: Iterable[Union[str, pd.DataFrame]]) -> pd.DataFrame:
+        """
+        分块汇总各桩长、桩径组合的沉降比（内存占用与结果表行数无关）
+
+        Returns:
+            pd.DataFrame: 每个组合的 pile_length、pile_diameter、weight（权重和）、
+                          ratio_sum（加权比值和）、ratio_square_sum（加权比值平方和）、count
+        """
+        partials = []
+        for chunk in self.read_chunks(sources):
+            ratio = self.calculate_ratios(chunk)
+            weight = chunk['weight'].to_numpy(dtype=float) if 'weight' in chunk.columns else np.ones(len(chunk))
+            valid = np.isfinite(ratio) & (weight > 0)
+            frame = pd.DataFrame({
+                'pile_length': chunk['pile_length'].to_numpy(dtype=float)[valid],
+                'pile_diameter': chunk['pile_diameter'].to_numpy(dtype=float)[valid],
+                'weight': weight[valid],
+                'ratio_sum': (weight * ratio)[valid],
+                'ratio_square_sum': (weight * ratio**2)[valid],
+                'count': 1
+            })
+            partials.append(frame.groupby(['pile_length', 'pile_diameter'], sort=False).sum())
+
+        if not partials:
+            raise ValueError("没有可用的数值模拟结果")
+        return pd.concat(partials).groupby(level=[0, 1]).sum().reset_index()
+
+    def fit(self, summary: pd.DataFrame, reference: Optional[CorrectionCoefficients] = None) -> Dict[str, Any]:
+        """
+        交替加权最小二乘拟合可分离修正曲面 ratio ≈ a(L)·b(D)
+
+        a、b 只能确定到一个比例因子，取使各组合 a 的加权平均值与参考系数一致的解，保持与原系数口径连续
+
+        Args:
+            summary: summarize 的汇总结果
+            reference: 参考修正系数（提供初值和比例口径），默认使用当前共享系数
+
+        Returns:
+            Dict: 'length'、'diameter' 升幂系数，'iterations'、'converged'、'statistics'
+        """
+        reference = reference or get_correction_coefficients()
+        length = summary['pile_length'].to_numpy(dtype=float)
+        diameter = summary['pile_diameter'].to_numpy(dtype=float)
+        weight = summary['weight'].to_numpy(dtype=float)
+        mean_ratio = summary['ratio_sum'].to_numpy(dtype=float) / weight
+
+        if len(np.unique(length)) <= self.length_degree:
+            raise ValueError(f"桩长取值数不足以拟合{self.length_degree}次多项式")
+        if len(np.unique(diameter)) <= self.diameter_degree:
+            raise ValueError(f"桩径取值数不足以拟合{self.diameter_degree}次多项式")
+
+        length_basis = np.polynomial.polynomial.polyvander(length, self.length_degree)
+        diameter_basis = np.polynomial.polynomial.polyvander(diameter, self.diameter_degree)
+        sqrt_weight = np.sqrt(weight)
+
+        def solve(basis, factor):
+            design = basis * (factor * sqrt_weight)[:, np.newaxis]
+            return np.linalg.lstsq(design, mean_ratio * sqrt_weight, rcond=None)[0]
+
+        reference_a = np.polynomial.polynomial.polyval(length, reference.length)
+        b = np.polynomial.polynomial.polyval(diameter, reference.diameter)
+        length_coefficients = solve(length_basis, b)
+        converged = False
+        iteration = 0
+        for iteration in range(1, self.max_iterations + 1):
+            diameter_coefficients = solve(diameter_basis, length_basis @ length_coefficients)
+            b = diameter_basis @ diameter_coefficients
+            updated = solve(length_basis, b)
+            change = np.abs(updated - length_coefficients).max() / max(np.abs(updated).max(), 1e-300)
+            length_coefficients = updated
+            if change < self.tolerance:
+                converged = True
+                break
+
+        a = length_basis @ length_coefficients
+        scale = np.average(reference_a, weights=weight) / np.average(a, weights=weight)
+        length_coefficients = length_coefficients * scale
+        diameter_coefficients = solve(diameter_basis, a * scale)
+
+        # 逐样本统计量由汇总量还原：Σw(r-f)² = Σwr² - 2fΣwr + f²Σw
+        fitted = (length_basis @ length_coefficients) * (diameter_basis @ diameter_coefficients)
+        ratio_sum = summary['ratio_sum'].to_numpy(dtype=float)
+        square_sum = summary['ratio_square_sum'].to_numpy(dtype=float)
+        residual_square = np.maximum(square_sum - 2 * fitted * ratio_sum + fitted**2 * weight, 0).sum()
+        total_square = square_sum.sum() - ratio_sum.sum()**2 / weight.sum()
+
+        statistics = {
+            'n_samples': int(summary['count'].sum()),
+            'n_combinations': int(len(summary)),
+            'rmse': float(np.sqrt(residual_square / weight.sum())),
+            'r_squared': float(1 - residual_square / total_square) if total_square > 0 else 1.0,
+            'max_combination_error': float(np.abs(fitted - mean_ratio).max())
+        }
+        return {
+            'length': length_coefficients,
+            'diameter': diameter_coefficients,
+            'length_range': (float(length.min()), float(length.max())),
+            'diameter_range': (float(diameter.min()), float(diameter.max())),
+            'iterations': iteration,
+            'converged': converged,
+            'statistics': statistics
+        }
+
+    def calibrate(self, sources: Iterable[Union[str, pd.DataFrame]], output_path: Optional[str] = None,
+                  reference: Optional[CorrectionCoefficients] = None,
+                  description: str = '') -> CorrectionCoefficients:
+        """
+        标定修正系数并生成新版本系数文件
+
+        Args:
+            sources: 数值模拟结果（CSV 路径或 DataFrame），列见 calculate_ratios 及 pile_length、pile_diameter
+            output_path: 系数文件输出路径，为 None 时不写文件
+            reference: 参考修正系数，默认使用当前共享系数
+            description: 标定说明
+
+        Returns:
+            CorrectionCoefficients: 新修正系数（版本号在参考系数基础上加1）
+        """
+        reference = reference or get_correction_coefficients()
+        sources = list(sources)
+        result = self.fit(self.summarize(sources), reference)
+
+        statistics = dict(result['statistics'],
+                          iterations=result['iterations'],
+                          converged=result['converged'],
+                          datasets=[source if isinstance(source, str) else 'DataFrame' for source in sources])
+        coefficients = CorrectionCoefficients(
+            length=tuple(float(c) for c in result['length']),
+            diameter=tuple(float(c) for c in result['diameter']),
+            length_range=result['length_range'],
+            diameter_range=result['diameter_range'],
+            version=reference.version + 1,
+            source='FLAC3D',
+            description=description or f"由{statistics['n_samples']}个数值模拟结果标定",
+            calibrated_at=datetime.datetime.now().isoformat(timespec='seconds'),
+            statistics=statistics
+        )
+
+        if output_path:
+            directory = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(directory, exist_ok=True)
+            coefficients.save(output_path)
+        return coefficients
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+路面差异沉降评估模块
+由路面沉降场（规则网格）向量化差分计算横断面差异沉降、横向坡度变化、纵坡变化和角变形，
+按可配置限值检查并给出最不利位置
+坐标约定同沉降计算模块：x 为路基横向（中心线为0），y 为路线方向
+"""
+
+import numpy as np
+from typing import Dict, Any, Optional
+
+
+# 缺省限值
+DEFAULT_LIMITS = {
+    'differential_settlement': 30.0,   # 横断面内差异沉降 (mm)
+    'transverse_slope': 0.005,         # 横向坡度变化（横坡度变化 0.5%）
+    'longitudinal_slope': 0.004,       # 纵坡变化（0.4%）
+    'angular_distortion': 1 / 500,     # 角变形（相邻两段评估跨度的弦坡度之差）
+}
+
+METRICS = tuple(DEFAULT_LIMITS)
+
+# 角变形评估跨度 (m)：缺省取该值与该方向路面范围四分之一的较小值
+DEFAULT_REFERENCE_SPAN = 5.0
+
+
+class DifferentialSettlementAnalyzer:
+    """路面差异沉降评估类"""
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None, worst_count: int = 5,
+                 reference_span: Optional[float] = None):
+        """
+        初始化评估
+
+        Args:
+            limits: 覆盖缺省限值
+            worst_count: 每项指标输出的最不利位置数
+            reference_span: 角变形评估跨度 (m)，缺省见 DEFAULT_REFERENCE_SPAN
+        """
+        if reference_span is not None and reference_span <= 0:
+            raise ValueError("角变形评估跨度必须大于0")
+        unknown = set(limits or {}) - set(METRICS)
+        if unknown:
+            raise ValueError(f"未知的限值项: {sorted(unknown)}")
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.worst_count = worst_count
+        self.reference_span = reference_span
+
+    def calculate_fields(self, x, y, settlement_mm, road_width: Optional[float] = None,
+                         road_center: float = 0.0) -> Dict[str, np.ndarray]:
+        """
+        计算差异沉降指标场
+
+        Args:
+            x: 横向坐标 (n_x,)，单调递增 (m)
+            y: 路线方向坐标 (n_y,)，单调递增 (m)
+            settlement_mm: 沉降场 (n_y, n_x) (mm)，向下为正
+            road_width: 路面宽度 (m)，缺省取整个网格宽度
+            road_center: 路面中心线横向坐标 (m)
+
+        Returns:
+            Dict: 'x'、'y'（路面范围内）、'settlement'，以及
+                  'differential_settlement' (n_y,)、'transverse_slope'、'longitudinal_slope' (n_y, n_x)、
+                  'angular_distortion' (n_y, n_x)（纵横两向的较大值，见 _span_distortion），
+                  'reference_span'（横向、纵向评估跨度 (m)）
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        settlement = np.asarray(settlement_mm, dtype=float)
+        if settlement.shape != (len(y), len(x)):
+            raise ValueError(f"沉降场形状应为 ({len(y)}, {len(x)})，实际为 {settlement.shape}")
+        if len(x) < 3 or len(y) < 3:
+            raise ValueError("沉降场每个方向至少需要3个网格点")
+
+        if road_width is not None:
+            inside = np.abs(x - road_center) <= road_width / 2 + 1e-9
+            if inside.sum() < 3:
+                raise ValueError("路面范围内横向网格点不足3个")
+            x = x[inside]
+            settlement = settlement[:, inside]
+
+        # 沉降 mm -> m，坡度为无量纲
+        deformation = settlement / 1000
+        span_x = self._reference_span(x, '横向')
+        span_y = self._reference_span(y, '纵向')
+        angular = np.maximum(self._span_distortion(deformation, x, span_x, axis=1),
+                             self._span_distortion(deformation, y, span_y, axis=0))
+
+        return {
+            'x': x,
+            'y': y,
+            'settlement': settlement,
+            'differential_settlement': np.ptp(settlement, axis=1),
+            'transverse_slope': np.abs(np.gradient(deformation, x, axis=1, edge_order=2)),
+            'longitudinal_slope': np.abs(np.gradient(deformation, y, axis=0, edge_order=2)),
+            'angular_distortion': angular,
+            'reference_span': (span_x, span_y)
+        }
+
+    def _reference_span(self, coords: np.ndarray, direction: str) -> float:
+        """该方向的角变形评估跨度 (m)"""
+        extent = coords[-1] - coords[0]
+        if self.reference_span is None:
+            return min(DEFAULT_REFERENCE_SPAN, extent / 4)
+        if 2 * self.reference_span > extent:
+            raise ValueError(f"角变形评估跨度 {self.reference_span} m 超过{direction}范围的一半（{extent / 2:g} m）")
+        return float(self.reference_span)
+
+    def _span_distortion(self, deformation: np.ndarray, coords: np.ndarray, span: float,
+                         axis: int) -> np.ndarray:
+        """
+        沿一个方向的角变形：两侧各长 span 的相邻两段弦坡度之差
+        β = |w(p+L) - 2w(p) + w(p-L)| / L，跨度端点处的沉降由网格线性插值，与网格间距无关；
+        两侧跨度超出网格的点为0
+        """
+        values = np.moveaxis(deformation, axis, -1)
+        result = np.zeros(values.shape)
+        tolerance = 1e-9 * max(1.0, abs(span))
+        valid = (coords - span >= coords[0] - tolerance) & (coords + span <= coords[-1] + tolerance)
+        if valid.any():
+            centre = coords[valid]
+            ahead = self._interpolate(values, coords, np.minimum(centre + span, coords[-1]))
+            behind = self._interpolate(values, coords, np.maximum(centre - span, coords[0]))
+            result[..., valid] = np.abs(ahead - 2 * values[..., valid] + behind) / span
+        return np.moveaxis(result, -1, axis)
+
+    def _interpolate(self, values: np.ndarray, coords: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """沿最后一维在 query 处线性插值"""
+        index = np.clip(np.searchsorted(coords, query, side='right') - 1, 0, len(coords) - 2)
+        weight = (query - coords[index]) / (coords[index + 1] - coords[index])
+        return values[..., index] * (1 - weight) + values[..., index + 1] * weight
+
+    def analyze(self, x, y, settlement_mm, road_width: Optional[float] = None,
+                road_center: float = 0.0) -> Dict[str, Any]:
+        """
+        评估路面差异沉降
+
+        Args:
+            x, y, settlement_mm, road_width, road_center: 见 calculate_fields
+
+        Returns:
+            Dict: 各指标的 value（最大值）、limit、exceeded、exceedance_ratio（超限点比例）、
+                  location（最不利位置）、worst（最不利位置列表），以及总体 safe 和 fields
+        """
+        fields = self.calculate_fields(x, y, settlement_mm, road_width, road_center)
+        x, y = fields['x'], fields['y']
+
+        result = {}
+        for metric in METRICS:
+            values = fields[metric]
+            limit = self.limits[metric]
+            flat = values.ravel()
+            count = min(self.worst_count, flat.size)
+            worst_index = np.argpartition(-flat, count - 1)[:count]
+            worst_index = worst_index[np.argsort(-flat[worst_index])]
+
+            if metric == 'differential_settlement':
+                # 横断面指标：给出断面位置及断面内最大、最小沉降点
+                rows = fields['settlement'][worst_index]
+                worst = [{'y': float(y[i]), 'value': float(flat[i]),
+                          'x_max': float(x[row.argmax()]), 'x_min': float(x[row.argmin()])}
+                         for i, row in zip(worst_index, rows)]
+            else:
+                rows, columns = np.unravel_index(worst_index, values.shape)
+                worst = [{'x': float(x[j]), 'y': float(y[i]), 'value': float(flat[k])}
+                         for i, j, k in zip(rows, columns, worst_index)]
+
+            result[metric] = {
+                'value': float(flat[worst_index[0]]),
+                'limit': limit,
+                'exceeded': bool(flat[worst_index[0]] > limit),
+                'exceedance_ratio': float(np.count_nonzero(flat > limit) / flat.size),
+                'location': worst[0],
+                'worst': worst
+            }
+
+        result['safe'] = not any(result[metric]['exceeded'] for metric in METRICS)
+        result['fields'] = fields
+        return result
+
+    def analyze_grid(self, grid: Dict[str, np.ndarray], road_width: Optional[float] = None,
+                     road_center: float = 0.0, key: str = 'uz') -> Dict[str, Any]:
+        """
+        评估网格位移场（如 CerrutiCalculator.calculate_grid 的单一深度结果）
+
+        Args:
+            grid: 含二维 'x'、'y' 网格坐标及位移 (m) 的字典
+            road_width, road_center: 见 calculate_fields
+            key: 竖向位移键名
+
+        Returns:
+            Dict: 见 analyze
+        """
+        if np.ndim(grid[key]) != 2:
+            raise ValueError("网格位移场应为单一深度的二维数组")
+        return self.analyze(grid['x'][0], grid['y'][:, 0], np.asarray(grid[key]) * 1000, road_width, road_center)
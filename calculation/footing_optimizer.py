@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础尺寸优化模块
+在基础宽度、长度、埋深的取值范围内向量化网格搜索，剔除不满足地基承载力、
+抗倾覆、抗滑移验算的方案，再在较优方案附近加密搜索，求混凝土用量最小的基础尺寸
+"""
+
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+
+from .tower_calculator import TowerCalculator
+from .tower_batch import TowerBatchCalculator
+
+
+# 缺省搜索范围 (m)
+DEFAULT_DIMENSION_BOUNDS = {
+    'base_width': (1.0, 8.0),
+    'base_length': (1.0, 8.0),
+    'embedment_depth': (0.5, 4.0),
+}
+
+DIMENSION_NAMES = ('base_width', 'base_length', 'embedment_depth')
+
+
+class FootingOptimizer:
+    """电线塔基础尺寸优化类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None,
+                 coarse_step: float = 0.25, fine_step: float = 0.05, refine_candidates: int = 5,
+                 max_aspect_ratio: float = 1.5, max_refinements: int = 10):
+        """
+        初始化优化器
+
+        Args:
+            tower_calculator: 单塔计算器，提供安全系数要求和土质参数
+            coarse_step: 粗网格步长 (m)
+            fine_step: 加密网格步长 (m)，即尺寸取整模数
+            refine_candidates: 加密搜索的粗网格候选方案数
+            max_aspect_ratio: 基础长宽比上限（长、宽取较大值与较小值之比）
+            max_refinements: 加密搜索轮数上限
+        """
+        self.batch = TowerBatchCalculator(tower_calculator)
+        self.coarse_step = coarse_step
+        self.fine_step = fine_step
+        self.refine_candidates = refine_candidates
+        self.max_aspect_ratio = max_aspect_ratio
+        self.max_refinements = max_refinements
+
+    def calculate_concrete_volume(self, base_width, base_length, embedment_depth) -> np.ndarray:
+        """
+        计算基础混凝土用量
+
+        按埋深范围内的实体基础计：V = B × L × d
+
+        Returns:
+            np.ndarray: 混凝土体积 (m³)
+        """
+        return np.asarray(base_width) * np.asarray(base_length) * np.asarray(embedment_depth)
+
+    def evaluate_dimensions(self, params: Dict[str, Any], base_width, base_length,
+                            embedment_depth) -> Dict[str, np.ndarray]:
+        """
+        向量化验算一组基础尺寸方案（正常使用和极端工况）
+
+        基础自重按当前方案的混凝土体积与原尺寸体积之比缩放
+
+        Args:
+            params: 单塔计算参数（荷载、土质及当前基础尺寸、自重）
+            base_width: 基础宽度数组 (m)
+            base_length: 基础长度数组 (m)
+            embedment_depth: 基础埋深数组 (m)
+
+        Returns:
+            Dict: 各方案尺寸、混凝土用量、基础自重、是否满足两种工况全部验算(feasible)
+                  及 evaluate_comprehensive 的全部结果
+        """
+        base_width, base_length, embedment_depth = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (base_width, base_length, embedment_depth))
+        )
+        current = self.get_current_dimensions(params)
+        current_volume = self.calculate_concrete_volume(*current)
+        volume = self.calculate_concrete_volume(base_width, base_length, embedment_depth)
+        base_weight = params.get('base_weight', 200.0) * volume / current_volume
+
+        shape = volume.shape
+        sites = {
+            'soil_code': np.full(shape, self.batch.parameters.soils.code(params.get('soil_type', '黏土'))),
+            'tower_load': np.full(shape, float(params.get('tower_load', 500.0))),
+            'horizontal_force': np.full(shape, float(params.get('horizontal_force', 50.0))),
+            'force_height': np.full(shape, float(params.get('force_height', 15.0))),
+            'base_weight': base_weight,
+            'base_width': base_width,
+            'base_length': base_length,
+            'embedment_depth': embedment_depth,
+        }
+
+        result = self.batch.evaluate_comprehensive(sites)
+        result.update({
+            'feasible': np.logical_and.reduce([
+                result[f'{case}_{check}_check']
+                for case in ('normal', 'extreme') for check in ('bearing', 'overturning', 'sliding')
+            ]),
+            'base_width': base_width,
+            'base_length': base_length,
+            'embedment_depth': embedment_depth,
+            'concrete_volume': volume,
+            'base_weight': base_weight
+        })
+        return result
+
+    def optimize(self, params: Dict[str, Any],
+                 bounds: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+        """
+        搜索混凝土用量最小且满足全部验算的基础尺寸
+
+        1. 粗网格：剔除长宽比超限的方案，其余方案向量化验算，剔除不满足验算的方案
+        2. 加密：在用量最小的若干可行方案邻域内按尺寸模数加密，
+           先剔除用量不小于当前最优值的方案，再验算其余方案；
+           找到更优方案后以其为中心重复加密，直至无改进
+
+        Args:
+            params: 单塔计算参数
+            bounds: 各尺寸搜索范围 {名称: (下限, 上限)}，缺省为 DEFAULT_DIMENSION_BOUNDS
+
+        Returns:
+            Dict: 最优尺寸、混凝土用量、控制利用率及验算方案数；无可行方案时 feasible 为 False
+        """
+        bounds = dict(DEFAULT_DIMENSION_BOUNDS, **(bounds or {}))
+        lower = np.array([bounds[name][0] for name in DIMENSION_NAMES], dtype=float)
+        upper = np.array([bounds[name][1] for name in DIMENSION_NAMES], dtype=float)
+
+        # 粗网格
+        axes = [np.arange(lo, hi + self.coarse_step / 2, self.coarse_step) for lo, hi in zip(lower, upper)]
+        grid = [axis.ravel() for axis in np.meshgrid(*axes, indexing='ij')]
+        grid = [dimension[self._within_aspect_ratio(grid[0], grid[1])] for dimension in grid]
+        coarse = self.evaluate_dimensions(params, *grid)
+        evaluations = grid[0].size
+
+        feasible = coarse['feasible']
+        if not feasible.any():
+            # 无可行方案时返回控制利用率最小的方案
+            best = int(np.argmin(coarse['critical_ratio']))
+            return self._build_result(params, coarse, best, evaluations, feasible=False)
+
+        candidates = np.flatnonzero(feasible)
+        candidates = candidates[np.argsort(coarse['concrete_volume'][candidates], kind='mergesort')]
+        candidates = candidates[:self.refine_candidates]
+        best_result, best_index = coarse, int(candidates[0])
+        best_volume = coarse['concrete_volume'][best_index]
+        centres = np.stack([dimension[candidates] for dimension in grid], axis=-1)
+
+        # 候选方案邻域按尺寸模数加密，找到更优方案后以其为中心继续搜索
+        offsets = np.arange(-self.coarse_step, self.coarse_step + self.fine_step / 2, self.fine_step)
+        neighbourhood = np.stack([axis.ravel() for axis in np.meshgrid(offsets, offsets, offsets, indexing='ij')],
+                                 axis=-1)
+        visited = set()
+        for _ in range(self.max_refinements):
+            points = (centres[:, np.newaxis, :] + neighbourhood[np.newaxis, :, :]).reshape(-1, 3)
+            points = np.unique(np.round(points / self.fine_step).astype(np.int64), axis=0)
+            points = np.array([point for point in points if tuple(point) not in visited]).reshape(-1, 3)
+            visited.update(map(tuple, points))
+            points = points * self.fine_step
+
+            points = points[np.all((points >= lower - 1e-9) & (points <= upper + 1e-9), axis=1)]
+            points = points[self._within_aspect_ratio(points[:, 0], points[:, 1]) &
+                            (self.calculate_concrete_volume(*points.T) < best_volume)]
+            if len(points) == 0:
+                break
+
+            fine = self.evaluate_dimensions(params, *points.T)
+            evaluations += len(points)
+            fine_feasible = np.flatnonzero(fine['feasible'])
+            if fine_feasible.size == 0:
+                break
+
+            order = np.lexsort((fine['critical_ratio'][fine_feasible], fine['concrete_volume'][fine_feasible]))
+            best_result, best_index = fine, int(fine_feasible[order[0]])
+            best_volume = fine['concrete_volume'][best_index]
+            centres = points[fine_feasible[order[:self.refine_candidates]]]
+
+        return self._build_result(params, best_result, best_index, evaluations)
+
+    def get_current_dimensions(self, params: Dict[str, Any]) -> Tuple[float, float, float]:
+        """获取当前基础尺寸（缺省值与 TowerCalculator 一致）"""
+        return (params.get('base_width', 2.0), params.get('base_length', 3.0),
+                params.get('embedment_depth', 1.5))
+
+    def _within_aspect_ratio(self, base_width, base_length) -> np.ndarray:
+        """长宽比约束"""
+        return np.maximum(base_width, base_length) <= self.max_aspect_ratio * np.minimum(base_width, base_length) + 1e-9
+
+    def _build_result(self, params: Dict[str, Any], result: Dict[str, np.ndarray], index: int,
+                      evaluations: int, feasible: bool = True) -> Dict[str, Any]:
+        """整理最优方案"""
+        current_volume = float(self.calculate_concrete_volume(*self.get_current_dimensions(params)))
+        volume = float(result['concrete_volume'][index])
+
+        return {
+            'feasible': feasible,
+            'optimal_dimensions': {
+                name: round(float(result[name][index]), 4) for name in DIMENSION_NAMES
+            },
+            'concrete_volume': volume,
+            'base_weight': float(result['base_weight'][index]),
+            'current_volume': current_volume,
+            'volume_saving': 1 - volume / current_volume,
+            'critical_ratio': float(result['critical_ratio'][index]),
+            'governing_check': str(result['governing_check'][index]),
+            'evaluations': evaluations
+        }
@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础荷载组合模块
+以荷载作用矩阵 × 分项系数矩阵一次求出全部组合的基础作用效应，
+向量化完成地基承载力、抗倾覆、抗滑移验算并给出各验算项的控制组合
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass, field
+
+from .tower_calculator import TowerCalculator, TowerFoundationCalculation
+from .tower_batch import TowerBatchCalculator
+
+
+# 作用效应分量：竖向力N、x向水平力Hx、y向水平力Hy、绕y轴弯矩Mx(由Hx产生)、绕x轴弯矩My(由Hy产生)
+EFFECT_COMPONENTS = ('vertical', 'horizontal_x', 'horizontal_y', 'moment_x', 'moment_y')
+
+# 标准组合分项系数（可按工程要求覆盖）
+STANDARD_PARTIAL_FACTORS = {
+    'wind_normal': {'tower_load': 1.0, 'base_weight': 1.0, 'wind': 1.0},
+    'wind_extreme': {'tower_load': 1.2, 'base_weight': 1.0, 'wind': 1.2},
+    'ice': {'tower_load': 1.0, 'base_weight': 1.0, 'ice': 1.0, 'wind': 0.25},
+    'broken_wire': {'tower_load': 1.0, 'base_weight': 1.0, 'ice': 1.0, 'broken_wire': 1.0},
+    'seismic': {'tower_load': 1.0, 'base_weight': 1.0, 'seismic': 1.0, 'wind': 0.2},
+}
+
+CHECK_KEYS = ('bearing', 'overturning', 'sliding')
+
+
+@dataclass
+class LoadAction:
+    """荷载作用（标准值）"""
+    name: str
+    vertical: float = 0.0       # 竖向力 (kN)，向下为正
+    horizontal_x: float = 0.0   # x向（基础宽度方向）水平力 (kN)
+    horizontal_y: float = 0.0   # y向（基础长度方向）水平力 (kN)
+    height: float = 0.0         # 水平力作用高度 (m)
+
+
+@dataclass
+class LoadCombination:
+    """荷载组合"""
+    name: str
+    factors: Dict[str, float] = field(default_factory=dict)  # 作用名称 -> 分项系数
+    load_case: str = 'normal'  # 安全系数要求 ('normal' 或 'extreme')
+
+
+class LoadCombinationEngine:
+    """电线塔基础荷载组合计算类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None):
+        """
+        初始化荷载组合计算器
+
+        Args:
+            tower_calculator: 单塔计算器，提供安全系数要求和土质参数
+        """
+        self.tower_calculator = tower_calculator or TowerCalculator()
+        self.batch = TowerBatchCalculator(self.tower_calculator)
+        self.safety_factors = self.tower_calculator.safety_factors
+
+    def build_action_matrix(self, actions: Sequence[LoadAction]) -> np.ndarray:
+        """
+        构建荷载作用矩阵
+
+        Args:
+            actions: 荷载作用列表
+
+        Returns:
+            np.ndarray: 形状 (n_actions, 5)，列为 EFFECT_COMPONENTS
+        """
+        matrix = np.zeros((len(actions), len(EFFECT_COMPONENTS)))
+        for i, action in enumerate(actions):
+            matrix[i] = (
+                action.vertical,
+                action.horizontal_x,
+                action.horizontal_y,
+                action.horizontal_x * action.height,
+                action.horizontal_y * action.height
+            )
+        return matrix
+
+    def build_factor_matrix(self, combinations: Sequence[LoadCombination],
+                            actions: Sequence[LoadAction]) -> np.ndarray:
+        """
+        构建分项系数矩阵
+
+        Args:
+            combinations: 荷载组合列表
+            actions: 荷载作用列表
+
+        Returns:
+            np.ndarray: 形状 (n_combinations, n_actions)
+        """
+        action_index = {action.name: i for i, action in enumerate(actions)}
+        matrix = np.zeros((len(combinations), len(actions)))
+        for i, combination in enumerate(combinations):
+            for name, factor in combination.factors.items():
+                if name not in action_index:
+                    raise ValueError(f"荷载组合 {combination.name} 引用了未定义的作用: {name}")
+                matrix[i, action_index[name]] = factor
+        return matrix
+
+    def get_default_actions(self, params: Dict[str, Any],
+                            wind_directions: Sequence[float] = (0.0,)) -> List[LoadAction]:
+        """
+        由单塔计算参数生成荷载作用
+
+        horizontal_force 作为风荷载按风向分解（0°沿基础宽度方向）；
+        可选参数 ice_load (覆冰竖向荷载, kN)、broken_wire_force (断线张力, kN, 沿线路即y向)、
+        seismic_force (水平地震作用, kN, 沿x向)
+
+        Args:
+            params: 单塔计算参数
+            wind_directions: 风向角列表 (度)
+
+        Returns:
+            List[LoadAction]: 荷载作用列表
+        """
+        force_height = params.get('force_height', 15.0)  # m
+        wind_force = params.get('horizontal_force', 50.0)  # kN
+
+        actions = [
+            LoadAction('tower_load', vertical=params.get('tower_load', 500.0)),
+            LoadAction('base_weight', vertical=params.get('base_weight', 200.0)),
+        ]
+
+        for angle in wind_directions:
+            theta = math.radians(angle)
+            actions.append(LoadAction(
+                self._wind_action_name(angle),
+                horizontal_x=wind_force * math.cos(theta),
+                horizontal_y=wind_force * math.sin(theta),
+                height=force_height
+            ))
+
+        if params.get('ice_load'):
+            actions.append(LoadAction('ice', vertical=params['ice_load']))
+        if params.get('broken_wire_force'):
+            actions.append(LoadAction('broken_wire', horizontal_y=params['broken_wire_force'], height=force_height))
+        if params.get('seismic_force'):
+            actions.append(LoadAction('seismic', horizontal_x=params['seismic_force'],
+                                      height=params.get('seismic_height', force_height)))
+
+        return actions
+
+    def get_standard_combinations(self, actions: Sequence[LoadAction],
+                                  partial_factors: Optional[Dict[str, Dict[str, float]]] = None
+                                  ) -> List[LoadCombination]:
+        """
+        生成标准荷载组合：每个风向的大风正常/极端工况，及覆冰、断线、地震工况
+
+        Args:
+            actions: 荷载作用列表（get_default_actions 生成）
+            partial_factors: 分项系数表，缺省为 STANDARD_PARTIAL_FACTORS
+
+        Returns:
+            List[LoadCombination]: 荷载组合列表
+        """
+        factors = partial_factors or STANDARD_PARTIAL_FACTORS
+        action_names = {action.name for action in actions}
+        wind_names = [action.name for action in actions if action.name.startswith('wind')]
+
+        def combine(template, wind_name=None):
+            combined = {}
+            for name, factor in template.items():
+                target = wind_name if name == 'wind' else name
+                if target in action_names:
+                    combined[target] = factor
+            return combined
+
+        combinations = []
+        for wind_name in wind_names:
+            label = wind_name.replace('wind_', '')
+            combinations.append(LoadCombination(f'大风{label}°', combine(factors['wind_normal'], wind_name), 'normal'))
+            combinations.append(LoadCombination(f'大风{label}°(极端)', combine(factors['wind_extreme'], wind_name), 'extreme'))
+
+        if 'ice' in action_names:
+            for wind_name in wind_names:
+                label = wind_name.replace('wind_', '')
+                combinations.append(LoadCombination(f'覆冰{label}°', combine(factors['ice'], wind_name), 'normal'))
+        if 'broken_wire' in action_names:
+            combinations.append(LoadCombination('断线', combine(factors['broken_wire']), 'extreme'))
+        if 'seismic' in action_names:
+            wind_name = wind_names[0] if wind_names else None
+            combinations.append(LoadCombination('地震', combine(factors['seismic'], wind_name), 'extreme'))
+
+        return combinations
+
+    def calculate_effects(self, action_matrix: np.ndarray, factor_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        计算各组合的作用效应 E = F × A
+
+        Args:
+            action_matrix: 荷载作用矩阵 (n_actions, 5)
+            factor_matrix: 分项系数矩阵 (..., n_combinations, n_actions)
+
+        Returns:
+            Dict: 各效应分量数组 (..., n_combinations)
+        """
+        effects = factor_matrix @ action_matrix
+        return {name: effects[..., i] for i, name in enumerate(EFFECT_COMPONENTS)}
+
+    def evaluate_effects(self, params: Dict[str, Any], effects: Dict[str, np.ndarray],
+                         extreme_mask: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        向量化验算各组合
+
+        基底压力只取闭合解：一般部分脱开情况的最大压力为角点三角形受压区上限值（偏于安全），
+        需要精确值时由 refine_base_pressure 对可能控制或验算结论未定的组合迭代求解
+
+        Args:
+            params: 单塔计算参数（基础尺寸、埋深、土质）
+            effects: 作用效应数组字典
+            extreme_mask: 按极端工况要求验算的组合
+
+        Returns:
+            Dict: 各组合的基底压力、安全系数、验算结果及利用率
+        """
+        base_width = params.get('base_width', 2.0)  # m
+        base_length = params.get('base_length', 3.0)  # m
+        soil_code = self.batch.parameters.soils.code(params.get('soil_type', '黏土'))
+
+        bearing_capacity = float(self.batch.calculate_bearing_capacity(
+            soil_code, base_width, params.get('embedment_depth', 1.5)
+        ))
+        friction_coefficient = float(self.batch.parameters.soils.lookup(soil_code, 'friction_coefficient'))
+
+        vertical = effects['vertical']
+        moment_x = np.abs(effects['moment_x'])
+        moment_y = np.abs(effects['moment_y'])
+        horizontal = np.hypot(effects['horizontal_x'], effects['horizontal_y'])
+
+        # 双向偏心基底压力（考虑基底部分脱开）
+        pressure = self.batch.base_pressure_solver.solve(vertical, moment_x, moment_y, base_width, base_length,
+                                                         iterate=False)
+        max_pressure = pressure['max_pressure']
+        min_pressure = pressure['min_pressure']
+        average_pressure = pressure['average_pressure']
+
+        # 抗倾覆：分别绕两个方向基础边缘，取较小安全系数
+        factor_x = self.batch._safe_ratio(vertical * base_width / 2, moment_x)
+        factor_y = self.batch._safe_ratio(vertical * base_length / 2, moment_y)
+        governs_x = factor_x <= factor_y
+        overturning_factor = np.where(governs_x, factor_x, factor_y)
+        resistance_moment = vertical * np.where(governs_x, base_width, base_length) / 2
+        overturning_moment = np.where(governs_x, moment_x, moment_y)
+
+        # 抗滑移：合成水平力
+        sliding_resistance = vertical * friction_coefficient
+        sliding_factor = self.batch._safe_ratio(sliding_resistance, horizontal)
+
+        overturning_required = np.where(extreme_mask, self.safety_factors['overturning_extreme'],
+                                        self.safety_factors['overturning_normal'])
+        sliding_required = np.where(extreme_mask, self.safety_factors['sliding_extreme'],
+                                    self.safety_factors['sliding_normal'])
+
+        return {
+            'vertical_force': vertical,
+            'horizontal_force': horizontal,
+            'corrected_bearing_capacity': np.full(vertical.shape, bearing_capacity),
+            'max_base_pressure': max_pressure,
+            'min_base_pressure': min_pressure,
+            'average_base_pressure': average_pressure,
+            'base_contact_ratio': pressure['contact_ratio'],
+            'base_pressure_exact': pressure['exact'],
+            'overturning_resistance_moment': resistance_moment,
+            'overturning_moment': overturning_moment,
+            'overturning_safety_factor': overturning_factor,
+            'sliding_resistance_force': sliding_resistance,
+            'sliding_safety_factor': sliding_factor,
+            'bearing_check': (max_pressure <= bearing_capacity) & (min_pressure >= 0),
+            'overturning_check': overturning_factor >= overturning_required,
+            'sliding_check': sliding_factor >= sliding_required,
+            'bearing_ratio': max_pressure / bearing_capacity,
+            'overturning_ratio': overturning_required / overturning_factor,
+            'sliding_ratio': sliding_required / sliding_factor
+        }
+
+    def refine_base_pressure(self, params: Dict[str, Any], effects: Dict[str, np.ndarray],
+                             results: Dict[str, np.ndarray]) -> int:
+        """
+        对可能控制地基承载力验算的组合迭代求解基底压力（原位更新 results）
+
+        一般部分脱开情况的真实最大压力介于线弹性公式 N/A + Mx/Wx + My/Wy 与角点三角形上限之间：
+        上限不低于全部组合最大下限值的组合可能成为控制组合，上下限跨越承载力的组合验算结论未定，
+        只对这两类组合迭代
+
+        Args:
+            params: 单塔计算参数
+            effects: 作用效应数组字典
+            results: evaluate_effects 的返回值
+
+        Returns:
+            int: 迭代求解的组合数量
+        """
+        base_width = params.get('base_width', 2.0)  # m
+        base_length = params.get('base_length', 3.0)  # m
+
+        exact = results['base_pressure_exact']
+        upper = results['max_base_pressure']
+        capacity = results['corrected_bearing_capacity']
+        vertical = effects['vertical']
+        moment_x = np.abs(effects['moment_x'])
+        moment_y = np.abs(effects['moment_y'])
+
+        linear = (vertical / (base_width * base_length)
+                  + 6 * moment_x / (base_length * base_width**2)
+                  + 6 * moment_y / (base_width * base_length**2))
+        lower = np.where(exact, upper, linear)
+        refine = ~exact & ((upper >= lower.max()) | ((lower <= capacity) & (upper > capacity)))
+        if not refine.any():
+            return 0
+
+        pressure = self.batch.base_pressure_solver.solve(
+            vertical[refine], moment_x[refine], moment_y[refine], base_width, base_length
+        )
+        upper[refine] = pressure['max_pressure']
+        results['base_contact_ratio'][refine] = pressure['contact_ratio']
+        exact[refine] = pressure['converged']
+        results['bearing_check'] = (upper <= capacity) & (results['min_base_pressure'] >= 0)
+        results['bearing_ratio'] = upper / capacity
+        return int(refine.sum())
+
+    def calculate_combinations(self, params: Dict[str, Any],
+                               actions: Optional[Sequence[LoadAction]] = None,
+                               combinations: Optional[Sequence[LoadCombination]] = None,
+                               wind_directions: Sequence[float] = (0.0,)) -> Dict[str, Any]:
+        """
+        计算全部荷载组合并确定各验算项的控制组合
+
+        Args:
+            params: 单塔计算参数
+            actions: 荷载作用列表，缺省由 get_default_actions 生成
+            combinations: 荷载组合列表，缺省由 get_standard_combinations 生成
+            wind_directions: 缺省作用的风向角列表 (度)
+
+        Returns:
+            Dict: 组合名称、各组合结果数组、控制组合及整体是否满足
+        """
+        if actions is None:
+            actions = self.get_default_actions(params, wind_directions)
+        if combinations is None:
+            combinations = self.get_standard_combinations(actions)
+
+        action_matrix = self.build_action_matrix(actions)
+        factor_matrix = self.build_factor_matrix(combinations, actions)
+        extreme_mask = np.array([c.load_case == 'extreme' for c in combinations], dtype=bool)
+
+        effects = self.calculate_effects(action_matrix, factor_matrix)
+        results = self.evaluate_effects(params, effects, extreme_mask)
+        self.refine_base_pressure(params, effects, results)
+        names = [c.name for c in combinations]
+
+        governing = {}
+        for check in CHECK_KEYS:
+            index = int(np.argmax(results[f'{check}_ratio']))
+            governing[check] = {
+                'combination': names[index],
+                'index': index,
+                'ratio': float(results[f'{check}_ratio'][index]),
+                'passed': bool(results[f'{check}_check'][index])
+            }
+
+        return {
+            'combinations': names,
+            'results': results,
+            'governing': governing,
+            'overall_safe': bool(all(results[f'{check}_check'].all() for check in CHECK_KEYS))
+        }
+
+    def to_foundation_calculation(self, combination_result: Dict[str, Any], index: int) -> TowerFoundationCalculation:
+        """
+        将某一组合的结果转换为标准结果数据结构
+
+        Args:
+            combination_result: calculate_combinations 的返回值
+            index: 组合序号
+
+        Returns:
+            TowerFoundationCalculation: 该组合的基础稳定性结果
+        """
+        r = combination_result['results']
+        return TowerFoundationCalculation(
+            corrected_bearing_capacity=float(r['corrected_bearing_capacity'][index]),
+            max_base_pressure=float(r['max_base_pressure'][index]),
+            min_base_pressure=float(r['min_base_pressure'][index]),
+            average_base_pressure=float(r['average_base_pressure'][index]),
+            overturning_resistance_moment=float(r['overturning_resistance_moment'][index]),
+            overturning_moment=float(r['overturning_moment'][index]),
+            overturning_safety_factor=float(r['overturning_safety_factor'][index]),
+            sliding_resistance_force=float(r['sliding_resistance_force'][index]),
+            sliding_force=float(r['horizontal_force'][index]),
+            sliding_safety_factor=float(r['sliding_safety_factor'][index]),
+            bearing_check=bool(r['bearing_check'][index]),
+            overturning_check=bool(r['overturning_check'][index]),
+            sliding_check=bool(r['sliding_check'][index])
+        )
+
+    def _wind_action_name(self, angle: float) -> str:
+        """风荷载作用名称"""
+        return f'wind_{angle:g}'
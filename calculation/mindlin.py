@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Mindlin理论计算模块
+实现半无限空间弹性体内部作用竖向集中力（桩端荷载、桩侧摩阻力）的三维位移计算，
+数组接口与Boussinesq/Cerruti向量化计算一致，荷载作用深度为0时退化为Boussinesq解
+"""
+
+import numpy as np
+
+
+class MindlinCalculator:
+    """Mindlin理论计算器（向量化）"""
+
+    def __init__(self, shaft_points: int = 12):
+        """
+        初始化计算器
+
+        Args:
+            shaft_points: 桩侧分布荷载沿桩长积分的Gauss-Legendre积分点数
+        """
+        self.shaft_points = shaft_points
+
+    def calculate_displacement(self, P, G, x, y, z, nu, depth):
+        """
+        计算内部竖向集中力作用下的三维位移（荷载作用于 (0, 0, depth)，z向下为正）
+
+        R1² = r² + (z-c)²，R2² = r² + (z+c)²，两者共用水平距离平方 r²：
+        uz = P/(16πG(1-ν))·[(3-4ν)/R1 + (8(1-ν)²-(3-4ν))/R2 + (z-c)²/R1³
+             + ((3-4ν)(z+c)²-2cz)/R2³ + 6cz(z+c)²/R2⁵]
+        ux = P·x/(16πG(1-ν))·[(z-c)/R1³ + (3-4ν)(z-c)/R2³ - 4(1-ν)(1-2ν)/(R2(R2+z+c)) + 6cz(z+c)/R2⁵]
+
+        Args:
+            P: 竖向集中力 (kN)，向下为正
+            G: 剪切模量 (MPa)
+            x, y, z: 计算点坐标 (m)
+            nu: 泊松比
+            depth: 荷载作用深度 c (m)
+
+        Returns:
+            tuple: (ux, uy, uz) 位移 (m)，荷载作用点处取0
+        """
+        x, y, z, c = (np.asarray(value, dtype=float) for value in (x, y, z, depth))
+        nu = np.asarray(nu, dtype=float)
+        factor = np.asarray(P, dtype=float) * 1000 / (16 * np.pi * np.asarray(G, dtype=float) * 1e6 * (1 - nu))
+
+        r2 = x**2 + y**2
+        below = z - c
+        above = z + c
+        R1_2 = r2 + below**2
+        singular = R1_2 == 0
+        R1 = np.sqrt(np.where(singular, 1.0, R1_2))
+        R2 = np.sqrt(r2 + above**2)
+        R2 = np.where(R2 == 0, 1.0, R2)
+        R1_3 = R1 * R1 * R1
+        R2_3 = R2 * R2 * R2
+        R2_5 = R2_3 * R2 * R2
+
+        k = 3 - 4 * nu
+        cz6 = 6 * c * z
+        uz = factor * (k / R1 + (8 * (1 - nu)**2 - k) / R2 + below**2 / R1_3
+                       + (k * above**2 - 2 * c * z) / R2_3 + cz6 * above**2 / R2_5)
+        radial = factor * (below / R1_3 + k * below / R2_3
+                           - 4 * (1 - nu) * (1 - 2 * nu) / (R2 * (R2 + above)) + cz6 * above / R2_5)
+
+        return tuple(np.where(singular, 0.0, component) for component in (radial * x, radial * y, uz))
+
+    def calculate_settlement(self, P, G, x, y, z, nu, depth):
+        """计算内部竖向集中力作用下的竖向位移 (m)"""
+        return self.calculate_displacement(P, G, x, y, z, nu, depth)[2]
+
+    def calculate_pile_displacement(self, tip_load, shaft_load, G, x, y, z, nu, pile_length,
+                                    shaft_distribution='uniform'):
+        """
+        计算单桩桩端荷载与桩侧摩阻力共同作用下的三维位移（桩顶位于原点）
+
+        桩侧摩阻力沿桩长按 Gauss-Legendre 积分点离散为内部集中力叠加
+
+        Args:
+            tip_load: 桩端荷载 (kN)
+            shaft_load: 桩侧摩阻力合力 (kN)
+            G: 剪切模量 (MPa)
+            x, y, z: 计算点坐标 (m)
+            nu: 泊松比
+            pile_length: 桩长 (m)
+            shaft_distribution: 'uniform' 均匀分布，'triangular' 自桩顶为0线性增加
+
+        Returns:
+            tuple: (ux, uy, uz) 位移 (m)
+        """
+        if shaft_distribution not in ('uniform', 'triangular'):
+            raise ValueError(f"不支持的桩侧摩阻力分布: {shaft_distribution}")
+
+        x, y, z = (np.asarray(value, dtype=float) for value in (x, y, z))
+        tip = self.calculate_displacement(tip_load, G, x, y, z, nu, pile_length)
+
+        nodes, weights = np.polynomial.legendre.leggauss(self.shaft_points)
+        depths = pile_length * (nodes + 1) / 2
+        weights = weights / 2
+        if shaft_distribution == 'triangular':
+            weights = weights * 2 * depths / pile_length
+
+        expand = (slice(None),) + (np.newaxis,) * np.broadcast(x, y, z).ndim
+        shaft = self.calculate_displacement(shaft_load * weights[expand], G, x, y, z, nu, depths[expand])
+
+        return tuple(t + s.sum(axis=0) for t, s in zip(tip, shaft))
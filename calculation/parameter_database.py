@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+材料与土质参数数据库模块
+从数据文件延迟加载参数，建立按整数编码索引的内存参数表，进程内共享
+"""
+
+import os
+import json
+import threading
+import numpy as np
+from typing import Dict, List, Iterable, Optional, Union
+
+
+# 内置参数文件
+DEFAULT_PARAMETER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'parameters.json')
+
+# 用户参数文件环境变量（多个文件以 os.pathsep 分隔，后者覆盖前者）
+PARAMETER_FILE_ENV = 'BRIDGE_CALC_PARAMETER_FILES'
+
+
+class ParameterTable:
+    """索引化参数表：名称 -> 整数编码 -> 属性数组"""
+
+    def __init__(self, records: Dict[str, Dict[str, float]], fields: Dict[str, str], default: str):
+        """
+        初始化参数表
+
+        Args:
+            records: 参数记录 {名称: {属性: 数值}}
+            fields: 属性及单位 {属性: 单位}
+            default: 未知名称时使用的默认记录名称
+        """
+        if default not in records:
+            raise ValueError(f"默认参数记录不存在: {default}")
+
+        self.fields = dict(fields)
+        self.names = list(records.keys())
+        self.index = {name: code for code, name in enumerate(self.names)}
+        self.default = default
+        self.default_code = self.index[default]
+
+        # 缺省属性取默认记录的值
+        default_record = records[default]
+        self.columns = {}
+        for field in self.fields:
+            column = np.empty(len(self.names), dtype=float)
+            for code, name in enumerate(self.names):
+                value = records[name].get(field, default_record.get(field, np.nan))
+                column[code] = float(value)
+            column.setflags(write=False)
+            self.columns[field] = column
+
+        self._records = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def code(self, name: str) -> int:
+        """获取单个名称的编码，未知名称返回默认编码"""
+        return self.index.get(name, self.default_code)
+
+    def encode(self, names: Union[str, Iterable[str]]) -> np.ndarray:
+        """
+        批量名称编码
+
+        只对不重复的名称查字典，其余通过逆索引展开，避免逐个字符串查找
+
+        Args:
+            names: 名称或名称序列
+
+        Returns:
+            np.ndarray: 整数编码数组
+        """
+        names = np.asarray(names, dtype=object)
+        if names.size == 0:
+            return np.zeros(names.shape, dtype=np.intp)
+
+        unique_names, inverse = np.unique(names.astype(str), return_inverse=True)
+        unique_codes = np.array([self.code(name) for name in unique_names], dtype=np.intp)
+        return unique_codes[inverse].reshape(names.shape)
+
+    def lookup(self, codes: Union[int, np.ndarray], field: str) -> np.ndarray:
+        """
+        按编码查询属性数组
+
+        Args:
+            codes: 整数编码（标量或数组）
+            field: 属性名
+
+        Returns:
+            np.ndarray: 属性数组，形状与codes一致
+        """
+        if field not in self.columns:
+            raise KeyError(f"未知参数属性: {field}")
+        return self.columns[field][np.asarray(codes, dtype=np.intp)]
+
+    def lookup_names(self, names: Union[str, Iterable[str]], field: str) -> np.ndarray:
+        """按名称查询属性数组"""
+        return self.lookup(self.encode(names), field)
+
+    def get(self, name: str) -> Dict[str, float]:
+        """获取单条记录，未知名称返回默认记录"""
+        return self.as_dict()[self.names[self.code(name)]]
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """获取字典形式的参数表（只构建一次，调用方不应修改）"""
+        if self._records is None:
+            self._records = {
+                name: {field: float(self.columns[field][code]) for field in self.fields}
+                for code, name in enumerate(self.names)
+            }
+        return self._records
+
+
+class ParameterDatabase:
+    """材料与土质参数数据库"""
+
+    def __init__(self, soils: ParameterTable, materials: ParameterTable,
+                 sources: Optional[List[str]] = None):
+        self.soils = soils
+        self.materials = materials
+        self.sources = list(sources or [])
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> 'ParameterDatabase':
+        """
+        从参数文件构建数据库
+
+        后加载的文件可新增土质/材料，或覆盖同名记录的部分属性
+
+        Args:
+            paths: 参数文件路径列表
+
+        Returns:
+            ParameterDatabase: 参数数据库
+        """
+        sections = {
+            'soils': {'default': None, 'fields': {}, 'records': {}},
+            'materials': {'default': None, 'fields': {}, 'records': {}}
+        }
+        sources = []
+
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            sources.append(path)
+
+            for section_name, section in sections.items():
+                file_section = data.get(section_name)
+                if not file_section:
+                    continue
+                if file_section.get('default'):
+                    section['default'] = file_section['default']
+                section['fields'].update(file_section.get('fields', {}))
+                for name, record in file_section.get('records', {}).items():
+                    section['records'].setdefault(name, {}).update(record)
+
+        tables = {}
+        for section_name, section in sections.items():
+            if not section['records']:
+                raise ValueError(f"参数文件中缺少{section_name}数据")
+            default = section['default'] or next(iter(section['records']))
+            tables[section_name] = ParameterTable(section['records'], section['fields'], default)
+
+        return cls(tables['soils'], tables['materials'], sources)
+
+
+_database = None
+_database_lock = threading.Lock()
+
+
+def get_parameter_files() -> List[str]:
+    """获取参数文件列表：内置文件 + 环境变量指定的用户文件"""
+    paths = [DEFAULT_PARAMETER_FILE]
+    extra = os.environ.get(PARAMETER_FILE_ENV, '')
+    for path in extra.split(os.pathsep):
+        path = path.strip()
+        if path and os.path.exists(path):
+            paths.append(path)
+    return paths
+
+
+def get_parameter_database() -> ParameterDatabase:
+    """
+    获取进程内共享的参数数据库
+
+    首次调用时从参数文件加载，之后直接返回缓存
+
+    Returns:
+        ParameterDatabase: 参数数据库
+    """
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = ParameterDatabase.from_files(get_parameter_files())
+    return _database
+
+
+def reload_parameter_database(paths: Optional[Iterable[str]] = None) -> ParameterDatabase:
+    """
+    重新加载参数数据库（修改参数文件后调用）
+
+    Args:
+        paths: 参数文件列表，默认使用内置文件 + 环境变量指定的用户文件
+
+    Returns:
+        ParameterDatabase: 新的参数数据库
+    """
+    global _database
+    with _database_lock:
+        _database = ParameterDatabase.from_files(paths if paths is not None else get_parameter_files())
+    return _database
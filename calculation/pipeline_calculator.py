@@ -9,6 +9,9 @@ import math
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 
+from .parameter_database import get_parameter_database
+from .soil_arching import SoilArchingCalculator
+
 
 @dataclass
 class PipelinePushCalculation:
@@ -41,47 +44,21 @@ class PipelineSettlementCalculation:
     # 验算结果
     stress_check: bool  # 应力是否满足
     deformation_check: bool  # 变形是否满足
+    
+    # 土拱效应
+    overburden_pressure: float = 0.0  # 全覆土压力 (kPa)
+    arching_applied: bool = False  # 是否按深埋考虑土拱效应
 
 
 class PipelineCalculator:
     """路基顶管计算类"""
     
     def __init__(self):
-        # 材料参数数据库
-        self.material_properties = {
-            '混凝土': {
-                'elastic_modulus': 30000,  # MPa
-                'tensile_strength': 2.01,  # MPa (C30混凝土)
-                'density': 25.0  # kN/m³
-            },
-            '高密度聚乙烯': {
-                'elastic_modulus': 800,  # MPa
-                'tensile_strength': 20.0,  # MPa
-                'density': 9.5  # kN/m³
-            }
-        }
-        
-        # 土质参数数据库
-        self.soil_parameters = {
-            '黏土': {
-                'unit_weight': 18.0,  # kN/m³
-                'cohesion': 25.0,  # kPa
-                'friction_angle': 15.0,  # 度
-                'friction_coefficient': 0.3
-            },
-            '砂土': {
-                'unit_weight': 19.0,  # kN/m³
-                'cohesion': 0.0,  # kPa
-                'friction_angle': 30.0,  # 度
-                'friction_coefficient': 0.4
-            },
-            '粉土': {
-                'unit_weight': 18.5,  # kN/m³
-                'cohesion': 15.0,  # kPa
-                'friction_angle': 20.0,  # 度
-                'friction_coefficient': 0.35
-            }
-        }
+        # 材料与土质参数数据库（进程内共享，延迟加载）
+        self.parameters = get_parameter_database()
+        self.material_properties = self.parameters.materials.as_dict()
+        self.soil_parameters = self.parameters.soils.as_dict()
+        self.soil_arching = SoilArchingCalculator()
     
     def calculate_push_force(self, params: Dict[str, Any]) -> PipelinePushCalculation:
         """
@@ -162,11 +139,8 @@ class PipelineCalculator:
         material = params.get('material', '混凝土')
         reduction_factor = params.get('reduction_factor', 0.85)
         
-        # 获取材料强度
-        if material in self.material_properties:
-            tensile_strength = self.material_properties[material]['tensile_strength']  # MPa
-        else:
-            tensile_strength = 2.01  # 默认C30混凝土
+        # 获取材料强度 (未知材料按C30混凝土)
+        tensile_strength = self.parameters.materials.get(material)['tensile_strength']  # MPa
         
         # 计算截面积
         outer_radius = pipe_diameter / 2
@@ -262,7 +236,7 @@ class PipelineCalculator:
         计算管道沉降
         
         公式：
-        垂直土压力：Pv = γ × H
+        垂直土压力：深埋按Terzaghi土拱效应分层计算，浅埋取 Pv = Σγh
         车辆活载：q = 260/A (按JTGD60-2015)
         环向应力：σ = (Pv + q) × D / (2t)
         管体变形：S = (Pv + q) × D⁴ / (3.67Et³ + 0.061E'D³)
@@ -280,18 +254,17 @@ class PipelineCalculator:
         material = params.get('material', '混凝土')
         soil_modulus = params.get('soil_modulus', 10.0)  # MPa
         
-        # 获取材料参数
-        if material in self.material_properties:
-            elastic_modulus = self.material_properties[material]['elastic_modulus']  # MPa
-            tensile_strength = self.material_properties[material]['tensile_strength']  # MPa
-            unit_weight = self.material_properties[material]['density']  # kN/m³
-        else:
-            elastic_modulus = 30000  # 默认混凝土
-            tensile_strength = 2.01
-            unit_weight = 25.0
+        # 获取材料参数 (未知材料按混凝土)
+        material_data = self.parameters.materials.get(material)
+        elastic_modulus = material_data['elastic_modulus']  # MPa
+        tensile_strength = material_data['tensile_strength']  # MPa
         
-        # 计算土压力
-        vertical_soil_pressure = unit_weight * cover_depth  # kPa
+        # 计算土压力 (按覆土土层，考虑土拱效应)
+        cover_layers = self.get_cover_layers(params)
+        pressure = self.soil_arching.calculate_profile_pressures([cover_layers], pipe_diameter)
+        vertical_soil_pressure = float(pressure['vertical_pressure'][0])  # kPa
+        overburden_pressure = float(pressure['overburden_pressure'][0])  # kPa
+        arching_applied = bool(pressure['deep_cover'][0])
         
         # 车辆活载 (按JTGD60-2015)
         contact_area = 0.2 * 0.6  # m² (标准车辆荷载接触面积)
@@ -333,9 +306,37 @@ class PipelineCalculator:
             allowable_stress=allowable_stress,
             allowable_deformation=allowable_deformation,
             stress_check=stress_check,
-            deformation_check=deformation_check
+            deformation_check=deformation_check,
+            overburden_pressure=overburden_pressure,
+            arching_applied=arching_applied
         )
     
+    def get_cover_layers(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        获取管顶覆土土层
+        
+        优先使用 cover_layers (自上而下的土层列表)，否则按 soil_type 单一土层、
+        厚度取覆土深度，soil_unit_weight 覆盖土层重度
+        
+        Args:
+            params: 计算参数
+            
+        Returns:
+            List[Dict]: 土层列表 [{'thickness', 'soil_type', ...}, ...]
+        """
+        cover_layers = params.get('cover_layers')
+        if cover_layers:
+            return cover_layers
+        
+        layer = {
+            'thickness': params.get('cover_depth', 2.0),  # m
+            'soil_type': params.get('soil_type', self.parameters.soils.default)
+        }
+        if params.get('soil_unit_weight') is not None:
+            layer['unit_weight'] = params['soil_unit_weight']  # kN/m³
+        
+        return [layer]
+    
     def calculate_pipeline_stability(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         计算管道整体稳定性
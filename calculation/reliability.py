@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础可靠度分析模块
+对地基承载力、基底摩擦系数和荷载按拉丁超立方抽样，向量化分批验算地基承载力、
+抗倾覆、抗滑移三种失效模式，估计失效概率和可靠指标，体系失效概率估计值变异系数满足要求时提前停止
+"""
+
+import math
+import numpy as np
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+
+from .tower_calculator import TowerCalculator
+from .tower_batch import TowerBatchCalculator
+
+
+# 缺省随机变量：名称 -> (分布类型, 变异系数)
+DEFAULT_RANDOM_VARIABLES = {
+    'bearing_capacity': ('lognormal', 0.15),      # 地基承载力特征值
+    'friction_coefficient': ('lognormal', 0.20),  # 基底摩擦系数
+    'tower_load': ('normal', 0.10),               # 塔身竖向荷载
+    'horizontal_force': ('gumbel', 0.25),         # 水平风荷载（极值I型）
+    'base_weight': ('normal', 0.05),              # 基础自重
+}
+
+FAILURE_MODES = ('bearing', 'overturning', 'sliding', 'system')
+
+# 欧拉常数
+EULER_GAMMA = 0.5772156649015329
+
+
+def _normal_ppf(probability) -> np.ndarray:
+    """标准正态分布反函数（Acklam 有理逼近，相对误差约1e-9）"""
+    p = np.clip(np.asarray(probability, dtype=float), 1e-300, 1 - 1e-16)
+
+    a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+
+    def tail(q):
+        return (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+            ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+
+    low = p < 0.02425
+    high = p > 1 - 0.02425
+    central = ~(low | high)
+
+    z = np.empty_like(p)
+    q = p[central] - 0.5
+    r = q * q
+    z[central] = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+        (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+    z[low] = tail(np.sqrt(-2 * np.log(p[low])))
+    z[high] = -tail(np.sqrt(-2 * np.log(1 - p[high])))
+    return z
+
+
+@dataclass
+class RandomVariable:
+    """随机变量"""
+    name: str
+    distribution: str   # 'normal'、'lognormal' 或 'gumbel'
+    mean: float
+    cov: float          # 变异系数
+
+    @property
+    def std(self) -> float:
+        """标准差"""
+        return abs(self.mean) * self.cov
+
+    def ppf(self, probability) -> np.ndarray:
+        """
+        由累积概率求随机变量取值
+
+        Args:
+            probability: (0, 1) 内的累积概率
+
+        Returns:
+            np.ndarray: 随机变量取值（正态分布截断于0）
+        """
+        if self.cov == 0:
+            return np.full(np.shape(probability), float(self.mean))
+
+        if self.distribution == 'normal':
+            return np.maximum(0.0, self.mean + self.std * _normal_ppf(probability))
+        if self.distribution == 'lognormal':
+            sigma = math.sqrt(math.log(1 + self.cov**2))
+            mu = math.log(self.mean) - sigma**2 / 2
+            return np.exp(mu + sigma * _normal_ppf(probability))
+        if self.distribution == 'gumbel':
+            scale = self.std * math.sqrt(6) / math.pi
+            location = self.mean - EULER_GAMMA * scale
+            return location - scale * np.log(-np.log(np.asarray(probability, dtype=float)))
+
+        raise ValueError(f"不支持的分布类型: {self.distribution}")
+
+
+class TowerReliabilityAnalyzer:
+    """电线塔基础可靠度分析类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None, batch_size: int = 20000,
+                 max_samples: int = 1000000, target_cov: float = 0.05, min_probability: float = 1e-5,
+                 min_batches: int = 10, min_failures: int = 100):
+        """
+        初始化可靠度分析
+
+        Args:
+            tower_calculator: 单塔计算器，提供土质参数
+            batch_size: 每批拉丁超立方样本数
+            max_samples: 样本总数上限（按整批计）
+            target_cov: 体系失效概率估计值的目标变异系数
+            min_probability: 可忽略的失效概率，体系未出现失效且其95%置信上限低于该值时视为收敛
+            min_batches: 提前停止前至少抽样的批数（批间方差估计需足够批数）
+            min_failures: 按变异系数提前停止前体系失效样本数下限
+        """
+        self.batch = TowerBatchCalculator(tower_calculator)
+        self.batch_size = batch_size
+        self.max_samples = max_samples
+        self.target_cov = target_cov
+        self.min_probability = min_probability
+        self.min_batches = min_batches
+        self.min_failures = min_failures
+
+    def get_random_variables(self, params: Dict[str, Any],
+                             overrides: Optional[Dict[str, tuple]] = None) -> List[RandomVariable]:
+        """
+        生成随机变量列表，均值取计算参数（地基承载力、摩擦系数取土质参数库）
+
+        Args:
+            params: 单塔计算参数
+            overrides: 覆盖缺省分布 {名称: (分布类型, 变异系数)}
+
+        Returns:
+            List[RandomVariable]: 随机变量列表
+        """
+        soil = self.batch.parameters.soils.get(params.get('soil_type', '黏土'))
+        means = {
+            'bearing_capacity': params.get('bearing_capacity', soil['bearing_capacity']),
+            'friction_coefficient': params.get('friction_coefficient', soil['friction_coefficient']),
+            'tower_load': params.get('tower_load', 500.0),
+            'horizontal_force': params.get('horizontal_force', 50.0),
+            'base_weight': params.get('base_weight', 200.0),
+        }
+
+        specification = dict(DEFAULT_RANDOM_VARIABLES, **(overrides or {}))
+        return [RandomVariable(name, distribution, float(means[name]), cov)
+                for name, (distribution, cov) in specification.items()]
+
+    def latin_hypercube(self, n_samples: int, n_variables: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        拉丁超立方抽样：每个变量的 (0,1) 区间等分为 n_samples 层，每层随机取一点并随机排列
+
+        Returns:
+            np.ndarray: 累积概率样本 (n_samples, n_variables)
+        """
+        strata = (np.arange(n_samples)[:, np.newaxis] + rng.random((n_samples, n_variables))) / n_samples
+        order = np.argsort(rng.random((n_samples, n_variables)), axis=0)
+        return np.take_along_axis(strata, order, axis=0)
+
+    def sample(self, variables: List[RandomVariable], n_samples: int,
+               rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """按拉丁超立方抽样生成随机变量样本"""
+        probabilities = self.latin_hypercube(n_samples, len(variables), rng)
+        return {variable.name: variable.ppf(probabilities[:, i]) for i, variable in enumerate(variables)}
+
+    def evaluate_failures(self, params: Dict[str, Any], samples: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        向量化判断各样本的失效模式（抗力小于作用效应，即安全系数小于1）
+
+        地基承载力宽度、深度修正项按确定值计，叠加在承载力特征值样本上
+
+        Args:
+            params: 单塔计算参数（基础尺寸、作用高度、土质）
+            samples: 随机变量样本
+
+        Returns:
+            Dict: 各失效模式的失效标记数组
+        """
+        soils = self.batch.parameters.soils
+        soil_code = soils.code(params.get('soil_type', '黏土'))
+        base_width = params.get('base_width', 2.0)
+        base_length = params.get('base_length', 3.0)
+        force_height = params.get('force_height', 15.0)
+
+        correction = float(self.batch.calculate_bearing_capacity(
+            soil_code, base_width, params.get('embedment_depth', 1.5)
+        )) - float(soils.lookup(soil_code, 'bearing_capacity'))
+        bearing_capacity = samples['bearing_capacity'] + correction
+
+        tower_load = samples['tower_load']
+        horizontal_force = samples['horizontal_force']
+        base_weight = samples['base_weight']
+
+        max_pressure = self.batch.calculate_base_pressure(
+            tower_load, horizontal_force, force_height, base_weight, base_width, base_length
+        )[0]
+        overturning_factor = self.batch.calculate_overturning_stability(
+            tower_load, horizontal_force, force_height, base_weight, base_width
+        )[2]
+        sliding_factor = self.batch._safe_ratio(samples['friction_coefficient'] * (tower_load + base_weight),
+                                                horizontal_force)
+
+        failures = {
+            'bearing': max_pressure > bearing_capacity,
+            'overturning': overturning_factor < 1.0,
+            'sliding': sliding_factor < 1.0
+        }
+        failures['system'] = failures['bearing'] | failures['overturning'] | failures['sliding']
+        return failures
+
+    def analyze(self, params: Dict[str, Any], variables: Optional[List[RandomVariable]] = None,
+                seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        分批抽样估计各失效模式的失效概率和可靠指标
+
+        每批为独立的拉丁超立方样本，估计值变异系数取批间方差估计与二项分布变异系数
+        sqrt((1-p)/(n·p)) 的较大值；至少抽样 min_batches 批后，体系失效样本数不少于 min_failures
+        且变异系数不大于 target_cov，或体系未出现失效且其置信上限低于 min_probability 时停止
+        （各单一失效模式只报告估计值及其变异系数，罕见模式不要求达到精度）
+
+        Args:
+            params: 单塔计算参数
+            variables: 随机变量列表，缺省由 get_random_variables 生成
+            seed: 随机数种子
+
+        Returns:
+            Dict: 各失效模式的 failure_probability、reliability_index、cov、failures，
+                  以及样本数 n_samples、批数 n_batches、是否收敛 converged
+        """
+        variables = variables or self.get_random_variables(params)
+        rng = np.random.default_rng(seed)
+
+        batch_failures = {mode: [] for mode in FAILURE_MODES}
+        max_batches = max(1, math.ceil(self.max_samples / self.batch_size))
+        converged = False
+        for _ in range(max_batches):
+            failures = self.evaluate_failures(params, self.sample(variables, self.batch_size, rng))
+            for mode in FAILURE_MODES:
+                batch_failures[mode].append(int(np.count_nonzero(failures[mode])))
+
+            if len(batch_failures['system']) < self.min_batches:
+                continue
+            if self._is_converged(self._estimate({'system': batch_failures['system']})['system']):
+                converged = True
+                break
+
+        result = self._estimate(batch_failures)
+        result.update({
+            'n_samples': len(batch_failures['system']) * self.batch_size,
+            'n_batches': len(batch_failures['system']),
+            'converged': converged,
+            'variables': variables
+        })
+        return result
+
+    def _estimate(self, batch_failures: Dict[str, List[int]]) -> Dict[str, Dict[str, float]]:
+        """由各批失效数估计失效概率、估计值变异系数和可靠指标"""
+        statistics = {}
+        for mode, counts in batch_failures.items():
+            counts = np.asarray(counts, dtype=float)
+            n_samples = len(counts) * self.batch_size
+            failures = counts.sum()
+            probability = failures / n_samples
+
+            if failures == 0:
+                cov = np.inf
+            else:
+                # 拉丁超立方的批间方差可能偏小（批数少或各批失效数相同），以二项分布变异系数为下限
+                cov = math.sqrt((1 - probability) / (n_samples * probability))
+                if len(counts) > 1:
+                    variance = (counts / self.batch_size).var(ddof=1) / len(counts)
+                    cov = max(cov, math.sqrt(variance) / probability)
+
+            statistics[mode] = {
+                'failure_probability': probability,
+                'reliability_index': float(-_normal_ppf(probability)) if failures else np.inf,
+                'cov': cov,
+                'failures': int(failures),
+                'n_samples': n_samples
+            }
+        return statistics
+
+    def _is_converged(self, statistic: Dict[str, float]) -> bool:
+        """判断失效概率估计是否满足精度要求"""
+        if statistic['failures'] == 0:
+            # 零失效时失效概率95%置信上限约为 3/n
+            return 3.0 / statistic['n_samples'] < self.min_probability
+        return statistic['failures'] >= self.min_failures and statistic['cov'] <= self.target_cov
@@ -10,6 +10,44 @@ from .boussinesq import BoussinesqCalculator
 from .correction import CorrectionCalculator
 
 
+# 根据JTG D30-2015规范的沉降限值 (单位转换: cm -> mm)
+SETTLEMENT_LIMITS = {
+    "高速公路": {
+        "general_limit": 200,      # 最严格标准：20cm = 200mm
+        "bridge_limit": 150,       # 桥梁工程：15cm = 150mm  
+        "bridge_approach": 80,     # 桥头引道：8cm = 80mm
+        "culvert_passage": 150     # 涵洞通道：15cm = 150mm
+    },
+    "一级公路": {
+        "general_limit": 300,      # 一般路段：30cm = 300mm
+        "bridge_limit": 200,       # 严格要求：20cm = 200mm  
+        "bridge_approach": 100,    # 桥头引道：10cm = 100mm
+        "culvert_passage": 200     # 涵洞通道：20cm = 200mm
+    },
+    "二级公路": {
+        "general_limit": 400,      # 一般路段：40cm = 400mm
+        "bridge_limit": 300,       # 桥梁工程：30cm = 300mm
+        "bridge_approach": 150,    # 桥头引道：15cm = 150mm
+        "culvert_passage": 300     # 涵洞通道：30cm = 300mm
+    },
+    "三级公路": {
+        "general_limit": 500,      # 一般路段：50cm = 500mm
+        "bridge_limit": 400,       # 桥梁工程：40cm = 400mm
+        "bridge_approach": 200,    # 桥头引道：20cm = 200mm
+        "culvert_passage": 400     # 涵洞通道：40cm = 400mm
+    },
+    "四级公路": {
+        "general_limit": 600,      # 最宽松标准：60cm = 600mm
+        "bridge_limit": 500,       # 桥梁工程：50cm = 500mm
+        "bridge_approach": 250,    # 桥头引道：25cm = 250mm
+        "culvert_passage": 500     # 涵洞通道：50cm = 500mm
+    }
+}
+
+# 影响范围阈值 (mm)
+INFLUENCE_THRESHOLD = 5
+
+
 class SettlementCalculator:
     """沉降计算主类"""
     
@@ -175,7 +213,8 @@ class SettlementCalculator:
                     'method': 'Boussinesq理论 + 双桩叠加分析',
                     'standard': 'JTG D30-2015',
                     'correction_applied': True,
-                    'flac3d_calibrated': True,
+                    'flac3d_calibrated': self.correction.coefficients.source == 'FLAC3D',
+                    'correction_version': self.correction.coefficients.version,
                     'pile_interaction': True,
                     'coordinate_system': {
                         'x_axis': '路基横向，中心线为0，负值为左侧，正值为右侧',
@@ -299,51 +338,35 @@ class SettlementCalculator:
     
     def _evaluate_safety(self, calculation_results, road_level):
         """评估工程安全性"""
-        # 根据JTG D30-2015规范的沉降限值 (单位转换: cm -> mm)
-        limit_values = {
-            "高速公路": {
-                "general_limit": 200,      # 最严格标准：20cm = 200mm
-                "bridge_limit": 150,       # 桥梁工程：15cm = 150mm  
-                "bridge_approach": 80,     # 桥头引道：8cm = 80mm
-                "culvert_passage": 150     # 涵洞通道：15cm = 150mm
-            },
-            "一级公路": {
-                "general_limit": 300,      # 一般路段：30cm = 300mm
-                "bridge_limit": 200,       # 严格要求：20cm = 200mm  
-                "bridge_approach": 100,    # 桥头引道：10cm = 100mm
-                "culvert_passage": 200     # 涵洞通道：20cm = 200mm
-            },
-            "二级公路": {
-                "general_limit": 400,      # 一般路段：40cm = 400mm
-                "bridge_limit": 300,       # 桥梁工程：30cm = 300mm
-                "bridge_approach": 150,    # 桥头引道：15cm = 150mm
-                "culvert_passage": 300     # 涵洞通道：30cm = 300mm
-            },
-            "三级公路": {
-                "general_limit": 500,      # 一般路段：50cm = 500mm
-                "bridge_limit": 400,       # 桥梁工程：40cm = 400mm
-                "bridge_approach": 200,    # 桥头引道：20cm = 200mm
-                "culvert_passage": 400     # 涵洞通道：40cm = 400mm
-            },
-            "四级公路": {
-                "general_limit": 600,      # 最宽松标准：60cm = 600mm
-                "bridge_limit": 500,       # 桥梁工程：50cm = 500mm
-                "bridge_approach": 250,    # 桥头引道：25cm = 250mm
-                "culvert_passage": 500     # 涵洞通道：50cm = 500mm
-            }
-        }
+        return self.evaluate_settlement_safety(
+            [r['x'] for r in calculation_results],
+            [r['y'] for r in calculation_results],
+            [r['settlement_mm'] for r in calculation_results],
+            road_level
+        )
+    
+    def evaluate_settlement_safety(self, x, y, settlement_mm, road_level):
+        """
+        按路基沉降限值评估一组计算点的工程安全性（数组运算）
         
+        参数:
+        x, y: 计算点平面坐标数组 (m)
+        settlement_mm: 计算点沉降数组 (mm)
+        road_level: 路线等级
+        
+        返回:
+        安全评估结果字典
+        """
         # 获取当前路线等级的限值，默认使用一级公路标准
-        current_limits = limit_values.get(road_level, limit_values["一级公路"])
+        current_limits = SETTLEMENT_LIMITS.get(road_level, SETTLEMENT_LIMITS["一级公路"])
         
         # 针对桩基础工程，主要考虑桥梁部分，使用严格标准
         general_limit = current_limits["general_limit"]
         bridge_limit = current_limits["bridge_limit"]      # 桩基础按严格标准
         approach_limit = current_limits["bridge_approach"] # 桥头引道标准
         
-        # 检查是否超限
-        settlements_mm = [r['settlement_mm'] for r in calculation_results]
-        max_settlement_mm = max(settlements_mm)
+        settlements_mm = np.asarray(settlement_mm, dtype=float).ravel()
+        max_settlement_mm = float(settlements_mm.max())
         
         # 安全等级判定
         safety_level = "安全"
@@ -377,22 +400,19 @@ class SettlementCalculator:
             recommendations.append("建议按现有设计方案实施")
             recommendations.append("施工过程中加强沉降观测")
         
-        # 影响范围评估
-        influence_points = []
-        warning_points = []
-        danger_points = []
-        
-        for result in calculation_results:
-            settlement = result['settlement_mm']
-            if settlement > 5:  # 5mm作为影响阈值
-                influence_points.append(result)
-            if settlement > approach_limit:
-                warning_points.append(result)
-            if settlement > bridge_limit:
-                danger_points.append(result)
+        # 影响范围评估：按影响阈值、桥头引道限值、桥梁限值分级
+        # 0 安全，1 影响范围内，2 超出桥头引道限值，3 超出桥梁限值
+        category = np.digitize(settlements_mm, [INFLUENCE_THRESHOLD, approach_limit, bridge_limit], right=True)
+        counts = np.bincount(category, minlength=4)
+        influence_count = int(counts[1:].sum())
+        warning_count = int(counts[2:].sum())
+        danger_count = int(counts[3])
         
         # 计算影响范围面积
-        influence_area = self._calculate_influence_area(influence_points)
+        influence = category > 0
+        influence_area = self._calculate_influence_area(
+            np.asarray(x, dtype=float).ravel()[influence], np.asarray(y, dtype=float).ravel()[influence]
+        )
         
         # 详细的工程建议
         if max_settlement_mm > bridge_limit:
@@ -402,7 +422,7 @@ class SettlementCalculator:
                 "评估地基处理方案的必要性"
             ])
         
-        if len(danger_points) > len(calculation_results) * 0.3:  # 超过30%的点超限
+        if danger_count > len(settlements_mm) * 0.3:  # 超过30%的点超限
             recommendations.append("大范围超限，建议全面重新设计基础方案")
         
         # 技术措施建议
@@ -427,14 +447,14 @@ class SettlementCalculator:
             'recommendations': recommendations,
             'technical_recommendations': technical_recommendations,
             'influence_area': influence_area,
-            'influence_points_count': len(influence_points),
-            'warning_points_count': len(warning_points),
-            'danger_points_count': len(danger_points),
+            'influence_points_count': influence_count,
+            'warning_points_count': warning_count,
+            'danger_points_count': danger_count,
             'safety_statistics': {
-                'safe_points': len(calculation_results) - len(influence_points),
-                'influence_points': len(influence_points) - len(warning_points),
-                'warning_points': len(warning_points) - len(danger_points),
-                'danger_points': len(danger_points)
+                'safe_points': int(counts[0]),
+                'influence_points': int(counts[1]),
+                'warning_points': int(counts[2]),
+                'danger_points': danger_count
             },
             'compliance_analysis': {
                 'meets_general_standard': max_settlement_mm <= general_limit,
@@ -444,16 +464,13 @@ class SettlementCalculator:
             }
         }
     
-    def _calculate_influence_area(self, influence_points):
+    def _calculate_influence_area(self, x, y):
         """计算影响范围面积"""
-        if not influence_points:
+        if len(x) == 0:
             return 0
         
         # 简化计算：用最大距离估算影响半径
-        max_distance = 0
-        for point in influence_points:
-            distance = math.sqrt(point['x']**2 + point['y']**2)
-            max_distance = max(max_distance, distance)
+        max_distance = float(np.sqrt(x**2 + y**2).max())
         
         # 影响面积（近似为圆形）
         influence_area = math.pi * max_distance**2
@@ -481,6 +498,100 @@ class SettlementCalculator:
             'levels': np.linspace(min(settlements), max(settlements), 10)
         } 
     
+    def calculate_settlement_field(self, params, x, z, y=0.0):
+        """
+        沉降场：在任意计算点上直接求闭合解（向量化，与 calculate_settlement 逐点结果一致）
+
+        参数:
+        params: 计算参数字典（同 calculate_settlement）
+        x: 横向坐标数组 (m)
+        z: 深度数组 (m)，与 x 可广播
+        y: 路线方向坐标 (m)，缺省为桩所在断面
+
+        返回:
+        settlement_mm: 总沉降数组 (mm)，形状为 x、z 广播后的形状
+        """
+        raw, interaction_factor = self.calculate_pile_fields(params, x, z, y)
+        pile1 = params['pile1']
+        pile2 = params['pile2']
+
+        settlement1 = raw[..., 0] * self.correction.calculate_combined_correction(pile1['length'], pile1['diameter'])
+        settlement2 = raw[..., 1] * self.correction.calculate_combined_correction(pile2['length'], pile2['diameter'])
+
+        return (settlement1 + settlement2) * interaction_factor * 1000
+
+    def calculate_pile_fields(self, params, x, z, y=0.0):
+        """
+        两桩各自作用下的Boussinesq沉降场（未乘修正系数及桩间相互作用系数）
+
+        参数:
+        params: 计算参数字典（同 calculate_settlement）
+        x: 横向坐标数组 (m)
+        z: 深度数组 (m)，与 x 可广播
+        y: 路线方向坐标 (m)，缺省为桩所在断面
+
+        返回:
+        (raw, interaction_factor): raw 为桩1、桩2沉降数组，形状为广播后的形状 + (2,) (m)；
+        interaction_factor 为桩间相互作用系数
+        """
+        self._validate_parameters(params)
+        pile1 = params['pile1']
+        pile2 = params['pile2']
+        road_params = params['road_params']
+
+        x, y, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+                                      np.asarray(z, dtype=float))
+        E, nu = self._soil_properties_field(params['soil_layers'], z)
+        G = self.boussinesq.calculate_shear_modulus(E, nu)
+
+        pile1_x, pile1_y = self._get_pile_position(1, road_params)
+        pile2_x, pile2_y = self._get_pile_position(2, road_params)
+
+        raw = np.stack([
+            self.boussinesq.calculate_settlement_array(pile1['load'], G, x - pile1_x, y - pile1_y, z, nu),
+            self.boussinesq.calculate_settlement_array(pile2['load'], G, x - pile2_x, y - pile2_y, z, nu)
+        ], axis=-1)
+
+        pile_spacing = math.sqrt((pile2_x - pile1_x)**2 + (pile2_y - pile1_y)**2)
+        interaction_factor = self._calculate_pile_interaction(pile_spacing, pile1['diameter'], pile2['diameter'])
+
+        return raw, interaction_factor
+
+    def soil_layer_index(self, soil_layers, depth):
+        """
+        各深度所在土层的序号（向量化的 _get_soil_properties_at_depth 查找规则：
+        分界深度处取靠前的土层，不在任何土层范围内时取最后一层）
+
+        参数:
+        soil_layers: 土层参数列表
+        depth: 深度数组 (m)
+
+        返回:
+        index: 与 depth 同形状的整数数组
+        """
+        depth = np.asarray(depth, dtype=float)
+        index = np.full(depth.shape, len(soil_layers) - 1)
+
+        # 逆序赋值，使靠前的土层在分界深度处优先
+        for i in range(len(soil_layers) - 1, -1, -1):
+            depth_range = soil_layers[i]['depth_range']
+            if '-' in depth_range:
+                depth_start, depth_end = map(float, depth_range.split('-'))
+                index[(depth >= depth_start) & (depth <= depth_end)] = i
+        return index
+
+    def _soil_properties_field(self, soil_layers, depth):
+        """
+        各深度处的土层压缩模量和泊松比（向量化的 _get_soil_properties_at_depth）
+
+        返回:
+        (E, nu): 与 depth 同形状的数组
+        """
+        index = self.soil_layer_index(soil_layers, depth)
+        E = np.array([float(layer['compression_modulus']) for layer in soil_layers])[index]
+        nu = np.array([float(layer['poisson_ratio']) for layer in soil_layers])[index]
+        return E, nu
+
     def _get_16_standard_points(self, road_params):
         """获取16个标准计算点（按工程示意图合理分布）"""
         import numpy as np
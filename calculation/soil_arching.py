@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+土拱效应计算模块
+按Terzaghi卸荷拱理论计算分层覆土作用于管顶的竖向土压力，支持多管线、多埋深批量计算
+"""
+
+import numpy as np
+from typing import Dict, List, Any, Sequence
+
+from .parameter_database import get_parameter_database
+
+
+class SoilArchingCalculator:
+    """Terzaghi土拱效应计算器"""
+
+    def __init__(self, deep_cover_ratio: float = 1.0, min_column_ratio: float = 1.0):
+        """
+        初始化计算器
+
+        Args:
+            deep_cover_ratio: 深埋判定系数，覆土深度 ≥ 系数 × 管外径时考虑土拱效应
+            min_column_ratio: 最小土柱高度系数，土拱压力不小于管顶土层 γ × 系数 × 管外径
+        """
+        self.deep_cover_ratio = deep_cover_ratio
+        self.min_column_ratio = min_column_ratio
+        self.parameters = get_parameter_database()
+
+    def calculate_arching_width(self, pipe_diameter, friction_angle) -> np.ndarray:
+        """
+        计算管顶土拱宽度
+
+        公式 (CECS 246-2008)：Bt = D × [1 + tan(45° - φ/2)]
+
+        Args:
+            pipe_diameter: 管外径 (m)
+            friction_angle: 管顶土层内摩擦角 (度)
+
+        Returns:
+            np.ndarray: 土拱宽度 (m)
+        """
+        phi = np.radians(np.asarray(friction_angle, dtype=float))
+        return np.asarray(pipe_diameter, dtype=float) * (1 + np.tan(np.pi / 4 - phi / 2))
+
+    def calculate_crown_pressure(self, thickness, unit_weight, cohesion, friction_angle,
+                                 arching_width, surcharge=0.0) -> np.ndarray:
+        """
+        计算分层覆土的管顶竖向土压力（向量化）
+
+        每层按Terzaghi公式由上往下递推：
+        σ底 = (γ·Bt - 2c)/(2Kμ) × (1 - e^(-2Kμh/Bt)) + σ顶 × e^(-2Kμh/Bt)
+        K = tan²(45° - φ/2)，μ = tanφ；φ = 0 时取极限 σ底 = σ顶 + (γ - 2c/Bt)·h
+
+        土层参数最后一维为土层（自上而下），其余维度与arching_width广播；
+        层数不同的剖面可用零厚度土层补齐
+
+        Args:
+            thickness: 土层厚度 (m)，形状 (..., n_layers)
+            unit_weight: 土层重度 (kN/m³)
+            cohesion: 土层黏聚力 (kPa)
+            friction_angle: 土层内摩擦角 (度)
+            arching_width: 土拱宽度 (m)，形状 (...)
+            surcharge: 地表超载 (kPa)
+
+        Returns:
+            np.ndarray: 管顶竖向土压力 (kPa)，形状 (...)
+        """
+        thickness = np.asarray(thickness, dtype=float)
+        unit_weight = np.asarray(unit_weight, dtype=float)
+        cohesion = np.asarray(cohesion, dtype=float)
+        phi = np.radians(np.asarray(friction_angle, dtype=float))
+
+        thickness, unit_weight, cohesion, phi = np.broadcast_arrays(thickness, unit_weight, cohesion, phi)
+        width = np.asarray(arching_width, dtype=float)
+
+        # 侧压力系数与摩擦系数的乘积 Kμ
+        k_mu = np.tan(np.pi / 4 - phi / 2)**2 * np.tan(phi)
+
+        sigma = np.zeros(np.broadcast(thickness[..., 0], width).shape) + np.asarray(surcharge, dtype=float)
+
+        for layer in range(thickness.shape[-1]):
+            h = thickness[..., layer]
+            gamma = unit_weight[..., layer]
+            c = cohesion[..., layer]
+            km = k_mu[..., layer]
+
+            # 净荷载项 γ - 2c/Bt
+            net_load = gamma - 2 * c / width
+
+            # 指数项 x = 2Kμh/Bt，(1 - e^-x)/(2Kμ/Bt) 在Kμ→0时趋于h
+            x = 2 * km * h / width
+            decay = np.exp(-x)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                arching_depth = np.where(x > 1e-12, -np.expm1(-x) * width / (2 * km), h)
+
+            sigma = np.maximum(net_load * arching_depth + sigma * decay, 0.0)
+
+        return sigma
+
+    def calculate_overburden_pressure(self, thickness, unit_weight, surcharge=0.0) -> np.ndarray:
+        """
+        计算全覆土压力 Pv = Σγh + q
+
+        Args:
+            thickness: 土层厚度 (m)，形状 (..., n_layers)
+            unit_weight: 土层重度 (kN/m³)
+            surcharge: 地表超载 (kPa)
+
+        Returns:
+            np.ndarray: 全覆土压力 (kPa)
+        """
+        thickness = np.asarray(thickness, dtype=float)
+        unit_weight = np.asarray(unit_weight, dtype=float)
+        return np.sum(thickness * unit_weight, axis=-1) + np.asarray(surcharge, dtype=float)
+
+    def calculate_vertical_pressure(self, thickness, unit_weight, cohesion, friction_angle,
+                                    pipe_diameter, surcharge=0.0) -> Dict[str, np.ndarray]:
+        """
+        计算管顶竖向土压力（深埋考虑土拱效应，浅埋取全覆土压力）
+
+        黏聚力较大时土拱公式可能给出零压力，此时按最小土柱高度取下限
+
+        Args:
+            thickness, unit_weight, cohesion, friction_angle: 土层参数，形状 (..., n_layers)
+            pipe_diameter: 管外径 (m)，形状 (...)
+            surcharge: 地表超载 (kPa)
+
+        Returns:
+            Dict: 竖向土压力、全覆土压力、土拱宽度及是否按深埋计算
+        """
+        thickness = np.asarray(thickness, dtype=float)
+        friction_angle = np.asarray(friction_angle, dtype=float)
+        pipe_diameter = np.asarray(pipe_diameter, dtype=float)
+
+        # 土拱宽度按管顶所在土层（最下一层非零厚度土层）的内摩擦角计算
+        crown_layer = self._get_crown_layer_index(thickness)[..., np.newaxis]
+        crown_friction_angle = np.take_along_axis(
+            np.broadcast_to(friction_angle, thickness.shape), crown_layer, axis=-1
+        )[..., 0]
+        crown_unit_weight = np.take_along_axis(
+            np.broadcast_to(np.asarray(unit_weight, dtype=float), thickness.shape), crown_layer, axis=-1
+        )[..., 0]
+        arching_width = self.calculate_arching_width(pipe_diameter, crown_friction_angle)
+
+        overburden = self.calculate_overburden_pressure(thickness, unit_weight, surcharge)
+        arching = self.calculate_crown_pressure(thickness, unit_weight, cohesion, friction_angle,
+                                                arching_width, surcharge)
+
+        cover_depth = np.sum(thickness, axis=-1)
+        deep_cover = cover_depth >= self.deep_cover_ratio * pipe_diameter
+        min_pressure = crown_unit_weight * self.min_column_ratio * pipe_diameter
+        arching = np.minimum(np.maximum(arching, min_pressure), overburden)
+        vertical_pressure = np.where(deep_cover, arching, overburden)
+
+        return {
+            'vertical_pressure': vertical_pressure,
+            'overburden_pressure': overburden,
+            'arching_width': arching_width,
+            'deep_cover': deep_cover
+        }
+
+    def build_layer_arrays(self, profiles: Sequence[List[Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+        """
+        将多条覆土剖面整理为补齐的土层参数数组
+
+        每个土层为字典 {'thickness', 'soil_type'}，可用 'unit_weight'、'cohesion'、
+        'friction_angle' 覆盖参数数据库中的值
+
+        Args:
+            profiles: 覆土剖面列表，每个剖面为自上而下的土层列表
+
+        Returns:
+            Dict: thickness、unit_weight、cohesion、friction_angle 数组，形状 (n_profiles, n_layers)
+        """
+        soils = self.parameters.soils
+        n_profiles = len(profiles)
+        n_layers = max((len(profile) for profile in profiles), default=0)
+        n_layers = max(n_layers, 1)
+
+        thickness = np.zeros((n_profiles, n_layers))
+        soil_names = np.full((n_profiles, n_layers), soils.default, dtype=object)
+        overrides = {field: np.full((n_profiles, n_layers), np.nan)
+                     for field in ('unit_weight', 'cohesion', 'friction_angle')}
+
+        for i, profile in enumerate(profiles):
+            for j, layer in enumerate(profile):
+                thickness[i, j] = layer['thickness']
+                soil_names[i, j] = layer.get('soil_type', soils.default)
+                for field, values in overrides.items():
+                    if layer.get(field) is not None:
+                        values[i, j] = layer[field]
+
+        codes = soils.encode(soil_names)
+        arrays = {'thickness': thickness}
+        for field, values in overrides.items():
+            arrays[field] = np.where(np.isnan(values), soils.lookup(codes, field), values)
+
+        return arrays
+
+    def calculate_profile_pressures(self, profiles: Sequence[List[Dict[str, Any]]], pipe_diameter,
+                                    surcharge=0.0) -> Dict[str, np.ndarray]:
+        """
+        批量计算多条覆土剖面的管顶竖向土压力
+
+        Args:
+            profiles: 覆土剖面列表
+            pipe_diameter: 管外径 (m)，标量或与剖面数一致的数组
+            surcharge: 地表超载 (kPa)
+
+        Returns:
+            Dict: 同 calculate_vertical_pressure
+        """
+        arrays = self.build_layer_arrays(profiles)
+        return self.calculate_vertical_pressure(
+            arrays['thickness'], arrays['unit_weight'], arrays['cohesion'],
+            arrays['friction_angle'], pipe_diameter, surcharge
+        )
+
+    def _get_crown_layer_index(self, thickness: np.ndarray) -> np.ndarray:
+        """获取最下一层非零厚度土层的序号"""
+        n_layers = thickness.shape[-1]
+        has_thickness = thickness > 0
+        last_index = n_layers - 1 - np.argmax(has_thickness[..., ::-1], axis=-1)
+        return np.where(has_thickness.any(axis=-1), last_index, 0)
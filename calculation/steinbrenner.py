@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+有限厚度土层沉降计算模块
+按Steinbrenner法计算刚性下卧层（基岩）以上分层土的沉降：
+各土层沉降取该层顶面与底面的半无限空间位移之差，避免Boussinesq半无限空间解在基岩较浅时高估沉降。
+矩形均布荷载采用Steinbrenner影响系数闭合解，集中荷载采用Boussinesq竖向位移差，均为向量化计算
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+
+class SteinbrennerCalculator:
+    """Steinbrenner有限土层沉降计算器"""
+
+    def __init__(self):
+        """初始化计算器"""
+        pass
+
+    def parse_layers(self, soil_layers: List[Dict[str, Any]], rigid_depth: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        解析土层参数为数组
+
+        Args:
+            soil_layers: 土层参数列表，每层含 depth_range ('0-5')、compression_modulus (MPa)、poisson_ratio
+            rigid_depth: 刚性下卧层顶面深度 (m)，缺省取最后一层底面；其下土层不计
+
+        Returns:
+            Dict: 'top'、'bottom'、'modulus'、'poisson_ratio' 数组
+        """
+        if not soil_layers:
+            raise ValueError("至少需要一个土层")
+
+        top, bottom = [], []
+        for i, layer in enumerate(soil_layers):
+            depth_range = str(layer['depth_range'])
+            if '-' not in depth_range:
+                raise ValueError(f"第{i+1}层土的深度范围格式应为 '起始-终止'")
+            depth_start, depth_end = map(float, depth_range.split('-'))
+            if depth_end <= depth_start:
+                raise ValueError(f"第{i+1}层土的深度范围无效: {depth_range}")
+            top.append(depth_start)
+            bottom.append(depth_end)
+
+        top, bottom = np.array(top), np.array(bottom)
+        if rigid_depth is not None:
+            bottom = np.minimum(bottom, rigid_depth)
+            top = np.minimum(top, rigid_depth)
+
+        return {
+            'top': top,
+            'bottom': bottom,
+            'modulus': np.array([layer['compression_modulus'] for layer in soil_layers], dtype=float),
+            'poisson_ratio': np.array([layer['poisson_ratio'] for layer in soil_layers], dtype=float)
+        }
+
+    def influence_factors(self, length_ratio, depth_ratio):
+        """
+        Steinbrenner影响系数（矩形均布荷载角点，土层厚度 H 以下为刚性层）
+
+        F1 = 1/π·[M·ln((1+√(M²+1))·√(M²+N²) / (M·(1+√(M²+N²+1)))) + ln((M+√(M²+1))·√(1+N²) / (M+√(M²+N²+1)))]
+        F2 = N/(2π)·arctan(M / (N·√(M²+N²+1)))
+
+        Args:
+            length_ratio: M = L/B
+            depth_ratio: N = H/B
+
+        Returns:
+            tuple: (F1, F2)
+        """
+        M = np.asarray(length_ratio, dtype=float)
+        N = np.asarray(depth_ratio, dtype=float)
+        M2, N2 = M**2, N**2
+        root_m = np.sqrt(M2 + 1)
+        root_mn = np.sqrt(M2 + N2)
+        root_all = np.sqrt(M2 + N2 + 1)
+
+        F1 = (M * np.log((1 + root_m) * root_mn / (M * (1 + root_all)))
+              + np.log((M + root_m) * np.sqrt(1 + N2) / (M + root_all))) / np.pi
+        F2 = N / (2 * np.pi) * np.arctan2(M, N * root_all)
+        return F1, F2
+
+    def rectangle_factors(self, x, y, width, length, depth):
+        """
+        矩形均布荷载下计算点的影响系数（角点法叠加，计算点可在矩形外）
+
+        Args:
+            x, y: 计算点相对矩形中心的坐标 (m)，x 沿宽度方向
+            width, length: 矩形荷载宽度、长度 (m)
+            depth: 计算深度（自荷载面起）(m)
+
+        Returns:
+            tuple: (B·F1, B·F2) 的叠加值 (m)，沉降 = q/E·[(1-ν²)·第一项 + (1-ν-2ν²)·第二项]
+        """
+        x, y, depth = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (x, y, depth)))
+        total1 = np.zeros(x.shape)
+        total2 = np.zeros(x.shape)
+
+        for a, sign_a in ((width / 2 - x, 1), (-width / 2 - x, -1)):
+            for b, sign_b in ((length / 2 - y, 1), (-length / 2 - y, -1)):
+                sign = sign_a * sign_b * np.sign(a) * np.sign(b)
+                short = np.minimum(np.abs(a), np.abs(b))
+                long = np.maximum(np.abs(a), np.abs(b))
+                loaded = short > 0
+                short = np.where(loaded, short, 1.0)
+
+                F1, F2 = self.influence_factors(long / short, depth / short)
+                total1 += np.where(loaded, sign * short * F1, 0.0)
+                total2 += np.where(loaded, sign * short * F2, 0.0)
+
+        return total1, total2
+
+    def calculate_rectangle_settlement(self, q, width, length, soil_layers, x=0.0, y=0.0,
+                                       load_depth=0.0, rigid_depth=None):
+        """
+        计算矩形均布荷载下有限厚度分层土的地面沉降
+
+        Args:
+            q: 均布荷载 (kPa)
+            width, length: 荷载面宽度、长度 (m)
+            soil_layers: 土层参数列表
+            x, y: 计算点相对荷载中心的坐标 (m)，可为数组
+            load_depth: 荷载作用面深度（基础埋深）(m)，其上土层不计
+            rigid_depth: 刚性下卧层顶面深度 (m)
+
+        Returns:
+            np.ndarray: 沉降 (m)
+        """
+        layers = self.parse_layers(soil_layers, rigid_depth)
+        top = np.maximum(layers['top'], load_depth) - load_depth
+        bottom = np.maximum(layers['bottom'], load_depth) - load_depth
+        modulus = layers['modulus'] * 1000  # MPa转kPa
+        nu = layers['poisson_ratio']
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        shape = np.broadcast(x, y).shape
+        boundaries = np.concatenate([top, bottom])[(slice(None),) + (np.newaxis,) * len(shape)]
+        factor1, factor2 = self.rectangle_factors(x, y, width, length, boundaries)
+        n_layers = len(top)
+        delta1 = factor1[n_layers:] - factor1[:n_layers]
+        delta2 = factor2[n_layers:] - factor2[:n_layers]
+
+        weight1 = ((1 - nu**2) / modulus)[(slice(None),) + (np.newaxis,) * len(shape)]
+        weight2 = ((1 - nu - 2 * nu**2) / modulus)[(slice(None),) + (np.newaxis,) * len(shape)]
+        return q * (weight1 * delta1 + weight2 * delta2).sum(axis=0)
+
+    def calculate_point_settlement(self, P, soil_layers, x, y, z=0.0, rigid_depth=None):
+        """
+        计算表面集中力作用下有限厚度分层土的竖向位移
+
+        各层取 Boussinesq 竖向位移 ω(z_顶) - ω(z_底)，计算点以上土层不计
+
+        Args:
+            P: 集中力 (kN)
+            soil_layers: 土层参数列表
+            x, y, z: 计算点坐标 (m)，荷载作用点为原点，可为数组
+            rigid_depth: 刚性下卧层顶面深度 (m)
+
+        Returns:
+            np.ndarray: 竖向位移 (m)
+        """
+        layers = self.parse_layers(soil_layers, rigid_depth)
+        x, y, z = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (x, y, z)))
+        expand = (slice(None),) + (np.newaxis,) * x.ndim
+
+        top = np.maximum(layers['top'][expand], z)
+        bottom = np.maximum(layers['bottom'][expand], z)
+        nu = layers['poisson_ratio'][expand]
+        G = layers['modulus'][expand] / (2 * (1 + nu)) * 1e6  # MPa转Pa
+        horizontal2 = x**2 + y**2
+
+        def omega(depth):
+            R2 = horizontal2 + depth**2
+            R = np.sqrt(np.where(R2 > 0, R2, 1.0))
+            return np.where(R2 > 0, depth**2 / (R2 * R) + 2 * (1 - nu) / R, 0.0)
+
+        return (P * 1000 / (4 * np.pi * G) * (omega(top) - omega(bottom))).sum(axis=0)
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础批量验算模块
+从塔位表（CSV/Excel）分块读取塔位参数，向量化完成地基承载力、抗倾覆、抗滑移验算，
+输出按危险程度排序的控制塔位表
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, Optional, Callable, Tuple
+
+from .tower_calculator import TowerCalculator
+
+
+# 塔位参数及缺省值（与 TowerCalculator 各验算方法的缺省值一致）
+DEFAULT_SITE_VALUES = {
+    'tower_load': 500.0,        # kN
+    'horizontal_force': 50.0,   # kN
+    'force_height': 15.0,       # m
+    'base_weight': 200.0,       # kN
+    'base_width': 2.0,          # m
+    'base_length': 3.0,         # m
+    'embedment_depth': 1.5,     # m
+}
+
+# 输出表列名
+RESULT_COLUMN_NAMES = {
+    'rank': '排序',
+    'site_id': '塔位编号',
+    'soil_type': '土质类型',
+    'base_width': '基础宽度(m)',
+    'base_length': '基础长度(m)',
+    'embedment_depth': '基础埋深(m)',
+    'corrected_bearing_capacity': '修正承载力(kPa)',
+    'normal_max_base_pressure': '正常工况最大基底压力(kPa)',
+    'extreme_max_base_pressure': '极端工况最大基底压力(kPa)',
+    'normal_overturning_safety_factor': '正常工况抗倾覆安全系数',
+    'extreme_overturning_safety_factor': '极端工况抗倾覆安全系数',
+    'normal_sliding_safety_factor': '正常工况抗滑移安全系数',
+    'extreme_sliding_safety_factor': '极端工况抗滑移安全系数',
+    'bearing_ratio': '承载力利用率',
+    'overturning_ratio': '抗倾覆利用率',
+    'sliding_ratio': '抗滑移利用率',
+    'critical_ratio': '控制利用率',
+    'governing_check': '控制验算项',
+    'overall_safe': '是否满足',
+}
+
+CHECK_NAMES = np.array(['地基承载力', '抗倾覆', '抗滑移'], dtype=object)
+
+
+class TowerBatchCalculator:
+    """电线塔基础批量验算类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None):
+        """
+        初始化批量验算器
+
+        Args:
+            tower_calculator: 单塔计算器，提供安全系数要求和土质参数
+        """
+        self.tower_calculator = tower_calculator or TowerCalculator()
+        self.parameters = self.tower_calculator.parameters
+        self.safety_factors = self.tower_calculator.safety_factors
+        self.base_pressure_solver = self.tower_calculator.base_pressure_solver
+
+    def calculate_bearing_capacity(self, soil_codes, base_width, embedment_depth) -> np.ndarray:
+        """
+        向量化计算修正后的地基承载力
+
+        公式：fa = fak + ηb×γ×(b-3) + ηd×γm×(d-0.5)
+
+        Args:
+            soil_codes: 土质编码数组
+            base_width: 基础宽度 (m)
+            embedment_depth: 基础埋深 (m)
+
+        Returns:
+            np.ndarray: 修正后的地基承载力 (kPa)
+        """
+        soils = self.parameters.soils
+        fak = soils.lookup(soil_codes, 'bearing_capacity')
+        gamma = soils.lookup(soil_codes, 'unit_weight')
+        eta_b = soils.lookup(soil_codes, 'width_correction')
+        eta_d = soils.lookup(soil_codes, 'depth_correction')
+
+        return fak + eta_b * gamma * np.maximum(0, np.asarray(base_width) - 3) + \
+            eta_d * gamma * np.maximum(0, np.asarray(embedment_depth) - 0.5)
+
+    def calculate_base_pressure(self, tower_load, horizontal_force, force_height, base_weight,
+                                base_width, base_length) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        向量化计算基底压力
+
+        公式：e ≤ B/6 时 Pmax,min = (N+G)/A ± M/W，e > B/6 时按基底部分脱开计算
+
+        Returns:
+            Tuple: (最大压力, 最小压力, 平均压力) (kPa)，基底受压面积比
+        """
+        pressure = self.base_pressure_solver.solve(
+            tower_load + base_weight, horizontal_force * force_height, 0.0, base_width, base_length
+        )
+
+        return (pressure['max_pressure'], pressure['min_pressure'], pressure['average_pressure'],
+                pressure['contact_ratio'])
+
+    def calculate_overturning_stability(self, tower_load, horizontal_force, force_height, base_weight,
+                                        base_width) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        向量化计算抗倾覆稳定性
+
+        公式：K = M抗 / M倾
+
+        Returns:
+            Tuple: (抗倾覆力矩, 倾覆力矩, 安全系数)
+        """
+        resistance_moment = (tower_load + base_weight) * (base_width / 2)
+        overturning_moment = horizontal_force * force_height
+        safety_factor = self._safe_ratio(resistance_moment, overturning_moment)
+
+        return resistance_moment, overturning_moment, safety_factor
+
+    def calculate_sliding_stability(self, soil_codes, tower_load, horizontal_force,
+                                    base_weight) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        向量化计算抗滑移稳定性
+
+        公式：Kh = μ(N+G) / H
+
+        Returns:
+            Tuple: (抗滑移力, 滑移力, 安全系数)
+        """
+        friction_coefficient = self.parameters.soils.lookup(soil_codes, 'friction_coefficient')
+        resistance_force = (tower_load + base_weight) * friction_coefficient
+        sliding_force = np.asarray(horizontal_force, dtype=float)
+        safety_factor = self._safe_ratio(resistance_force, sliding_force)
+
+        return resistance_force, sliding_force, safety_factor
+
+    def evaluate_sites(self, sites: Dict[str, np.ndarray], load_case: str = 'normal') -> Dict[str, np.ndarray]:
+        """
+        向量化计算一组塔位的基础稳定性
+
+        Args:
+            sites: 塔位参数数组字典（见 prepare_sites）
+            load_case: 荷载工况 ('normal' 或 'extreme')
+
+        Returns:
+            Dict: 与 TowerFoundationCalculation 字段同名的结果数组及基底受压面积比
+        """
+        soil_codes = sites['soil_code']
+        tower_load = sites['tower_load']
+        horizontal_force = sites['horizontal_force']
+        force_height = sites['force_height']
+        base_weight = sites['base_weight']
+        base_width = sites['base_width']
+        base_length = sites['base_length']
+
+        bearing_capacity = self.calculate_bearing_capacity(soil_codes, base_width, sites['embedment_depth'])
+        max_pressure, min_pressure, avg_pressure, contact_ratio = self.calculate_base_pressure(
+            tower_load, horizontal_force, force_height, base_weight, base_width, base_length
+        )
+        resistance_moment, overturning_moment, overturning_factor = self.calculate_overturning_stability(
+            tower_load, horizontal_force, force_height, base_weight, base_width
+        )
+        resistance_force, sliding_force, sliding_factor = self.calculate_sliding_stability(
+            soil_codes, tower_load, horizontal_force, base_weight
+        )
+
+        overturning_required = self.safety_factors[f'overturning_{load_case}']
+        sliding_required = self.safety_factors[f'sliding_{load_case}']
+
+        return {
+            'corrected_bearing_capacity': bearing_capacity,
+            'max_base_pressure': max_pressure,
+            'min_base_pressure': min_pressure,
+            'average_base_pressure': avg_pressure,
+            'base_contact_ratio': contact_ratio,
+            'overturning_resistance_moment': resistance_moment,
+            'overturning_moment': overturning_moment,
+            'overturning_safety_factor': overturning_factor,
+            'sliding_resistance_force': resistance_force,
+            'sliding_force': sliding_force,
+            'sliding_safety_factor': sliding_factor,
+            'bearing_check': (max_pressure <= bearing_capacity) & (min_pressure >= 0),
+            'overturning_check': overturning_factor >= overturning_required,
+            'sliding_check': sliding_factor >= sliding_required
+        }
+
+    def evaluate_comprehensive(self, sites: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        向量化计算正常使用和极端工况，并给出各验算项利用率
+
+        利用率 = 作用/抗力（承载力）或 要求安全系数/实际安全系数，取两种工况的较大值，>1 表示不满足
+
+        Args:
+            sites: 塔位参数数组字典
+
+        Returns:
+            Dict: normal_/extreme_ 前缀的工况结果、各项利用率、控制验算项及是否满足
+        """
+        factor = self.tower_calculator.extreme_load_factor
+        extreme_sites = dict(sites)
+        extreme_sites['tower_load'] = sites['tower_load'] * factor
+        extreme_sites['horizontal_force'] = sites['horizontal_force'] * factor
+
+        cases = {
+            'normal': self.evaluate_sites(sites, 'normal'),
+            'extreme': self.evaluate_sites(extreme_sites, 'extreme')
+        }
+
+        result = {}
+        for case_name, case in cases.items():
+            for key, values in case.items():
+                result[f'{case_name}_{key}'] = values
+
+        ratios = []
+        for check in ('overturning', 'sliding'):
+            ratios.append(np.maximum.reduce([
+                self.safety_factors[f'{check}_{case_name}'] /
+                case[f'{check}_safety_factor']
+                for case_name, case in cases.items()
+            ]))
+        bearing_ratio = np.maximum.reduce([
+            case['max_base_pressure'] / case['corrected_bearing_capacity'] for case in cases.values()
+        ])
+        ratio_matrix = np.stack([bearing_ratio] + ratios, axis=-1)
+
+        normal = cases['normal']
+        result.update({
+            'corrected_bearing_capacity': normal['corrected_bearing_capacity'],
+            'bearing_ratio': bearing_ratio,
+            'overturning_ratio': ratios[0],
+            'sliding_ratio': ratios[1],
+            'critical_ratio': ratio_matrix.max(axis=-1),
+            'governing_check': CHECK_NAMES[ratio_matrix.argmax(axis=-1)],
+            # 与 calculate_comprehensive_stability 一致，按正常使用工况判定
+            'overall_safe': normal['bearing_check'] & normal['overturning_check'] & normal['sliding_check']
+        })
+        return result
+
+    def prepare_sites(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        将塔位表整理为参数数组，缺失列或空值取缺省值
+
+        Args:
+            frame: 塔位表，列名与单塔计算参数一致，可含 site_id、soil_type
+
+        Returns:
+            Dict: 参数数组字典（含土质编码 soil_code）
+        """
+        n_sites = len(frame)
+        sites = {}
+        for key, default in DEFAULT_SITE_VALUES.items():
+            if key in frame.columns:
+                values = pd.to_numeric(frame[key], errors='coerce').to_numpy(dtype=float)
+                sites[key] = np.where(np.isnan(values), default, values)
+            else:
+                sites[key] = np.full(n_sites, default)
+
+        soils = self.parameters.soils
+        if 'soil_type' in frame.columns:
+            soil_types = frame['soil_type'].where(frame['soil_type'].notna(), soils.default).astype(str).to_numpy()
+        else:
+            soil_types = np.full(n_sites, soils.default, dtype=object)
+        sites['soil_type'] = soil_types
+        sites['soil_code'] = soils.encode(soil_types)
+
+        return sites
+
+    def read_site_chunks(self, input_path: str, chunksize: int = 5000) -> Iterator[pd.DataFrame]:
+        """
+        分块读取塔位表
+
+        Args:
+            input_path: CSV 或 Excel 文件路径
+            chunksize: 每块塔位数
+
+        Yields:
+            pd.DataFrame: 塔位表分块
+        """
+        extension = os.path.splitext(input_path)[1].lower()
+
+        if extension in ('.xlsx', '.xlsm'):
+            import openpyxl
+
+            workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                header = [str(name).strip() if name is not None else '' for name in next(rows, [])]
+                buffer = []
+                for row in rows:
+                    if row is None or all(value is None for value in row):
+                        continue
+                    buffer.append(row[:len(header)])
+                    if len(buffer) >= chunksize:
+                        yield pd.DataFrame(buffer, columns=header)
+                        buffer = []
+                if buffer:
+                    yield pd.DataFrame(buffer, columns=header)
+            finally:
+                workbook.close()
+        else:
+            for chunk in pd.read_csv(input_path, chunksize=chunksize, encoding='utf-8-sig'):
+                chunk.columns = [str(name).strip() for name in chunk.columns]
+                yield chunk
+
+    def evaluate_site_table(self, input_path: str, output_path: Optional[str] = None,
+                            chunksize: int = 5000, top_n: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int], None]] = None) -> pd.DataFrame:
+        """
+        批量验算塔位表并输出控制塔位排序表
+
+        Args:
+            input_path: 塔位表路径 (CSV/Excel)
+            output_path: 排序表输出路径 (.csv/.xlsx)，None 时不写文件
+            chunksize: 每块塔位数
+            top_n: 只保留利用率最高的前 N 个塔位，None 时保留全部
+            progress_callback: 进度回调，参数为已处理塔位数
+
+        Returns:
+            pd.DataFrame: 按控制利用率降序排列的塔位表
+        """
+        ranked = None
+        processed = 0
+
+        for chunk in self.read_site_chunks(input_path, chunksize):
+            sites = self.prepare_sites(chunk)
+            result = self.evaluate_comprehensive(sites)
+
+            if 'site_id' in chunk.columns:
+                site_ids = chunk['site_id'].astype(str).to_numpy()
+            else:
+                site_ids = np.arange(processed + 1, processed + len(chunk) + 1).astype(str)
+
+            summary = pd.DataFrame({
+                'site_id': site_ids,
+                'soil_type': sites['soil_type'],
+                'base_width': sites['base_width'],
+                'base_length': sites['base_length'],
+                'embedment_depth': sites['embedment_depth'],
+                'corrected_bearing_capacity': result['corrected_bearing_capacity'],
+                'normal_max_base_pressure': result['normal_max_base_pressure'],
+                'extreme_max_base_pressure': result['extreme_max_base_pressure'],
+                'normal_overturning_safety_factor': result['normal_overturning_safety_factor'],
+                'extreme_overturning_safety_factor': result['extreme_overturning_safety_factor'],
+                'normal_sliding_safety_factor': result['normal_sliding_safety_factor'],
+                'extreme_sliding_safety_factor': result['extreme_sliding_safety_factor'],
+                'bearing_ratio': result['bearing_ratio'],
+                'overturning_ratio': result['overturning_ratio'],
+                'sliding_ratio': result['sliding_ratio'],
+                'critical_ratio': result['critical_ratio'],
+                'governing_check': result['governing_check'],
+                'overall_safe': result['overall_safe'],
+            })
+
+            ranked = summary if ranked is None else pd.concat([ranked, summary], ignore_index=True)
+            if top_n is not None and len(ranked) > top_n:
+                ranked = ranked.nlargest(top_n, 'critical_ratio')
+
+            processed += len(chunk)
+            if progress_callback:
+                progress_callback(processed)
+
+        if ranked is None:
+            ranked = pd.DataFrame(columns=[key for key in RESULT_COLUMN_NAMES if key != 'rank'])
+
+        ranked = ranked.sort_values('critical_ratio', ascending=False, kind='mergesort').reset_index(drop=True)
+        ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+
+        if output_path:
+            self.write_ranked_table(ranked, output_path)
+
+        return ranked
+
+    def write_ranked_table(self, ranked: pd.DataFrame, output_path: str):
+        """
+        写出控制塔位排序表（中文表头）
+
+        Args:
+            ranked: evaluate_site_table 返回的排序表
+            output_path: 输出路径 (.csv/.xlsx)
+        """
+        table = ranked.rename(columns=RESULT_COLUMN_NAMES)
+        table[RESULT_COLUMN_NAMES['overall_safe']] = np.where(ranked['overall_safe'].astype(bool), '是', '否')
+
+        if os.path.splitext(output_path)[1].lower() in ('.xlsx', '.xlsm'):
+            table.to_excel(output_path, sheet_name='控制塔位', index=False)
+        else:
+            table.to_csv(output_path, index=False, encoding='utf-8-sig', float_format='%.4f')
+
+    def _safe_ratio(self, numerator, denominator) -> np.ndarray:
+        """计算安全系数，分母不大于0时取无穷大"""
+        numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype=float),
+                                                     np.asarray(denominator, dtype=float))
+        ratio = np.full(numerator.shape, np.inf)
+        np.divide(numerator, denominator, out=ratio, where=denominator > 0)
+        return ratio
@@ -9,6 +9,9 @@ import math
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 
+from .parameter_database import get_parameter_database
+from .base_pressure import BasePressureSolver
+
 
 @dataclass
 class TowerFoundationCalculation:
@@ -50,37 +53,15 @@ class TowerCalculator:
             'sliding_extreme': 1.1      # 抗滑移极端状态
         }
         
-        # 土质参数数据库
-        self.soil_parameters = {
-            '黏土': {
-                'bearing_capacity': 150,    # kPa
-                'unit_weight': 18.0,        # kN/m³
-                'friction_coefficient': 0.25,
-                'cohesion': 25.0,           # kPa
-                'friction_angle': 15.0      # 度
-            },
-            '砂土': {
-                'bearing_capacity': 200,    # kPa
-                'unit_weight': 19.0,        # kN/m³
-                'friction_coefficient': 0.4,
-                'cohesion': 0.0,            # kPa
-                'friction_angle': 30.0      # 度
-            },
-            '粉土': {
-                'bearing_capacity': 180,    # kPa
-                'unit_weight': 18.5,        # kN/m³
-                'friction_coefficient': 0.3,
-                'cohesion': 15.0,           # kPa
-                'friction_angle': 20.0      # 度
-            },
-            '岩石': {
-                'bearing_capacity': 500,    # kPa
-                'unit_weight': 25.0,        # kN/m³
-                'friction_coefficient': 0.6,
-                'cohesion': 50.0,           # kPa
-                'friction_angle': 40.0      # 度
-            }
-        }
+        # 极端工况荷载放大系数
+        self.extreme_load_factor = 1.2
+        
+        # 土质参数数据库（进程内共享，延迟加载）
+        self.parameters = get_parameter_database()
+        self.soil_parameters = self.parameters.soils.as_dict()
+        
+        # 偏心基底压力求解器（考虑基底部分脱开）
+        self.base_pressure_solver = BasePressureSolver()
     
     def calculate_bearing_capacity(self, params: Dict[str, Any]) -> float:
         """
@@ -100,14 +81,10 @@ class TowerCalculator:
         base_length = params.get('base_length', 3.0)    # m
         embedment_depth = params.get('embedment_depth', 1.5)  # m
         
-        # 获取土体参数
-        if soil_type in self.soil_parameters:
-            soil_data = self.soil_parameters[soil_type]
-            fak = soil_data['bearing_capacity']  # kPa
-            gamma = soil_data['unit_weight']     # kN/m³
-        else:
-            fak = 150  # 默认粘土
-            gamma = 18.0
+        # 获取土体参数 (未知土质按黏土)
+        soil_data = self.parameters.soils.get(soil_type)
+        fak = soil_data['bearing_capacity']  # kPa
+        gamma = soil_data['unit_weight']     # kN/m³
         
         # 修正系数 (按GB50007-2011)
         width_correction_factor = self.get_width_correction_factor(soil_type, base_width)
@@ -121,35 +98,20 @@ class TowerCalculator:
     
     def get_width_correction_factor(self, soil_type: str, base_width: float) -> float:
         """获取宽度修正系数"""
-        # 按GB50007-2011表5.2.4
-        if soil_type == '黏土':
-            return 0.0  # 粘性土宽度修正系数为0
-        elif soil_type in ['砂土', '粉土']:
-            return 2.0  # 砂土和粉土宽度修正系数
-        elif soil_type == '岩石':
-            return 0.5  # 岩石宽度修正系数
-        else:
-            return 0.0
+        # 按GB50007-2011表5.2.4，系数见参数数据库
+        return self.parameters.soils.get(soil_type)['width_correction']
     
     def get_depth_correction_factor(self, soil_type: str, embedment_depth: float) -> float:
         """获取深度修正系数"""
-        # 按GB50007-2011表5.2.4
-        if soil_type == '黏土':
-            return 1.0  # 粘性土深度修正系数
-        elif soil_type == '砂土':
-            return 3.0  # 砂土深度修正系数
-        elif soil_type == '粉土':
-            return 2.0  # 粉土深度修正系数
-        elif soil_type == '岩石':
-            return 4.4  # 岩石深度修正系数
-        else:
-            return 1.0
+        # 按GB50007-2011表5.2.4，系数见参数数据库
+        return self.parameters.soils.get(soil_type)['depth_correction']
     
     def calculate_base_pressure(self, params: Dict[str, Any]) -> Tuple[float, float, float]:
         """
         计算基底压力
         
-        公式：Pmax,min = (N+G)/A ± M/W
+        公式：e ≤ B/6 时 Pmax,min = (N+G)/A ± M/W
+              e > B/6 时基底部分脱开，Pmax = 2(N+G) / (3L(B/2 - e))，Pmin = 0
         
         Args:
             params: 计算参数
@@ -165,25 +127,19 @@ class TowerCalculator:
         base_width = params.get('base_width', 2.0)        # m
         base_length = params.get('base_length', 3.0)      # m
         
-        # 计算基础面积和截面模量
-        base_area = base_width * base_length  # m²
-        section_modulus = (base_length * base_width**2) / 6  # m³
-        
         # 计算总竖向力
         total_vertical_force = tower_load + base_weight  # kN
         
         # 计算弯矩
         moment = horizontal_force * force_height  # kN·m
         
-        # 计算基底压力
-        average_pressure = total_vertical_force / base_area  # kPa
-        
-        # 最大和最小基底压力
-        max_pressure = average_pressure + moment / section_modulus  # kPa
-        min_pressure = average_pressure - moment / section_modulus  # kPa
-        
-        # 确保最小压力不小于0
-        min_pressure = max(0, min_pressure)
+        # 计算基底压力（合力偏出基底时最大压力为无穷大）
+        pressure = self.base_pressure_solver.solve(
+            total_vertical_force, moment, 0.0, base_width, base_length
+        )
+        max_pressure = float(pressure['max_pressure'])  # kPa
+        min_pressure = float(pressure['min_pressure'])  # kPa
+        average_pressure = float(pressure['average_pressure'])  # kPa
         
         return max_pressure, min_pressure, average_pressure
     
@@ -239,11 +195,8 @@ class TowerCalculator:
         base_weight = params.get('base_weight', 200.0)    # kN
         soil_type = params.get('soil_type', '黏土')
         
-        # 获取摩擦系数
-        if soil_type in self.soil_parameters:
-            friction_coefficient = self.soil_parameters[soil_type]['friction_coefficient']
-        else:
-            friction_coefficient = 0.25  # 默认粘土
+        # 获取摩擦系数 (未知土质按黏土)
+        friction_coefficient = self.parameters.soils.get(soil_type)['friction_coefficient']
         
         # 计算抗滑移力 (竖向力 × 摩擦系数)
         total_vertical_force = tower_load + base_weight  # kN
@@ -324,8 +277,8 @@ class TowerCalculator:
         # 计算极端工况
         extreme_params = params.copy()
         # 极端工况下荷载放大1.2倍
-        extreme_params['tower_load'] = params.get('tower_load', 500.0) * 1.2
-        extreme_params['horizontal_force'] = params.get('horizontal_force', 50.0) * 1.2
+        extreme_params['tower_load'] = params.get('tower_load', 500.0) * self.extreme_load_factor
+        extreme_params['horizontal_force'] = params.get('horizontal_force', 50.0) * self.extreme_load_factor
         extreme_calculation = self.calculate_tower_stability(extreme_params, 'extreme')
         
         # 创建综合结果
@@ -421,12 +374,16 @@ class TowerCalculator:
         """
         计算经济优化建议
         
+        在满足正常使用和极端工况全部验算的前提下搜索混凝土用量最小的基础尺寸
+        
         Args:
             params: 计算参数
             
         Returns:
             Dict: 经济优化建议
         """
+        from .footing_optimizer import FootingOptimizer
+        
         # 获取当前计算结果
         result = self.calculate_comprehensive_stability(params)
         normal_calc = result['normal_condition']
@@ -436,6 +393,9 @@ class TowerCalculator:
         overturning_margin = normal_calc.overturning_safety_factor - self.safety_factors['overturning_normal']
         sliding_margin = normal_calc.sliding_safety_factor - self.safety_factors['sliding_normal']
         
+        # 基础尺寸优化
+        optimal = FootingOptimizer(self).optimize(params)
+        
         # 生成优化建议
         optimization = {
             'current_dimensions': {
@@ -448,23 +408,32 @@ class TowerCalculator:
                 'overturning_margin': overturning_margin,
                 'sliding_margin': sliding_margin
             },
+            'optimal_design': optimal,
             'optimization_suggestions': []
         }
         
-        # 根据裕度提供优化建议
-        if bearing_margin > 100:  # 地基承载力裕度较大
+        dimensions = optimal['optimal_dimensions']
+        dimension_text = (f"{dimensions['base_width']:.2f}m × {dimensions['base_length']:.2f}m，"
+                          f"埋深 {dimensions['embedment_depth']:.2f}m")
+        if not optimal['feasible']:
             optimization['optimization_suggestions'].append(
-                "地基承载力裕度较大，可考虑减小基础尺寸以节约材料"
+                f"搜索范围内无满足全部验算的基础尺寸，最接近方案为 {dimension_text}，"
+                f"控制验算项为{optimal['governing_check']}"
             )
-        
-        if overturning_margin > 0.5:  # 抗倾覆安全系数裕度较大
+        elif abs(optimal['volume_saving']) < 1e-9:
             optimization['optimization_suggestions'].append(
-                "抗倾覆安全系数裕度较大，可考虑减小基础宽度"
+                f"当前基础尺寸 {dimension_text} 已为满足全部验算的最经济方案，"
+                f"混凝土用量 {optimal['concrete_volume']:.2f}m³（控制验算项：{optimal['governing_check']}）"
             )
-        
-        if sliding_margin > 0.3:  # 抗滑移安全系数裕度较大
+        elif optimal['volume_saving'] > 0:
+            optimization['optimization_suggestions'].append(
+                f"建议基础尺寸 {dimension_text}，混凝土用量 {optimal['concrete_volume']:.2f}m³，"
+                f"较当前方案节约 {optimal['volume_saving']:.1%}（控制验算项：{optimal['governing_check']}）"
+            )
+        else:
             optimization['optimization_suggestions'].append(
-                "抗滑移安全系数裕度较大，可考虑减小基础埋深"
+                f"当前方案需增大至 {dimension_text}（混凝土用量 {optimal['concrete_volume']:.2f}m³）"
+                f"方可满足全部验算"
             )
         
         return optimization
\ No newline at end of file
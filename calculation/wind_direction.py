@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础最不利风向扫描模块
+将塔身风荷载和导线荷载按0~360°风向分解到矩形基础两个主轴方向，
+对风向和塔位同时向量化验算，确定各验算项的最不利风向及最小安全系数
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, Sequence
+
+from .tower_calculator import TowerCalculator, TowerFoundationCalculation
+from .tower_batch import TowerBatchCalculator
+
+
+# 导线荷载参数及缺省值
+DEFAULT_CONDUCTOR_VALUES = {
+    'conductor_force': 0.0,     # 导线横向风荷载（风向垂直线路时） kN
+    'longitudinal_force': 0.0,  # 导线纵向不平衡张力 kN
+    'line_angle': 0.0,          # 线路走向与基础x轴（宽度方向）夹角 度
+    'conductor_height': np.nan  # 导线挂点高度 m，缺省取 force_height
+}
+
+CHECK_KEYS = ('bearing', 'overturning', 'sliding')
+
+
+class WindDirectionSweep:
+    """电线塔基础风向扫描类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None, resolution: float = 1.0):
+        """
+        初始化风向扫描
+
+        Args:
+            tower_calculator: 单塔计算器，提供安全系数要求和土质参数
+            resolution: 风向角步长 (度)
+        """
+        self.batch = TowerBatchCalculator(tower_calculator)
+        self.tower_calculator = self.batch.tower_calculator
+        self.safety_factors = self.batch.safety_factors
+        self.resolution = resolution
+
+    def get_angles(self) -> np.ndarray:
+        """获取扫描风向角 [0, 360) (度)"""
+        return np.arange(0.0, 360.0, self.resolution)
+
+    def prepare_sites(self, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        将塔位表整理为参数数组，在 TowerBatchCalculator.prepare_sites 基础上补充导线荷载参数
+
+        Args:
+            frame: 塔位表
+
+        Returns:
+            Dict: 参数数组字典
+        """
+        sites = self.batch.prepare_sites(frame)
+        for key, default in DEFAULT_CONDUCTOR_VALUES.items():
+            if key in frame.columns:
+                values = pd.to_numeric(frame[key], errors='coerce').to_numpy(dtype=float)
+                sites[key] = np.where(np.isnan(values), default, values)
+            else:
+                sites[key] = np.full(len(frame), default)
+        return sites
+
+    def resolve_horizontal_loads(self, sites: Dict[str, np.ndarray],
+                                 angles: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        将水平荷载按风向分解到基础主轴
+
+        塔身风荷载：大小不随风向变化，沿风向作用于 force_height
+        导线横向风荷载：F = Fc × sin²(θ - α)，垂直线路指向背风侧，作用于导线挂点
+        导线纵向张力：沿线路方向，大小不随风向变化
+
+        Args:
+            sites: 参数数组字典 (n_towers,)，缺少导线荷载参数时取缺省值
+            angles: 风向角 (n_angles,) (度)
+
+        Returns:
+            Dict: horizontal_x、horizontal_y (kN)，moment_x、moment_y (kN·m)，形状 (n_towers, n_angles)
+        """
+        theta = np.radians(np.asarray(angles, dtype=float))[np.newaxis, :]
+        n_towers = len(sites['horizontal_force'])
+        column = {}
+        for key, default in dict(DEFAULT_CONDUCTOR_VALUES, horizontal_force=np.nan, force_height=np.nan).items():
+            values = sites[key] if key in sites else np.full(n_towers, default)
+            column[key] = np.asarray(values, dtype=float)[:, np.newaxis]
+        column['conductor_height'] = np.where(np.isnan(column['conductor_height']),
+                                              column['force_height'], column['conductor_height'])
+        alpha = np.radians(column['line_angle'])
+
+        # 塔身风荷载
+        wind_x = column['horizontal_force'] * np.cos(theta)
+        wind_y = column['horizontal_force'] * np.sin(theta)
+
+        # 导线荷载：横向分量按风向与线路夹角正弦平方折减
+        relative = np.sin(theta - alpha)
+        transverse = column['conductor_force'] * relative * np.abs(relative)
+        conductor_x = -transverse * np.sin(alpha) + column['longitudinal_force'] * np.cos(alpha)
+        conductor_y = transverse * np.cos(alpha) + column['longitudinal_force'] * np.sin(alpha)
+
+        return {
+            'horizontal_x': wind_x + conductor_x,
+            'horizontal_y': wind_y + conductor_y,
+            'moment_x': wind_x * column['force_height'] + conductor_x * column['conductor_height'],
+            'moment_y': wind_y * column['force_height'] + conductor_y * column['conductor_height']
+        }
+
+    def evaluate(self, sites: Dict[str, np.ndarray], angles: Optional[np.ndarray] = None,
+                 load_case: str = 'normal') -> Dict[str, np.ndarray]:
+        """
+        向量化验算全部塔位、全部风向
+
+        Args:
+            sites: 参数数组字典 (n_towers,)
+            angles: 风向角 (度)，缺省按 resolution 扫描
+            load_case: 荷载工况 ('normal' 或 'extreme'，极端工况荷载按 extreme_load_factor 放大)
+
+        Returns:
+            Dict: 与 TowerFoundationCalculation 字段同名的结果数组及各验算项利用率，形状 (n_towers, n_angles)
+        """
+        angles = self.get_angles() if angles is None else np.asarray(angles, dtype=float)
+        factor = self.tower_calculator.extreme_load_factor if load_case == 'extreme' else 1.0
+
+        loads = self.resolve_horizontal_loads(sites, angles)
+        loads = {key: value * factor for key, value in loads.items()}
+
+        base_width = np.asarray(sites['base_width'], dtype=float)[:, np.newaxis]
+        base_length = np.asarray(sites['base_length'], dtype=float)[:, np.newaxis]
+        vertical = (np.asarray(sites['tower_load'], dtype=float) * factor +
+                    np.asarray(sites['base_weight'], dtype=float))[:, np.newaxis]
+        shape = loads['horizontal_x'].shape
+
+        bearing_capacity = self.batch.calculate_bearing_capacity(
+            sites['soil_code'], sites['base_width'], sites['embedment_depth']
+        )[:, np.newaxis]
+        friction_coefficient = self.batch.parameters.soils.lookup(
+            sites['soil_code'], 'friction_coefficient'
+        )[:, np.newaxis]
+
+        # 双向偏心基底压力
+        pressure = self.batch.base_pressure_solver.solve(
+            vertical, loads['moment_x'], loads['moment_y'], base_width, base_length
+        )
+
+        # 抗倾覆：分别绕两个方向基础边缘，取较小安全系数
+        moment_x = np.abs(loads['moment_x'])
+        moment_y = np.abs(loads['moment_y'])
+        factor_x = self.batch._safe_ratio(vertical * base_width / 2, moment_x)
+        factor_y = self.batch._safe_ratio(vertical * base_length / 2, moment_y)
+        governs_x = factor_x <= factor_y
+        overturning_factor = np.where(governs_x, factor_x, factor_y)
+
+        # 抗滑移：合成水平力
+        sliding_force = np.hypot(loads['horizontal_x'], loads['horizontal_y'])
+        sliding_resistance = np.broadcast_to(vertical * friction_coefficient, shape)
+        sliding_factor = self.batch._safe_ratio(sliding_resistance, sliding_force)
+
+        overturning_required = self.safety_factors[f'overturning_{load_case}']
+        sliding_required = self.safety_factors[f'sliding_{load_case}']
+        bearing_capacity = np.broadcast_to(bearing_capacity, shape)
+
+        return {
+            'corrected_bearing_capacity': bearing_capacity,
+            'max_base_pressure': pressure['max_pressure'],
+            'min_base_pressure': pressure['min_pressure'],
+            'average_base_pressure': np.broadcast_to(pressure['average_pressure'], shape),
+            'base_contact_ratio': pressure['contact_ratio'],
+            'overturning_resistance_moment': vertical * np.where(governs_x, base_width, base_length) / 2,
+            'overturning_moment': np.where(governs_x, moment_x, moment_y),
+            'overturning_safety_factor': overturning_factor,
+            'sliding_resistance_force': sliding_resistance,
+            'sliding_force': sliding_force,
+            'sliding_safety_factor': sliding_factor,
+            'bearing_check': pressure['max_pressure'] <= bearing_capacity,
+            'overturning_check': overturning_factor >= overturning_required,
+            'sliding_check': sliding_factor >= sliding_required,
+            'bearing_ratio': pressure['max_pressure'] / bearing_capacity,
+            'overturning_ratio': overturning_required / overturning_factor,
+            'sliding_ratio': sliding_required / sliding_factor
+        }
+
+    def sweep(self, sites: Dict[str, np.ndarray], angles: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        风向扫描，确定各塔位、各工况、各验算项的最不利风向
+
+        Args:
+            sites: 参数数组字典 (n_towers,)
+            angles: 风向角 (度)，缺省按 resolution 扫描
+
+        Returns:
+            Dict: angles；normal/extreme 工况的逐风向结果 (n_towers, n_angles)；
+                  critical 为各工况、各验算项的最不利风向角、风向序号和利用率 (n_towers,)
+        """
+        angles = self.get_angles() if angles is None else np.asarray(angles, dtype=float)
+        result = {'angles': angles, 'critical': {}}
+
+        for load_case in ('normal', 'extreme'):
+            case = self.evaluate(sites, angles, load_case)
+            result[load_case] = case
+            result['critical'][load_case] = {}
+            for check in CHECK_KEYS:
+                index = np.argmax(case[f'{check}_ratio'], axis=-1)
+                result['critical'][load_case][check] = {
+                    'angle': angles[index],
+                    'index': index,
+                    'ratio': np.take_along_axis(case[f'{check}_ratio'], index[:, np.newaxis], axis=-1)[:, 0]
+                }
+
+        return result
+
+    def sweep_tower(self, params: Dict[str, Any], angles: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """
+        单塔风向扫描，结果按 calculate_comprehensive_stability 的格式返回
+
+        各验算项分别取其最不利风向的结果填入 TowerFoundationCalculation
+
+        Args:
+            params: 单塔计算参数（可含 conductor_force、longitudinal_force、line_angle、conductor_height）
+            angles: 风向角 (度)，缺省按 resolution 扫描
+
+        Returns:
+            Dict: normal_condition、extreme_condition、safety_assessment，
+                  以及 critical_directions (各工况、各验算项最不利风向角) 和逐风向安全系数
+        """
+        sites = self.prepare_sites(pd.DataFrame([params]))
+        result = self.sweep(sites, angles)
+
+        calculations = {}
+        critical_directions = {}
+        for load_case in ('normal', 'extreme'):
+            critical = result['critical'][load_case]
+            calculations[load_case] = self.to_foundation_calculation(
+                result[load_case], 0, {check: int(critical[check]['index'][0]) for check in CHECK_KEYS}
+            )
+            critical_directions[load_case] = {check: float(critical[check]['angle'][0]) for check in CHECK_KEYS}
+
+        normal, extreme = calculations['normal'], calculations['extreme']
+        overall_safe = normal.bearing_check and normal.overturning_check and normal.sliding_check
+
+        return {
+            'normal_condition': normal,
+            'extreme_condition': extreme,
+            'safety_assessment': {
+                'overall_safe': overall_safe,
+                'critical_condition': 'normal' if overall_safe else 'extreme',
+                'recommendations': self.tower_calculator.generate_tower_recommendations(normal, extreme)
+            },
+            'critical_directions': critical_directions,
+            'angles': result['angles'],
+            'direction_safety_factors': {
+                load_case: {
+                    'max_base_pressure': result[load_case]['max_base_pressure'][0],
+                    'overturning_safety_factor': result[load_case]['overturning_safety_factor'][0],
+                    'sliding_safety_factor': result[load_case]['sliding_safety_factor'][0]
+                }
+                for load_case in ('normal', 'extreme')
+            }
+        }
+
+    def to_foundation_calculation(self, case: Dict[str, np.ndarray], tower: int,
+                                  indices: Dict[str, int]) -> TowerFoundationCalculation:
+        """
+        将逐风向结果转换为标准结果数据结构
+
+        Args:
+            case: evaluate 的返回值
+            tower: 塔位序号
+            indices: 各验算项取值的风向序号 {'bearing': i, 'overturning': j, 'sliding': k}
+
+        Returns:
+            TowerFoundationCalculation: 基础稳定性结果
+        """
+        bearing, overturning, sliding = (indices[check] for check in CHECK_KEYS)
+        return TowerFoundationCalculation(
+            corrected_bearing_capacity=float(case['corrected_bearing_capacity'][tower, bearing]),
+            max_base_pressure=float(case['max_base_pressure'][tower, bearing]),
+            min_base_pressure=float(case['min_base_pressure'][tower, bearing]),
+            average_base_pressure=float(case['average_base_pressure'][tower, bearing]),
+            overturning_resistance_moment=float(case['overturning_resistance_moment'][tower, overturning]),
+            overturning_moment=float(case['overturning_moment'][tower, overturning]),
+            overturning_safety_factor=float(case['overturning_safety_factor'][tower, overturning]),
+            sliding_resistance_force=float(case['sliding_resistance_force'][tower, sliding]),
+            sliding_force=float(case['sliding_force'][tower, sliding]),
+            sliding_safety_factor=float(case['sliding_safety_factor'][tower, sliding]),
+            bearing_check=bool(case['bearing_check'][tower, bearing]),
+            overturning_check=bool(case['overturning_check'][tower, overturning]),
+            sliding_check=bool(case['sliding_check'][tower, sliding])
+        )
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+电线塔基础风速时程分析模块
+分块读取长期测风记录，将风速换算为水平风荷载，逐块向量化验算地基承载力、
+抗倾覆、抗滑移，流式统计安全系数低于限值的次数、持续时间及倾覆力矩雨流计数直方图，
+全过程不需将整个时程读入内存
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, Iterable, Iterator, Union, Callable, List
+
+from .tower_calculator import TowerCalculator
+from .tower_batch import TowerBatchCalculator
+
+
+CHECK_KEYS = ('bearing', 'overturning', 'sliding')
+
+
+class ExceedanceCounter:
+    """超限次数与持续时间流式统计（跨数据块延续超限事件）"""
+
+    def __init__(self, duration_edges: np.ndarray):
+        """
+        Args:
+            duration_edges: 超限事件持续时间直方图分组边界 (记录数)
+        """
+        self.duration_edges = np.asarray(duration_edges, dtype=float)
+        self.duration_counts = np.zeros(len(self.duration_edges) - 1, dtype=np.int64)
+        self.exceedance_count = 0
+        self.events = 0
+        self.max_event_length = 0
+        self.current_run = 0
+
+    def update(self, exceeded: np.ndarray):
+        """
+        累计一个数据块的超限标记
+
+        Args:
+            exceeded: 超限标记数组
+        """
+        exceeded = np.asarray(exceeded, dtype=bool)
+        if exceeded.size == 0:
+            return
+        self.exceedance_count += int(np.count_nonzero(exceeded))
+
+        # 上一块末尾的事件在本块首个记录未超限时结束
+        if self.current_run and not exceeded[0]:
+            self._close([self.current_run])
+            self.current_run = 0
+
+        # 游程编码：超限段起点与终点
+        padded = np.concatenate([[False], exceeded, [False]])
+        edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+        starts, ends = edges[::2], edges[1::2]
+        lengths = ends - starts
+        if lengths.size == 0:
+            return
+
+        # 与上一块末尾未结束的事件相连
+        if starts[0] == 0:
+            lengths[0] += self.current_run
+            self.current_run = 0
+
+        # 本块末尾未结束的事件延续到下一块
+        if ends[-1] == exceeded.size:
+            self.current_run = int(lengths[-1])
+            lengths = lengths[:-1]
+        self._close(lengths)
+
+    def finalize(self):
+        """结束记录末尾未结束的事件"""
+        if self.current_run:
+            self._close([self.current_run])
+            self.current_run = 0
+
+    def _close(self, lengths):
+        """记录已结束的超限事件"""
+        lengths = np.asarray(lengths, dtype=float)
+        if lengths.size == 0:
+            return
+        self.events += lengths.size
+        self.max_event_length = max(self.max_event_length, int(lengths.max()))
+        index = np.clip(np.searchsorted(self.duration_edges, lengths, side='right') - 1,
+                        0, len(self.duration_counts) - 1)
+        np.add.at(self.duration_counts, index, 1)
+
+
+class RainflowCounter:
+    """雨流计数流式统计（ASTM E1049 三点法，残余峰谷保留在栈中跨块延续）"""
+
+    def __init__(self, range_edges: np.ndarray):
+        """
+        Args:
+            range_edges: 循环幅值直方图分组边界，末组包含超出上界的循环
+        """
+        self.range_edges = np.asarray(range_edges, dtype=float)
+        self.cycle_counts = np.zeros(len(self.range_edges) - 1)
+        self.stack: List[float] = []
+        self.last_value: Optional[float] = None
+        self.direction = 0
+
+    def update(self, values: np.ndarray):
+        """
+        累计一个数据块：提取峰谷点后按雨流法计数
+
+        Args:
+            values: 信号数组
+        """
+        self._count(self.extract_reversals(values))
+
+    def extract_reversals(self, values: np.ndarray) -> np.ndarray:
+        """提取峰谷点（上一块最后一点暂不确定，随下一块一并判断）"""
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return values
+        series = values if self.last_value is None else np.concatenate([[self.last_value], values])
+        series = series[np.concatenate([[True], np.diff(series) != 0])]
+
+        # 斜率方向改变处为峰谷点；尚无斜率方向 (direction = 0) 时首点为记录起点
+        slopes = np.sign(np.diff(series)).astype(int)
+        if slopes.size == 0:
+            reversals = series[:0]
+        else:
+            previous = np.concatenate([[self.direction], slopes[:-1]])
+            reversals = series[:-1][slopes != previous]
+            self.direction = int(slopes[-1])
+
+        self.last_value = float(series[-1])
+        return reversals
+
+    def finalize(self):
+        """记录结束：最后一点计为峰谷点，残余峰谷按半循环计数"""
+        if self.last_value is not None:
+            self._count([self.last_value])
+            self.last_value = None
+        self._add(np.abs(np.diff(self.stack)), 0.5)
+        self.stack = []
+        self.direction = 0
+
+    @property
+    def total_cycles(self) -> float:
+        """已计循环数"""
+        return float(self.cycle_counts.sum())
+
+    def _count(self, reversals):
+        """三点法计数"""
+        stack = self.stack
+        full, half = [], []
+        for point in reversals:
+            stack.append(float(point))
+            while len(stack) >= 3:
+                x = abs(stack[-1] - stack[-2])
+                y = abs(stack[-2] - stack[-3])
+                if x < y:
+                    break
+                if len(stack) == 3:
+                    half.append(y)
+                    del stack[0]
+                else:
+                    full.append(y)
+                    del stack[-3:-1]
+        self._add(full, 1.0)
+        self._add(half, 0.5)
+
+    def _add(self, ranges, weight: float):
+        """按幅值分组累计循环数"""
+        ranges = np.asarray(ranges, dtype=float)
+        if ranges.size == 0:
+            return
+        index = np.clip(np.searchsorted(self.range_edges, ranges, side='right') - 1,
+                        0, len(self.cycle_counts) - 1)
+        np.add.at(self.cycle_counts, index, weight)
+
+
+class WindHistoryAnalyzer:
+    """电线塔基础风速时程分析类"""
+
+    def __init__(self, tower_calculator: Optional[TowerCalculator] = None, chunksize: int = 100000,
+                 time_step: float = 10.0, design_wind_speed: float = 30.0, range_bins: int = 20,
+                 duration_edges_hours=(0.0, 0.5, 1.0, 2.0, 6.0, 12.0, 24.0, 48.0, np.inf)):
+        """
+        初始化风速时程分析
+
+        Args:
+            tower_calculator: 单塔计算器，提供安全系数要求和土质参数
+            chunksize: 每块记录数
+            time_step: 记录时间间隔 (min)
+            design_wind_speed: horizontal_force 对应的设计风速 (m/s)
+            range_bins: 雨流计数幅值分组数
+            duration_edges_hours: 超限事件持续时间分组边界 (h)
+        """
+        self.batch = TowerBatchCalculator(tower_calculator)
+        self.safety_factors = self.batch.safety_factors
+        self.chunksize = chunksize
+        self.time_step = time_step
+        self.design_wind_speed = design_wind_speed
+        self.range_bins = range_bins
+        self.duration_edges_hours = np.asarray(duration_edges_hours, dtype=float)
+
+    def wind_speed_to_force(self, wind_speed, params: Dict[str, Any]) -> np.ndarray:
+        """
+        风速换算水平风荷载（风压与风速平方成正比）
+
+        公式：H = H设计 × (v / v设计)²
+
+        Args:
+            wind_speed: 风速 (m/s)
+            params: 单塔计算参数，horizontal_force 为设计风速下的水平力，可含 design_wind_speed
+
+        Returns:
+            np.ndarray: 水平力 (kN)
+        """
+        design_speed = params.get('design_wind_speed', self.design_wind_speed)
+        return params.get('horizontal_force', 50.0) * (np.asarray(wind_speed, dtype=float) / design_speed)**2
+
+    def read_wind_chunks(self, source: Union[str, Iterable], speed_column: str = 'wind_speed') -> Iterator[pd.DataFrame]:
+        """
+        分块读取测风记录
+
+        Args:
+            source: CSV/Excel 文件路径，或依次给出数据块（DataFrame 或风速数组）的可迭代对象
+            speed_column: 风速列名
+
+        Yields:
+            pd.DataFrame: 测风记录分块
+        """
+        if isinstance(source, str):
+            yield from self.batch.read_site_chunks(source, self.chunksize)
+            return
+        for chunk in source:
+            yield chunk if isinstance(chunk, pd.DataFrame) else pd.DataFrame({speed_column: np.asarray(chunk)})
+
+    def evaluate_chunk(self, params: Dict[str, Any], horizontal_force: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        向量化验算一个数据块
+
+        Args:
+            params: 单塔计算参数
+            horizontal_force: 各时刻水平力 (kN)
+
+        Returns:
+            Dict: 各验算项安全系数（地基承载力为 承载力/最大基底压力）、是否超限及倾覆力矩
+        """
+        tower_load = params.get('tower_load', 500.0)
+        force_height = params.get('force_height', 15.0)
+        base_weight = params.get('base_weight', 200.0)
+        base_width = params.get('base_width', 2.0)
+        base_length = params.get('base_length', 3.0)
+        soil_code = self.batch.parameters.soils.code(params.get('soil_type', '黏土'))
+
+        bearing_capacity = self.batch.calculate_bearing_capacity(
+            soil_code, base_width, params.get('embedment_depth', 1.5)
+        )
+        max_pressure = self.batch.calculate_base_pressure(
+            tower_load, horizontal_force, force_height, base_weight, base_width, base_length
+        )[0]
+        _, overturning_moment, overturning_factor = self.batch.calculate_overturning_stability(
+            tower_load, horizontal_force, force_height, base_weight, base_width
+        )
+        sliding_factor = self.batch.calculate_sliding_stability(
+            soil_code, tower_load, horizontal_force, base_weight
+        )[2]
+
+        factors = {
+            'bearing': self.batch._safe_ratio(np.full(max_pressure.shape, float(bearing_capacity)), max_pressure),
+            'overturning': overturning_factor,
+            'sliding': sliding_factor
+        }
+        required = {
+            'bearing': 1.0,
+            'overturning': self.safety_factors['overturning_normal'],
+            'sliding': self.safety_factors['sliding_normal']
+        }
+
+        return {
+            'safety_factors': factors,
+            'exceeded': {check: factors[check] < required[check] for check in CHECK_KEYS},
+            'overturning_moment': overturning_moment
+        }
+
+    def analyze(self, source: Union[str, Iterable], params: Dict[str, Any], speed_column: str = 'wind_speed',
+                time_column: Optional[str] = 'time',
+                progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """
+        流式分析测风记录
+
+        风速缺失的记录跳过，不中断超限事件
+
+        Args:
+            source: CSV/Excel 文件路径，或数据块可迭代对象
+            params: 单塔计算参数
+            speed_column: 风速列名
+            time_column: 时间列名（用于给出最不利时刻，可缺省）
+            progress_callback: 进度回调，参数为已处理记录数
+
+        Returns:
+            Dict: 记录数及时长；各验算项超限次数、时长、事件数、最长持续时间、持续时间直方图和最小安全系数；
+                  倾覆力矩雨流计数直方图
+        """
+        hours_per_record = self.time_step / 60.0
+        duration_edges = self.duration_edges_hours / hours_per_record
+        design_moment = params.get('horizontal_force', 50.0) * params.get('force_height', 15.0)
+
+        counters = {check: ExceedanceCounter(duration_edges) for check in CHECK_KEYS}
+        minimum = {check: {'safety_factor': np.inf, 'index': -1, 'time': None} for check in CHECK_KEYS}
+        rainflow = RainflowCounter(np.linspace(0.0, 2 * design_moment, self.range_bins + 1))
+        n_records = 0
+        max_speed = 0.0
+
+        for chunk in self.read_wind_chunks(source, speed_column):
+            speeds = pd.to_numeric(chunk[speed_column], errors='coerce').to_numpy(dtype=float)
+            valid = ~np.isnan(speeds)
+            speeds = speeds[valid]
+            if speeds.size:
+                result = self.evaluate_chunk(params, self.wind_speed_to_force(speeds, params))
+                max_speed = max(max_speed, float(speeds.max()))
+
+                for check in CHECK_KEYS:
+                    counters[check].update(result['exceeded'][check])
+                    factors = result['safety_factors'][check]
+                    position = int(np.argmin(factors))
+                    if factors[position] < minimum[check]['safety_factor']:
+                        times = chunk[time_column].to_numpy()[valid] if time_column in chunk.columns else None
+                        minimum[check] = {
+                            'safety_factor': float(factors[position]),
+                            'index': n_records + position,
+                            'time': None if times is None else times[position]
+                        }
+                rainflow.update(result['overturning_moment'])
+
+            n_records += speeds.size
+            if progress_callback:
+                progress_callback(n_records)
+
+        rainflow.finalize()
+        for counter in counters.values():
+            counter.finalize()
+
+        total_hours = n_records * hours_per_record
+        return {
+            'n_records': n_records,
+            'total_hours': total_hours,
+            'max_wind_speed': max_speed,
+            'checks': {
+                check: {
+                    'exceedance_count': counter.exceedance_count,
+                    'exceedance_hours': counter.exceedance_count * hours_per_record,
+                    'exceedance_fraction': counter.exceedance_count / n_records if n_records else 0.0,
+                    'events': counter.events,
+                    'max_event_hours': counter.max_event_length * hours_per_record,
+                    'duration_edges_hours': self.duration_edges_hours,
+                    'duration_counts': counter.duration_counts,
+                    'min_safety_factor': minimum[check]['safety_factor'],
+                    'min_index': minimum[check]['index'],
+                    'min_time': minimum[check]['time']
+                }
+                for check, counter in counters.items()
+            },
+            'rainflow': {
+                'signal': 'overturning_moment',
+                'range_edges': rainflow.range_edges,
+                'cycle_counts': rainflow.cycle_counts,
+                'total_cycles': rainflow.total_cycles
+            }
+        }
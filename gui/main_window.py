@@ -773,13 +773,13 @@ class MainWindow:
                 pile1_distance_val, pile2_distance_val
             )
         elif plot_type == "沉降分析图":
-            return self.plotter.create_settlement_plot(updated_results)
+            return self.plotter.get_figure('settlement', updated_results)
         elif plot_type == "等高线图":
-            return self.plotter.create_contour_plot(updated_results)
+            return self.plotter.get_figure('contour', updated_results)
         elif plot_type == "雷达图":
-            return self.plotter.create_radar_plot(updated_results)
+            return self.plotter.get_figure('radar', updated_results)
         elif plot_type == "瀑布图":
-            return self.plotter.create_waterfall_plot(updated_results)
+            return self.plotter.get_figure('waterfall', updated_results)
         else:
             return self.plotter.create_settlement_distribution_plot(updated_results)
     
@@ -827,6 +827,8 @@ class MainWindow:
             
             # 创建画布
             self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
+            # 等高线图的平移/缩放重新求值连接到新画布
+            self.plotter.attach_contour_refresh(self.canvas)
             self.canvas.draw()
             
             # 获取画布widget
@@ -1392,7 +1394,7 @@ class MainWindow:
             )
             
             if filename:
-                self.exporter.export_to_excel(self.calculation_results, filename)
+                self.exporter.export_to_excel(self.calculation_results, filename, incremental=True)
                 messagebox.showinfo("导出成功", f"报告已导出到：\n{filename}")
                 
         except Exception as e:
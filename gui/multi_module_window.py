@@ -518,6 +518,8 @@ class MultiModuleWindow:
             # 创建画布
             from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
             self.canvas = FigureCanvasTkAgg(self.figure, self.bridge_plot_display_frame)
+            # 等高线图的平移/缩放重新求值连接到新画布
+            self.plotter.attach_contour_refresh(self.canvas)
             self.canvas.draw()
             
             # 获取画布widget
@@ -590,13 +592,13 @@ class MultiModuleWindow:
                 pile1_distance_val, pile2_distance_val
             )
         elif plot_type == "沉降分析图":
-            return self.plotter.create_settlement_plot(updated_results)
+            return self.plotter.get_figure('settlement', updated_results)
         elif plot_type == "等高线图":
-            return self.plotter.create_contour_plot(updated_results)
+            return self.plotter.get_figure('contour', updated_results)
         elif plot_type == "雷达图":
-            return self.plotter.create_radar_plot(updated_results)
+            return self.plotter.get_figure('radar', updated_results)
         elif plot_type == "瀑布图":
-            return self.plotter.create_waterfall_plot(updated_results)
+            return self.plotter.get_figure('waterfall', updated_results)
         else:
             return self.plotter.create_settlement_distribution_plot(updated_results)
     
@@ -1530,7 +1532,7 @@ class MultiModuleWindow:
             if filename:
                 # 根据当前模块导出相应结果
                 if self.current_module == "bridge" and self.calculation_results['bridge']:
-                    self.exporter.export_to_excel(self.calculation_results['bridge'], filename)
+                    self.exporter.export_to_excel(self.calculation_results['bridge'], filename, incremental=True)
                 elif self.current_module == "pipeline" and self.calculation_results['pipeline']:
                     # 创建管道计算的综合报告
                     self.export_pipeline_report(filename)
@@ -8,6 +8,7 @@ a = Analysis(
     binaries=[],
     datas=[
         ('resources', 'resources'),
+        ('calculation/data', 'calculation/data'),
         ('templates', 'templates'),
     ],
     hiddenimports=[
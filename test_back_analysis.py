@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试土层模量反分析
+验证正演模型与沉降计算公式一致、由沉降计算合成的监测数据反演模量（往返一致）、
+分时段分批反演、修正系数反演及重新标定的系数文件
+"""
+
+import sys
+import os
+import time
+import tempfile
+import dataclasses
+import numpy as np
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.back_analysis import ModulusBackAnalyzer, correction_coefficient_names
+from calculation.settlement import SettlementCalculator
+from calculation.correction import (get_correction_coefficients, reload_correction_coefficients,
+                                    DEFAULT_CORRECTION_FILE)
+
+
+PARAMS = {
+    'pile1': {'diameter': 1.2, 'length': 20.0, 'load': 1500.0},
+    'pile2': {'diameter': 1.5, 'length': 25.0, 'load': 1800.0},
+    'road_level': '高速公路',
+    'road_params': {'width': 16.0, 'pile1_distance': 3.0, 'pile2_distance': 6.0},
+    'soil_layers': [
+        {'depth_range': '0-5', 'name': '粘土', 'compression_modulus': 10.0, 'poisson_ratio': 0.35},
+        {'depth_range': '5-10', 'name': '砂土', 'compression_modulus': 15.0, 'poisson_ratio': 0.30},
+        {'depth_range': '10-15', 'name': '粘土', 'compression_modulus': 12.0, 'poisson_ratio': 0.35}
+    ]
+}
+
+TRUE_MODULI = np.array([7.5, 21.0, 9.0])
+
+
+def with_moduli(params, moduli):
+    """替换各土层压缩模量"""
+    layers = [dict(layer, compression_modulus=float(m)) for layer, m in zip(params['soil_layers'], moduli)]
+    return dict(params, soil_layers=layers)
+
+
+def make_observations(n_points=300, epochs=(0,), moduli=TRUE_MODULI, noise=0.02, seed=0):
+    """按真实模量由沉降计算公式生成合成监测数据，第 e 个时段桩荷载为初始荷载的 (1 + 0.1e) 倍"""
+    rng = np.random.default_rng(seed)
+    calculator = SettlementCalculator()
+    true_params = with_moduli(PARAMS, moduli)
+
+    frames, loads = [], {}
+    for epoch in epochs:
+        scale = 1 + 0.1 * epoch
+        loads[epoch] = [PARAMS['pile1']['load'] * scale, PARAMS['pile2']['load'] * scale]
+        epoch_params = dict(true_params,
+                            pile1=dict(PARAMS['pile1'], load=loads[epoch][0]),
+                            pile2=dict(PARAMS['pile2'], load=loads[epoch][1]))
+        frame = pd.DataFrame({
+            'x': rng.uniform(-20, 20, n_points),
+            'y': rng.uniform(-15, 15, n_points),
+            'z': rng.choice([1.0, 2.5, 7.5, 12.0], n_points),
+            'epoch': epoch
+        })
+        frame['settlement_mm'] = calculator.calculate_settlement_field(
+            epoch_params, frame['x'], frame['z'], frame['y']
+        ) + rng.normal(0, noise, n_points)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True), loads
+
+
+def test_forward_model():
+    """测试正演模型与沉降计算结果一致"""
+    print("测试正演模型...")
+
+    # 以沉降计算的16个标准计算点作为监测点
+    exact = with_moduli(PARAMS, TRUE_MODULI)
+    results = SettlementCalculator().calculate_settlement(exact)
+    observations = pd.DataFrame({
+        'x': [point['x'] for point in results['points']],
+        'y': [point['y'] for point in results['points']],
+        'z': [point['z'] for point in results['points']],
+        'settlement_mm': [point['settlement_mm'] for point in results['points']]
+    })
+
+    analyzer = ModulusBackAnalyzer(max_iterations=0)
+    result = analyzer.analyze(exact, observations)
+    assert result['predicted_mm'].shape == (16,)
+    assert np.allclose(result['residual_mm'], 0.0, atol=1e-10)
+
+    # 初值偏离真值时残差不为0
+    assert np.abs(analyzer.analyze(PARAMS, observations)['residual_mm']).max() > 0.1
+
+    print("正演模型测试通过！\n")
+
+
+def test_joint_inversion():
+    """测试由沉降计算合成的数据反演恢复真实模量"""
+    print("测试联合反演...")
+
+    observations, loads = make_observations(n_points=2000)
+    start = time.time()
+    result = ModulusBackAnalyzer().analyze(PARAMS, observations, loads)
+    elapsed = time.time() - start
+
+    print(f"   反演模量: {np.round(result['moduli'][0], 3)} MPa，真实值 {TRUE_MODULI}")
+    print(f"   均方根残差 {result['rmse_mm'][0]:.4f} mm，迭代 {result['iterations']} 次，耗时 {elapsed:.2f}s")
+    assert result['converged'].all()
+    assert np.allclose(result['moduli'][0], TRUE_MODULI, rtol=2e-2)
+    assert np.all(np.abs(result['moduli'][0] / TRUE_MODULI - 1) < 4 * result['standard_errors'][0] + 1e-3)
+    assert result['soil_layers'][1]['compression_modulus'] == result['moduli'][0][1]
+
+    # 反演后的计算参数重新计算，与监测值一致
+    fitted = SettlementCalculator().calculate_settlement_field(
+        dict(PARAMS, soil_layers=result['soil_layers']), observations['x'], observations['z'], observations['y']
+    )
+    assert np.allclose(fitted, result['predicted_mm'], rtol=1e-10)
+
+    print("联合反演测试通过！\n")
+
+
+def test_per_epoch_batch():
+    """测试分时段分批反演与逐时段单独反演一致"""
+    print("测试分时段分批反演...")
+
+    epochs = list(range(24))
+    observations, loads = make_observations(n_points=200, epochs=epochs, seed=1)
+    observations = observations.drop(index=np.arange(0, len(observations), 7))  # 各时段观测数不同
+
+    analyzer = ModulusBackAnalyzer()
+    start = time.time()
+    result = analyzer.analyze(PARAMS, observations, loads, per_epoch=True)
+    print(f"   {len(epochs)}个时段、{len(observations)}个观测，耗时 {time.time() - start:.2f}s")
+
+    assert result['moduli'].shape == (len(epochs), 3)
+    assert np.allclose(result['moduli'], TRUE_MODULI, rtol=5e-2)
+    for epoch in (0, 5, 23):
+        single = analyzer.analyze(PARAMS, observations[observations['epoch'] == epoch], loads)
+        assert np.allclose(result['moduli'][epoch], single['moduli'][0], rtol=1e-4)
+
+    print("分时段分批反演测试通过！\n")
+
+
+def test_correction_inversion():
+    """测试反演已知偏差的修正系数（模量已知或部分已知）"""
+    print("测试修正系数反演...")
+
+    # 以 a0 放大 8% 的修正系数由正演模型生成监测数据
+    initial = get_correction_coefficients()
+    true_a0 = initial.length[0] * 1.08
+    perturbed = dataclasses.replace(initial, length=(true_a0,) + tuple(initial.length[1:]))
+    observations, loads = make_observations(n_points=1000, noise=0.0, seed=2)
+    exact = with_moduli(PARAMS, TRUE_MODULI)
+    observations['settlement_mm'] = ModulusBackAnalyzer(coefficients=perturbed, max_iterations=0).analyze(
+        exact, observations, loads)['predicted_mm'] + np.random.default_rng(3).normal(0, 0.02, len(observations))
+
+    analyzer = ModulusBackAnalyzer()
+
+    # 全部模量已知：只反演 a0
+    known = analyzer.analyze(exact, observations, loads, fit_correction=['a0'], fixed_layers=[0, 1, 2])
+    coefficient = known['correction_coefficients'][0]['a0']
+    print(f"   模量已知: a0 {initial.length[0]} -> {coefficient:.4f}（真值 {true_a0:.4f}）")
+    assert np.isclose(coefficient, true_a0, rtol=2e-3)
+    assert np.array_equal(known['moduli'][0], TRUE_MODULI) and not known['standard_errors'].any()
+    assert list(known['correction_coefficients'][0]) == correction_coefficient_names(initial)
+
+    # 第一层模量已知：同时反演其余土层模量及 a0
+    partial = analyzer.analyze(with_moduli(PARAMS, [TRUE_MODULI[0], 15.0, 12.0]), observations, loads,
+                               fit_correction=['a0'], fixed_layers=[0])
+    coefficient = partial['correction_coefficients'][0]['a0']
+    print(f"   第一层模量已知: a0 = {coefficient:.4f}，模量 {np.round(partial['moduli'][0], 3)} MPa")
+    assert np.isclose(coefficient, true_a0, rtol=1e-2)
+    assert np.allclose(partial['moduli'][0], TRUE_MODULI, rtol=2e-2)
+    assert partial['rmse_mm'][0] < 0.03
+
+    # 修正系数不能与全部土层模量同时反演
+    for kwargs in ({'fit_correction': ['a0']}, {'fit_correction': ['c0'], 'fixed_layers': [0]},
+                   {'fixed_layers': [3]}):
+        try:
+            analyzer.analyze(PARAMS, observations, loads, **kwargs)
+            assert False, f"应拒绝 {kwargs}"
+        except ValueError:
+            pass
+
+    print("修正系数反演测试通过！\n")
+
+
+def test_recalibrated_coefficients():
+    """测试反演采用重新标定的系数文件并记录版本"""
+    print("测试重新标定的修正系数...")
+
+    recalibrated = dataclasses.replace(get_correction_coefficients(), length=(0.9, -0.0004, 1e-6), version=7)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'coefficients.json')
+        recalibrated.save(path)
+        try:
+            reload_correction_coefficients(path)
+            observations, loads = make_observations(n_points=50, noise=0.0)
+            exact = with_moduli(PARAMS, TRUE_MODULI)
+            result = ModulusBackAnalyzer(max_iterations=0).analyze(exact, observations, loads)
+            assert result['correction_version'] == 7
+            assert np.allclose(result['residual_mm'], 0.0, atol=1e-10)
+            assert list(result['correction_coefficients'][0]) == ['a0', 'a1', 'a2', 'b0', 'b1', 'b2']
+        finally:
+            reload_correction_coefficients(DEFAULT_CORRECTION_FILE)
+
+    assert ModulusBackAnalyzer().analyze(PARAMS, observations, loads)['correction_version'] == 1
+
+    print("重新标定的修正系数测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("土层模量反分析测试")
+    print("=" * 60)
+
+    test_forward_model()
+    test_joint_inversion()
+    test_per_epoch_batch()
+    test_correction_inversion()
+    test_recalibrated_coefficients()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试矩形基础双向偏心基底压力
+验证闭合解、部分脱开迭代解的平衡条件以及与单塔计算的衔接
+"""
+
+import sys
+import os
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.base_pressure import BasePressureSolver
+from calculation.tower_calculator import TowerCalculator
+
+
+def test_closed_form_cases():
+    """测试全截面受压、单向脱开和角点三角形受压区闭合解"""
+    print("测试基底压力闭合解...")
+
+    solver = BasePressureSolver()
+    N, B, L = 600.0, 3.0, 4.0
+
+    # 核心区内：与 N/A ± M/W 一致
+    result = solver.solve(N, N * 0.2, N * 0.3, B, L)
+    expected = N / (B * L) + N * 0.2 / (L * B**2 / 6) + N * 0.3 / (B * L**2 / 6)
+    assert np.isclose(result['max_pressure'], expected)
+    assert result['contact_ratio'] == 1.0
+
+    # 单向偏心 e = 1.0 > B/6
+    result = solver.solve(N, -N * 1.0, 0.0, B, L)
+    assert np.isclose(result['max_pressure'], 2 * N / (3 * L * (B / 2 - 1.0)))
+    assert np.isclose(result['contact_ratio'], 3 * (B / 2 - 1.0) / B)
+    assert result['min_pressure'] == 0.0
+
+    # 角点三角形受压区
+    result = solver.solve(N, N * 0.9, N * 1.2, B, L)
+    s, t = 4 * (B / 2 - 0.9), 4 * (L / 2 - 1.2)
+    assert np.isclose(result['max_pressure'], 6 * N / (s * t))
+
+    # 合力偏出基底
+    result = solver.solve(N, N * 1.6, 0.0, B, L)
+    assert np.isinf(result['max_pressure']) and not result['stable']
+
+    print("基底压力闭合解测试通过！\n")
+
+
+def test_partial_uplift_equilibrium():
+    """测试一般部分脱开情况满足竖向力和弯矩平衡"""
+    print("测试双向偏心部分脱开迭代解...")
+
+    rng = np.random.default_rng(0)
+    n = 2000
+    B = rng.uniform(2.0, 5.0, n)
+    L = rng.uniform(2.0, 6.0, n)
+    N = rng.uniform(100.0, 1000.0, n)
+    ex = rng.uniform(0.0, 0.45, n) * B
+    ey = rng.uniform(0.0, 0.45, n) * L
+
+    result = BasePressureSolver().solve(N, N * ex, N * ey, B, L)
+    assert result['converged'].all() and result['stable'].all()
+    assert np.all(result['contact_ratio'] > 0) and np.all(result['contact_ratio'] <= 1)
+    assert np.all(result['max_pressure'] >= result['average_pressure'])
+
+    # 不迭代时取角点三角形受压区上限值
+    bound = BasePressureSolver().solve(N, N * ex, N * ey, B, L, iterate=False)
+    general = ~bound['exact']
+    ratio = bound['max_pressure'][general] / result['max_pressure'][general]
+    assert general.any() and bound['exact'][~general].all()
+    assert np.all(ratio >= 1 - 1e-9) and np.all(ratio <= 1.125 + 1e-9)
+    assert np.array_equal(bound['max_pressure'][~general], result['max_pressure'][~general])
+
+    # 与细分网格迭代解对比
+    m = 400
+    for i in range(10):
+        x = ((np.arange(m) + 0.5) / m - 0.5) * B[i]
+        y = ((np.arange(m) + 0.5) / m - 0.5) * L[i]
+        X, Y = np.meshgrid(x, y, indexing='ij')
+        dA = B[i] * L[i] / m**2
+        plane = np.array([N[i] / (B[i] * L[i]), N[i] * ex[i] / (L[i] * B[i]**3 / 12),
+                          N[i] * ey[i] / (B[i] * L[i]**3 / 12)])
+        for _ in range(200):
+            c = (plane[0] + plane[1] * X + plane[2] * Y) > 0
+            system = np.array([
+                [c.sum(), (X * c).sum(), (Y * c).sum()],
+                [(X * c).sum(), (X * X * c).sum(), (X * Y * c).sum()],
+                [(Y * c).sum(), (X * Y * c).sum(), (Y * Y * c).sum()]
+            ]) * dA
+            plane = np.linalg.solve(system, [N[i], N[i] * ex[i], N[i] * ey[i]])
+        pressure = np.maximum(plane[0] + plane[1] * X + plane[2] * Y, 0)
+        assert np.isclose(result['contact_ratio'][i], (pressure > 0).mean(), atol=5e-3)
+        assert np.isclose(result['max_pressure'][i], pressure.max(), rtol=3e-2)
+
+    print(f"   {n}组工况全部收敛，最小受压面积比 {result['contact_ratio'].min():.3f}")
+    print("双向偏心部分脱开测试通过！\n")
+
+
+def test_near_uniaxial_and_small_contact():
+    """测试近单向偏心及极小受压区的迭代收敛"""
+    print("测试近单向偏心及极小受压区...")
+
+    solver = BasePressureSolver()
+    N, B, L = 600.0, 3.0, 4.0
+
+    # 近单向偏心：另一方向偏心率趋于0，结果趋于单向脱开闭合解
+    u = np.array([0.3416, 0.45, 0.25])
+    v = np.array([6e-12, 1e-9, 1e-8])
+    result = solver.solve(N, N * u * B, N * v * L, B, L)
+    assert result['converged'].all()
+    assert np.allclose(result['max_pressure'], 2 * N / (3 * L * (B / 2 - u * B)), rtol=1e-6)
+    assert np.allclose(result['contact_ratio'], 3 * (0.5 - u), rtol=1e-6)
+
+    # 极小受压区：合力接近基底边缘
+    u = np.array([0.4994, 0.4993, 0.499])
+    v = np.array([0.1507, 0.1009, 0.2])
+    result = solver.solve(N, N * u * B, N * v * L, B, L)
+    assert result['converged'].all()
+    assert np.all(result['contact_ratio'] < 5e-3)
+    assert np.all(result['max_pressure'] * result['contact_ratio'] * B * L > N)
+
+    print("近单向偏心及极小受压区测试通过！\n")
+
+
+def test_tower_calculator_uplift():
+    """测试单塔计算在基底脱开时不再截断最小压力"""
+    print("测试单塔基底脱开压力...")
+
+    params = {'tower_load': 300.0, 'horizontal_force': 20.0, 'force_height': 20.0,
+              'base_weight': 150.0, 'base_width': 3.0, 'base_length': 3.0}
+    max_p, min_p, avg_p = TowerCalculator().calculate_base_pressure(params)
+
+    e = 20.0 * 20.0 / 450.0
+    print(f"   偏心距 {e:.3f}m > B/6，Pmax = {max_p:.2f} kPa")
+    assert np.isclose(max_p, 2 * 450.0 / (3 * 3.0 * (1.5 - e)))
+    assert min_p == 0.0 and np.isclose(avg_p, 50.0)
+
+    print("单塔基底脱开压力测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("偏心基底压力测试")
+    print("=" * 60)
+
+    test_closed_form_cases()
+    test_partial_uplift_equilibrium()
+    test_near_uniaxial_and_small_contact()
+    test_tower_calculator_uplift()
+
+
+if __name__ == "__main__":
+    main()
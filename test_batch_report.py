@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试多项目批量报告生成
+验证进程池生成归档内容、失败项目记录、续做时跳过已完成项目及清理未完成/已修改项目，
+以及生成过程中被终止（暂存文件、归档写入中断）后续做保留已完成项目
+"""
+
+import sys
+import os
+import json
+import zipfile
+import tempfile
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from utils.batch_report import BatchReportGenerator, MANIFEST_NAME, STAGING_SUFFIX
+from utils.exporter import ResultExporter
+from test_helpers import make_params
+
+
+def write_projects(project_dir):
+    """写入两个参数项目、一个结果项目和一个无效项目"""
+    for name, load in (('项目A', 8000.0), ('项目B', 6000.0)):
+        params = make_params()
+        params['pile1']['load'] = load
+        with open(os.path.join(project_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+            json.dump(params, f, ensure_ascii=False)
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    assert ResultExporter().export_to_json(results, os.path.join(project_dir, '项目C.json'))[0]
+
+    with open(os.path.join(project_dir, '无效项目.json'), 'w', encoding='utf-8') as f:
+        json.dump({'pile1': {}}, f)
+
+
+def archive_names(archive):
+    """归档中的文件名"""
+    with zipfile.ZipFile(archive) as zf:
+        return zf.namelist()
+
+
+def test_batch_generation_and_resume():
+    """测试批量生成及续做"""
+    print("测试批量报告生成...")
+
+    events = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = os.path.join(tmp_dir, 'projects')
+        os.makedirs(project_dir)
+        write_projects(project_dir)
+        archive = os.path.join(tmp_dir, 'reports', '报告.zip')
+
+        generator = BatchReportGenerator(workers=2, progress=lambda *args: events.append(args))
+        summary = generator.generate(project_dir, archive)
+        assert sorted(summary['completed']) == ['项目A', '项目B', '项目C']
+        assert list(summary['failed']) == ['无效项目']
+        assert [event[0] for event in events] == [1, 2, 3, 4] and events[-1][1] == 4
+
+        names = archive_names(archive)
+        for project in ('项目A', '项目B', '项目C'):
+            assert f'{project}/{project}_计算报告.xlsx' in names
+            assert f'{project}/{project}_汇总报告.txt' in names
+            assert f'{project}/沉降分析图.png' in names
+            assert f'{project}/{MANIFEST_NAME}' in names
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+            assert '高架桥桩基沉降影响范围计算报告' in zf.read('项目A/项目A_汇总报告.txt').decode('utf-8')
+        print(f"   归档 {len(names)} 个文件，{os.path.getsize(archive) / 1e6:.1f} MB")
+
+        # 再次运行：已完成项目全部跳过，只重试失败项目
+        summary = BatchReportGenerator(workers=0, progress=None).generate(project_dir, archive)
+        assert summary['completed'] == [] and summary['skipped'] == ['项目A', '项目B', '项目C']
+        assert archive_names(archive) == names
+
+        # 模拟中断：项目B只写入部分文件（无完成标记），项目A被修改
+        with zipfile.ZipFile(archive) as zf:
+            kept = {name: zf.read(name) for name in names if not name.startswith('项目B/')}
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for name, data in kept.items():
+                zf.writestr(name, data)
+            zf.writestr('项目B/项目B_汇总报告.txt', b'partial')
+        params = make_params()
+        params['pile2']['load'] = 7000.0
+        with open(os.path.join(project_dir, '项目A.json'), 'w', encoding='utf-8') as f:
+            json.dump(params, f, ensure_ascii=False)
+
+        summary = BatchReportGenerator(workers=0, progress=None).generate(project_dir, archive)
+        assert summary['completed'] == ['项目A', '项目B'] and summary['skipped'] == ['项目C']
+        names = archive_names(archive)
+        assert len(names) == len(set(names))
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.read('项目B/项目B_汇总报告.txt') != b'partial'
+
+    print("批量报告生成测试通过！\n")
+
+
+class Killed(Exception):
+    """模拟进程被终止"""
+
+
+def truncate(path, size):
+    """截断文件（模拟写入中断）"""
+    with open(path, 'r+b') as f:
+        f.truncate(size)
+
+
+def test_resume_after_kill():
+    """测试生成过程中被终止后续做"""
+    print("测试终止后续做...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_dir = os.path.join(tmp_dir, 'projects')
+        os.makedirs(project_dir)
+        write_projects(project_dir)
+        os.remove(os.path.join(project_dir, '无效项目.json'))
+        archive = os.path.join(tmp_dir, '报告.zip')
+        staging = archive + STAGING_SUFFIX
+
+        # 第一个项目完成后被终止：已完成项目在暂存目录中，归档尚未写出
+        def kill_after_first(done, total, name, status):
+            raise Killed(name)
+
+        try:
+            BatchReportGenerator(workers=0, progress=kill_after_first).generate(project_dir, archive)
+            assert False, "应被终止"
+        except Killed as e:
+            first = str(e)
+        assert not os.path.exists(archive)
+        assert os.listdir(staging) == [f'{first}.zip']
+
+        # 终止时正在写入的暂存文件和归档临时文件只写了一部分
+        with open(os.path.join(staging, '项目B.zip.tmp'), 'wb') as f:
+            f.write(b'PK\x03\x04partial')
+        with open(archive + '.tmp', 'wb') as f:
+            f.write(b'PK\x03\x04partial')
+
+        summary = BatchReportGenerator(workers=0, progress=None).generate(project_dir, archive)
+        assert summary['skipped'] == [first] and len(summary['completed']) == 2
+        assert not os.path.exists(staging) and not os.path.exists(archive + '.tmp')
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+            names = zf.namelist()
+        assert sum(name.endswith(MANIFEST_NAME) for name in names) == 3
+
+        # 修改一个项目后重新生成，合并写出归档时被终止（归档临时文件截断）：原归档完好
+        with open(os.path.join(project_dir, '项目A.json'), 'r+', encoding='utf-8') as f:
+            params = json.load(f)
+            params['pile2']['load'] = 7000.0
+            f.seek(0)
+            f.truncate()
+            json.dump(params, f, ensure_ascii=False)
+        generator = BatchReportGenerator(workers=0, progress=None)
+
+        def killed_merge(archive, staging, fingerprints):
+            with open(archive + '.tmp', 'wb') as f:
+                f.write(b'PK\x03\x04partial')
+            raise Killed('merge')
+
+        generator._merge_archive = killed_merge
+        try:
+            generator.generate(project_dir, archive)
+            assert False, "应被终止"
+        except Killed:
+            pass
+        assert os.listdir(staging) == ['项目A.zip']
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.namelist() == names
+
+        # 归档本身被截断（如旧版本追加写入时中断）：已暂存的项目仍然保留，其余项目重新生成
+        truncate(archive, os.path.getsize(archive) // 2)
+        summary = BatchReportGenerator(workers=0, progress=None).generate(project_dir, archive)
+        assert summary['completed'] == ['项目B', '项目C'] and summary['skipped'] == ['项目A']
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+            assert sum(name.endswith(MANIFEST_NAME) for name in zf.namelist()) == 3
+
+    print("终止后续做测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("多项目批量报告生成测试")
+    print("=" * 60)
+
+    test_batch_generation_and_resume()
+    test_resume_after_kill()
+
+
+if __name__ == "__main__":
+    main()
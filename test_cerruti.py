@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Cerruti水平荷载位移计算
+验证表面闭合解、互等定理、与Boussinesq竖向位移一致、斜向荷载叠加及位移场安全评估
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.boussinesq import BoussinesqCalculator
+from calculation.cerruti import CerrutiCalculator
+from calculation.settlement import SettlementCalculator
+
+
+G = 8.0     # MPa
+NU = 0.3
+
+
+def test_closed_form():
+    """测试表面水平位移闭合解及方向旋转"""
+    print("测试Cerruti表面位移...")
+
+    calculator = CerrutiCalculator()
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-5, 5, (2, 200))
+    ux, uy, uz = calculator.calculate_displacement(100.0, 0.0, 0.0, G, x, y, 0.0, NU)
+
+    # 表面: ux = Q/(2πGR)·[(1-ν) + νx²/R²]，uz = Q(1-2ν)x/(4πGR²)
+    R = np.hypot(x, y)
+    factor = 100e3 / (G * 1e6)
+    assert np.allclose(ux, factor / (2 * np.pi * R) * ((1 - NU) + NU * x**2 / R**2))
+    assert np.allclose(uy, factor / (2 * np.pi * R) * NU * x * y / R**2)
+    assert np.allclose(uz, factor * (1 - 2 * NU) * x / (4 * np.pi * R**2))
+
+    # y向水平力等于将x向结果旋转90°
+    z = rng.uniform(0, 5, 200)
+    rotated = calculator.calculate_horizontal_displacement(100.0, G, x, y, z, NU, direction=90.0)
+    reference = calculator.calculate_displacement(100.0, 0.0, 0.0, G, y, -x, z, NU)
+    assert np.allclose(rotated[0], -reference[1], atol=1e-15)
+    assert np.allclose(rotated[1], reference[0])
+    assert np.allclose(rotated[2], reference[2])
+
+    # 荷载作用点处取0
+    assert calculator.calculate_displacement(100.0, 50.0, 300.0, G, 0.0, 0.0, 0.0, NU) == (0.0, 0.0, 0.0)
+
+    print("Cerruti表面位移测试通过！\n")
+
+
+def test_reciprocity_and_boussinesq():
+    """测试与Boussinesq解一致及Betti互等定理"""
+    print("测试与Boussinesq解一致性...")
+
+    calculator = CerrutiCalculator()
+    boussinesq = BoussinesqCalculator()
+    points = [(1.1, 0.0, 1.0), (2.2, 1.5, 2.0), (-3.0, 2.0, 0.5), (0.5, -4.0, 4.0)]
+    for x, y, z in points:
+        uz = calculator.calculate_displacement(0.0, 0.0, 500.0, G, x, y, z, NU)[2]
+        assert np.isclose(uz, boussinesq.calculate_settlement(500.0, G, x, y, z, NU))
+
+    # 表面两点A、B：A处竖向力引起B处x向位移 = B处x向力引起A处竖向位移
+    x = np.linspace(-4, 4, 9)
+    x = x[x != 0]
+    ux_from_vertical = calculator.calculate_displacement(0.0, 0.0, 100.0, G, x, 0.0, 0.0, NU)[0]
+    uz_from_horizontal = calculator.calculate_displacement(100.0, 0.0, 0.0, G, -x, 0.0, 0.0, NU)[2]
+    assert np.allclose(ux_from_vertical, uz_from_horizontal)
+
+    print("Boussinesq一致性与互等定理测试通过！\n")
+
+
+def test_inclined_field():
+    """测试斜向荷载叠加、位移场网格及安全评估"""
+    print("测试斜向荷载位移场...")
+
+    calculator = CerrutiCalculator(chunk_size=1000)
+    Qx, Qy, P = calculator.resolve_inclined_load(800.0, inclination=15.0, azimuth=30.0)
+    assert np.isclose(np.sqrt(Qx**2 + Qy**2 + P**2), 800.0)
+
+    loads = [{'x': 0.0, 'y': 0.0, 'Qx': Qx, 'Qy': Qy, 'P': P},
+             {'x': 4.0, 'y': 0.0, 'Qx': Qx, 'Qy': Qy, 'P': P}]
+    grid = calculator.calculate_grid(loads, G, NU, np.linspace(-10, 14, 49), np.linspace(-10, 10, 41), [1.0, 2.0])
+    assert grid['uz'].shape == (2, 41, 49)
+
+    # 逐荷载、逐点计算叠加结果一致
+    for k, j, i in [(0, 20, 20), (1, 5, 30), (0, 40, 0)]:
+        x, y, z = grid['x'][k, j, i], grid['y'][k, j, i], grid['z'][k, j, i]
+        expected = sum(np.array(calculator.calculate_displacement(Qx, Qy, P, G, x - load['x'], y, z, NU))
+                       for load in loads)
+        assert np.allclose([grid['ux'][k, j, i], grid['uy'][k, j, i], grid['uz'][k, j, i]], expected)
+
+    points = np.column_stack([grid['x'][0].ravel(), grid['y'][0].ravel(), grid['z'][0].ravel()])
+    safety = calculator.evaluate_safety(points, calculator.calculate_field(loads, G, NU, points), "一级公路")
+    assert np.isclose(safety['max_settlement_mm'], grid['uz'][0].max() * 1000)
+    print(f"   最大竖向位移 {safety['max_settlement_mm']:.2f} mm，安全等级: {safety['safety_level']}")
+
+    print("斜向荷载位移场测试通过！\n")
+
+
+def test_field_safety():
+    """测试位移场安全评估按数组分级，与逐点评估一致"""
+    print("测试位移场安全评估...")
+
+    rng = np.random.default_rng(0)
+    n = 200000
+    points = np.column_stack([rng.uniform(-20, 20, n), rng.uniform(-20, 20, n), np.ones(n)])
+    field = {'uz': rng.uniform(0.0, 0.25, n)}
+
+    calculator = CerrutiCalculator()
+    start = time.time()
+    safety = calculator.evaluate_safety(points, field, "高速公路")
+    elapsed = time.time() - start
+    print(f"   {n}个计算点，耗时 {elapsed * 1000:.1f} ms")
+
+    statistics = safety['safety_statistics']
+    assert sum(statistics.values()) == n
+    assert statistics['danger_points'] == safety['danger_points_count'] == np.sum(field['uz'] * 1000 > 150)
+    assert safety['warning_points_count'] == np.sum(field['uz'] * 1000 > 80)
+    assert elapsed < 0.5
+
+    # 与沉降计算模块逐点评估结果一致
+    subset = slice(0, 500)
+    results = [{'x': x, 'y': y, 'z': z, 'settlement_mm': value * 1000}
+               for (x, y, z), value in zip(points[subset].tolist(), field['uz'][subset].tolist())]
+    expected = SettlementCalculator()._evaluate_safety(results, "高速公路")
+    assert calculator.evaluate_safety(points[subset], {'uz': field['uz'][subset]}, "高速公路") == expected
+
+    print("位移场安全评估测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Cerruti水平荷载位移测试")
+    print("=" * 60)
+
+    test_closed_form()
+    test_reciprocity_and_boussinesq()
+    test_inclined_field()
+    test_field_safety()
+
+
+if __name__ == "__main__":
+    main()
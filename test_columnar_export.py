@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试列式二进制导出
+验证计算点结果往返、网格沉降场形状还原、元数据、按列读取及百万行读取速度
+"""
+
+import sys
+import os
+import time
+import tempfile
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.cerruti import CerrutiCalculator
+from utils.exporter import ResultExporter
+from utils.columnar import save_columnar, load_columnar, parquet_available
+from test_excel_export_fix import create_mock_calculation_results
+
+
+def test_points_round_trip():
+    """测试计算点结果往返"""
+    print("测试计算点结果往返...")
+
+    exporter = ResultExporter()
+    results = create_mock_calculation_results()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        success, message = exporter.export_to_columnar(results, os.path.join(tmp_dir, 'points.npz'), engine='npz')
+        assert success, message
+        columns, metadata = load_columnar(os.path.join(tmp_dir, 'points.npz'))
+
+    assert columns['settlement_mm'].dtype == np.float64
+    assert np.allclose(columns['settlement_mm'], [p['settlement_mm'] for p in results['points']])
+    assert list(columns['point_id']) == [p['point_id'] for p in results['points']]
+    assert columns['soil_properties.name'][10] == '砂土'
+    assert metadata['project']['input_parameters']['project_name'] == '测试项目'
+    assert metadata['project']['statistics']['max_settlement_mm'] == 15.23
+    print(f"   {len(columns)} 列: {', '.join(list(columns)[:5])} ...")
+
+    print("计算点结果往返测试通过！\n")
+
+
+def test_grid_field():
+    """测试网格位移场形状还原、附加元数据及按列读取"""
+    print("测试网格沉降场...")
+
+    grid = CerrutiCalculator().calculate_grid([{'x': 9.0, 'y': 0.0, 'Qx': -40.0, 'P': 1500.0}], 8.0, 0.3,
+                                              np.linspace(-6, 6, 25), np.linspace(-30, 30, 61), [0.0, 0.5, 1.0])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 未安装 pyarrow 时退回 .npz
+        path = save_columnar(grid, os.path.join(tmp_dir, 'field.parquet'), metadata={'load_case': '工况1'})
+        assert path.endswith('.parquet' if parquet_available() else '.npz')
+
+        columns, metadata = load_columnar(path)
+        assert metadata['metadata']['load_case'] == '工况1'
+        for name, values in grid.items():
+            assert np.array_equal(columns[name], values), name
+
+        uz, _ = load_columnar(path, columns=['uz'])
+        assert list(uz) == ['uz'] and uz['uz'].shape == grid['uz'].shape
+
+    print("网格沉降场测试通过！\n")
+
+
+def test_large_sweep():
+    """测试百万行参数扫描结果的写出与读取"""
+    print("测试百万行列式数据...")
+
+    rng = np.random.default_rng(0)
+    n_rows = 1000000
+    sweep = {
+        'pile_length': rng.uniform(10, 40, n_rows),
+        'pile_diameter': rng.uniform(0.8, 2.0, n_rows),
+        'settlement_mm': rng.gamma(2.0, 5.0, n_rows),
+        'safe': rng.random(n_rows) > 0.1
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.time()
+        path = save_columnar(sweep, os.path.join(tmp_dir, 'sweep'), engine='npz')
+        write_time = time.time() - start
+
+        start = time.time()
+        columns, _ = load_columnar(path, columns=['settlement_mm'])
+        read_time = time.time() - start
+        print(f"   {n_rows}行，文件 {os.path.getsize(path) / 1e6:.1f} MB，写出 {write_time:.2f}s，单列读取 {read_time * 1000:.0f}ms")
+
+        assert np.array_equal(columns['settlement_mm'], sweep['settlement_mm'])
+        assert load_columnar(path)[0]['safe'].dtype == bool
+        assert read_time < 1.0
+
+    print("百万行列式数据测试通过！\n")
+
+
+def test_export_formats():
+    """测试导出格式列表"""
+    formats = ResultExporter().get_export_formats()
+    assert formats['columnar']['extension'] in ('.parquet', '.npz')
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("列式二进制导出测试")
+    print("=" * 60)
+
+    test_points_round_trip()
+    test_grid_field()
+    test_large_sweep()
+    test_export_formats()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试等高线图的解析沉降场
+验证沉降场与逐点计算一致、按屏幕分辨率采样、沉降场缓存及平移/缩放后重新求值（含界面更换画布）
+"""
+
+import sys
+import os
+import gc
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from visualization.plotter import ResultPlotter, CONTOUR_MAX_SAMPLES
+from test_helpers import make_params
+
+
+def test_field_matches_points():
+    """测试沉降场与逐点计算结果一致"""
+    print("测试沉降场与计算点一致...")
+
+    calculator = SettlementCalculator()
+    params = make_params()
+    params['soil_layers'][0]['depth_range'] = '0-2.5'
+    results = calculator.calculate_settlement(params)
+
+    x = np.array([point['x'] for point in results['points']])
+    z = np.array([point['z'] for point in results['points']])
+    field = calculator.calculate_settlement_field(params, x, z)
+    expected = np.array([point['settlement_mm'] for point in results['points']])
+    assert np.allclose(field, expected, rtol=1e-12)
+
+    # 分层处按土层分界取值，网格形状保持
+    X, Z = np.meshgrid(np.linspace(-15, 15, 31), np.linspace(0.5, 20, 40))
+    assert calculator.calculate_settlement_field(params, X, Z).shape == (40, 31)
+
+    print("沉降场一致性测试通过！\n")
+
+
+def test_contour_field_cache_and_refresh():
+    """测试沉降场缓存及缩放后重新求值"""
+    print("测试沉降场缓存及缩放重新求值...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    plotter = ResultPlotter()
+
+    fig = plotter.create_contour_plot(results)
+    ax = fig.axes[0]
+    assert len(plotter._contour_fields) == 1
+    X, Y, field = next(iter(plotter._contour_fields.values()))
+    assert X.shape[1] > 100 and max(X.shape) <= CONTOUR_MAX_SAMPLES
+    assert np.isnan(field[Y >= 0]).all() and np.isfinite(field[Y < 0]).all()
+    plt.close(fig)
+
+    # 相同计算参数（新的结果字典）再次绘制时取用缓存
+    fig = plotter.create_contour_plot(dict(results))
+    ax = fig.axes[0]
+    assert len(plotter._contour_fields) == 1
+
+    # 缩放：下一次绘制时按新的显示范围求值一次
+    fig.canvas.draw()
+    ax.set_xlim(-12, 0)
+    ax.set_ylim(-6, 0)
+    fig.canvas.draw()
+    assert len(plotter._contour_fields) == 2
+    X, Y, _ = next(reversed(plotter._contour_fields.values()))
+    assert (X.min(), X.max(), Y.min(), Y.max()) == (-12, 0, -6, 0)
+    assert ax.get_xlim() == (-12, 0) and ax.get_ylim() == (-6, 0)
+    fig.canvas.draw()
+    assert len(plotter._contour_fields) == 2
+    plt.close(fig)
+
+    print("沉降场缓存及缩放重新求值测试通过！\n")
+
+
+def test_refresh_after_canvas_swap():
+    """测试界面以新画布包装图形后缩放仍重新求值"""
+    print("测试更换画布后缩放重新求值...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    plotter = ResultPlotter()
+    fig = plotter.create_contour_plot(results)
+    ax = fig.axes[0]
+
+    # 与界面相同：新建画布包装图形后连接，重复连接不产生重复回调
+    canvas = FigureCanvasAgg(fig)
+    before = len(canvas.callbacks.callbacks.get('draw_event', {}))
+    plotter.attach_contour_refresh(canvas)
+    plotter.attach_contour_refresh(canvas)
+    connected = len(canvas.callbacks.callbacks.get('draw_event', {}))
+    assert 1 <= connected <= before + 1
+
+    canvas.draw()
+    ax.set_xlim(-10, 2)
+    canvas.draw()
+    assert len(plotter._contour_fields) == 2
+    X, Y, _ = next(reversed(plotter._contour_fields.values()))
+    assert (X.min(), X.max()) == (-10, 2)
+
+    # 非等高线图不做处理，关闭后图形可释放
+    other = plt.figure()
+    plotter.attach_contour_refresh(FigureCanvasAgg(other))
+    plt.close('all')
+    del fig, ax, canvas, other
+    gc.collect()
+    assert not plotter._contour_refresh
+
+    print("更换画布后缩放重新求值测试通过！\n")
+
+
+def test_points_only_results():
+    """测试只有计算点的结果仍由插值绘制"""
+    print("测试只有计算点的结果...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    points_only = {'points': results['points'], 'safety_assessment': results['safety_assessment']}
+    plotter = ResultPlotter()
+    fig = plotter.create_contour_plot(points_only)
+    assert not plotter._contour_fields
+    plt.close(fig)
+
+    print("只有计算点的结果测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("等高线图解析沉降场测试")
+    print("=" * 60)
+
+    test_field_matches_points()
+    test_contour_field_cache_and_refresh()
+    test_refresh_after_canvas_swap()
+    test_points_only_results()
+
+
+if __name__ == "__main__":
+    main()
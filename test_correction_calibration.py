@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试修正系数标定
+验证系数文件加载与数组求值、合成数值模拟结果标定、分块汇总及版本化系数文件
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.boussinesq import BoussinesqCalculator
+from calculation.correction import (
+    CorrectionCalculator, CorrectionCoefficients, get_correction_coefficients,
+    reload_correction_coefficients, DEFAULT_CORRECTION_FILE
+)
+from calculation.correction_calibration import CorrectionCalibrator
+
+
+def make_results(n_rows=200000, seed=0):
+    """生成合成数值模拟结果：数值解 = Boussinesq解 × a(L)·b(D) × 噪声"""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'pile_length': rng.choice(np.arange(10.0, 45.0, 5.0), n_rows),
+        'pile_diameter': rng.choice([0.8, 1.0, 1.2, 1.5, 1.8, 2.0], n_rows),
+        'load': rng.uniform(500, 3000, n_rows),
+        'shear_modulus': rng.uniform(3, 10, n_rows),
+        'poisson_ratio': rng.uniform(0.25, 0.4, n_rows),
+        'x': rng.uniform(1, 20, n_rows),
+        'y': rng.uniform(-5, 5, n_rows),
+        'z': rng.uniform(0, 10, n_rows)
+    })
+    theoretical = BoussinesqCalculator().calculate_settlement_array(
+        frame['load'], frame['shear_modulus'], frame['x'], frame['y'], frame['z'], frame['poisson_ratio']
+    )
+    a = 0.97 - 0.0008 * frame['pile_length']
+    b = 0.05 * frame['pile_diameter']**2 - 0.25 * frame['pile_diameter'] + 1.2
+    frame['numerical_settlement'] = theoretical * a * b * rng.normal(1.0, 0.01, n_rows)
+    return frame
+
+
+def test_coefficient_file():
+    """测试共享系数文件及数组求值"""
+    print("测试修正系数文件...")
+
+    coefficients = get_correction_coefficients()
+    assert CorrectionCalculator().coefficients is coefficients
+    assert coefficients.path == DEFAULT_CORRECTION_FILE
+
+    calculator = CorrectionCalculator()
+    assert np.isclose(calculator.calculate_length_correction(20.0), 0.985 - 0.00051 * 20)
+    assert np.isclose(calculator.calculate_diameter_correction(1.0), 0.038 - 0.206 + 1.159)
+    assert isinstance(calculator.calculate_combined_correction(20.0, 1.0), float)
+
+    lengths = np.linspace(10, 40, 7)
+    diameters = np.linspace(0.8, 2.0, 7)
+    combined = calculator.calculate_combined_correction(lengths, diameters)
+    assert np.allclose(combined, [calculator.calculate_combined_correction(l, d) for l, d in zip(lengths, diameters)])
+
+    assert calculator.validate_correction_parameters(20.0, 1.0)[0]
+    assert not calculator.validate_correction_parameters(20.0, 3.0)[0]
+
+    print("修正系数文件测试通过！\n")
+
+
+def test_calibration():
+    """测试标定恢复修正曲面并生成新版本系数文件"""
+    print("测试修正系数标定...")
+
+    results = make_results()
+    calibrator = CorrectionCalibrator(chunksize=30000)
+
+    # 理论沉降与沉降计算使用同一Boussinesq解
+    sample = results.iloc[:20].drop(columns='numerical_settlement').assign(numerical_settlement=1.0)
+    expected = [1.0 / BoussinesqCalculator().calculate_settlement(row.load, row.shear_modulus, row.x, row.y, row.z,
+                                                                  row.poisson_ratio)
+                for row in sample.itertuples()]
+    assert np.allclose(calibrator.calculate_ratios(sample), expected, rtol=1e-12)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 分两个CSV文件分块读取，与整表汇总一致
+        paths = [os.path.join(tmp_dir, f'flac3d_{i}.csv') for i in range(2)]
+        results.iloc[:120000].to_csv(paths[0], index=False)
+        results.iloc[120000:].to_csv(paths[1], index=False)
+        output = os.path.join(tmp_dir, 'coefficients', 'correction_coefficients.json')
+        coefficients = calibrator.calibrate(paths, output)
+
+        summary = CorrectionCalibrator(chunksize=len(results)).summarize([results])
+        assert summary['count'].sum() == len(results)
+        assert np.allclose(CorrectionCalibrator().fit(summary)['length'], coefficients.length, rtol=1e-6)
+
+        loaded = reload_correction_coefficients(output)
+        try:
+            calculator = CorrectionCalculator()
+            assert calculator.coefficients is loaded
+            assert loaded.version == get_correction_coefficients().version
+            assert loaded.version == CorrectionCoefficients.from_file(DEFAULT_CORRECTION_FILE).version + 1
+
+            lengths, diameters = np.meshgrid(np.arange(10.0, 45.0, 5.0), [0.8, 1.0, 1.5, 2.0])
+            expected = (0.97 - 0.0008 * lengths) * (0.05 * diameters**2 - 0.25 * diameters + 1.2)
+            assert np.allclose(calculator.calculate_combined_correction(lengths, diameters), expected, rtol=2e-3)
+        finally:
+            reload_correction_coefficients(DEFAULT_CORRECTION_FILE)
+
+    statistics = coefficients.statistics
+    print(f"   a = {coefficients.length[0]:.4f} + ({coefficients.length[1]:.6f})·L")
+    print(f"   b = {coefficients.diameter[0]:.4f} + ({coefficients.diameter[1]:.4f})·D + {coefficients.diameter[2]:.4f}·D²")
+    print(f"   {statistics['n_samples']}个结果，{statistics['n_combinations']}个组合，"
+          f"均方根误差 {statistics['rmse']:.4f}，迭代 {statistics['iterations']} 次")
+    assert statistics['converged'] and abs(statistics['rmse'] - 0.01 * 0.9) < 3e-3
+    assert coefficients.length_range == (10.0, 40.0)
+
+    print("修正系数标定测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("修正系数标定测试")
+    print("=" * 60)
+
+    test_coefficient_file()
+    test_calibration()
+
+
+if __name__ == "__main__":
+    main()
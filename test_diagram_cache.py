@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试计算简图内存嵌入及缓存
+验证简图嵌入Excel、未修改工程重复导出不重新绘制、输入变化重新绘制及目录缓存
+"""
+
+import sys
+import os
+import tempfile
+import openpyxl
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.exporter import ResultExporter, clear_diagram_cache
+from visualization.plotter import ResultPlotter
+from test_excel_export_fix import create_mock_calculation_results
+
+
+class RenderCounter:
+    """统计计算简图绘制次数"""
+
+    def __init__(self):
+        self.count = 0
+        self.original = ResultPlotter.settlement_distribution_plot
+
+    def __enter__(self):
+        counter = self
+
+        def counted(plotter, *args):
+            counter.count += 1
+            return counter.original(plotter, *args)
+
+        ResultPlotter.settlement_distribution_plot = counted
+        return self
+
+    def __exit__(self, *exc_info):
+        ResultPlotter.settlement_distribution_plot = self.original
+
+
+def count_images(path):
+    """统计计算简图表中的图像数"""
+    workbook = openpyxl.load_workbook(path)
+    return len(workbook['计算简图']._images)
+
+
+def test_embedded_diagram():
+    """测试计算简图嵌入两种导出方式"""
+    print("测试计算简图嵌入...")
+
+    clear_diagram_cache()
+    exporter = ResultExporter()
+    results = create_mock_calculation_results()
+
+    with tempfile.TemporaryDirectory() as tmp_dir, RenderCounter() as counter:
+        for streaming in (False, True):
+            path = os.path.join(tmp_dir, f'report_{streaming}.xlsx')
+            assert exporter.export_to_excel(results, path, streaming=streaming)[0]
+            assert count_images(path) == 1
+        # 临时目录中除导出文件外不产生图像文件
+        assert sorted(os.listdir(tmp_dir)) == ['report_False.xlsx', 'report_True.xlsx']
+
+    assert counter.count == 1
+    print("计算简图嵌入测试通过！\n")
+
+
+def test_cache_hits_and_misses():
+    """测试未修改工程复用缓存、输入变化重新绘制"""
+    print("测试计算简图缓存...")
+
+    clear_diagram_cache()
+    exporter = ResultExporter()
+    results = create_mock_calculation_results()
+
+    with tempfile.TemporaryDirectory() as tmp_dir, RenderCounter() as counter:
+        path = os.path.join(tmp_dir, 'report.xlsx')
+        exporter.export_to_excel(results, path)
+        exporter._render_calculation_diagram(results, results['input_parameters'])
+        exporter.export_to_excel(create_mock_calculation_results(), path)
+        assert counter.count == 1
+
+        results['points'][0]['settlement_mm'] += 1.0
+        exporter._render_calculation_diagram(results, results['input_parameters'])
+        assert counter.count == 2
+
+        results['input_parameters']['road_params']['width'] = 14.0
+        exporter.export_to_excel(results, path)
+        assert counter.count == 3
+        print(f"   3个不同工程状态共绘制 {counter.count} 次")
+
+    print("计算简图缓存测试通过！\n")
+
+
+def test_directory_cache():
+    """测试缓存目录跨进程复用"""
+    print("测试计算简图目录缓存...")
+
+    results = create_mock_calculation_results()
+    with tempfile.TemporaryDirectory() as tmp_dir, RenderCounter() as counter:
+        cache_dir = os.path.join(tmp_dir, 'diagrams')
+        clear_diagram_cache()
+        image = ResultExporter(cache_dir)._render_calculation_diagram(results, results['input_parameters'])
+        assert len(os.listdir(cache_dir)) == 1
+
+        # 清空进程内缓存，模拟新进程
+        clear_diagram_cache()
+        cached = ResultExporter(cache_dir)._render_calculation_diagram(results, results['input_parameters'])
+        assert counter.count == 1
+        assert cached.getvalue() == image.getvalue()
+
+    print("计算简图目录缓存测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("计算简图缓存测试")
+    print("=" * 60)
+
+    test_embedded_diagram()
+    test_cache_hits_and_misses()
+    test_directory_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试路面差异沉降评估
+验证解析沉降场的坡度与角变形、角变形与网格间距无关、限值检查与最不利位置、百万网格点计算及位移场接口
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.cerruti import CerrutiCalculator
+from calculation.differential_settlement import DifferentialSettlementAnalyzer
+
+
+def test_analytic_fields():
+    """测试平面及抛物面沉降场"""
+    print("测试解析沉降场...")
+
+    analyzer = DifferentialSettlementAnalyzer()
+    x = np.linspace(-10, 10, 41)
+    y = np.linspace(0, 100, 201)
+    X, Y = np.meshgrid(x, y)
+
+    # 平面沉降场：坡度为常数，无角变形
+    fields = analyzer.calculate_fields(x, y, 20 + 0.8 * X + 0.3 * Y, road_width=12.0)
+    assert np.allclose(fields['transverse_slope'], 0.8e-3)
+    assert np.allclose(fields['longitudinal_slope'], 0.3e-3)
+    assert np.allclose(fields['angular_distortion'], 0.0, atol=1e-12)
+    assert np.allclose(fields['differential_settlement'], 0.8 * 12.0)
+
+    # 纵向抛物面 s = c·(y-50)²：相邻两段评估跨度 L 的弦坡度之差为 2c·L，两端 L 范围内为0
+    c = 0.02
+    fields = analyzer.calculate_fields(x, y, c * (Y - 50)**2)
+    span = fields['reference_span'][1]
+    inner = (y >= span) & (y <= 100 - span)
+    assert span == 5.0
+    assert np.allclose(fields['angular_distortion'][inner], 2 * c * span / 1000)
+    assert np.allclose(fields['angular_distortion'][~inner], 0.0)
+    assert np.isclose(fields['longitudinal_slope'].max(), 2 * c * 50 / 1000)
+
+    print("解析沉降场测试通过！\n")
+
+
+def test_grid_refinement():
+    """测试角变形与网格间距无关"""
+    print("测试网格加密...")
+
+    values = []
+    for n in (41, 201, 2001):
+        x = np.linspace(-10, 10, n)
+        y = np.linspace(0, 60, n)
+        X, Y = np.meshgrid(x, y)
+        settlement = 40 * np.exp(-((X - 3)**2 + (Y - 20)**2) / 10)
+        result = DifferentialSettlementAnalyzer().analyze(x, y, settlement)
+        values.append(result['angular_distortion']['value'])
+    print(f"   41/201/2001 网格点角变形 {values[0]:.5f} / {values[1]:.5f} / {values[2]:.5f}")
+    assert abs(values[1] - values[2]) < 0.005 * values[2]
+    assert abs(values[0] - values[2]) < 0.05 * values[2]
+
+    # 指定评估跨度
+    x = np.linspace(-10, 10, 201)
+    y = np.linspace(0, 60, 301)
+    X, Y = np.meshgrid(x, y)
+    fields = DifferentialSettlementAnalyzer(reference_span=2.0).calculate_fields(x, y, 0.02 * X**2)
+    assert fields['reference_span'] == (2.0, 2.0)
+    assert np.isclose(fields['angular_distortion'].max(), 2 * 0.02 * 2.0 / 1000)
+    try:
+        DifferentialSettlementAnalyzer(reference_span=15.0).calculate_fields(x, y, 0.02 * X**2)
+        assert False, "应拒绝超过网格范围一半的评估跨度"
+    except ValueError:
+        pass
+
+    print("网格加密测试通过！\n")
+
+
+def test_limits_and_worst_locations():
+    """测试限值检查及最不利位置"""
+    print("测试限值检查...")
+
+    x = np.linspace(-8, 8, 33)
+    y = np.linspace(0, 60, 121)
+    X, Y = np.meshgrid(x, y)
+    settlement = 40 * np.exp(-((X - 3)**2 + (Y - 20)**2) / 10)
+
+    result = DifferentialSettlementAnalyzer().analyze(x, y, settlement, road_width=12.0)
+    location = result['differential_settlement']['location']
+    print(f"   最大差异沉降 {result['differential_settlement']['value']:.2f} mm，位于 y = {location['y']} m")
+    print(f"   最大横向坡度变化 {result['transverse_slope']['value']:.4f}，最大角变形 {result['angular_distortion']['value']:.4f}")
+
+    assert location['y'] == 20.0 and location['x_max'] == 3.0
+    assert result['differential_settlement']['exceeded'] and not result['safe']
+    assert len(result['transverse_slope']['worst']) == 5
+    values = [item['value'] for item in result['transverse_slope']['worst']]
+    assert values == sorted(values, reverse=True)
+    assert abs(result['transverse_slope']['location']['y'] - 20.0) < 1.0
+
+    relaxed = DifferentialSettlementAnalyzer(limits={'differential_settlement': 100.0, 'transverse_slope': 0.05,
+                                                     'longitudinal_slope': 0.05, 'angular_distortion': 0.05})
+    assert relaxed.analyze(x, y, settlement, road_width=12.0)['safe']
+
+    try:
+        DifferentialSettlementAnalyzer(limits={'tilt': 0.01})
+        assert False, "应拒绝未知限值项"
+    except ValueError:
+        pass
+
+    print("限值检查测试通过！\n")
+
+
+def test_dense_field():
+    """测试百万网格点及Cerruti位移场接口"""
+    print("测试大规模沉降场...")
+
+    x = np.linspace(-15, 15, 1001)
+    y = np.linspace(0, 500, 1001)
+    settlement = np.random.default_rng(0).normal(0, 1, (1001, 1001)).cumsum(axis=0) * 0.1
+
+    start = time.time()
+    result = DifferentialSettlementAnalyzer().analyze(x, y, settlement)
+    print(f"   {settlement.size}个网格点，耗时 {time.time() - start:.2f}s")
+    assert result['fields']['angular_distortion'].shape == settlement.shape
+
+    calculator = CerrutiCalculator()
+    grid = calculator.calculate_grid([{'x': 9.0, 'y': 0.0, 'Qx': -40.0, 'P': 1500.0}], 8.0, 0.3,
+                                     np.linspace(-6, 6, 25), np.linspace(-30, 30, 61), 0.5)
+    from_grid = DifferentialSettlementAnalyzer().analyze_grid(grid, road_width=12.0)
+    direct = DifferentialSettlementAnalyzer().analyze(grid['x'][0], grid['y'][:, 0], grid['uz'] * 1000, 12.0)
+    assert from_grid['transverse_slope']['value'] == direct['transverse_slope']['value']
+    assert from_grid['differential_settlement']['location']['y'] == 0.0
+
+    print("大规模沉降场测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("路面差异沉降评估测试")
+    print("=" * 60)
+
+    test_analytic_fields()
+    test_grid_refinement()
+    test_limits_and_worst_locations()
+    test_dense_field()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试绘图器图形缓存
+验证缓存命中、显示范围恢复、计算点布局不变时原位更新图元、最近最少使用淘汰及图形关闭
+"""
+
+import sys
+import os
+import io
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from visualization.plotter import ResultPlotter, FIGURE_TYPES, FIGURE_CACHE_SIZE
+from test_helpers import make_params
+
+
+def render(fig):
+    """渲染为像素数组"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=40)
+    buffer.seek(0)
+    return plt.imread(buffer)
+
+
+def recalculated(load):
+    """修改桩1荷载后重新计算（计算点布局不变）"""
+    params = make_params()
+    params['pile1']['load'] = load
+    return SettlementCalculator().calculate_settlement(params)
+
+
+def test_cache_hit_and_view_restore():
+    """测试缓存命中及显示范围恢复"""
+    print("测试图形缓存命中...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    plotter = ResultPlotter()
+
+    figures = {plot_type: plotter.get_figure(plot_type, results) for plot_type in FIGURE_TYPES}
+    for plot_type, fig in figures.items():
+        # 界面每次传入新的结果字典副本
+        assert plotter.get_figure(plot_type, dict(results)) is fig
+    assert plotter.get_figure('radar', results, size=(8, 4)) is not figures['radar']
+    assert tuple(plotter.get_figure('radar', results, size=(8, 4)).get_size_inches()) == (8, 4)
+
+    # 缩放后切换回来：恢复初始显示范围
+    ax = figures['waterfall'].axes[0]
+    xlim = ax.get_xlim()
+    ax.set_xlim(0, 3)
+    assert plotter.get_figure('waterfall', results).axes[0].get_xlim() == xlim
+
+    plotter.clear_figure_cache()
+    print("图形缓存命中测试通过！\n")
+
+
+def test_in_place_update():
+    """测试计算点布局不变时原位更新"""
+    print("测试原位更新...")
+
+    plotter = ResultPlotter()
+    for plot_type in ('radar', 'waterfall'):
+        fig = plotter.get_figure(plot_type, recalculated(8000.0))
+        changed = recalculated(12000.0)
+        assert plotter.get_figure(plot_type, changed) is fig
+        assert len(plotter._figures) == 1
+
+        # 原位更新后的图形与重新创建的图形一致
+        fresh = getattr(ResultPlotter(), FIGURE_TYPES[plot_type][0])(changed)[0]
+        assert np.abs(render(fig) - render(fresh)).max() < 0.1
+        plt.close(fresh)
+        plotter.clear_figure_cache()
+
+    # 不支持原位更新的图形重新创建
+    fig = plotter.get_figure('settlement', recalculated(8000.0))
+    assert plotter.get_figure('settlement', recalculated(12000.0)) is not fig
+    assert len(plotter._figures) == 2
+
+    plotter.clear_figure_cache()
+    print("原位更新测试通过！\n")
+
+
+def test_eviction_closes_figures():
+    """测试淘汰时关闭图形"""
+    print("测试缓存淘汰...")
+
+    plt.close('all')
+    plotter = ResultPlotter()
+    first = plotter.get_figure('waterfall', recalculated(5000.0))
+    for i in range(FIGURE_CACHE_SIZE):
+        plotter.get_figure('settlement', recalculated(6000.0 + 500 * i))
+    assert len(plotter._figures) == FIGURE_CACHE_SIZE
+    assert first.number not in plt.get_fignums()
+    assert len(plt.get_fignums()) == FIGURE_CACHE_SIZE
+
+    plotter.clear_figure_cache()
+    assert not plt.get_fignums()
+    print("缓存淘汰测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("图形缓存测试")
+    print("=" * 60)
+
+    test_cache_hit_and_view_restore()
+    test_in_place_update()
+    test_eviction_closes_figures()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础尺寸优化
+验证最优方案满足全部验算、与细网格穷举结果接近，以及经济优化建议输出
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.tower_calculator import TowerCalculator
+from calculation.footing_optimizer import FootingOptimizer
+
+
+TEST_PARAMS = {
+    'tower_load': 600.0,
+    'horizontal_force': 60.0,
+    'force_height': 18.0,
+    'base_weight': 220.0,
+    'base_width': 3.0,
+    'base_length': 3.5,
+    'embedment_depth': 2.0,
+    'soil_type': '砂土'
+}
+
+
+def test_optimal_dimensions():
+    """测试最优尺寸满足验算且与穷举结果一致"""
+    print("测试基础尺寸优化...")
+
+    optimizer = FootingOptimizer()
+    start = time.time()
+    result = optimizer.optimize(TEST_PARAMS)
+    elapsed = (time.time() - start) * 1000
+
+    dimensions = result['optimal_dimensions']
+    print(f"   最优尺寸: {dimensions}，混凝土 {result['concrete_volume']:.2f}m³，"
+          f"验算 {result['evaluations']} 个方案，用时 {elapsed:.1f}ms")
+    assert result['feasible'] and result['volume_saving'] > 0
+
+    # 按缩放后的自重用单塔计算复核两种工况
+    params = dict(TEST_PARAMS, base_weight=result['base_weight'], **dimensions)
+    stability = TowerCalculator().calculate_comprehensive_stability(params)
+    for case in ('normal_condition', 'extreme_condition'):
+        calc = stability[case]
+        assert calc.bearing_check and calc.overturning_check and calc.sliding_check, case
+
+    # 按尺寸模数穷举
+    widths = np.arange(1.0, 8.0 + 1e-9, 0.05)
+    depths = np.arange(0.5, 4.0 + 1e-9, 0.05)
+    B, L, D = (axis.ravel() for axis in np.meshgrid(widths, widths, depths, indexing='ij'))
+    keep = optimizer._within_aspect_ratio(B, L)
+    exhaustive = optimizer.evaluate_dimensions(TEST_PARAMS, B[keep], L[keep], D[keep])
+    best_volume = np.where(exhaustive['feasible'], exhaustive['concrete_volume'], np.inf).min()
+    print(f"   穷举 {keep.sum()} 个方案最小混凝土量 {best_volume:.2f}m³")
+    assert result['concrete_volume'] <= best_volume * 1.01
+
+    print("基础尺寸优化测试通过！\n")
+
+
+def test_infeasible_bounds():
+    """测试搜索范围内无可行方案"""
+    print("测试无可行方案...")
+
+    result = FootingOptimizer().optimize(TEST_PARAMS, bounds={'base_width': (1.0, 1.5),
+                                                              'base_length': (1.0, 1.5)})
+    print(f"   最接近方案: {result['optimal_dimensions']}，控制验算项 {result['governing_check']}")
+    assert not result['feasible'] and result['critical_ratio'] > 1
+
+    print("无可行方案测试通过！\n")
+
+
+def test_economic_recommendation():
+    """测试经济优化建议"""
+    print("测试经济优化建议...")
+
+    recommendation = TowerCalculator().calculate_economic_recommendation(TEST_PARAMS)
+    for suggestion in recommendation['optimization_suggestions']:
+        print(f"   {suggestion}")
+    assert recommendation['optimal_design']['feasible']
+    assert '节约' in recommendation['optimization_suggestions'][0]
+
+    # 当前尺寸即为最优方案：不提示增大或节约
+    optimal = recommendation['optimal_design']
+    params = dict(TEST_PARAMS, base_weight=optimal['base_weight'], **optimal['optimal_dimensions'])
+    recommendation = TowerCalculator().calculate_economic_recommendation(params)
+    suggestion = recommendation['optimization_suggestions'][0]
+    print(f"   {suggestion}")
+    assert recommendation['optimal_design']['optimal_dimensions'] == optimal['optimal_dimensions']
+    assert abs(recommendation['optimal_design']['volume_saving']) < 1e-9
+    assert '已为' in suggestion and '增大' not in suggestion and '节约' not in suggestion
+
+    print("经济优化建议测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("基础尺寸优化测试")
+    print("=" * 60)
+
+    test_optimal_dimensions()
+    test_infeasible_bounds()
+    test_economic_recommendation()
+
+
+if __name__ == "__main__":
+    main()
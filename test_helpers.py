@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试共用数据
+各测试模块共用的计算参数及结果集生成函数
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from test_excel_export_fix import create_mock_calculation_results
+
+
+def make_params():
+    """双桩沉降计算参数"""
+    return {
+        'pile1': {'diameter': 1.2, 'length': 30.0, 'load': 8000.0},
+        'pile2': {'diameter': 1.0, 'length': 25.0, 'load': 6000.0},
+        'road_level': '高速公路',
+        'road_params': {'width': 12.0, 'pile1_distance': 5.0, 'pile2_distance': 5.0},
+        'soil_layers': [
+            {'depth_range': '0-5', 'name': '粉质粘土', 'compression_modulus': 8.5, 'poisson_ratio': 0.35},
+            {'depth_range': '5-10', 'name': '砂土', 'compression_modulus': 15.0, 'poisson_ratio': 0.30}
+        ]
+    }
+
+
+def make_columnar_results(n_points, seed=0):
+    """生成列式计算点的大结果集"""
+    rng = np.random.default_rng(seed)
+    results = create_mock_calculation_results()
+    settlement = rng.uniform(0, 30, n_points)
+    results['points'] = {
+        'point_id': [f'W{i + 1}' for i in range(n_points)],
+        'x': rng.uniform(-20, 20, n_points),
+        'y': rng.uniform(-10, 10, n_points),
+        'pile1_settlement': settlement * 0.6 / 1000,
+        'pile2_settlement': settlement * 0.4 / 1000,
+        'settlement_mm': settlement
+    }
+    return results
+
+
+def make_site_table(n_sites=50, seed=0):
+    """生成随机塔位表"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'site_id': [f'N{i+1:03d}' for i in range(n_sites)],
+        'tower_load': rng.uniform(300, 900, n_sites),
+        'horizontal_force': rng.uniform(20, 120, n_sites),
+        'force_height': rng.uniform(10, 30, n_sites),
+        'base_weight': rng.uniform(100, 400, n_sites),
+        'base_width': rng.uniform(1.5, 5.0, n_sites),
+        'base_length': rng.uniform(2.0, 6.0, n_sites),
+        'embedment_depth': rng.uniform(0.5, 3.0, n_sites),
+        'soil_type': rng.choice(['黏土', '砂土', '粉土', '岩石'], n_sites),
+    })
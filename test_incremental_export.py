@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Excel增量导出
+验证分区指纹、未修改分区沿用上次导出的工作表（含计算简图图像）、只重新生成已修改分区
+及文件经电子表格软件另存（改用共享字符串表）后完整导出
+"""
+
+import sys
+import os
+import re
+import copy
+import time
+import zipfile
+import tempfile
+import openpyxl
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from utils.exporter import ResultExporter, EXPORT_SECTIONS, clear_diagram_cache
+from test_helpers import make_params, make_columnar_results
+
+
+def sheet_part(path, sheet_name):
+    """读取工作表部件的原始内容"""
+    exporter = ResultExporter()
+    with zipfile.ZipFile(path) as zf:
+        return zf.read(exporter._xlsx_sheet_parts(zf)[sheet_name])
+
+
+def resave_with_shared_strings(path):
+    """
+    模拟电子表格软件另存：各工作表的内联字符串改存共享字符串表，保留文档自定义属性（分区指纹）
+    """
+    with zipfile.ZipFile(path) as zf:
+        parts = {info.filename: zf.read(info) for info in zf.infolist()}
+        sheet_parts = ResultExporter()._xlsx_sheet_parts(zf).values()
+
+    strings = []
+
+    def shared(match):
+        strings.append(match.group(2))
+        return f'{match.group(1)} t="s"><v>{len(strings) - 1}</v></c>'
+
+    for part in sheet_parts:
+        parts[part] = re.sub(r'(<c r="[A-Z]+\d+"(?: s="\d+")?) t="inlineStr"><is><t(?: [^>]*)?>(.*?)</t></is></c>',
+                             shared, parts[part].decode('utf-8')).encode('utf-8')
+    items = ''.join(f'<si><t xml:space="preserve">{text}</t></si>' for text in strings)
+    parts['xl/sharedStrings.xml'] = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        f'count="{len(strings)}" uniqueCount="{len(strings)}">{items}</sst>'
+    ).encode('utf-8')
+    parts['[Content_Types].xml'] = parts['[Content_Types].xml'].replace(b'</Types>', (
+        b'<Override PartName="/xl/sharedStrings.xml" '
+        b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>'))
+    parts['xl/_rels/workbook.xml.rels'] = parts['xl/_rels/workbook.xml.rels'].replace(b'</Relationships>', (
+        b'<Relationship Id="rId99" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+        b'sharedStrings" Target="sharedStrings.xml"/></Relationships>'))
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    return len(strings)
+
+
+def test_section_fingerprints():
+    """测试分区指纹只随相关输入变化"""
+    print("测试分区指纹...")
+
+    exporter = ResultExporter()
+    results = SettlementCalculator().calculate_settlement(make_params())
+    fingerprints = exporter._section_fingerprints(results)
+    assert list(fingerprints) == list(EXPORT_SECTIONS)
+    assert exporter._section_fingerprints(copy.deepcopy(results)) == fingerprints
+
+    changed = copy.deepcopy(results)
+    changed['safety_assessment']['recommendations'].append('加强施工期监测')
+    dirty = [name for name, value in exporter._section_fingerprints(changed).items() if value != fingerprints[name]]
+    assert dirty == ['安全评估']
+
+    changed['safety_assessment']['bridge_limit'] = 100
+    dirty = [name for name, value in exporter._section_fingerprints(changed).items() if value != fingerprints[name]]
+    assert dirty == ['计算结果', '安全评估', '计算简图']
+
+    print("分区指纹测试通过！\n")
+
+
+def test_incremental_export():
+    """测试增量导出沿用未修改分区"""
+    print("测试增量导出...")
+
+    exporter = ResultExporter()
+    results = SettlementCalculator().calculate_settlement(make_params())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'report.xlsx')
+        success, message = exporter.export_to_excel(results, path, incremental=True)
+        assert success and '重新生成 6 个分区' in message, message
+        assert exporter.read_section_fingerprints(path) == exporter._section_fingerprints(results)
+        first_points = sheet_part(path, '计算结果')
+
+        # 结果未修改：全部沿用，计算简图取自上次导出的文件而不重新绘制
+        clear_diagram_cache()
+        start = time.time()
+        success, message = exporter.export_to_excel(results, path, incremental=True)
+        assert success and '沿用 6 个分区' in message, message
+        assert time.time() - start < 1.0
+
+        # 只修改建议事项：只重新生成安全评估
+        changed = copy.deepcopy(results)
+        changed['safety_assessment']['recommendations'].append('加强施工期监测')
+        success, message = exporter.export_to_excel(changed, path, incremental=True)
+        assert success and '重新生成 1 个分区' in message, message
+        assert sheet_part(path, '计算结果') == first_points
+
+        wb = openpyxl.load_workbook(path)
+        assert wb.sheetnames == list(EXPORT_SECTIONS)
+        assert len(wb['计算简图']._images) == 1
+        sheet = wb['安全评估']
+        assert sheet.cell(row=sheet.max_row, column=2).value == '加强施工期监测'
+        assert wb['计算结果']['A3'].value == 'W1'
+        assert wb['统计分析']['A1'].font.bold
+
+        # 非增量导出的文件：完整导出
+        exporter.export_to_excel(results, path)
+        assert exporter.read_section_fingerprints(path) == {}
+        success, message = exporter.export_to_excel(results, path, incremental=True)
+        assert success and '重新生成 6 个分区' in message, message
+        assert not [name for name in os.listdir(tmp_dir) if name != 'report.xlsx']
+
+    print("增量导出测试通过！\n")
+
+
+def test_resaved_file():
+    """测试文件经电子表格软件另存后不沿用工作表，完整导出"""
+    print("测试另存后的增量导出...")
+
+    exporter = ResultExporter()
+    results = SettlementCalculator().calculate_settlement(make_params())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'report.xlsx')
+        assert exporter.export_to_excel(results, path, incremental=True)[0]
+        assert resave_with_shared_strings(path) > 0
+        assert openpyxl.load_workbook(path)['计算结果']['A3'].value == 'W1'
+        assert exporter.read_section_fingerprints(path) == {}
+
+        changed = copy.deepcopy(results)
+        changed['safety_assessment']['recommendations'].append('加强施工期监测')
+        success, message = exporter.export_to_excel(changed, path, incremental=True)
+        assert success and '重新生成 6 个分区' in message, message
+
+        wb = openpyxl.load_workbook(path)
+        assert wb.sheetnames == list(EXPORT_SECTIONS)
+        assert wb['计算结果']['A3'].value == 'W1'
+        sheet = wb['安全评估']
+        assert sheet.cell(row=sheet.max_row, column=2).value == '加强施工期监测'
+
+        # 完整导出后再次增量导出恢复沿用
+        success, message = exporter.export_to_excel(changed, path, incremental=True)
+        assert success and '沿用 6 个分区' in message, message
+
+    print("另存后的增量导出测试通过！\n")
+
+
+def test_incremental_large_table():
+    """测试大计算点表沿用"""
+    print("测试大计算点表增量导出...")
+
+    exporter = ResultExporter()
+    results = make_columnar_results(15000)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'large.xlsx')
+        start = time.time()
+        assert exporter.export_to_excel(results, path, incremental=True)[0]
+        full = time.time() - start
+
+        results['safety_assessment'] = dict(results['safety_assessment'], safety_level='需复核')
+        start = time.time()
+        success, message = exporter.export_to_excel(results, path, incremental=True)
+        partial = time.time() - start
+        assert success, message
+        print(f"   完整导出 {full:.2f}s，增量导出 {partial:.2f}s（{message}）")
+        assert partial < full
+
+        wb = openpyxl.load_workbook(path, read_only=True)
+        assert wb['计算结果'].max_row == 15006
+        assert wb['安全评估']['B2'].value == '需复核'
+
+    print("大计算点表增量导出测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Excel增量导出测试")
+    print("=" * 60)
+
+    test_section_fingerprints()
+    test_incremental_export()
+    test_resaved_file()
+    test_incremental_large_table()
+
+
+if __name__ == "__main__":
+    main()
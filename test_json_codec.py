@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试NumPy感知的JSON编解码
+验证计算结果往返、数组与标量类型保持、旁路二进制文件、紧凑模式及体积压缩
+"""
+
+import sys
+import os
+import json
+import tempfile
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.cerruti import CerrutiCalculator
+from calculation.settlement import SettlementCalculator
+from utils import json_codec
+from utils.exporter import ResultExporter
+from test_helpers import make_params
+
+
+def test_results_round_trip():
+    """测试沉降计算结果往返"""
+    print("测试计算结果往返...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    exporter = ResultExporter()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'project.json')
+        success, message = exporter.export_to_json(results, path)
+        assert success, message
+        loaded = exporter.load_from_json(path)
+
+    assert loaded['points'] == json.loads(json.dumps(results['points'], default=float))
+    assert loaded['input_parameters'] == results['input_parameters']
+    assert loaded['statistics']['avg_settlement'] == float(results['statistics']['avg_settlement'])
+    assert loaded['points'][3]['soil_properties'] == results['points'][3]['soil_properties']
+
+    print("计算结果往返测试通过！\n")
+
+
+def test_arrays_and_scalars():
+    """测试数组、标量及元组的类型保持"""
+    print("测试数组与标量...")
+
+    grid = CerrutiCalculator().calculate_grid([{'x': 9.0, 'y': 0.0, 'Qx': -40.0, 'P': 1500.0}], 8.0, 0.3,
+                                              np.linspace(-6, 6, 25), np.linspace(-30, 30, 61), 0.5)
+    data = {
+        'grid': grid,
+        'mask': grid['uz'] > grid['uz'].mean(),
+        'ids': np.arange(5, dtype=np.int32),
+        'labels': np.array(['桩1', '桩2']),
+        'scalar': np.float32(1.5),
+        'count': np.int64(7),
+        'extent': (0.0, 12.0)
+    }
+
+    restored = json_codec.loads(json_codec.dumps(data))
+    for name, values in grid.items():
+        assert restored['grid'][name].dtype == values.dtype
+        assert np.array_equal(restored['grid'][name], values)
+    assert restored['mask'].dtype == bool and np.array_equal(restored['mask'], data['mask'])
+    assert restored['ids'].dtype == np.int32 and list(restored['labels']) == ['桩1', '桩2']
+    assert restored['scalar'] == 1.5 and type(restored['count']) is int
+    assert restored['extent'] == (0.0, 12.0)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'field.json')
+        sidecar = json_codec.dump(data, path, sidecar=True)
+        assert sidecar == path + json_codec.SIDECAR_SUFFIX
+        assert os.path.getsize(path) < 3000
+        restored = json_codec.load(path)
+        assert np.array_equal(restored['grid']['ux'], grid['ux'])
+
+        # 无旁路数据时删除遗留的旁路文件
+        assert json_codec.dump({'a': 1}, path, sidecar=True) is None
+        assert not os.path.exists(sidecar)
+
+    print("数组与标量测试通过！\n")
+
+
+def test_size_reduction():
+    """测试大结果集的体积压缩"""
+    print("测试体积压缩...")
+
+    rng = np.random.default_rng(0)
+    points = [{'point_id': f'W{i + 1}', 'x': float(x), 'y': float(y), 'z': 0.5,
+               'settlement_mm': float(s), 'soil_properties': {'name': '砂土', 'poisson_ratio': 0.3}}
+              for i, (x, y, s) in enumerate(rng.uniform(0, 30, (20000, 3)))]
+    field = rng.normal(0, 1, (200, 200))
+    data = {'points': points, 'field': field}
+
+    legacy = json.dumps({'points': points, 'field': field.tolist()}, ensure_ascii=False, indent=2, default=str)
+    compact = json_codec.dumps(data)
+    print(f"   缩进JSON {len(legacy) / 1e6:.1f} MB，紧凑编码 {len(compact) / 1e6:.1f} MB")
+    assert len(compact) * 4 < len(legacy)
+    assert json_codec.loads(compact)['points'] == points
+    assert '\n' not in compact and '\n' in json_codec.dumps({'a': [1, 2]}, minify=False)
+
+    print("体积压缩测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("JSON编解码测试")
+    print("=" * 60)
+
+    test_results_round_trip()
+    test_arrays_and_scalars()
+    test_size_reduction()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础荷载组合
+验证标准组合与单塔计算一致、多风向组合的控制工况及批量验算耗时
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.tower_calculator import TowerCalculator
+from calculation.load_combination import LoadCombinationEngine, LoadAction, LoadCombination
+
+
+TEST_PARAMS = {
+    'tower_load': 600.0,
+    'horizontal_force': 60.0,
+    'force_height': 18.0,
+    'base_weight': 220.0,
+    'base_width': 3.0,
+    'base_length': 3.5,
+    'embedment_depth': 2.0,
+    'soil_type': '砂土'
+}
+
+
+def test_matches_comprehensive_stability():
+    """测试0°大风组合与单塔正常/极端工况一致"""
+    print("测试荷载组合与单塔计算一致性...")
+
+    engine = LoadCombinationEngine()
+    result = engine.calculate_combinations(TEST_PARAMS)
+    expected = TowerCalculator().calculate_comprehensive_stability(TEST_PARAMS)
+
+    print(f"   组合: {', '.join(result['combinations'])}")
+    for index, case in ((0, 'normal_condition'), (1, 'extreme_condition')):
+        calc = engine.to_foundation_calculation(result, index)
+        reference = expected[case]
+        for field in ('max_base_pressure', 'overturning_safety_factor', 'sliding_safety_factor',
+                      'overturning_moment', 'sliding_resistance_force'):
+            assert np.isclose(getattr(calc, field), getattr(reference, field)), (case, field)
+        for field in ('bearing_check', 'overturning_check', 'sliding_check'):
+            assert getattr(calc, field) == getattr(reference, field), (case, field)
+
+    print("荷载组合一致性测试通过！\n")
+
+
+def test_wind_direction_combinations():
+    """测试多风向及覆冰、断线、地震组合"""
+    print("测试多风向荷载组合...")
+
+    params = dict(TEST_PARAMS, ice_load=80.0, broken_wire_force=40.0, seismic_force=30.0)
+    engine = LoadCombinationEngine()
+    result = engine.calculate_combinations(params, wind_directions=np.arange(0, 360, 15))
+
+    print(f"   组合数量: {len(result['combinations'])}")
+    for check, governing in result['governing'].items():
+        print(f"   {check}: {governing['combination']} (利用率 {governing['ratio']:.3f})")
+
+    # 24个风向 × (正常 + 极端 + 覆冰) + 断线 + 地震
+    assert len(result['combinations']) == 24 * 3 + 2
+    for check, governing in result['governing'].items():
+        assert governing['ratio'] == result['results'][f'{check}_ratio'].max()
+
+    print("多风向荷载组合测试通过！\n")
+
+
+def test_custom_combination_matrix():
+    """测试自定义荷载作用与组合"""
+    print("测试自定义荷载组合...")
+
+    engine = LoadCombinationEngine()
+    actions = [
+        LoadAction('dead', vertical=800.0),
+        LoadAction('wind', horizontal_x=30.0, horizontal_y=40.0, height=20.0),
+    ]
+    combinations = [
+        LoadCombination('基本组合', {'dead': 1.0, 'wind': 1.0}),
+        LoadCombination('有利恒载', {'dead': 0.9, 'wind': 1.4}, 'extreme'),
+    ]
+    result = engine.calculate_combinations(TEST_PARAMS, actions, combinations)
+
+    # 合成水平力 50kN
+    assert np.allclose(result['results']['horizontal_force'], [50.0, 70.0])
+    assert result['governing']['sliding']['combination'] == '有利恒载'
+
+    print("自定义荷载组合测试通过！\n")
+
+
+def test_governing_bearing_refinement():
+    """测试只对可能控制的组合迭代求解基底压力"""
+    print("测试控制组合基底压力迭代...")
+
+    engine = LoadCombinationEngine()
+    for extra in ({}, {'tower_load': 3000.0, 'horizontal_force': 200.0},
+                  {'tower_load': 1500.0, 'horizontal_force': 150.0, 'base_width': 4.0, 'base_length': 4.0}):
+        params = dict(TEST_PARAMS, **extra)
+        result = engine.calculate_combinations(params, wind_directions=np.arange(0, 360, 5))
+        results = result['results']
+
+        actions = engine.get_default_actions(params, np.arange(0, 360, 5))
+        combinations = engine.get_standard_combinations(actions)
+        effects = engine.calculate_effects(engine.build_action_matrix(actions),
+                                           engine.build_factor_matrix(combinations, actions))
+        full = engine.batch.base_pressure_solver.solve(
+            effects['vertical'], np.abs(effects['moment_x']), np.abs(effects['moment_y']),
+            params['base_width'], params['base_length']
+        )
+        capacity = results['corrected_bearing_capacity']
+
+        # 控制组合及全部验算结论与逐组合迭代一致，未迭代的组合为偏于安全的上限值
+        assert result['governing']['bearing']['index'] == int(np.argmax(full['max_pressure']))
+        assert np.isclose(result['governing']['bearing']['ratio'], full['max_pressure'].max() / capacity[0])
+        assert np.array_equal(results['bearing_check'], full['max_pressure'] <= capacity)
+        assert np.all(results['max_base_pressure'] >= full['max_pressure'] * (1 - 1e-9))
+        assert np.all(results['max_base_pressure'] <= full['max_pressure'] * 1.125 + 1e-9)
+        upper = int((~results['base_pressure_exact']).sum())
+        print(f"   {len(result['combinations'])} 个组合中 {upper} 个取角点三角形上限值")
+
+    print("控制组合基底压力迭代测试通过！\n")
+
+
+def test_evaluation_timing():
+    """测试数百个组合的批量验算在1毫秒以内"""
+    print("测试荷载组合验算耗时...")
+
+    params = dict(TEST_PARAMS, ice_load=80.0, broken_wire_force=40.0, seismic_force=30.0)
+    engine = LoadCombinationEngine()
+    actions = engine.get_default_actions(params, np.arange(0, 360, 5))
+    combinations = engine.get_standard_combinations(actions)
+    effects = engine.calculate_effects(engine.build_action_matrix(actions),
+                                       engine.build_factor_matrix(combinations, actions))
+    extreme_mask = np.array([c.load_case == 'extreme' for c in combinations], dtype=bool)
+    assert len(combinations) == 218
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(20):
+            engine.evaluate_effects(params, effects, extreme_mask)
+        timings.append((time.perf_counter() - start) / 20)
+    print(f"   {len(combinations)} 个组合验算耗时 {min(timings) * 1000:.3f} ms")
+    assert min(timings) < 1e-3
+
+    print("荷载组合验算耗时测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("荷载组合测试")
+    print("=" * 60)
+
+    test_matches_comprehensive_stability()
+    test_wind_direction_combinations()
+    test_custom_combination_matrix()
+    test_governing_bearing_refinement()
+    test_evaluation_timing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Mindlin内部集中力位移计算
+验证作用深度为0时退化为Boussinesq解、Kelvin远场极限、对称性及桩侧摩阻力积分
+"""
+
+import sys
+import os
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.cerruti import CerrutiCalculator
+from calculation.mindlin import MindlinCalculator
+
+
+G = 8.0     # MPa
+NU = 0.3
+
+
+def test_surface_limit():
+    """测试荷载作用深度为0时与Boussinesq解一致"""
+    print("测试Boussinesq退化...")
+
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-5, 5, (2, 300))
+    z = rng.uniform(0, 8, 300)
+    mindlin = MindlinCalculator().calculate_displacement(500.0, G, x, y, z, NU, 0.0)
+    boussinesq = CerrutiCalculator().calculate_displacement(0.0, 0.0, 500.0, G, x, y, z, NU)
+    for calc, expected in zip(mindlin, boussinesq):
+        assert np.allclose(calc, expected, rtol=1e-10, atol=1e-15)
+
+    print("Boussinesq退化测试通过！\n")
+
+
+def test_deep_load():
+    """测试深埋荷载附近趋于Kelvin全空间解及竖向位移对称性"""
+    print("测试深埋荷载...")
+
+    calculator = MindlinCalculator()
+    c = 1000.0
+    x = np.array([0.5, 1.0, 2.0])
+    uz = calculator.calculate_settlement(500.0, G, x, 0.0, c, NU, c)
+
+    # Kelvin解: uz = P/(16πG(1-ν))·(3-4ν)/r
+    kelvin = 500e3 / (16 * np.pi * G * 1e6 * (1 - NU)) * (3 - 4 * NU) / x
+    assert np.allclose(uz, kelvin, rtol=1e-2)
+
+    # 竖向位移关于荷载所在竖直轴对称，水平位移径向
+    ux, uy, uz = calculator.calculate_displacement(500.0, G, [1.0, -1.0, 0.0], [0.0, 0.0, 1.0], 6.0, NU, 5.0)
+    assert np.allclose(uz, uz[0]) and np.isclose(ux[0], -ux[1]) and np.isclose(uy[2], ux[0])
+
+    # 荷载作用点处取0；地表沉降随作用深度增加而减小
+    assert calculator.calculate_displacement(500.0, G, 0.0, 0.0, 5.0, NU, 5.0) == (0.0, 0.0, 0.0)
+    surface = calculator.calculate_settlement(500.0, G, 2.0, 0.0, 0.0, NU, np.array([0.0, 5.0, 10.0, 20.0]))
+    assert np.all(np.diff(surface) < 0)
+
+    print("深埋荷载测试通过！\n")
+
+
+def test_pile_shaft():
+    """测试桩侧摩阻力积分与细分求和一致"""
+    print("测试桩侧摩阻力积分...")
+
+    calculator = MindlinCalculator(shaft_points=16)
+    x = np.linspace(1.0, 6.0, 6)
+    length = 12.0
+
+    for distribution in ('uniform', 'triangular'):
+        result = calculator.calculate_pile_displacement(300.0, 600.0, G, x, 0.0, 0.0, NU, length, distribution)
+
+        # 沿桩长细分为集中力求和
+        n = 4000
+        depths = (np.arange(n) + 0.5) / n * length
+        weights = np.full(n, 1.0 / n) if distribution == 'uniform' else 2 * depths / length / n
+        tip = calculator.calculate_settlement(300.0, G, x, 0.0, 0.0, NU, length)
+        shaft = calculator.calculate_settlement(600.0 * weights[:, np.newaxis], G, x, 0.0, 0.0, NU,
+                                                depths[:, np.newaxis]).sum(axis=0)
+        assert np.allclose(result[2], tip + shaft, rtol=1e-4)
+        print(f"   {distribution}: 桩顶附近地表沉降 {result[2][0] * 1000:.3f} mm")
+
+    print("桩侧摩阻力积分测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Mindlin内部集中力位移测试")
+    print("=" * 60)
+
+    test_surface_limit()
+    test_deep_load()
+    test_pile_shaft()
+
+
+if __name__ == "__main__":
+    main()
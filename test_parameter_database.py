@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试材料与土质参数数据库
+验证共享缓存、向量化编码查询及用户参数文件扩展
+"""
+
+import sys
+import os
+import json
+import tempfile
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.parameter_database import (
+    get_parameter_database, reload_parameter_database, DEFAULT_PARAMETER_FILE
+)
+from calculation.tower_calculator import TowerCalculator
+from calculation.pipeline_calculator import PipelineCalculator
+
+
+def test_shared_database():
+    """测试参数数据库进程内共享"""
+    print("测试参数数据库共享...")
+
+    tower = TowerCalculator()
+    pipeline = PipelineCalculator()
+
+    assert tower.parameters is pipeline.parameters
+    assert tower.soil_parameters is pipeline.soil_parameters
+    print(f"   土质类型: {', '.join(tower.get_soil_types())}")
+    print(f"   管材类型: {', '.join(pipeline.get_material_list())}")
+
+    print("参数数据库共享测试通过！\n")
+
+
+def test_vectorized_lookup():
+    """测试向量化编码与查询"""
+    print("测试向量化查询...")
+
+    soils = get_parameter_database().soils
+    names = ['砂土', '黏土', '岩石', '未知土', '砂土']
+    codes = soils.encode(names)
+    friction = soils.lookup(codes, 'friction_coefficient')
+    print(f"   编码: {codes.tolist()}")
+    print(f"   摩擦系数: {friction.tolist()}")
+
+    # 未知土质按默认黏土处理
+    assert codes[3] == soils.code('黏土')
+    np.testing.assert_allclose(friction, [0.4, 0.25, 0.6, 0.25, 0.4])
+
+    print("向量化查询测试通过！\n")
+
+
+def test_user_parameter_file():
+    """测试用户参数文件扩展"""
+    print("测试用户参数文件...")
+
+    user_data = {
+        'soils': {
+            'records': {
+                '红黏土': {'bearing_capacity': 160.0, 'unit_weight': 17.5},
+                '砂土': {'friction_coefficient': 0.45}
+            }
+        }
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        user_file = os.path.join(tmp_dir, 'regional.json')
+        with open(user_file, 'w', encoding='utf-8') as f:
+            json.dump(user_data, f, ensure_ascii=False)
+
+        try:
+            database = reload_parameter_database([DEFAULT_PARAMETER_FILE, user_file])
+            red_clay = database.soils.get('红黏土')
+            print(f"   红黏土: {red_clay}")
+
+            assert red_clay['bearing_capacity'] == 160.0
+            # 未给出的属性取默认土质的值
+            assert red_clay['friction_coefficient'] == database.soils.get('黏土')['friction_coefficient']
+            assert database.soils.get('砂土')['friction_coefficient'] == 0.45
+            assert database.soils.get('砂土')['unit_weight'] == 19.0
+        finally:
+            reload_parameter_database()
+
+    print("用户参数文件测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("参数数据库测试")
+    print("=" * 60)
+
+    test_shared_database()
+    test_vectorized_lookup()
+    test_user_parameter_file()
+
+
+if __name__ == "__main__":
+    main()
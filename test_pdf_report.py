@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试PDF报告生成
+验证报告章节内容、模板静态内容缓存、导出器接口及多项目批量报告
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from utils.exporter import ResultExporter
+from utils.pdf_report import PdfReportEngine, ReportTemplate, get_static_parts
+from test_helpers import make_params, make_columnar_results
+
+
+def test_report_sections():
+    """测试报告章节内容块"""
+    print("测试报告章节...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    engine = PdfReportEngine()
+    blocks = list(engine.build_blocks(results, include_plots=False))
+
+    headings = [block[1] for block in blocks if block[0] == 'heading']
+    assert headings == ['一、输入参数', '二、计算结果', '三、统计分析', '四、安全评估',
+                        '五、修正系数', '六、工程建议', '七、计算依据']
+    rows = [block[1] for block in blocks if block[0] == 'table_row']
+    assert sum(1 for row in rows if str(row[0]).startswith('W')) == len(results['points'])
+    assert ('text', '1. 《公路路基设计规范》JTG D30-2015') in blocks
+
+    print("报告章节测试通过！\n")
+
+
+def test_static_parts_cache():
+    """测试模板静态内容缓存"""
+    print("测试模板静态内容缓存...")
+
+    parts = get_static_parts(ReportTemplate())
+    assert get_static_parts(ReportTemplate()) is parts
+    assert get_static_parts(ReportTemplate(footer='内部审查稿')) is not parts
+    assert parts.font.get_file() and parts.bold_font.get_file()
+    assert parts.core_mono_afm.endswith('.afm')
+
+    print("模板静态内容缓存测试通过！\n")
+
+
+def test_export_pdf():
+    """测试导出单项目及批量PDF报告"""
+    print("测试PDF报告导出...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+    exporter = ResultExporter()
+    assert 'pdf' in exporter.get_export_formats()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'report.pdf')
+        success, message = exporter.export_to_pdf(results, path)
+        assert success, message
+        with open(path, 'rb') as f:
+            assert f.read(5) == b'%PDF-'
+        print(f"   {message}，{os.path.getsize(path) / 1e3:.0f} kB")
+
+        # 多项目批量报告：计算点表按页面自动分页
+        projects = [make_columnar_results(800, seed) for seed in range(2)]
+        batch_path = os.path.join(tmp_dir, 'batch.pdf')
+        start = time.time()
+        pages = PdfReportEngine().export_batch(projects, batch_path, include_plots=False)
+        elapsed = time.time() - start
+        print(f"   批量报告 {pages} 页，耗时 {elapsed:.1f}s（{elapsed / pages * 1000:.0f} ms/页）")
+        assert pages >= 2 * 800 // 60
+        assert elapsed / pages < 0.05, f"批量报告每页耗时 {elapsed / pages * 1000:.0f} ms，超出 50 ms/页"
+
+        # 计算点表行以标准14字体 Courier 写出（不嵌入字体）
+        with open(batch_path, 'rb') as f:
+            data = f.read()
+        assert b'/BaseFont /Courier' in data
+
+    print("PDF报告导出测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("PDF报告生成测试")
+    print("=" * 60)
+
+    test_report_sections()
+    test_static_parts_cache()
+    test_export_pdf()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础可靠度分析
+验证拉丁超立方抽样分层、分布反函数、失效概率估计、提前停止及收敛判据
+"""
+
+import sys
+import os
+import numpy as np
+from statistics import NormalDist
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.reliability import TowerReliabilityAnalyzer, RandomVariable, _normal_ppf
+
+
+TEST_PARAMS = {
+    'tower_load': 600.0,
+    'horizontal_force': 40.0,
+    'force_height': 18.0,
+    'base_weight': 260.0,
+    'base_width': 3.5,
+    'base_length': 3.5,
+    'embedment_depth': 2.0,
+    'soil_type': '砂土'
+}
+
+
+def test_sampling():
+    """测试拉丁超立方分层和分布反函数"""
+    print("测试拉丁超立方抽样...")
+
+    analyzer = TowerReliabilityAnalyzer()
+    rng = np.random.default_rng(0)
+    probabilities = analyzer.latin_hypercube(1000, 3, rng)
+
+    # 每个变量在每一层恰有一个样本
+    for column in probabilities.T:
+        assert np.array_equal(np.sort(np.floor(column * 1000)), np.arange(1000))
+
+    reference = NormalDist()
+    p = np.array([1e-9, 1e-4, 0.02, 0.3, 0.5, 0.8, 0.99, 1 - 1e-7])
+    assert np.allclose(_normal_ppf(p), [reference.inv_cdf(x) for x in p], atol=1e-7)
+
+    for distribution in ('normal', 'lognormal', 'gumbel'):
+        values = RandomVariable('x', distribution, 100.0, 0.2).ppf(analyzer.latin_hypercube(200000, 1, rng)[:, 0])
+        print(f"   {distribution}: 均值 {values.mean():.2f}，变异系数 {values.std() / values.mean():.3f}")
+        assert np.isclose(values.mean(), 100.0, rtol=2e-3)
+        assert np.isclose(values.std() / values.mean(), 0.2, rtol=2e-2)
+
+    print("拉丁超立方抽样测试通过！\n")
+
+
+def test_failure_probability():
+    """测试失效概率与直接蒙特卡罗抽样一致"""
+    print("测试失效概率估计...")
+
+    analyzer = TowerReliabilityAnalyzer(target_cov=0.02)
+    result = analyzer.analyze(TEST_PARAMS, seed=1)
+
+    for mode in ('bearing', 'overturning', 'sliding', 'system'):
+        statistic = result[mode]
+        print(f"   {mode}: Pf = {statistic['failure_probability']:.3e}，"
+              f"β = {statistic['reliability_index']:.3f}，变异系数 {statistic['cov']:.3f}")
+    print(f"   样本数 {result['n_samples']}，批数 {result['n_batches']}")
+
+    # 直接蒙特卡罗抽样
+    rng = np.random.default_rng(2)
+    n = 1000000
+    samples = {variable.name: variable.ppf(rng.random(n)) for variable in result['variables']}
+    failures = analyzer.evaluate_failures(TEST_PARAMS, samples)
+
+    for mode in ('bearing', 'overturning', 'system'):
+        probability = failures[mode].mean()
+        assert abs(result[mode]['failure_probability'] - probability) < \
+            4 * result[mode]['failure_probability'] * result[mode]['cov'] + 4 * np.sqrt(probability / n), mode
+        assert np.isclose(result[mode]['reliability_index'], -NormalDist().inv_cdf(result[mode]['failure_probability']))
+
+    assert result['system']['failure_probability'] >= max(result[m]['failure_probability']
+                                                          for m in ('bearing', 'overturning', 'sliding'))
+
+    print("失效概率估计测试通过！\n")
+
+
+def test_early_stopping():
+    """测试满足精度后提前停止"""
+    print("测试提前停止...")
+
+    analyzer = TowerReliabilityAnalyzer(batch_size=5000, max_samples=500000, target_cov=0.1, min_probability=1e-3)
+    result = analyzer.analyze(TEST_PARAMS, seed=3)
+    print(f"   样本数 {result['n_samples']} / {analyzer.max_samples}")
+    assert result['converged'] and result['n_samples'] < analyzer.max_samples
+
+    # 精度要求过高时达到样本上限
+    strict = TowerReliabilityAnalyzer(batch_size=5000, max_samples=20000, target_cov=1e-4)
+    result = strict.analyze(TEST_PARAMS, seed=3)
+    assert not result['converged'] and result['n_samples'] == 20000
+
+    print("提前停止测试通过！\n")
+
+
+def test_convergence_criteria():
+    """测试最少批数、最少失效数、二项分布变异系数下限及按体系失效判断收敛"""
+    print("测试收敛判据...")
+
+    # 各批失效数相同时批间方差为0，变异系数取二项分布值
+    analyzer = TowerReliabilityAnalyzer(batch_size=1000)
+    statistic = analyzer._estimate({'system': [50, 50]})['system']
+    assert np.isclose(statistic['cov'], np.sqrt((1 - 0.05) / (2000 * 0.05)))
+
+    # 精度要求宽松时也不在最少批数前停止
+    loose = TowerReliabilityAnalyzer(batch_size=2000, target_cov=1.0)
+    result = loose.analyze(TEST_PARAMS, seed=4)
+    assert result['converged'] and result['n_batches'] == loose.min_batches
+
+    # 最少批数内失效数不足时继续抽样，达到下限才停止
+    loose = TowerReliabilityAnalyzer(batch_size=100, target_cov=1.0)
+    result = loose.analyze(TEST_PARAMS, seed=4)
+    print(f"   失效数不足: Pf = {result['system']['failure_probability']:.2e}，批数 {result['n_batches']}")
+    assert result['converged'] and result['n_batches'] > loose.min_batches
+    assert result['system']['failures'] >= loose.min_failures
+
+    # 单一模式罕见（抗倾覆）不要求达到精度，体系估计满足要求即停止
+    analyzer = TowerReliabilityAnalyzer(batch_size=5000, max_samples=1000000, target_cov=0.05)
+    result = analyzer.analyze(TEST_PARAMS, seed=5)
+    print(f"   体系变异系数 {result['system']['cov']:.3f}，抗倾覆变异系数 {result['overturning']['cov']:.3f}")
+    assert result['converged'] and result['n_samples'] < analyzer.max_samples
+    assert result['system']['cov'] <= 0.05 < result['overturning']['cov']
+
+    print("收敛判据测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("可靠度分析测试")
+    print("=" * 60)
+
+    test_sampling()
+    test_failure_probability()
+    test_early_stopping()
+    test_convergence_criteria()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Terzaghi土拱效应计算
+验证单层闭合解、分层递推一致性及批量计算
+"""
+
+import sys
+import os
+import math
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.soil_arching import SoilArchingCalculator
+from calculation.pipeline_calculator import PipelineCalculator
+
+
+def test_single_layer_closed_form():
+    """测试单层土拱压力与闭合解一致"""
+    print("测试单层土拱压力...")
+
+    calc = SoilArchingCalculator()
+    gamma, c, phi, h, width = 19.0, 5.0, 30.0, 8.0, 2.5
+
+    k_mu = math.tan(math.radians(45 - phi / 2))**2 * math.tan(math.radians(phi))
+    expected = (gamma * width - 2 * c) / (2 * k_mu) * (1 - math.exp(-2 * k_mu * h / width))
+
+    sigma = calc.calculate_crown_pressure([h], [gamma], [c], [phi], width)
+    print(f"   土拱压力: {float(sigma):.3f} kPa (闭合解 {expected:.3f} kPa)")
+    assert abs(float(sigma) - expected) < 1e-9
+
+    # 内摩擦角为0时退化为全覆土压力
+    sigma = calc.calculate_crown_pressure([h], [gamma], [0.0], [0.0], width)
+    assert abs(float(sigma) - gamma * h) < 1e-9
+
+    print("单层土拱压力测试通过！\n")
+
+
+def test_layer_split_consistency():
+    """测试同一土层拆分为多层时结果不变"""
+    print("测试分层递推一致性...")
+
+    calc = SoilArchingCalculator()
+    single = calc.calculate_crown_pressure([6.0], [18.5], [10.0], [25.0], 2.0)
+    split = calc.calculate_crown_pressure([1.0, 2.0, 3.0, 0.0], [18.5] * 4, [10.0] * 4, [25.0] * 4, 2.0)
+    print(f"   单层: {float(single):.6f} kPa, 拆分: {float(split):.6f} kPa")
+    assert abs(float(single) - float(split)) < 1e-9
+
+    print("分层递推一致性测试通过！\n")
+
+
+def test_batch_profiles():
+    """测试多剖面批量计算"""
+    print("测试批量剖面计算...")
+
+    calc = SoilArchingCalculator()
+    profiles = [
+        [{'thickness': 0.8, 'soil_type': '砂土'}],
+        [{'thickness': 3.0, 'soil_type': '粉土'}, {'thickness': 7.0, 'soil_type': '砂土'}],
+        [{'thickness': 2.0, 'soil_type': '砂土'}, {'thickness': 4.0, 'soil_type': '黏土'}],
+    ]
+    result = calc.calculate_profile_pressures(profiles, pipe_diameter=[1.0, 1.5, 1.0])
+
+    for i, pressure in enumerate(result['vertical_pressure']):
+        print(f"   剖面{i+1}: {pressure:.2f} kPa (全覆土 {result['overburden_pressure'][i]:.2f} kPa)")
+
+    # 浅埋取全覆土压力，深埋不超过全覆土压力
+    assert not result['deep_cover'][0]
+    assert result['vertical_pressure'][0] == result['overburden_pressure'][0]
+    assert np.all(result['vertical_pressure'] <= result['overburden_pressure'])
+    assert np.all(result['vertical_pressure'] > 0)
+
+    print("批量剖面计算测试通过！\n")
+
+
+def test_pipeline_settlement_uses_soil():
+    """测试管道沉降计算按土体而非管材计算土压力"""
+    print("测试管道竖向土压力...")
+
+    calc = PipelineCalculator()
+    result = calc.calculate_pipeline_settlement({
+        'cover_depth': 1.0, 'pipe_diameter': 1.2, 'soil_type': '砂土', 'material': '混凝土'
+    })
+    print(f"   竖向土压力: {result.vertical_soil_pressure:.2f} kPa")
+    assert abs(result.vertical_soil_pressure - 19.0) < 1e-9
+    assert not result.arching_applied
+
+    print("管道竖向土压力测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Terzaghi土拱效应测试")
+    print("=" * 60)
+
+    test_single_layer_closed_form()
+    test_layer_split_consistency()
+    test_batch_profiles()
+    test_pipeline_settlement_uses_soil()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Steinbrenner有限土层沉降计算
+验证影响系数的半无限空间极限、与Boussinesq解数值积分一致、分层叠加及刚性下卧层影响
+"""
+
+import sys
+import os
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.boussinesq import BoussinesqCalculator
+from calculation.steinbrenner import SteinbrennerCalculator
+
+
+SOIL_LAYERS = [
+    {'depth_range': '0-5', 'name': '粘土', 'compression_modulus': 10.0, 'poisson_ratio': 0.35},
+    {'depth_range': '5-10', 'name': '砂土', 'compression_modulus': 15.0, 'poisson_ratio': 0.30},
+    {'depth_range': '10-15', 'name': '粘土', 'compression_modulus': 12.0, 'poisson_ratio': 0.35}
+]
+
+
+def uniform_layers(bottom, modulus=10.0, nu=0.3, n_layers=1):
+    """生成均质土层"""
+    edges = np.linspace(0, bottom, n_layers + 1)
+    return [{'depth_range': f'{top}-{base}', 'name': '均质土', 'compression_modulus': modulus, 'poisson_ratio': nu}
+            for top, base in zip(edges[:-1], edges[1:])]
+
+
+def test_influence_factors():
+    """测试影响系数极限值"""
+    print("测试Steinbrenner影响系数...")
+
+    calculator = SteinbrennerCalculator()
+    F1, F2 = calculator.influence_factors(1.0, np.array([0.0, 1e6]))
+    assert np.allclose([F1[0], F2[0]], 0.0)
+
+    # 土层无限厚时正方形中心点影响系数为1.122（半无限空间）
+    assert np.isclose(4 * F1[1] * 0.5, 1.122, atol=1e-3)
+    assert F2[1] < 1e-5
+
+    # 角点法：矩形内点、边上点、外部点与反向坐标对称
+    x = np.array([0.0, 1.0, 2.0, 3.5, -3.5])
+    factors = calculator.rectangle_factors(x, 0.5, 4.0, 6.0, 5.0)
+    mirrored = calculator.rectangle_factors(-x, -0.5, 4.0, 6.0, 5.0)
+    assert np.allclose(factors, mirrored)
+    assert np.all(np.diff(factors[0][:4]) < 0)
+
+    print("影响系数测试通过！\n")
+
+
+def test_numerical_integration():
+    """测试与Boussinesq集中力解在矩形上数值积分一致"""
+    print("测试与数值积分一致性...")
+
+    calculator = SteinbrennerCalculator()
+    layers = uniform_layers(8.0, modulus=12.0, nu=0.3)
+    q, width, length = 100.0, 4.0, 6.0
+
+    # 矩形划分为微元集中力，按有限土层集中力解叠加
+    n = 240
+    xs = (np.arange(n) + 0.5) / n * width - width / 2
+    ys = (np.arange(n) + 0.5) / n * length - length / 2
+    X, Y = np.meshgrid(xs, ys)
+    dP = q * width * length / n**2
+
+    for x0, y0 in [(0.0, 0.0), (1.0, 2.0), (5.0, 1.0)]:
+        numerical = calculator.calculate_point_settlement(dP, layers, x0 - X, y0 - Y).sum()
+        closed = calculator.calculate_rectangle_settlement(q, width, length, layers, x0, y0)
+        print(f"   点({x0}, {y0}): 闭合解 {closed * 1000:.3f} mm，数值积分 {numerical * 1000:.3f} mm")
+        assert np.isclose(closed, numerical, rtol=5e-3)
+
+    print("数值积分一致性测试通过！\n")
+
+
+def test_layered_profile():
+    """测试分层叠加、刚性下卧层及集中力半无限空间极限"""
+    print("测试分层土与刚性下卧层...")
+
+    calculator = SteinbrennerCalculator()
+    x = np.linspace(0, 10, 11)
+
+    # 均质土任意分层结果一致
+    single = calculator.calculate_rectangle_settlement(150.0, 3.0, 3.0, uniform_layers(12.0), x)
+    split = calculator.calculate_rectangle_settlement(150.0, 3.0, 3.0, uniform_layers(12.0, n_layers=7), x)
+    assert np.allclose(single, split)
+
+    # 基岩越浅沉降越小
+    settlements = [calculator.calculate_rectangle_settlement(150.0, 3.0, 3.0, SOIL_LAYERS, rigid_depth=depth)
+                   for depth in (3.0, 6.0, 10.0, 15.0)]
+    assert np.all(np.diff(settlements) > 0)
+
+    # 基础埋深以上土层不计
+    shallow = calculator.calculate_rectangle_settlement(150.0, 3.0, 3.0, SOIL_LAYERS, load_depth=5.0)
+    shifted = calculator.calculate_rectangle_settlement(150.0, 3.0, 3.0, [
+        dict(layer, depth_range=f'{int(layer["depth_range"].split("-")[0]) - 5}-{int(layer["depth_range"].split("-")[1]) - 5}')
+        for layer in SOIL_LAYERS[1:]
+    ])
+    assert np.isclose(shallow, shifted)
+
+    # 土层很厚时集中力解退化为Boussinesq半无限空间解
+    boussinesq = BoussinesqCalculator()
+    G = boussinesq.calculate_shear_modulus(10.0, 0.3)
+    for point in [(1.1, 0.0, 1.0), (3.3, 2.0, 4.0)]:
+        finite = calculator.calculate_point_settlement(500.0, uniform_layers(1e6), *point)
+        assert np.isclose(finite, boussinesq.calculate_settlement(500.0, G, *point, 0.3), rtol=1e-5)
+
+    print(f"   基岩深度3/6/10/15m时中心沉降: {', '.join(f'{s * 1000:.1f}' for s in settlements)} mm")
+    print("分层土与刚性下卧层测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Steinbrenner有限土层沉降测试")
+    print("=" * 60)
+
+    test_influence_factors()
+    test_numerical_integration()
+    test_layered_profile()
+
+
+if __name__ == "__main__":
+    main()
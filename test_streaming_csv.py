@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试CSV流式导出
+验证沉降计算结果导出、生成器与列式数据的固定表头及内存占用不随行数增长
+"""
+
+import sys
+import os
+import csv
+import tempfile
+import tracemalloc
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.settlement import SettlementCalculator
+from utils.exporter import ResultExporter
+from test_helpers import make_params
+
+
+def read_csv(path):
+    """读取CSV文件全部行"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.reader(f))
+
+
+def generate_points(n_points):
+    """逐点生成计算结果"""
+    for i in range(n_points):
+        yield {
+            'point_id': f'W{i + 1}',
+            'x': i * 0.01,
+            'y': 0.0,
+            'z': 1.0,
+            'settlement_mm': 10.0 + i % 7,
+            'soil_properties': {'name': '砂土'}
+        }
+
+
+def test_settlement_results():
+    """测试沉降计算结果导出"""
+    print("测试沉降计算结果CSV导出...")
+
+    results = SettlementCalculator().calculate_settlement(make_params())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        success, message = ResultExporter().export_to_csv(results, tmp_dir)
+        assert success, message
+        rows = read_csv(os.path.join(tmp_dir, '计算结果.csv'))
+
+    header = rows[0]
+    assert header[:4] == ['计算点', 'X坐标(m)', 'Y坐标(m)', '深度(m)']
+    assert '沉降值(mm)' in header and '对应土层' in header
+    assert len(rows) == len(results['points']) + 1
+    column = header.index('沉降值(mm)')
+    assert np.allclose([float(row[column]) for row in rows[1:]], [p['settlement_mm'] for p in results['points']])
+    print(f"   {len(rows) - 1} 行，{len(header)} 列")
+
+    print("沉降计算结果CSV导出测试通过！\n")
+
+
+def test_generator_and_columnar():
+    """测试生成器及列式数据导出"""
+    print("测试生成器及列式数据导出...")
+
+    exporter = ResultExporter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'generator.csv')
+        success, message = exporter.export_to_csv_streaming(generate_points(25), path, chunk_size=10)
+        assert success, message
+        rows = read_csv(path)
+        assert rows[0] == ['计算点', 'X坐标(m)', 'Y坐标(m)', '深度(m)', '沉降值(mm)', '对应土层']
+        assert len(rows) == 26 and rows[25][0] == 'W25' and rows[25][5] == '砂土'
+
+        settlement = np.linspace(0, 30, 25)
+        path = os.path.join(tmp_dir, 'columnar.csv')
+        success, message = exporter.export_to_csv_streaming({'x': np.arange(25.0), 'settlement_mm': settlement},
+                                                            path, chunk_size=10)
+        assert success, message
+        rows = read_csv(path)
+        assert rows[0] == ['X坐标(m)', '沉降值(mm)']
+        assert np.array_equal([float(row[1]) for row in rows[1:]], settlement)
+
+        path = os.path.join(tmp_dir, 'empty.csv')
+        assert exporter.export_to_csv_streaming(iter([]), path)[0]
+        assert len(read_csv(path)) == 1
+
+    print("生成器及列式数据导出测试通过！\n")
+
+
+def test_flat_memory():
+    """测试内存占用不随行数增长"""
+    print("测试CSV流式导出内存占用...")
+
+    exporter = ResultExporter()
+    peaks = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exporter.export_to_csv_streaming(generate_points(100), os.path.join(tmp_dir, 'warmup.csv'))
+        for n_points in (50000, 200000):
+            path = os.path.join(tmp_dir, f'{n_points}.csv')
+            tracemalloc.start()
+            success, message = exporter.export_to_csv_streaming(generate_points(n_points), path)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            assert success and message.endswith(f'{n_points} 行')
+
+    print(f"   峰值内存: {peaks[0] / 1e6:.1f} MB / {peaks[1] / 1e6:.1f} MB")
+    assert peaks[1] < 1.5 * peaks[0]
+
+    print("CSV流式导出内存占用测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("CSV流式导出测试")
+    print("=" * 60)
+
+    test_settlement_results()
+    test_generator_and_columnar()
+    test_flat_memory()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试Excel流式导出
+验证工作表布局与标准导出一致、列式大结果集导出及内存占用不随行数增长
+"""
+
+import sys
+import os
+import tempfile
+import tracemalloc
+import numpy as np
+import openpyxl
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.exporter import ResultExporter, EXCEL_MAX_POINTS, EXCEL_MAX_ROWS
+from test_excel_export_fix import create_mock_calculation_results
+from test_helpers import make_columnar_results
+
+
+SHEET_NAMES = ['输入参数', '计算结果', '统计分析', '安全评估', '计算简图', '修正系数']
+
+
+def read_sheet(path, sheet_name):
+    """读取工作表全部单元格值"""
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return [tuple(value for value in row) for row in workbook[sheet_name].iter_rows(values_only=True)]
+    finally:
+        workbook.close()
+
+
+def strip_row(row):
+    """去除行尾空单元格"""
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return tuple(row)
+
+
+def test_same_layout():
+    """测试流式导出与标准导出内容一致"""
+    print("测试工作表布局一致性...")
+
+    exporter = ResultExporter()
+    results = create_mock_calculation_results()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        standard = os.path.join(tmp_dir, 'standard.xlsx')
+        streaming = os.path.join(tmp_dir, 'streaming.xlsx')
+        assert exporter.export_to_excel(results, standard, streaming=False)[0]
+        assert exporter.export_to_excel(results, streaming, streaming=True)[0]
+
+        assert openpyxl.load_workbook(streaming, read_only=True).sheetnames == SHEET_NAMES
+        for sheet_name in SHEET_NAMES:
+            expected = [strip_row(row) for row in read_sheet(standard, sheet_name)]
+            actual = [strip_row(row) for row in read_sheet(streaming, sheet_name)]
+            while expected and not expected[-1]:
+                expected.pop()
+            while actual and not actual[-1]:
+                actual.pop()
+            assert actual == expected, sheet_name
+            print(f"   {sheet_name}: {len(actual)} 行一致")
+
+    print("工作表布局一致性测试通过！\n")
+
+
+def test_large_columnar_results():
+    """测试列式大结果集流式导出"""
+    print("测试大结果集流式导出...")
+
+    exporter = ResultExporter()
+    results = make_columnar_results(30000)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'large.xlsx')
+        success, message = exporter.export_to_excel(results, path)  # 超过阈值自动启用流式导出
+        assert success, message
+
+        rows = read_sheet(path, '计算结果')
+        data_rows = [row for row in rows[2:] if row[0] and str(row[0]).startswith('W')]
+        assert len(data_rows) == 30000
+        assert data_rows[123][0] == 'W124'
+        assert data_rows[123][4] == f"{results['points']['settlement_mm'][123]:.2f}"
+
+        settlement = results['points']['settlement_mm']
+        expected_max = settlement[results['points']['y'] < 0].max()
+        assert any(row[0] and f"最大值: {expected_max:.2f} mm" in str(row[0]) for row in rows[-5:])
+        print(f"   导出 {len(data_rows)} 行，文件 {os.path.getsize(path) / 1e6:.1f} MB")
+
+    print("大结果集流式导出测试通过！\n")
+
+
+def test_row_limit():
+    """测试计算点数超过工作表行数上限时拒绝导出"""
+    print("测试Excel行数上限...")
+
+    exporter = ResultExporter()
+
+    # 计算结果表最后一行恰好为上限时计算点数为 EXCEL_MAX_POINTS
+    rows = list(exporter._calculation_result_rows(make_columnar_results(10)))
+    assert rows[-1][0] - 10 == EXCEL_MAX_ROWS - EXCEL_MAX_POINTS
+
+    results = create_mock_calculation_results()
+    n_points = EXCEL_MAX_POINTS + 1
+    results['points'] = {
+        'point_id': np.arange(n_points),
+        'x': np.zeros(n_points),
+        'y': np.zeros(n_points),
+        'settlement_mm': np.zeros(n_points)
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'too_large.xlsx')
+        for export in (lambda: exporter.export_to_excel(results, path, streaming=False),
+                       lambda: exporter.export_to_excel_streaming(results, path),
+                       lambda: exporter.export_to_excel(results, path, incremental=True)):
+            success, message = export()
+            assert not success
+            assert str(n_points) in message and 'CSV' in message, message
+            assert not os.path.exists(path)
+        print(f"   {message}")
+
+    print("Excel行数上限测试通过！\n")
+
+
+def test_flat_memory():
+    """测试内存占用不随行数增长"""
+    print("测试流式导出内存占用...")
+
+    exporter = ResultExporter()
+    peaks = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 预热：排除首次导入模块的内存
+        exporter.export_to_excel_streaming(make_columnar_results(100), os.path.join(tmp_dir, 'warmup.xlsx'),
+                                           include_diagram=False)
+        for n_points in (10000, 25000):
+            results = make_columnar_results(n_points)
+            tracemalloc.start()
+            exporter.export_to_excel_streaming(results, os.path.join(tmp_dir, f'{n_points}.xlsx'),
+                                               include_diagram=False)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    print(f"   峰值内存: {peaks[0] / 1e6:.1f} MB / {peaks[1] / 1e6:.1f} MB")
+    assert peaks[1] < 1.5 * peaks[0]
+
+    print("流式导出内存占用测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("Excel流式导出测试")
+    print("=" * 60)
+
+    test_same_layout()
+    test_large_columnar_results()
+    test_row_limit()
+    test_flat_memory()
+
+
+if __name__ == "__main__":
+    main()
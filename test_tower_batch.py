@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础批量验算
+验证向量化结果与单塔计算一致，以及CSV/Excel分块读取和排序输出
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.tower_calculator import TowerCalculator
+from calculation.tower_batch import TowerBatchCalculator
+from test_helpers import make_site_table
+
+
+def test_batch_matches_single_tower():
+    """测试批量结果与单塔计算一致"""
+    print("测试批量验算与单塔计算一致性...")
+
+    table = make_site_table()
+    batch = TowerBatchCalculator()
+    single = TowerCalculator()
+
+    result = batch.evaluate_comprehensive(batch.prepare_sites(table))
+
+    for i, row in enumerate(table.to_dict('records')):
+        expected = single.calculate_comprehensive_stability(row)
+        for case in ('normal', 'extreme'):
+            calc = expected[f'{case}_condition']
+            for field in ('corrected_bearing_capacity', 'max_base_pressure', 'min_base_pressure',
+                          'overturning_safety_factor', 'sliding_safety_factor'):
+                assert np.isclose(result[f'{case}_{field}'][i], getattr(calc, field)), (i, case, field)
+            for field in ('bearing_check', 'overturning_check', 'sliding_check'):
+                assert bool(result[f'{case}_{field}'][i]) == getattr(calc, field), (i, case, field)
+        assert bool(result['overall_safe'][i]) == expected['safety_assessment']['overall_safe']
+
+    print(f"   {len(table)}个塔位结果一致")
+    print("批量验算一致性测试通过！\n")
+
+
+def test_streaming_site_table():
+    """测试CSV/Excel分块读取与排序输出"""
+    print("测试塔位表分块读取...")
+
+    table = make_site_table(n_sites=120, seed=1)
+    batch = TowerBatchCalculator()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'sites.csv')
+        xlsx_path = os.path.join(tmp_dir, 'sites.xlsx')
+        output_path = os.path.join(tmp_dir, 'critical.csv')
+        table.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        table.to_excel(xlsx_path, index=False)
+
+        progress = []
+        ranked_csv = batch.evaluate_site_table(csv_path, output_path, chunksize=25,
+                                               progress_callback=progress.append)
+        ranked_xlsx = batch.evaluate_site_table(xlsx_path, chunksize=40)
+        top = batch.evaluate_site_table(csv_path, chunksize=25, top_n=10)
+
+        print(f"   进度回调: {progress}")
+        print(f"   最不利塔位: {ranked_csv['site_id'][0]} ({ranked_csv['governing_check'][0]}, "
+              f"利用率 {ranked_csv['critical_ratio'][0]:.3f})")
+
+        assert progress[-1] == len(table)
+        assert len(ranked_csv) == len(table)
+        ratios = ranked_csv['critical_ratio'].to_numpy()
+        assert np.all(ratios[:-1] >= ratios[1:])
+        assert list(ranked_csv['site_id']) == list(ranked_xlsx['site_id'])
+        assert list(top['site_id']) == list(ranked_csv['site_id'][:10])
+        assert '控制利用率' in pd.read_csv(output_path, encoding='utf-8-sig').columns
+
+    print("塔位表分块读取测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("电线塔基础批量验算测试")
+    print("=" * 60)
+
+    test_batch_matches_single_tower()
+    test_streaming_site_table()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础最不利风向扫描
+验证0°风向与单塔计算一致、荷载分解、批量扫描及标准结果输出
+"""
+
+import sys
+import os
+import numpy as np
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.tower_calculator import TowerCalculator
+from calculation.wind_direction import WindDirectionSweep
+from test_helpers import make_site_table
+
+
+TEST_PARAMS = {
+    'tower_load': 600.0,
+    'horizontal_force': 60.0,
+    'force_height': 18.0,
+    'base_weight': 220.0,
+    'base_width': 3.0,
+    'base_length': 3.5,
+    'embedment_depth': 2.0,
+    'soil_type': '砂土'
+}
+
+
+def test_zero_direction_matches_single_tower():
+    """测试0°风向（沿基础宽度方向）与单塔计算一致"""
+    print("测试0°风向与单塔计算一致性...")
+
+    result = WindDirectionSweep().sweep_tower(TEST_PARAMS, angles=[0.0])
+    expected = TowerCalculator().calculate_comprehensive_stability(TEST_PARAMS)
+
+    for case in ('normal_condition', 'extreme_condition'):
+        calc, reference = result[case], expected[case]
+        for field in ('max_base_pressure', 'average_base_pressure', 'overturning_safety_factor',
+                      'overturning_moment', 'sliding_safety_factor', 'sliding_force'):
+            assert np.isclose(getattr(calc, field), getattr(reference, field)), (case, field)
+        for field in ('bearing_check', 'overturning_check', 'sliding_check'):
+            assert getattr(calc, field) == getattr(reference, field), (case, field)
+
+    print("0°风向一致性测试通过！\n")
+
+
+def test_load_resolution():
+    """测试塔身风荷载与导线荷载分解"""
+    print("测试水平荷载分解...")
+
+    sweep = WindDirectionSweep()
+    sites = sweep.prepare_sites(make_site_table(1).assign(
+        horizontal_force=0.0, conductor_force=40.0, line_angle=30.0, conductor_height=25.0
+    ))
+    loads = sweep.resolve_horizontal_loads(sites, np.array([30.0, 120.0, 300.0]))
+
+    # 风向平行线路时无导线横向荷载；垂直线路时横向荷载全部作用
+    magnitude = np.hypot(loads['horizontal_x'], loads['horizontal_y'])[0]
+    assert np.allclose(magnitude, [0.0, 40.0, 40.0], atol=1e-9)
+    assert np.allclose(loads['moment_x'][0], loads['horizontal_x'][0] * 25.0)
+    assert np.allclose(loads['horizontal_x'][0, 1:], [-20.0, 20.0])
+
+    print("水平荷载分解测试通过！\n")
+
+
+def test_critical_direction():
+    """测试最不利风向及逐风向安全系数"""
+    print("测试最不利风向扫描...")
+
+    sweep = WindDirectionSweep(resolution=1.0)
+    result = sweep.sweep_tower(dict(TEST_PARAMS, conductor_force=40.0, line_angle=30.0, conductor_height=25.0))
+    factors = result['direction_safety_factors']['normal']
+
+    print(f"   最不利风向: {result['critical_directions']['normal']}")
+    print(f"   最小抗倾覆安全系数: {result['normal_condition'].overturning_safety_factor:.3f}")
+
+    assert len(result['angles']) == 360
+    assert np.isclose(result['normal_condition'].overturning_safety_factor, factors['overturning_safety_factor'].min())
+    assert np.isclose(result['normal_condition'].sliding_safety_factor, factors['sliding_safety_factor'].min())
+    assert np.isclose(result['normal_condition'].max_base_pressure, factors['max_base_pressure'].max())
+
+    # 仅塔身风荷载时抗滑移安全系数与风向无关，抗倾覆最不利方向为基础短边方向
+    plain = sweep.sweep_tower(TEST_PARAMS)
+    sliding = plain['direction_safety_factors']['normal']['sliding_safety_factor']
+    assert np.allclose(sliding, sliding[0])
+    assert plain['critical_directions']['normal']['overturning'] in (0.0, 180.0)
+
+    print("最不利风向扫描测试通过！\n")
+
+
+def test_batch_sweep():
+    """测试多塔位向量化扫描与单塔扫描一致"""
+    print("测试多塔位风向扫描...")
+
+    sweep = WindDirectionSweep(resolution=5.0)
+    table = make_site_table(n_sites=20, seed=2)
+    result = sweep.sweep(sweep.prepare_sites(table))
+
+    assert result['normal']['overturning_safety_factor'].shape == (20, 72)
+    for i, row in enumerate(table.to_dict('records')):
+        single = sweep.sweep_tower(row)
+        for check in ('bearing', 'overturning', 'sliding'):
+            assert result['critical']['normal'][check]['angle'][i] == single['critical_directions']['normal'][check]
+
+    print(f"   {len(table)}个塔位 × {len(result['angles'])}个风向结果一致")
+    print("多塔位风向扫描测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("最不利风向扫描测试")
+    print("=" * 60)
+
+    test_zero_direction_matches_single_tower()
+    test_load_resolution()
+    test_critical_direction()
+    test_batch_sweep()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试电线塔基础风速时程分析
+验证雨流计数、超限事件跨块统计以及分块读取测风记录
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from calculation.tower_calculator import TowerCalculator
+from calculation.wind_history import WindHistoryAnalyzer, RainflowCounter, ExceedanceCounter
+
+
+TEST_PARAMS = {
+    'tower_load': 600.0,
+    'horizontal_force': 60.0,
+    'force_height': 18.0,
+    'base_weight': 320.0,
+    'base_width': 3.5,
+    'base_length': 3.5,
+    'embedment_depth': 2.0,
+    'soil_type': '砂土',
+    'design_wind_speed': 12.0
+}
+
+
+def make_wind_record(n_records=20000, seed=0):
+    """生成10分钟间隔的模拟测风记录"""
+    rng = np.random.default_rng(seed)
+    speed = np.abs(8 + np.convolve(rng.normal(0, 3, n_records), np.ones(30) / 6, mode='same'))
+    return pd.DataFrame({
+        'time': pd.date_range('2020-01-01', periods=n_records, freq='10min'),
+        'wind_speed': speed
+    })
+
+
+def test_rainflow_counting():
+    """测试雨流计数（ASTM E1049 算例）及分块结果一致"""
+    print("测试雨流计数...")
+
+    counter = RainflowCounter(np.arange(0, 12))
+    counter.update([-2, 1, -3, 5, -1, 3, -4, 4, -2])
+    counter.finalize()
+    counts = {int(edge): count for edge, count in zip(counter.range_edges, counter.cycle_counts) if count}
+    assert counts == {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5}
+
+    signal = np.round(np.random.default_rng(1).normal(size=5000).cumsum(), 1)
+    histograms = []
+    for chunks in ([signal], np.array_split(signal, 37), [signal[i:i + 1] for i in range(len(signal))]):
+        counter = RainflowCounter(np.linspace(0, 30, 31))
+        for chunk in chunks:
+            counter.update(chunk)
+        counter.finalize()
+        histograms.append(counter.cycle_counts)
+    assert all(np.array_equal(histograms[0], other) for other in histograms[1:])
+
+    print(f"   随机信号循环数 {histograms[0].sum():.1f}，分块结果一致")
+    print("雨流计数测试通过！\n")
+
+
+def test_exceedance_events():
+    """测试超限事件跨块统计"""
+    print("测试超限事件统计...")
+
+    exceeded = np.random.default_rng(2).random(3000) < 0.4
+    padded = np.concatenate([[0], exceeded.astype(int), [0]])
+    edges = np.flatnonzero(np.diff(padded))
+    lengths = edges[1::2] - edges[::2]
+
+    for chunks in ([exceeded], np.array_split(exceeded, 41), [exceeded[i:i + 1] for i in range(len(exceeded))]):
+        counter = ExceedanceCounter(np.array([0, 1, 2, 4, np.inf]))
+        for chunk in chunks:
+            counter.update(chunk)
+        counter.finalize()
+        assert counter.events == len(lengths)
+        assert counter.exceedance_count == exceeded.sum()
+        assert counter.max_event_length == lengths.max()
+        assert list(counter.duration_counts) == list(np.histogram(lengths, [0, 1, 2, 4, np.inf])[0])
+
+    print(f"   {len(lengths)}次超限事件，最长 {lengths.max()} 个记录")
+    print("超限事件统计测试通过！\n")
+
+
+def test_wind_record_analysis():
+    """测试分块读取测风记录并与逐条单塔计算比较"""
+    print("测试测风记录分析...")
+
+    record = make_wind_record()
+    analyzer = WindHistoryAnalyzer(chunksize=3000)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'wind.csv')
+        record.to_csv(path, index=False)
+        progress = []
+        result = analyzer.analyze(path, TEST_PARAMS, progress_callback=progress.append)
+
+    # 分块与整体计算一致
+    whole = analyzer.analyze([record], TEST_PARAMS)
+    for check in ('bearing', 'overturning', 'sliding'):
+        stats = result['checks'][check]
+        print(f"   {check}: 超限 {stats['exceedance_hours']:.1f}h，{stats['events']}次，"
+              f"最长 {stats['max_event_hours']:.1f}h，最小安全系数 {stats['min_safety_factor']:.3f}")
+        for key in ('exceedance_count', 'events', 'max_event_hours', 'min_index'):
+            assert stats[key] == whole['checks'][check][key], (check, key)
+        assert np.isclose(stats['min_safety_factor'], whole['checks'][check]['min_safety_factor'])
+    assert np.allclose(result['rainflow']['cycle_counts'], whole['rainflow']['cycle_counts'])
+    assert progress[-1] == len(record)
+
+    # 最不利时刻与单塔计算一致
+    worst = result['checks']['overturning']
+    params = dict(TEST_PARAMS, horizontal_force=float(analyzer.wind_speed_to_force(
+        record['wind_speed'].iloc[worst['min_index']], TEST_PARAMS)))
+    expected = TowerCalculator().calculate_overturning_stability(params)[2]
+    assert np.isclose(worst['min_safety_factor'], expected)
+    assert worst['min_time'] == str(record['time'].iloc[worst['min_index']])
+
+    # 超限次数与逐条计算一致
+    force = analyzer.wind_speed_to_force(record['wind_speed'].to_numpy(), TEST_PARAMS)
+    sliding = analyzer.evaluate_chunk(TEST_PARAMS, force)['exceeded']['sliding']
+    assert result['checks']['sliding']['exceedance_count'] == sliding.sum()
+
+    print("测风记录分析测试通过！\n")
+
+
+def main():
+    """主测试函数"""
+    print("=" * 60)
+    print("风速时程分析测试")
+    print("=" * 60)
+
+    test_rainflow_counting()
+    test_exceedance_events()
+    test_wind_record_analysis()
+
+
+if __name__ == "__main__":
+    main()
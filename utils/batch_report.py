@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+多项目批量报告生成
+无界面批量处理目录中的项目文件：在进程池中（非交互 Agg 后端）计算并生成 Excel 报告、
+汇总报告及结果图；每个完成的项目先原子写入暂存目录（每项目一个 zip），全部处理后与已有归档
+合并为新归档再整体替换，归档本身从不原地修改。进程在任何时刻被终止后重新运行，
+跳过归档及暂存目录中已完成且未修改的项目
+
+项目文件为 JSON：计算参数（calculate_settlement 的 params），或 export_to_json 导出的结果文件
+
+用法:
+    python -m utils.batch_report 项目目录 报告.zip [--workers N]
+"""
+
+import os
+import io
+import json
+import glob
+import shutil
+import hashlib
+import tempfile
+import zipfile
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Callable, List
+
+
+# 报告内容或格式变化时递增，使已有归档中的项目重新生成
+BATCH_REPORT_VERSION = 1
+
+# 每个项目生成的结果图：(文件名, ResultPlotter 方法)
+BATCH_PLOTS = (
+    ('沉降分析图.png', 'create_settlement_plot'),
+    ('等高线图.png', 'create_contour_plot'),
+)
+
+# 项目完成标记，最后写入归档
+MANIFEST_NAME = 'manifest.json'
+
+# 暂存目录（归档文件名加后缀）：已完成项目各写一个 zip，合并归档后删除
+STAGING_SUFFIX = '.parts'
+
+# 已压缩格式直接存储，不再压缩
+_STORED_EXTENSIONS = ('.png', '.xlsx')
+
+
+def project_name(path: str) -> str:
+    """项目名（文件名去掉扩展名），即归档中的目录名"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def project_fingerprint(path: str) -> str:
+    """项目文件指纹：文件内容与报告版本的SHA-256"""
+    digest = hashlib.sha256(f'batch-report-{BATCH_REPORT_VERSION}'.encode())
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_project(path: str) -> Dict[str, Any]:
+    """
+    读取项目文件并得到计算结果
+
+    Args:
+        path: 项目文件（计算参数或导出的结果JSON）
+
+    Returns:
+        Dict: 计算结果字典
+    """
+    from utils import json_codec
+
+    data = json_codec.load(path)
+    if isinstance(data, dict) and 'results' in data:
+        return data['results']
+    if isinstance(data, dict) and 'points' in data:
+        return data
+
+    from calculation.settlement import SettlementCalculator
+    return SettlementCalculator().calculate_settlement(data)
+
+
+def _init_worker():
+    """工作进程初始化：使用非交互后端"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def render_project(path: str, dpi: int = 150) -> Dict[str, Any]:
+    """
+    生成单个项目的全部报告文件（在工作进程中运行）
+
+    Args:
+        path: 项目文件
+        dpi: 结果图分辨率
+
+    Returns:
+        Dict: name、fingerprint、files（[(归档内文件名, 内容)]）、error（成功为 None）
+    """
+    name = project_name(path)
+    result = {'name': name, 'fingerprint': project_fingerprint(path), 'files': [], 'error': None}
+    try:
+        import matplotlib.pyplot as plt
+        from utils.exporter import ResultExporter
+        from visualization.plotter import ResultPlotter
+
+        results = load_project(path)
+        exporter = ResultExporter()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            excel_path = os.path.join(tmp_dir, 'report.xlsx')
+            success, message = exporter.export_to_excel(results, excel_path)
+            if not success:
+                raise RuntimeError(message)
+            with open(excel_path, 'rb') as f:
+                result['files'].append((f'{name}_计算报告.xlsx', f.read()))
+
+        result['files'].append((f'{name}_汇总报告.txt', exporter.generate_summary_report(results).encode('utf-8')))
+
+        plotter = ResultPlotter()
+        for filename, method in BATCH_PLOTS:
+            fig = getattr(plotter, method)(results)
+            try:
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+            finally:
+                plt.close(fig)
+            result['files'].append((filename, buffer.getvalue()))
+    except Exception as e:
+        result['error'] = str(e)
+        result['files'] = []
+    return result
+
+
+def _print_progress(done: int, total: int, name: str, status: str):
+    """缺省进度输出"""
+    print(f"[{done}/{total}] {name}: {status}")
+
+
+class BatchReportGenerator:
+    """多项目批量报告生成类"""
+
+    def __init__(self, workers: Optional[int] = None, dpi: int = 150,
+                 progress: Optional[Callable[[int, int, str, str], None]] = _print_progress):
+        """
+        初始化批量报告生成
+
+        Args:
+            workers: 工作进程数，缺省为CPU核数；0 表示在当前进程中顺序生成（使用当前绘图后端）
+            dpi: 结果图分辨率
+            progress: 进度回调 (已处理数, 总数, 项目名, 状态)，None 时不输出
+        """
+        self.workers = os.cpu_count() if workers is None else workers
+        self.dpi = dpi
+        self.progress = progress
+
+    def find_projects(self, project_dir: str) -> List[str]:
+        """目录中的项目文件（按文件名排序）"""
+        return sorted(glob.glob(os.path.join(project_dir, '*.json')))
+
+    def completed_projects(self, archive: str) -> Dict[str, str]:
+        """
+        归档中已完成的项目
+
+        Args:
+            archive: zip 归档文件
+
+        Returns:
+            Dict[str, str]: 项目名到指纹（以完成标记为准）
+        """
+        if not os.path.exists(archive):
+            return {}
+        completed = {}
+        with zipfile.ZipFile(archive) as zf:
+            for entry in zf.namelist():
+                directory, _, filename = entry.rpartition('/')
+                if filename == MANIFEST_NAME:
+                    completed[directory] = json.loads(zf.read(entry))['fingerprint']
+        return completed
+
+    def generate(self, project_dir: str, archive: str) -> Dict[str, Any]:
+        """
+        批量生成报告并写入 zip 归档
+
+        每个项目的文件生成后立即写入暂存目录中该项目的 zip（先写临时文件再替换），
+        全部处理后与归档中保留的项目合并写出新归档并替换，再删除暂存目录；
+        再次运行时跳过归档及暂存目录中已完成且项目文件未修改的项目，
+        未完成或已修改项目的旧文件在合并时从归档中移除
+
+        Args:
+            project_dir: 项目文件目录
+            archive: 输出 zip 归档
+
+        Returns:
+            Dict: archive、completed（本次生成）、skipped（已完成跳过）、failed（项目名到错误信息）
+        """
+        projects = self.find_projects(project_dir)
+        fingerprints = {project_name(path): project_fingerprint(path) for path in projects}
+        staging = archive + STAGING_SUFFIX
+        completed = self._prepare_archive(archive, fingerprints)
+
+        pending = [path for path in projects if completed.get(project_name(path)) != fingerprints[project_name(path)]]
+        skipped = sorted(set(fingerprints) - {project_name(path) for path in pending})
+        summary = {'archive': archive, 'completed': [], 'skipped': skipped, 'failed': {}}
+
+        total = len(projects)
+        done = len(summary['skipped'])
+        if done and self.progress:
+            self.progress(done, total, f"{done}个项目", "已完成，跳过")
+
+        for result in self._render_all(pending):
+            done += 1
+            if result['error'] is None:
+                self._stage_project(staging, result)
+                summary['completed'].append(result['name'])
+                status = "完成"
+            else:
+                summary['failed'][result['name']] = result['error']
+                status = f"失败 - {result['error']}"
+            if self.progress:
+                self.progress(done, total, result['name'], status)
+
+        self._merge_archive(archive, staging, fingerprints)
+        return summary
+
+    def _render_all(self, paths: List[str]):
+        """在进程池（或当前进程）中生成各项目，按完成顺序返回"""
+        if not paths:
+            return
+        if self.workers == 0:
+            for path in paths:
+                yield render_project(path, self.dpi)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(paths)), initializer=_init_worker) as pool:
+            futures = [pool.submit(render_project, path, self.dpi) for path in paths]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def staged_projects(self, staging: str) -> Dict[str, str]:
+        """
+        暂存目录中已完成的项目
+
+        Args:
+            staging: 暂存目录
+
+        Returns:
+            Dict[str, str]: 项目名到指纹（无法读取的暂存文件删除）
+        """
+        staged = {}
+        for path in glob.glob(os.path.join(staging, '*.zip')):
+            try:
+                staged.update(self.completed_projects(path))
+            except (zipfile.BadZipFile, KeyError, ValueError, OSError):
+                os.remove(path)
+        return staged
+
+    def _prepare_archive(self, archive: str, fingerprints: Dict[str, str]) -> Dict[str, str]:
+        """
+        续做前整理：读取归档及暂存目录中已完成的项目，清理中断时残留的临时文件
+
+        Returns:
+            Dict[str, str]: 已完成且项目文件未修改的项目指纹
+        """
+        staging = archive + STAGING_SUFFIX
+        os.makedirs(staging, exist_ok=True)
+        for path in glob.glob(os.path.join(staging, '*.tmp')) + glob.glob(archive + '.tmp'):
+            os.remove(path)
+
+        completed = {}
+        if os.path.exists(archive):
+            try:
+                completed = self.completed_projects(archive)
+            except (zipfile.BadZipFile, KeyError, ValueError):
+                # 归档损坏：保留副本，已暂存的项目仍然保留
+                shutil.move(archive, archive + '.corrupt')
+        completed.update(self.staged_projects(staging))
+        return {name: fingerprint for name, fingerprint in completed.items() if fingerprints.get(name) == fingerprint}
+
+    def _stage_project(self, staging: str, result: Dict[str, Any]):
+        """写入一个项目的暂存 zip：先写临时文件，完成标记最后写入，再原子替换"""
+        name = result['name']
+        manifest = {
+            'project': name,
+            'fingerprint': result['fingerprint'],
+            'files': [filename for filename, _ in result['files']],
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        path = os.path.join(staging, f'{name}.zip')
+        with zipfile.ZipFile(path + '.tmp', 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for filename, data in result['files']:
+                compress_type = zipfile.ZIP_STORED if filename.endswith(_STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                zf.writestr(f'{name}/{filename}', data, compress_type=compress_type)
+            zf.writestr(f'{name}/{MANIFEST_NAME}', json.dumps(manifest, ensure_ascii=False, indent=2))
+        os.replace(path + '.tmp', path)
+
+    def _merge_archive(self, archive: str, staging: str, fingerprints: Dict[str, str]):
+        """
+        合并归档：保留归档中已完成且未修改、未被重新生成的项目，加入暂存的项目，
+        写出临时文件后替换归档，最后删除暂存目录
+        """
+        staged = {name: fingerprint for name, fingerprint in self.staged_projects(staging).items()
+                  if fingerprints.get(name) == fingerprint}
+        sources = [os.path.join(staging, f'{name}.zip') for name in sorted(staged)]
+        keep = set()
+        if os.path.exists(archive):
+            keep = {name for name, fingerprint in self.completed_projects(archive).items()
+                    if fingerprints.get(name) == fingerprint and name not in staged}
+            with zipfile.ZipFile(archive) as zf:
+                if not staged and all(entry.split('/')[0] in keep for entry in zf.namelist()):
+                    shutil.rmtree(staging, ignore_errors=True)
+                    return
+            sources.insert(0, archive)
+
+        tmp_path = archive + '.tmp'
+        with zipfile.ZipFile(tmp_path, 'w') as out:
+            for source in sources:
+                with zipfile.ZipFile(source) as zf:
+                    for entry in zf.infolist():
+                        if source != archive or entry.filename.split('/')[0] in keep:
+                            out.writestr(entry, zf.read(entry))
+        os.replace(tmp_path, archive)
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='多项目批量报告生成')
+    parser.add_argument('project_dir', help='项目文件目录（*.json）')
+    parser.add_argument('archive', help='输出 zip 归档')
+    parser.add_argument('--workers', type=int, default=None, help='工作进程数（缺省为CPU核数，0为顺序生成）')
+    parser.add_argument('--dpi', type=int, default=150, help='结果图分辨率')
+    args = parser.parse_args(argv)
+
+    summary = BatchReportGenerator(args.workers, args.dpi).generate(args.project_dir, args.archive)
+    print(f"完成 {len(summary['completed'])} 个，跳过 {len(summary['skipped'])} 个，"
+          f"失败 {len(summary['failed'])} 个：{summary['archive']}")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+列式二进制数据导出与读取
+沉降场、参数扫描等大结果集按类型化列压缩保存：安装 pyarrow 时写 Parquet，
+否则写压缩 .npz；工程元数据随文件保存，读取时按列直接还原为 NumPy 数组
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+import numpy as np
+
+
+# 元数据在 Parquet 模式元数据及 .npz 中的键名
+METADATA_KEY = '__metadata__'
+
+# 列式文件格式版本
+COLUMNAR_FORMAT_VERSION = 1
+
+ENGINES = ('parquet', 'npz')
+ENGINE_EXTENSIONS = {'parquet': '.parquet', 'npz': '.npz'}
+
+
+def parquet_available() -> bool:
+    """是否可写 Parquet（需要 pyarrow）"""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_engine() -> str:
+    """缺省导出引擎"""
+    return 'parquet' if parquet_available() else 'npz'
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """展开嵌套字典，键名以 '.' 连接"""
+    flat = {}
+    for key, value in record.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f'{name}.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _typed_column(values) -> np.ndarray:
+    """转换为类型化列：数值列保持数值类型（缺失为NaN），其余为定长字符串"""
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = np.asarray(values, dtype=object)
+    if array.dtype.kind in 'biufUM':
+        return array
+    try:
+        return np.asarray([np.nan if value is None else value for value in values], dtype=float)
+    except (TypeError, ValueError):
+        return np.asarray(['' if value is None else str(value) for value in values])
+
+
+def records_to_columns(records: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    逐点字典结果转换为列
+
+    Args:
+        records: 逐点字典（嵌套字典展开为 'a.b' 列），列集合以首条记录为准
+
+    Returns:
+        Dict[str, np.ndarray]: 列名到一维数组
+    """
+    values = None
+    for record in records:
+        flat = flatten_record(record)
+        if values is None:
+            values = {name: [] for name in flat}
+        for name, column in values.items():
+            column.append(flat.get(name))
+    return {name: _typed_column(column) for name, column in (values or {}).items()}
+
+
+def to_columns(data) -> Tuple[Dict[str, np.ndarray], Optional[Tuple[int, ...]]]:
+    """
+    整理为等长一维列
+
+    Args:
+        data: 计算结果字典（取 'points'）、逐点字典列表，或列式数组字典
+              （如 CerrutiCalculator.calculate_grid 的网格结果，各数组形状相同）
+
+    Returns:
+        (columns, shape): 一维列，及多维网格的原始形状（一维数据为 None）
+    """
+    if isinstance(data, dict) and 'points' in data:
+        data = data['points']
+    if not isinstance(data, dict):
+        columns = records_to_columns(data)
+        return columns, None
+
+    arrays = {name: np.asarray(values) for name, values in data.items()}
+    shapes = {array.shape for array in arrays.values()}
+    if len(shapes) > 1:
+        raise ValueError(f"各列形状不一致: {sorted(shapes)}")
+    shape = shapes.pop() if shapes else (0,)
+    columns = {name: _typed_column(array.ravel()) for name, array in arrays.items()}
+    return columns, (tuple(shape) if len(shape) > 1 else None)
+
+
+def _project_metadata(results) -> Dict[str, Any]:
+    """计算结果中随文件保存的工程信息"""
+    if not isinstance(results, dict) or 'points' not in results:
+        return {}
+    keys = ('input_parameters', 'statistics', 'safety_assessment', 'calculation_info')
+    return {key: results[key] for key in keys if key in results}
+
+
+def save_columnar(data, filename: str, metadata: Optional[Dict[str, Any]] = None,
+                  engine: Optional[str] = None) -> str:
+    """
+    保存列式二进制文件
+
+    Args:
+        data: 见 to_columns
+        filename: 输出文件名；扩展名与实际引擎不符时替换为对应扩展名
+        metadata: 附加元数据（可JSON序列化）
+        engine: 'parquet'、'npz' 或 None（有 pyarrow 时用 Parquet）；
+                指定 'parquet' 但未安装 pyarrow 时退回 'npz'
+
+    Returns:
+        str: 实际写出的文件名
+    """
+    if engine is None or (engine == 'parquet' and not parquet_available()):
+        engine = default_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"不支持的列式格式: {engine}")
+
+    columns, shape = to_columns(data)
+    info = {
+        'format_version': COLUMNAR_FORMAT_VERSION,
+        'export_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'software': '桥梁跨越工程安全性评估软件',
+        'engine': engine,
+        'shape': list(shape) if shape else None,
+        'project': _project_metadata(data),
+        'metadata': metadata or {}
+    }
+    metadata_json = json.dumps(info, ensure_ascii=False, default=_json_default)
+
+    root, extension = os.path.splitext(filename)
+    if extension.lower() != ENGINE_EXTENSIONS[engine]:
+        filename = root + ENGINE_EXTENSIONS[engine]
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+
+    if engine == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pydict(columns)
+        table = table.replace_schema_metadata({METADATA_KEY: metadata_json})
+        pq.write_table(table, filename, compression='zstd')
+    else:
+        if METADATA_KEY in columns:
+            raise ValueError(f"列名 {METADATA_KEY} 为保留名")
+        np.savez_compressed(filename, **columns, **{METADATA_KEY: np.asarray(metadata_json)})
+
+    return filename
+
+
+def load_columnar(filename: str, columns: Optional[Iterable[str]] = None,
+                  reshape: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    读取列式二进制文件
+
+    Args:
+        filename: Parquet 或 .npz 文件
+        columns: 只读取的列名（缺省全部）；两种格式均只解压所选列
+        reshape: 网格数据是否还原为原始形状
+
+    Returns:
+        (columns, metadata): 列名到数组，及保存时的元数据
+    """
+    with open(filename, 'rb') as f:
+        magic = f.read(4)
+
+    if magic == b'PAR1':
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filename, columns=list(columns) if columns is not None else None)
+        schema_metadata = pq.read_schema(filename).metadata or {}
+        metadata = json.loads(schema_metadata.get(METADATA_KEY.encode(), b'{}'))
+        data = {name: table.column(name).to_numpy() for name in table.column_names}
+    else:
+        with np.load(filename, allow_pickle=False) as archive:
+            metadata = json.loads(archive[METADATA_KEY].item())
+            names = [name for name in archive.files if name != METADATA_KEY]
+            if columns is not None:
+                missing = set(columns) - set(names)
+                if missing:
+                    raise KeyError(f"文件中不存在列: {sorted(missing)}")
+                names = [name for name in names if name in set(columns)]
+            data = {name: archive[name] for name in names}
+
+    shape = metadata.get('shape')
+    if reshape and shape:
+        data = {name: values.reshape(shape) for name, values in data.items()}
+    return data, metadata
+
+
+def _json_default(value):
+    """元数据中的 NumPy 标量/数组等转换为JSON类型"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
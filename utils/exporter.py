@@ -5,27 +5,125 @@
 
 import pandas as pd
 import os
+import io
+import csv
+import itertools
+import hashlib
+import zipfile
+import posixpath
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from datetime import datetime
 import json
 import openpyxl
+import openpyxl.drawing.image
+
+from utils import json_codec
+from utils.columnar import ENGINE_EXTENSIONS, default_engine, save_columnar, flatten_record
+
+
+# 计算点数超过该值时 export_to_excel 自动使用流式导出
+STREAMING_ROW_THRESHOLD = 20000
+
+# 列式计算结果每块转换的行数
+STREAMING_CHUNK_SIZE = 10000
+
+# xlsx 工作表行数上限；计算结果表除计算点外另有标题2行及表尾4行（含空行）
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_POINTS = EXCEL_MAX_ROWS - 6
+
+# 流式CSV导出的文件写缓冲区（字节）
+CSV_BUFFER_SIZE = 1 << 20
+
+# CSV表头：计算点字段到中文列名，未列出的字段以字段名为表头
+CSV_HEADERS = {
+    'point_id': '计算点',
+    'x': 'X坐标(m)',
+    'y': 'Y坐标(m)',
+    'z': '深度(m)',
+    'pile1_distance': '距桩1距离(m)',
+    'pile2_distance': '距桩2距离(m)',
+    'pile1_settlement': '桩1沉降(m)',
+    'pile2_settlement': '桩2沉降(m)',
+    'total_settlement': '总沉降(m)',
+    'settlement_mm': '沉降值(mm)',
+    'interaction_factor': '相互作用系数',
+    'tau_xz': '剪应力τxz(kPa)',
+    'tau_yz': '剪应力τyz(kPa)',
+    'soil_properties.name': '对应土层'
+}
+
+# 计算简图逐点绘制标注，计算点超过该值时不绘制
+DIAGRAM_MAX_POINTS = 200
+
+# 计算简图缓存：进程内按内容哈希保存的PNG图像数（最近最少使用淘汰）
+DIAGRAM_CACHE_SIZE = 32
+
+# 计算简图绘制方式变化时递增，使目录缓存失效
+DIAGRAM_CACHE_VERSION = 1
+
+# 增量导出：工作表分区（按工作簿中的顺序）及其指纹在文档自定义属性中的名称前缀
+EXPORT_SECTIONS = ('输入参数', '计算结果', '统计分析', '安全评估', '计算简图', '修正系数')
+SECTION_FINGERPRINT_PREFIX = '分区指纹-'
+
+# 增量导出：各工作表部件内容的SHA-256（自定义属性名称前缀），沿用前校验文件中的工作表未被其他程序改写
+SECTION_CONTENT_PREFIX = '分区内容-'
+
+# 工作表写法变化时递增，使已导出文件中的分区全部重新生成
+SECTION_FINGERPRINT_VERSION = 1
+
+# xlsx 包内部件的 XML 命名空间
+_XLSX_NS = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    'custom': 'http://schemas.openxmlformats.org/officeDocument/2006/custom-properties'
+}
+_XLSX_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+_diagram_cache = OrderedDict()
+_diagram_cache_lock = threading.Lock()
+
+
+def clear_diagram_cache():
+    """清空进程内的计算简图缓存"""
+    with _diagram_cache_lock:
+        _diagram_cache.clear()
 
 
 class ResultExporter:
     """结果导出器类"""
     
-    def __init__(self):
-        """初始化导出器"""
-        pass
+    def __init__(self, diagram_cache_dir=None):
+        """
+        初始化导出器
+        
+        参数:
+        diagram_cache_dir: 计算简图缓存目录，None 时仅使用进程内缓存
+        """
+        self.diagram_cache_dir = diagram_cache_dir
     
-    def export_to_excel(self, results, filename):
+    def export_to_excel(self, results, filename, streaming=None, incremental=False):
         """
         导出结果到Excel文件
         
         参数:
         results: 计算结果字典
         filename: 输出文件名
+        streaming: True 时使用只写流式模式（内存占用与行数无关），
+                   None 时计算点数超过 STREAMING_ROW_THRESHOLD 自动启用
+        incremental: True 时增量导出（见 export_to_excel_incremental）
         """
+        if incremental:
+            return self.export_to_excel_incremental(results, filename)
+        if streaming is None:
+            streaming = self._count_points(results.get('points', [])) > STREAMING_ROW_THRESHOLD
+        if streaming:
+            return self.export_to_excel_streaming(results, filename)
+        
         try:
+            self._check_excel_row_limit(results)
+            
             # 创建Excel写入器
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
                 
@@ -48,79 +146,404 @@ class ResultExporter:
                 self._write_correction_factors(writer, results)
             
             return True, "Excel导出成功"
+        
+        except Exception as e:
+            return False, f"Excel导出失败：{str(e)}"
+    
+    def export_to_excel_streaming(self, results, filename, include_diagram=True):
+        """
+        以只写流式模式导出结果到Excel文件
+        
+        使用 xlsxwriter 的 constant_memory 模式逐行写出，计算点可为字典列表或
+        列式数组字典 {列名: 数组}，按块转换后直接写入，内存占用不随行数增长；
+        工作表布局与 export_to_excel 相同
+        
+        参数:
+        results: 计算结果字典
+        filename: 输出文件名
+        include_diagram: 是否嵌入计算简图
+        """
+        try:
+            self._write_streaming_workbook(results, filename, include_diagram)
+            return True, "Excel导出成功"
+        
+        except Exception as e:
+            return False, f"Excel导出失败：{str(e)}"
+    
+    def export_to_excel_incremental(self, results, filename):
+        """
+        增量导出结果到Excel文件
+        
+        各工作表分区按其输入计算指纹并保存在文档自定义属性中，同时保存写出的工作表部件内容哈希；
+        再次导出到同一文件时，指纹未变且工作表部件未被改写的分区不重新生成，直接沿用上次导出文件中的
+        工作表（计算简图沿用已嵌入的图像，不重新绘制），只重新生成已修改的分区。文件不存在、不是增量
+        导出的文件或已由电子表格软件另存（工作表改用共享字符串、样式重新编号）时完整导出。
+        工作表布局与 export_to_excel_streaming 相同
+        
+        参数:
+        results: 计算结果字典
+        filename: 输出文件名
+        
+        返回:
+        (是否成功, 信息)，信息中包含重新生成与沿用的分区数
+        """
+        tmp_path = f'{filename}.{os.getpid()}.tmp'
+        spliced_path = f'{filename}.{os.getpid()}.splice'
+        try:
+            fingerprints = self._section_fingerprints(results)
+            previous = self.read_section_fingerprints(filename)
+            unchanged = [name for name in EXPORT_SECTIONS
+                         if name in previous and previous[name] == fingerprints[name]]
+            
+            # 计算简图带有图像关系部件，不整体沿用工作表，只沿用其中的图像
+            diagram_image = None
+            if '计算简图' in unchanged:
+                diagram_image = self._read_diagram_image(filename)
+                if diagram_image is None:
+                    unchanged.remove('计算简图')
+            reused = [name for name in unchanged if name != '计算简图']
             
+            self._write_streaming_workbook(results, tmp_path, fingerprints=fingerprints,
+                                           reused=reused, diagram_image=diagram_image)
+            self._splice_sheets(tmp_path, filename, spliced_path, reused)
+            os.replace(spliced_path, filename)
+            
+            return True, (f"Excel导出成功：重新生成 {len(EXPORT_SECTIONS) - len(unchanged)} 个分区，"
+                          f"沿用 {len(unchanged)} 个分区")
+        
         except Exception as e:
             return False, f"Excel导出失败：{str(e)}"
+        finally:
+            for path in (tmp_path, spliced_path):
+                if os.path.exists(path):
+                    os.remove(path)
     
-    def _write_input_parameters(self, writer, results):
-        """写入输入参数表"""
+    def _write_streaming_workbook(self, results, filename, include_diagram=True,
+                                  fingerprints=None, reused=(), diagram_image=None):
+        """
+        以 xlsxwriter constant_memory 模式写出工作簿
+        
+        参数:
+        results: 计算结果字典
+        filename: 输出文件名
+        include_diagram: 是否嵌入计算简图
+        fingerprints: 各分区指纹，写入文档自定义属性（同时写入工作表内容哈希的占位值，
+                      由 _splice_sheets 填写）
+        reused: 沿用上次导出的分区，只写占位工作表（由 _splice_sheets 替换）
+        diagram_image: 沿用的计算简图PNG数据，None 时绘制（或取自缓存）
+        """
+        import xlsxwriter
+        
+        self._check_excel_row_limit(results)
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        try:
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            
+            def write_rows(sheet_name, rows, width=15, columns=5):
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.set_column(0, columns - 1, width)
+                for row, values in rows:
+                    worksheet.write_row(row - 1, 0, values)
+                return worksheet
+            
+            def write_tables(sheet_name, tables):
+                worksheet = workbook.add_worksheet(sheet_name)
+                for start_row, table in tables:
+                    worksheet.write_row(start_row, 0, table[0], header_format)
+                    for i, values in enumerate(table[1:], 1):
+                        worksheet.write_row(start_row + i, 0, values)
+                return worksheet
+            
+            def write_diagram(sheet_name):
+                worksheet = write_rows(sheet_name, self._diagram_title_rows(), columns=1)
+                try:
+                    if diagram_image is not None:
+                        image_data = io.BytesIO(diagram_image)
+                    else:
+                        image_data = self._render_calculation_diagram(results, input_params)
+                    worksheet.insert_image('A4', 'calculation_diagram.png', {
+                        'image_data': image_data, 'object_position': 3
+                    })
+                except Exception as e:
+                    print(f"嵌入计算简图失败: {str(e)}")
+                    worksheet.write(3, 0, f"无法嵌入计算简图: {str(e)}")
+            
+            input_params = results['input_parameters']
+            sections = (
+                ('输入参数', lambda name: write_rows(name, self._input_parameter_rows(input_params))),
+                ('计算结果', lambda name: write_rows(name, self._calculation_result_rows(results))),
+                ('统计分析', lambda name: write_tables(name, [(0, self._statistics_table(results))])),
+                ('安全评估', lambda name: write_tables(name, self._safety_tables(results))),
+                ('计算简图', write_diagram),
+                ('修正系数', lambda name: write_tables(name, [(0, self._correction_table(results))])),
+            )
+            for sheet_name, write_section in sections:
+                if sheet_name == '计算简图' and not include_diagram:
+                    continue
+                if sheet_name in reused:
+                    # 占位工作表：使用一次表头格式，使样式表与完整写出时一致
+                    workbook.add_worksheet(sheet_name).write_blank(0, 0, None, header_format)
+                else:
+                    write_section(sheet_name)
+            
+            for sheet_name, fingerprint in (fingerprints or {}).items():
+                workbook.set_custom_property(SECTION_FINGERPRINT_PREFIX + sheet_name, fingerprint)
+                workbook.set_custom_property(SECTION_CONTENT_PREFIX + sheet_name,
+                                             self._content_placeholder(sheet_name))
+        finally:
+            workbook.close()
+    
+    def _section_fingerprints(self, results):
+        """
+        各工作表分区的指纹：分区内容所依赖输入的规范化编码的SHA-256
+        
+        参数:
+        results: 计算结果字典
+        
+        返回:
+        Dict[str, str]: 分区名（工作表名）到指纹
+        """
         input_params = results['input_parameters']
+        safety = results.get('safety_assessment', {})
+        try:
+            diagram = self._diagram_cache_key(self._diagram_inputs(results, input_params), 300)
+        except Exception as e:
+            diagram = str(e)
         
-        # 创建输入参数表
-        sheet_name = '输入参数'
-        writer.sheets[sheet_name] = writer.book.create_sheet(sheet_name)
+        sources = {
+            '输入参数': input_params,
+            '计算结果': [results['points'], safety.get('bridge_limit', 150)],
+            '统计分析': results.get('statistics'),
+            '安全评估': safety,
+            '计算简图': diagram,
+            '修正系数': [results.get('correction_factors'), self._correction_pile_dimensions(input_params)],
+        }
+        fingerprints = {}
+        for name in EXPORT_SECTIONS:
+            payload = json_codec.dumps([SECTION_FINGERPRINT_VERSION, name, sources[name]])
+            fingerprints[name] = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+        return fingerprints
+    
+    def read_section_fingerprints(self, filename):
+        """
+        读取增量导出文件中保存的分区指纹
+        
+        参数:
+        filename: Excel文件名
+        
+        返回:
+        Dict[str, str]: 分区名到指纹，只包含工作表部件与写出时一致（内容哈希相符）的分区；
+                        文件不存在、损坏或非增量导出时为空
+        """
+        if not os.path.exists(filename):
+            return {}
+        try:
+            with zipfile.ZipFile(filename) as zf:
+                if 'docProps/custom.xml' not in zf.namelist():
+                    return {}
+                root = ET.fromstring(zf.read('docProps/custom.xml'))
+                properties = {prop.get('name', ''): prop[0].text
+                              for prop in root.findall('custom:property', _XLSX_NS) if len(prop)}
+                
+                fingerprints = {}
+                for sheet_name, part in self._xlsx_sheet_parts(zf).items():
+                    fingerprint = properties.get(SECTION_FINGERPRINT_PREFIX + sheet_name)
+                    digest = properties.get(SECTION_CONTENT_PREFIX + sheet_name)
+                    # 只认可文件中确实存在、且未被其他程序改写的工作表
+                    if fingerprint and digest == hashlib.sha256(zf.read(part)).hexdigest():
+                        fingerprints[sheet_name] = fingerprint
+        except (zipfile.BadZipFile, ET.ParseError, KeyError, OSError):
+            return {}
+        return fingerprints
+    
+    def _content_placeholder(self, sheet_name):
+        """工作表内容哈希的占位值（写出后由 _splice_sheets 替换为实际哈希）"""
+        return f'待写入-{EXPORT_SECTIONS.index(sheet_name)}'
+    
+    def _xlsx_sheet_parts(self, zf):
+        """xlsx 包中工作表名到工作表部件路径"""
+        targets = self._xlsx_relationships(zf, 'xl/workbook.xml')
+        workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+        return {sheet.get('name'): targets[sheet.get(_XLSX_R_ID)]
+                for sheet in workbook.iterfind('main:sheets/main:sheet', _XLSX_NS)}
+    
+    def _xlsx_relationships(self, zf, part):
+        """部件的关系：关系ID到目标部件路径（不存在关系部件时为空）"""
+        directory, name = posixpath.split(part)
+        rels_path = posixpath.join(directory, '_rels', f'{name}.rels')
+        if rels_path not in zf.namelist():
+            return {}
+        targets = {}
+        for rel in ET.fromstring(zf.read(rels_path)).iterfind('rel:Relationship', _XLSX_NS):
+            target = rel.get('Target')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+            targets[rel.get('Id')] = target
+        return targets
+    
+    def _read_diagram_image(self, filename):
+        """读取上次导出文件中嵌入的计算简图PNG，没有时返回None"""
+        with zipfile.ZipFile(filename) as zf:
+            sheet_part = self._xlsx_sheet_parts(zf).get('计算简图')
+            if sheet_part is None:
+                return None
+            for drawing in self._xlsx_relationships(zf, sheet_part).values():
+                for target in self._xlsx_relationships(zf, drawing).values():
+                    if target.endswith('.png'):
+                        return zf.read(target)
+        return None
+    
+    def _splice_sheets(self, new_path, old_path, out_path, sheet_names):
+        """
+        由新写出的工作簿和上次导出的文件拼合输出：
+        指定工作表的部件取自上次导出的文件，其余部件取自新工作簿；
+        并将各工作表部件的内容哈希写入文档自定义属性（替换占位值）
+        
+        沿用的工作表部件经 read_section_fingerprints 校验与 _write_streaming_workbook 写出时一致
+        （constant_memory 模式字符串内联于工作表，不依赖共享字符串表），可整体替换
+        """
+        with zipfile.ZipFile(new_path) as new:
+            new_parts = self._xlsx_sheet_parts(new)
+            sheets = {part: name for name, part in new_parts.items()}
+            old = zipfile.ZipFile(old_path) if sheet_names else None
+            try:
+                replaced = {}
+                if old is not None:
+                    old_parts = self._xlsx_sheet_parts(old)
+                    replaced = {new_parts[name]: old_parts[name] for name in sheet_names}
+                
+                digests = {}
+                with zipfile.ZipFile(out_path, 'w', compression=zipfile.ZIP_DEFLATED) as out:
+                    for info in new.infolist():
+                        if info.filename == 'docProps/custom.xml':
+                            continue
+                        source = replaced.get(info.filename)
+                        data = old.read(source) if source else new.read(info)
+                        if info.filename in sheets:
+                            digests[sheets[info.filename]] = hashlib.sha256(data).hexdigest()
+                        out.writestr(info, data)
+                    
+                    if 'docProps/custom.xml' in new.namelist():
+                        custom = new.read('docProps/custom.xml').decode('utf-8')
+                        for sheet_name, digest in digests.items():
+                            custom = custom.replace(f'>{self._content_placeholder(sheet_name)}<', f'>{digest}<')
+                        out.writestr(new.getinfo('docProps/custom.xml'), custom.encode('utf-8'))
+            finally:
+                if old is not None:
+                    old.close()
+    
+    def _check_excel_row_limit(self, results):
+        """
+        检查计算结果表能否写入一个工作表（超出行数上限的行会被丢弃），在写出任何内容前调用
+        
+        参数:
+        results: 计算结果字典
+        """
+        n_points = self._count_points(results.get('points', []))
+        if n_points > EXCEL_MAX_POINTS:
+            raise ValueError(f"计算点数 {n_points} 超过Excel工作表行数上限（最多 {EXCEL_MAX_POINTS} 个计算点），"
+                             f"请改用CSV或列式数据格式（Parquet/NPZ）导出")
+    
+    def _count_points(self, points):
+        """计算点数量（字典列表或列式数组字典）"""
+        if isinstance(points, dict):
+            return len(next(iter(points.values()), []))
+        return len(points)
+    
+    def _iter_points(self, points, chunk_size=STREAMING_CHUNK_SIZE):
+        """
+        逐点迭代计算结果
+        
+        参数:
+        points: 字典列表，或列式数组字典 {列名: 数组}（按块转换为 Python 对象）
+        chunk_size: 列式数据每块转换的行数
+        
+        返回:
+        逐点字典的迭代器
+        """
+        if not isinstance(points, dict):
+            yield from points
+            return
+        
+        columns = list(points.keys())
+        n_points = self._count_points(points)
+        for start in range(0, n_points, chunk_size):
+            chunk = [self._to_list(points[column][start:start + chunk_size]) for column in columns]
+            for values in zip(*chunk):
+                yield dict(zip(columns, values))
+            # 释放本块后再转换下一块，峰值内存保持为一块
+            del chunk
+    
+    def _to_list(self, values):
+        """数组切片转换为列表"""
+        return values.tolist() if hasattr(values, 'tolist') else list(values)
+    
+    def _input_parameter_rows(self, input_params):
+        """
+        输入参数表的内容
+        
+        参数:
+        input_params: 输入参数字典
         
+        返回:
+        (行号, [各列值]) 的迭代器，行号从1开始
+        """
         # 添加项目名称
         row = 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value="[ 项目名称 ]")
+        yield row, ["[ 项目名称 ]"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value=input_params.get('project_name', '高架桥桩基沉降分析项目'))
+        yield row, [input_params.get('project_name', '高架桥桩基沉降分析项目')]
         row += 2
         
         # 添加项目类型
-        writer.sheets[sheet_name].cell(row=row, column=1, value="[ 项目类型 ]")
+        yield row, ["[ 项目类型 ]"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value="----------------------------------------------------------------------")
+        yield row, ["----------------------------------------------------------------------"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value=input_params.get('project_type', '桥梁工程'))
+        yield row, [input_params.get('project_type', '桥梁工程')]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value="*5种选择其中1种，容许值在计算过程中参考*")
+        yield row, ["*5种选择其中1种，容许值在计算过程中参考*"]
         row += 2
         
         # 计算条件
-        writer.sheets[sheet_name].cell(row=row, column=1, value="[ 计算条件 ]")
+        yield row, ["[ 计算条件 ]"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value="----------------------------------------------------------------------")
+        yield row, ["----------------------------------------------------------------------"]
         row += 1
         
         # 新建公路信息
-        writer.sheets[sheet_name].cell(row=row, column=1, value="[ 新建公路 ]")
+        yield row, ["[ 新建公路 ]"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value=f"公路类型：{input_params.get('road_level', '一级公路')}")
+        yield row, [f"公路类型：{input_params.get('road_level', '一级公路')}"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value=f"车道数量：{input_params.get('lane_count', 4)}")
+        yield row, [f"车道数量：{input_params.get('lane_count', 4)}"]
         row += 2
         
         # 荷载信息
         if 'pile1' in input_params:
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩顶荷载P1：{input_params['pile1']['load']} (KN)")
+            yield row, [f"桩顶荷载P1：{input_params['pile1']['load']} (KN)"]
         if 'pile2' in input_params:
             row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩顶荷载P2：{input_params['pile2']['load']} (KN)")
+            yield row, [f"桩顶荷载P2：{input_params['pile2']['load']} (KN)"]
         row += 2
         
         # 土层参数
-        writer.sheets[sheet_name].cell(row=row, column=1, value="[ 土层参数 ]")
+        yield row, ["[ 土层参数 ]"]
         row += 1
-        writer.sheets[sheet_name].cell(row=row, column=1, value="沉降计算修正公式：")
+        yield row, ["沉降计算修正公式："]
         row += 2
         
         # 土层参数表格
         soil_layers = input_params.get('soil_layers', [])
         if soil_layers:
             # 表头
-            writer.sheets[sheet_name].cell(row=row, column=1, value="序号")
-            writer.sheets[sheet_name].cell(row=row, column=2, value="土类型")
-            writer.sheets[sheet_name].cell(row=row, column=3, value="土层厚")
-            writer.sheets[sheet_name].cell(row=row, column=4, value="压缩模量 E")
-            writer.sheets[sheet_name].cell(row=row, column=5, value="泊松比 v")
+            yield row, ["序号", "土类型", "土层厚", "压缩模量 E", "泊松比 v"]
             row += 1
             
             # 土层数据
             for i, layer in enumerate(soil_layers):
-                writer.sheets[sheet_name].cell(row=row, column=1, value=f"{i+1}")
-                writer.sheets[sheet_name].cell(row=row, column=2, value=layer.get('name', 'N/A'))
-                
                 # 从depth_range计算土层厚度
                 depth_range = layer.get('depth_range', 'N/A')
                 thickness = 'N/A'
@@ -131,67 +554,73 @@ class ResultExporter:
                     except:
                         pass
                 
-                writer.sheets[sheet_name].cell(row=row, column=3, value=thickness)
-                writer.sheets[sheet_name].cell(row=row, column=4, value=layer.get('compression_modulus', 'N/A'))
-                writer.sheets[sheet_name].cell(row=row, column=5, value=layer.get('poisson_ratio', 'N/A'))
+                yield row, [f"{i+1}", layer.get('name', 'N/A'), thickness,
+                            layer.get('compression_modulus', 'N/A'), layer.get('poisson_ratio', 'N/A')]
                 row += 1
         
         row += 2
         
-        # 桩1参数
-        if 'pile1' in input_params:
-            writer.sheets[sheet_name].cell(row=row, column=1, value="[ 桩1参数 ]")
-            row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩直径：{input_params['pile1']['diameter']} (m)")
-            row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩长：{input_params['pile1']['length']} (m)")
-            row += 2
-        
-        # 桩2参数
-        if 'pile2' in input_params:
-            writer.sheets[sheet_name].cell(row=row, column=1, value="[ 桩2参数 ]")
-            row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩直径：{input_params['pile2']['diameter']} (m)")
-            row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"桩长：{input_params['pile2']['length']} (m)")
-            row += 2
+        # 桩1、桩2参数
+        for pile_key, pile_name in (('pile1', '桩1'), ('pile2', '桩2')):
+            if pile_key in input_params:
+                yield row, [f"[ {pile_name}参数 ]"]
+                row += 1
+                yield row, [f"桩直径：{input_params[pile_key]['diameter']} (m)"]
+                row += 1
+                yield row, [f"桩长：{input_params[pile_key]['length']} (m)"]
+                row += 2
         
         # 被跨越公路参数
         if 'road_params' in input_params:
             road_params = input_params['road_params']
-            writer.sheets[sheet_name].cell(row=row, column=1, value="[ 被跨越公路参数 ]")
+            yield row, ["[ 被跨越公路参数 ]"]
             row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"路基宽度：{road_params.get('width', 'N/A')} (m)")
+            yield row, [f"路基宽度：{road_params.get('width', 'N/A')} (m)"]
             row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"路基与桩1距离：{road_params.get('pile1_distance', 'N/A')} (m)")
+            yield row, [f"路基与桩1距离：{road_params.get('pile1_distance', 'N/A')} (m)"]
             row += 1
-            writer.sheets[sheet_name].cell(row=row, column=1, value=f"路基与桩2距离：{road_params.get('pile2_distance', 'N/A')} (m)")
+            yield row, [f"路基与桩2距离：{road_params.get('pile2_distance', 'N/A')} (m)"]
+    
+    def _write_input_parameters(self, writer, results):
+        """写入输入参数表"""
+        input_params = results['input_parameters']
+        
+        # 创建输入参数表
+        sheet_name = '输入参数'
+        writer.sheets[sheet_name] = writer.book.create_sheet(sheet_name)
+        
+        for row, values in self._input_parameter_rows(input_params):
+            for j, value in enumerate(values):
+                writer.sheets[sheet_name].cell(row=row, column=j+1, value=value)
         
         # 调整列宽
         for i in range(1, 6):
             writer.sheets[sheet_name].column_dimensions[chr(64+i)].width = 15
     
-    def _write_calculation_results(self, writer, results):
-        """写入计算结果表"""
-        points = results['points']
-        safety_assessment = results.get('safety_assessment', {})
+    def _calculation_result_rows(self, results):
+        """
+        计算结果表的内容（逐点生成，表尾最大沉降值在遍历过程中累计）
         
-        # 表头和说明
-        sheet_name = '计算结果'
-        title_row = 0
-        writer.sheets[sheet_name] = writer.book.create_sheet(sheet_name)
+        参数:
+        results: 计算结果字典
+        
+        返回:
+        (行号, [各列值]) 的迭代器，行号从1开始
+        """
+        safety_assessment = results.get('safety_assessment', {})
         
         # 添加标题
-        writer.sheets[sheet_name].cell(row=title_row+1, column=1, value="计算结果:")
-        writer.sheets[sheet_name].cell(row=title_row+2, column=1, value="----------------------------------------------------------------------")
+        title_row = 0
+        yield title_row+1, ["计算结果:"]
+        yield title_row+2, ["----------------------------------------------------------------------"]
         
         # 计算结果数据
-        calc_data = []
+        start_row = title_row + 3  # 表格开始行
         max_settlement = 0
-        for point in points:
+        count = 0
+        for point in self._iter_points(results['points']):
             # 提取坐标和各种沉降值
             x, y = point.get('x', 0), point.get('y', 0)
-            z = point.get('z', 0)
             
             # 提取桩1、桩2和总沉降值
             pile1_settlement = point.get('pile1_settlement', 0) * 1000  # 转为mm
@@ -202,52 +631,63 @@ class ResultExporter:
             if y < 0:  # 只考虑路基下方的点（y坐标为负值的点）
                 max_settlement = max(max_settlement, total_settlement)
             
-            calc_data.append([
+            yield start_row + count, [
                 point.get('point_id', ''),
                 f"({x:.1f}, {y:.1f})",
                 f"{pile1_settlement:.2f}",
                 f"{pile2_settlement:.2f}",
                 f"{total_settlement:.2f}"
-            ])
-        
-        # 创建DataFrame并写入Excel
-        start_row = title_row + 3  # 表格开始行
-        for i, row_data in enumerate(calc_data):
-            for j, value in enumerate(row_data):
-                writer.sheets[sheet_name].cell(row=start_row+i, column=j+1, value=value)
+            ]
+            count += 1
         
         # 在表格下方添加最大沉降值信息
-        end_row = start_row + len(calc_data) + 1
+        end_row = start_row + count + 1
         bridge_limit = safety_assessment.get('bridge_limit', 150)  # 默认桥梁限值150mm
-        writer.sheets[sheet_name].cell(row=end_row, column=1, 
-                                    value=f"路基下的计算点总沉降量最大值: {max_settlement:.2f} mm → " + 
-                                         (f"超过容许值({bridge_limit}mm)" if max_settlement > bridge_limit else f"未超过容许值({bridge_limit}mm)"))
+        yield end_row, [f"路基下的计算点总沉降量最大值: {max_settlement:.2f} mm → " +
+                        (f"超过容许值({bridge_limit}mm)" if max_settlement > bridge_limit else f"未超过容许值({bridge_limit}mm)")]
         
         # 添加公路等级与沉降容许值对比说明
-        writer.sheets[sheet_name].cell(row=end_row+2, column=1, 
-                                    value="注：根据《公路路基设计规范》JTG D30-2015，不同公路等级的沉降容许值要求不同。")
+        yield end_row+2, ["注：根据《公路路基设计规范》JTG D30-2015，不同公路等级的沉降容许值要求不同。"]
+    
+    def _write_calculation_results(self, writer, results):
+        """写入计算结果表"""
+        sheet_name = '计算结果'
+        writer.sheets[sheet_name] = writer.book.create_sheet(sheet_name)
+        
+        for row, values in self._calculation_result_rows(results):
+            for j, value in enumerate(values):
+                writer.sheets[sheet_name].cell(row=row, column=j+1, value=value)
         
         # 格式调整（可根据需要进一步优化）
-        for i in range(1, len(calc_data[0])+1):
+        for i in range(1, 6):
             writer.sheets[sheet_name].column_dimensions[chr(64+i)].width = 15
     
-    def _write_statistics(self, writer, results):
-        """写入统计分析表"""
+    def _statistics_table(self, results):
+        """统计分析表的内容（首行为表头）"""
         stats = results['statistics']
         
-        stats_data = [
+        return [
             ['统计项目', '数值', '单位'],
             ['最大沉降值', f"{stats['max_settlement_mm']:.3f}", 'mm'],
             ['最小沉降值', f"{stats['min_settlement_mm']:.3f}", 'mm'],
             ['平均沉降值', f"{stats['avg_settlement_mm']:.3f}", 'mm'],
             ['沉降值范围', f"{stats['max_settlement_mm'] - stats['min_settlement_mm']:.3f}", 'mm'],
         ]
+    
+    def _write_statistics(self, writer, results):
+        """写入统计分析表"""
+        stats_data = self._statistics_table(results)
         
         stats_df = pd.DataFrame(stats_data[1:], columns=stats_data[0])
         stats_df.to_excel(writer, sheet_name='统计分析', index=False)
     
-    def _write_safety_assessment(self, writer, results):
-        """写入安全评估表"""
+    def _safety_tables(self, results):
+        """
+        安全评估表的内容
+        
+        返回:
+        [(起始行（从0开始）, 表格（首行为表头）)]，评估结果表及建议事项表
+        """
         safety = results['safety_assessment']
         
         safety_data = [
@@ -261,9 +701,7 @@ class ResultExporter:
             ['影响范围面积', f"{safety['influence_area']:.2f} m²", ''],
             ['影响点数量', f"{safety['influence_points_count']}", '个'],
         ]
-        
-        safety_df = pd.DataFrame(safety_data[1:], columns=safety_data[0])
-        safety_df.to_excel(writer, sheet_name='安全评估', index=False, startrow=0)
+        tables = [(0, safety_data)]
         
         # 建议事项
         recommendations_data = [['序号', '建议事项']]
@@ -271,55 +709,168 @@ class ResultExporter:
             recommendations_data.append([i, rec])
         
         if len(recommendations_data) > 1:
-            rec_df = pd.DataFrame(recommendations_data[1:], columns=recommendations_data[0])
-            rec_df.to_excel(writer, sheet_name='安全评估', index=False, 
-                          startrow=len(safety_data)+2)
+            tables.append((len(safety_data)+2, recommendations_data))
+        return tables
+    
+    def _write_safety_assessment(self, writer, results):
+        """写入安全评估表"""
+        for start_row, table in self._safety_tables(results):
+            table_df = pd.DataFrame(table[1:], columns=table[0])
+            table_df.to_excel(writer, sheet_name='安全评估', index=False, startrow=start_row)
+    
+    def _diagram_title_rows(self):
+        """计算简图表的标题行"""
+        yield 1, ["计算简图:"]
+        yield 2, ["----------------------------------------------------------------------"]
+    
+    def _diagram_inputs(self, results, params):
+        """
+        由计算结果和输入参数整理计算简图的绘图输入（与界面工程示意简图一致）
+        
+        参数:
+        results: 计算结果字典
+        params: 输入参数字典
+        
+        返回:
+        tuple: ResultPlotter.settlement_distribution_plot 的位置参数
+        """
+        points = results.get('points', [])
+        if self._count_points(points) > DIAGRAM_MAX_POINTS:
+            raise ValueError(f"计算点超过 {DIAGRAM_MAX_POINTS} 个，不绘制计算简图")
+        
+        pile1_params = params.get('pile1', {})
+        pile2_params = params.get('pile2', {})
+        road_params = params.get('road_params', {})
+        
+        # 桩位置
+        roadbed_width = road_params.get('width', 20)
+        pile1_distance_val = road_params.get('pile1_distance', 5)
+        pile2_distance_val = road_params.get('pile2_distance', 5)
+        pile1_x = -(roadbed_width / 2 + pile1_distance_val)
+        pile2_x = +(roadbed_width / 2 + pile2_distance_val)
+        
+        # 计算点坐标和沉降值
+        points = list(self._iter_points(points))
+        points_3d = [(p['x'], p['y'], p['z']) for p in points]
+        settlements = [p['settlement_mm'] for p in points]
+        max_settlement_threshold = results.get('safety_assessment', {}).get('bridge_limit', 150)
+        
+        # 单桩沉降值（用于显示）
+        pile1_settlement = max([p.get('pile1_settlement', 0) * 1000 for p in points], default=0)
+        pile2_settlement = max([p.get('pile2_settlement', 0) * 1000 for p in points], default=0)
+        interaction_coefficient = 0.8
+        
+        # 桩参数（取较大的桩径和桩长）
+        pile_diameter = max(pile1_params.get('diameter', params.get('pile_diameter', 1.0)),
+                            pile2_params.get('diameter', params.get('pile_diameter', 1.0)))
+        pile_length = max(pile1_params.get('length', params.get('pile_length', 20.0)),
+                          pile2_params.get('length', params.get('pile_length', 20.0)))
+        
+        return (pile1_x, pile2_x, pile_diameter, pile_length,
+                roadbed_width, points_3d, settlements, max_settlement_threshold,
+                pile1_settlement, pile2_settlement, interaction_coefficient,
+                pile1_distance_val, pile2_distance_val)
+    
+    def _diagram_cache_key(self, inputs, dpi):
+        """计算简图缓存键：绘图输入规范化JSON的SHA-256"""
+        payload = json.dumps([DIAGRAM_CACHE_VERSION, dpi, inputs], sort_keys=True, default=float)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _render_calculation_diagram(self, results, params, dpi=300):
+        """
+        绘制计算简图并返回内存中的PNG图像
+        
+        图像按绘图输入的哈希缓存于进程内（及 diagram_cache_dir 目录），
+        未修改的工程再次导出时直接取用缓存，不重新绘制
+        
+        参数:
+        results: 计算结果字典
+        params: 输入参数字典
+        dpi: 图像分辨率
+        
+        返回:
+        BytesIO: PNG图像数据
+        """
+        inputs = self._diagram_inputs(results, params)
+        key = self._diagram_cache_key(inputs, dpi)
+        
+        image = self._load_cached_diagram(key)
+        if image is None:
+            import matplotlib.pyplot as plt
+            from visualization.plotter import ResultPlotter
+            
+            plotter = ResultPlotter()
+            fig = plotter.settlement_distribution_plot(*inputs)
+            try:
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+            finally:
+                plt.close(fig)
+            image = buffer.getvalue()
+            self._store_cached_diagram(key, image)
+        
+        return io.BytesIO(image)
+    
+    def _load_cached_diagram(self, key):
+        """读取缓存的计算简图，未命中返回None"""
+        with _diagram_cache_lock:
+            if key in _diagram_cache:
+                _diagram_cache.move_to_end(key)
+                return _diagram_cache[key]
+        
+        if self.diagram_cache_dir:
+            path = os.path.join(self.diagram_cache_dir, f'{key}.png')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    image = f.read()
+                self._store_cached_diagram(key, image, persist=False)
+                return image
+        return None
+    
+    def _store_cached_diagram(self, key, image, persist=True):
+        """缓存计算简图（进程内LRU，可选写入缓存目录）"""
+        with _diagram_cache_lock:
+            _diagram_cache[key] = image
+            _diagram_cache.move_to_end(key)
+            while len(_diagram_cache) > DIAGRAM_CACHE_SIZE:
+                _diagram_cache.popitem(last=False)
+        
+        if persist and self.diagram_cache_dir:
+            os.makedirs(self.diagram_cache_dir, exist_ok=True)
+            path = os.path.join(self.diagram_cache_dir, f'{key}.png')
+            # 先写临时文件再替换，避免并发导出读到不完整的图像
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(image)
+            os.replace(tmp_path, path)
     
     def _write_calculation_diagram(self, writer, results, params):
         """在Excel中嵌入计算简图"""
+        sheet_name = '计算简图'
         try:
-            import tempfile
-            import os
-            from visualization.plotter import ResultPlotter
-            
             # 创建计算简图表
-            sheet_name = '计算简图'
             writer.sheets[sheet_name] = writer.book.create_sheet(sheet_name)
             
             # 添加标题
-            writer.sheets[sheet_name].cell(row=1, column=1, value="计算简图:")
-            writer.sheets[sheet_name].cell(row=2, column=1, value="----------------------------------------------------------------------")
-            
-            # 生成并保存计算简图
-            plotter = ResultPlotter()
-            fig = plotter.settlement_distribution_plot(results, params)
-            
-            # 创建临时文件保存图像
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
+            for row, values in self._diagram_title_rows():
+                writer.sheets[sheet_name].cell(row=row, column=1, value=values[0])
             
-            # 保存图像
-            fig.savefig(tmp_path, dpi=300, bbox_inches='tight')
-            
-            # 在Excel中插入图像
-            img = openpyxl.drawing.image.Image(tmp_path)
+            # 在Excel中插入内存中的图像
+            img = openpyxl.drawing.image.Image(self._render_calculation_diagram(results, params))
             img.width = 800  # 图像宽度（像素）
             img.height = 600  # 图像高度（像素）
             writer.sheets[sheet_name].add_image(img, 'A4')  # 在A4单元格位置插入图像
             
-            # 删除临时文件
-            os.unlink(tmp_path)
-            
             return True
         except Exception as e:
             print(f"嵌入计算简图失败: {str(e)}")
             # 在Excel中添加错误信息
-            writer.sheets[sheet_name].cell(row=4, column=1, 
+            writer.sheets[sheet_name].cell(row=4, column=1,
                                         value=f"无法嵌入计算简图: {str(e)}")
             return False
     
-    def _write_correction_factors(self, writer, results):
-        """写入修正系数表"""
+    def _correction_table(self, results):
+        """修正系数表的内容（首行为表头）"""
         # 检查correction_factors是否存在，如果不存在则创建默认值
         correction = results.get('correction_factors', {
             'length_correction': 1.0,
@@ -327,25 +878,28 @@ class ResultExporter:
             'combined_correction': 1.0
         })
         
-        # 获取桩的参数（处理双桩情况）
-        input_params = results['input_parameters']
-        if 'pile1' in input_params:
-            # 双桩结构，使用桩1的参数作为主要参数
-            pile_length = input_params['pile1']['length']
-            pile_diameter = input_params['pile1']['diameter']
-        else:
-            # 单桩结构
-            pile_length = input_params.get('pile_length', 20.0)
-            pile_diameter = input_params.get('pile_diameter', 1.0)
-        
-        correction_data = [
+        pile_length, pile_diameter = self._correction_pile_dimensions(results['input_parameters'])
+        
+        return [
             ['修正系数', '数值', '说明'],
-            ['桩长修正系数a', f"{correction.get('length_correction', 1.0):.4f}", 
+            ['桩长修正系数a', f"{correction.get('length_correction', 1.0):.4f}",
              f"a = 0.985 - 0.00051 × {pile_length}"],
-            ['桩径修正系数b', f"{correction.get('diameter_correction', 1.0):.4f}", 
+            ['桩径修正系数b', f"{correction.get('diameter_correction', 1.0):.4f}",
              f"b = 0.038 × {pile_diameter}² - 0.206 × {pile_diameter} + 1.159"],
             ['综合修正系数', f"{correction.get('combined_correction', 1.0):.4f}", 'a × b'],
         ]
+    
+    def _correction_pile_dimensions(self, input_params):
+        """修正系数说明所用的桩长和桩径（处理双桩情况）"""
+        if 'pile1' in input_params:
+            # 双桩结构，使用桩1的参数作为主要参数
+            return input_params['pile1']['length'], input_params['pile1']['diameter']
+        # 单桩结构
+        return input_params.get('pile_length', 20.0), input_params.get('pile_diameter', 1.0)
+    
+    def _write_correction_factors(self, writer, results):
+        """写入修正系数表"""
+        correction_data = self._correction_table(results)
         
         correction_df = pd.DataFrame(correction_data[1:], columns=correction_data[0])
         correction_df.to_excel(writer, sheet_name='修正系数', index=False)
@@ -363,39 +917,117 @@ class ResultExporter:
                 os.makedirs(output_dir)
             
             # 导出计算结果
-            points = results['points']
-            calc_data = []
-            for point in points:
-                calc_data.append({
-                    '计算点': point['point_id'],
-                    'X坐标(m)': point['x'],
-                    'Y坐标(m)': point['y'],
-                    '深度(m)': point['z'],
-                    '距离(m)': point['distance'],
-                    '沉降值(mm)': point.get('settlement_mm', 0),
-                    '影响系数': point['influence_factor'],
-                    '垂直应力(kPa)': point['sigma_z'],
-                    '剪应力τxz(kPa)': point['tau_xz'],
-                    '剪应力τyz(kPa)': point['tau_yz'],
-                    '对应土层': point['soil_properties']['name']
-                })
-            
-            calc_df = pd.DataFrame(calc_data)
-            calc_df.to_csv(os.path.join(output_dir, '计算结果.csv'), 
-                          index=False, encoding='utf-8-sig')
+            success, message = self.export_to_csv_streaming(results, os.path.join(output_dir, '计算结果.csv'))
+            if not success:
+                return False, message
             
             return True, "CSV导出成功"
+        
+        except Exception as e:
+            return False, f"CSV导出失败：{str(e)}"
+    
+    def export_to_csv_streaming(self, points, filename, chunk_size=STREAMING_CHUNK_SIZE,
+                                buffer_size=CSV_BUFFER_SIZE):
+        """
+        流式导出计算点到CSV文件
+        
+        逐块写出缓冲行，不构建完整的数据表，内存占用与行数无关；
+        表头由结果容器确定：列式数据取列名，逐点结果取首条记录的键（嵌套字典展开为 'a.b'），
+        已知键使用 CSV_HEADERS 中的中文表头，后续记录缺少的键留空
+        
+        参数:
+        points: 计算结果字典（取 'points'）、逐点字典的列表或迭代器（如生成器），
+                或列式数组字典 {列名: 数组}
+        filename: 输出文件名
+        chunk_size: 每次写出的行数
+        buffer_size: 文件写缓冲区字节数
+        """
+        try:
+            if isinstance(points, dict) and 'points' in points:
+                points = points['points']
+            
+            with open(filename, 'w', newline='', encoding='utf-8-sig', buffering=buffer_size) as f:
+                writer = csv.writer(f)
+                n_rows = 0
+                
+                if isinstance(points, dict):
+                    columns = list(points.keys())
+                    writer.writerow([CSV_HEADERS.get(column, column) for column in columns])
+                    n_points = self._count_points(points)
+                    for start in range(0, n_points, chunk_size):
+                        chunk = [self._to_list(points[column][start:start + chunk_size]) for column in columns]
+                        writer.writerows(zip(*chunk))
+                        n_rows += len(chunk[0]) if chunk else 0
+                        del chunk
+                else:
+                    records = iter(points)
+                    first = next(records, None)
+                    columns = list(flatten_record(first)) if first is not None else list(CSV_HEADERS)
+                    writer.writerow([CSV_HEADERS.get(column, column) for column in columns])
+                    if first is not None:
+                        records = itertools.chain([first], records)
+                        while True:
+                            batch = [flatten_record(record) for record in itertools.islice(records, chunk_size)]
+                            if not batch:
+                                break
+                            writer.writerows([record.get(column, '') for column in columns] for record in batch)
+                            n_rows += len(batch)
             
+            return True, f"CSV导出成功：{n_rows} 行"
+        
         except Exception as e:
             return False, f"CSV导出失败：{str(e)}"
     
-    def export_to_json(self, results, filename):
+    def export_to_columnar(self, results, filename, engine=None, metadata=None):
+        """
+        导出计算点或沉降场/参数扫描结果到列式二进制文件
+        
+        安装 pyarrow 时写 Parquet（zstd 压缩），否则写压缩 .npz；
+        工程参数、统计及附加元数据随文件保存，可用 utils.columnar.load_columnar 读取
+        
+        参数:
+        results: 计算结果字典、逐点字典列表或列式数组字典
+        filename: 输出文件名（扩展名按实际格式修正）
+        engine: 'parquet'、'npz' 或 None（自动选择）
+        metadata: 附加元数据字典
+        """
+        try:
+            path = save_columnar(results, filename, metadata=metadata, engine=engine)
+            return True, f"列式数据导出成功：{path}"
+        
+        except Exception as e:
+            return False, f"列式数据导出失败：{str(e)}"
+    
+    def export_to_pdf(self, results, filename, template=None, include_plots=True):
+        """
+        导出PDF计算报告
+        
+        参数:
+        results: 计算结果字典
+        filename: 输出文件名
+        template: 报告模板（utils.pdf_report.ReportTemplate），None 时使用默认模板
+        include_plots: 是否插入计算简图及结果图
+        """
+        try:
+            from utils.pdf_report import PdfReportEngine
+            
+            pages = PdfReportEngine(template, exporter=self).export(results, filename, include_plots)
+            return True, f"PDF报告导出成功：{pages} 页"
+        
+        except Exception as e:
+            return False, f"PDF报告导出失败：{str(e)}"
+    
+    def export_to_json(self, results, filename, minify=False, sidecar=False):
         """
         导出结果到JSON文件
         
+        NumPy 数组及标量按类型保存，逐点结果按列打包，可用 load_from_json 还原
+        
         参数:
         results: 计算结果字典
         filename: 输出文件名
+        minify: 是否输出紧凑格式（默认缩进排版）
+        sidecar: 大数组是否写入旁路二进制文件 filename + '.bin'（默认 base64 内嵌）
         """
         try:
             # 添加导出时间戳
@@ -409,14 +1041,25 @@ class ResultExporter:
                 'results': results
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+            json_codec.dump(export_data, filename, minify=minify, sidecar=sidecar)
             
             return True, "JSON导出成功"
-            
+        
         except Exception as e:
             return False, f"JSON导出失败：{str(e)}"
     
+    def load_from_json(self, filename):
+        """
+        读取 export_to_json 导出的JSON文件
+        
+        参数:
+        filename: JSON文件名
+        
+        返回:
+        results: 计算结果字典（数组还原为 np.ndarray）
+        """
+        return json_codec.load(filename)['results']
+    
     def generate_summary_report(self, results):
         """
         生成汇总报告文本
@@ -443,9 +1086,7 @@ class ResultExporter:
             "",
             "一、输入参数",
             "-" * 30,
-            f"桩径：{input_params['pile_diameter']} m",
-            f"桩长：{input_params['pile_length']} m",
-            f"荷载：{input_params['load']} kN",
+            *self._pile_summary_lines(input_params),
             f"路线等级：{input_params['road_level']}",
             f"土层数量：{len(input_params['soil_layers'])} 层",
             "",
@@ -454,7 +1095,7 @@ class ResultExporter:
             f"最大沉降值：{stats['max_settlement_mm']:.3f} mm",
             f"最小沉降值：{stats['min_settlement_mm']:.3f} mm",
             f"平均沉降值：{stats['avg_settlement_mm']:.3f} mm",
-            f"计算点数量：{len(results['points'])} 个",
+            f"计算点数量：{self._count_points(results['points'])} 个",
             "",
             "三、安全评估",
             "-" * 30,
@@ -485,6 +1126,21 @@ class ResultExporter:
         
         return "\n".join(report_lines)
     
+    def _pile_summary_lines(self, input_params):
+        """汇总报告中的桩基参数（双桩参数或单桩参数）"""
+        lines = []
+        for key, label in (('pile1', '桩1'), ('pile2', '桩2')):
+            if key in input_params:
+                pile = input_params[key]
+                lines.append(f"{label}：桩径 {pile['diameter']} m，桩长 {pile['length']} m，荷载 {pile['load']} kN")
+        if lines:
+            return lines
+        return [
+            f"桩径：{input_params['pile_diameter']} m",
+            f"桩长：{input_params['pile_length']} m",
+            f"荷载：{input_params['load']} kN",
+        ]
+    
     def export_summary_report(self, results, filename):
         """
         导出汇总报告到文本文件
@@ -500,7 +1156,7 @@ class ResultExporter:
                 f.write(report_text)
             
             return True, "汇总报告导出成功"
-            
+        
         except Exception as e:
             return False, f"汇总报告导出失败：{str(e)}"
     
@@ -522,9 +1178,19 @@ class ResultExporter:
                 'extension': '.json',
                 'description': '结构化数据格式'
             },
+            'pdf': {
+                'name': 'PDF报告',
+                'extension': '.pdf',
+                'description': '按报告样式排版的完整计算报告'
+            },
             'txt': {
                 'name': '汇总报告',
                 'extension': '.txt',
                 'description': '简要的文本报告'
+            },
+            'columnar': {
+                'name': '列式二进制数据',
+                'extension': ENGINE_EXTENSIONS[default_engine()],
+                'description': '沉降场及参数扫描的压缩列式数据（Parquet/NPZ）'
             }
         } 
\ No newline at end of file
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy 感知的 JSON 编解码
+NumPy 数组按 dtype/形状原样保存（大数组为 base64 或旁路二进制文件），NumPy 标量转换为
+Python 数值，同构的逐点字典列表按列打包；loads/load 还原为原结果对象
+"""
+
+import os
+import json
+import base64
+from typing import Any, Optional
+
+import numpy as np
+
+
+# 元素数不少于该值的数组以二进制（base64 或旁路文件）保存，较小的数组保存为列表
+ARRAY_THRESHOLD = 64
+
+# 元素数不少于该值的同构字典列表按列打包
+RECORDS_THRESHOLD = 16
+
+ARRAY_KEY = '__ndarray__'
+RECORDS_KEY = '__records__'
+TUPLE_KEY = '__tuple__'
+CATEGORIES_KEY = '__categories__'
+
+# 旁路二进制文件的扩展名（附加在JSON文件名之后）
+SIDECAR_SUFFIX = '.bin'
+
+_PRIMITIVES = (bool, int, float, str)
+
+# 按列打包时嵌套键路径的分隔符
+_PATH_SEPARATOR = '\x1f'
+
+
+class _Encoder:
+    """编码状态：旁路二进制数据块"""
+
+    def __init__(self, array_threshold, records_threshold, sidecar):
+        self.array_threshold = array_threshold
+        self.records_threshold = records_threshold
+        self.sidecar = sidecar
+        self.blobs = []
+        self.offset = 0
+
+    def encode(self, value):
+        """转换为可JSON序列化的对象"""
+        if isinstance(value, dict):
+            return {key: self.encode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            records = self._pack_records(value)
+            if records is not None:
+                return records
+            return [self.encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {TUPLE_KEY: [self.encode(item) for item in value]}
+        if isinstance(value, np.ndarray):
+            return self._encode_array(value)
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _encode_array(self, array):
+        """数组编码：小数组或对象数组为列表，其余为 base64 或旁路文件中的数据块"""
+        header = {'dtype': array.dtype.str, 'shape': list(array.shape)}
+        if array.dtype.hasobject or array.size < self.array_threshold:
+            header[ARRAY_KEY] = self.encode(array.tolist()) if array.dtype.hasobject else array.tolist()
+            return header
+
+        data = np.ascontiguousarray(array).tobytes()
+        if self.sidecar:
+            header[ARRAY_KEY] = 'sidecar'
+            header['offset'] = self.offset
+            header['nbytes'] = len(data)
+            self.blobs.append(data)
+            self.offset += len(data)
+        else:
+            header[ARRAY_KEY] = 'base64'
+            header['data'] = base64.b64encode(data).decode('ascii')
+        return header
+
+    def _pack_records(self, records):
+        """同构字典列表（各键值类型一致的基本类型）按列打包，否则返回None"""
+        if len(records) < self.records_threshold or not isinstance(records[0], dict):
+            return None
+        flat_records = [_flatten(record) for record in records if isinstance(record, dict)]
+        if len(flat_records) != len(records) or any(flat is None for flat in flat_records):
+            return None
+
+        keys = list(flat_records[0])
+        types = [type(flat_records[0][key]) for key in keys]
+        if any(kind not in _PRIMITIVES for kind in types):
+            return None
+        for flat in flat_records:
+            if len(flat) != len(keys) or any(type(flat.get(key)) is not kind for key, kind in zip(keys, types)):
+                return None
+
+        columns = {}
+        for key, kind in zip(keys, types):
+            values = [flat[key] for flat in flat_records]
+            # 重复值多的列（土层名称、常数深度等）按字典编码：唯一值 + 索引
+            unique = list(dict.fromkeys(values))
+            if len(unique) * 4 <= len(values):
+                index = {value: i for i, value in enumerate(unique)}
+                codes = np.fromiter((index[value] for value in values), dtype=np.min_scalar_type(len(unique)),
+                                    count=len(values))
+                columns[key] = {CATEGORIES_KEY: unique, 'codes': self._encode_array(codes)}
+            elif kind is str:
+                columns[key] = values
+            else:
+                try:
+                    columns[key] = self._encode_array(np.asarray(values, dtype=kind))
+                except OverflowError:
+                    return None
+        return {RECORDS_KEY: columns, 'keys': keys}
+
+
+def _flatten(record, prefix=''):
+    """展开嵌套字典为 {键路径: 值}；键不是字符串或含路径分隔符时返回None"""
+    flat = {}
+    for key, value in record.items():
+        if not isinstance(key, str) or _PATH_SEPARATOR in key:
+            return None
+        path = prefix + key
+        if isinstance(value, dict) and value:
+            nested = _flatten(value, path + _PATH_SEPARATOR)
+            if nested is None:
+                return None
+            flat.update(nested)
+        else:
+            flat[path] = value.item() if isinstance(value, np.generic) else value
+    return flat
+
+
+def _unflatten(flat):
+    """由 {键路径: 值} 还原嵌套字典"""
+    record = {}
+    for key, value in flat.items():
+        *parents, name = key.split(_PATH_SEPARATOR)
+        node = record
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+    return record
+
+
+class _Decoder:
+    """解码状态：旁路二进制文件"""
+
+    def __init__(self, sidecar_data=None):
+        self.sidecar_data = sidecar_data
+
+    def object_hook(self, obj):
+        """还原数组、元组及按列打包的字典列表"""
+        if ARRAY_KEY in obj:
+            return self._decode_array(obj)
+        if CATEGORIES_KEY in obj:
+            categories = obj[CATEGORIES_KEY]
+            return [categories[code] for code in obj['codes'].tolist()]
+        if TUPLE_KEY in obj and len(obj) == 1:
+            return tuple(obj[TUPLE_KEY])
+        if RECORDS_KEY in obj:
+            columns = obj[RECORDS_KEY]
+            keys = obj['keys']
+            values = [columns[key].tolist() if isinstance(columns[key], np.ndarray) else columns[key]
+                      for key in keys]
+            return [_unflatten(dict(zip(keys, row))) for row in zip(*values)]
+        return obj
+
+    def _decode_array(self, obj):
+        dtype = np.dtype(obj['dtype'])
+        shape = tuple(obj['shape'])
+        storage = obj[ARRAY_KEY]
+        if storage == 'base64':
+            data = base64.b64decode(obj['data'])
+        elif storage == 'sidecar':
+            if self.sidecar_data is None:
+                raise ValueError("缺少旁路二进制文件")
+            data = self.sidecar_data[obj['offset']:obj['offset'] + obj['nbytes']]
+        else:
+            return np.array(storage, dtype=dtype).reshape(shape)
+        return np.frombuffer(data, dtype=dtype).reshape(shape).copy()
+
+
+def dumps(obj: Any, minify: bool = True, array_threshold: int = ARRAY_THRESHOLD,
+          records_threshold: int = RECORDS_THRESHOLD) -> str:
+    """
+    编码为JSON字符串（数组数据以 base64 内嵌）
+
+    Args:
+        obj: 待编码对象（可含 NumPy 数组及标量）
+        minify: 是否输出紧凑格式（无缩进和多余空格）
+        array_threshold: 以 base64 保存的最小数组元素数
+        records_threshold: 按列打包的最小字典列表长度
+
+    Returns:
+        str: JSON 文本
+    """
+    encoder = _Encoder(array_threshold, records_threshold, sidecar=False)
+    return _serialize(encoder.encode(obj), minify)
+
+
+def loads(text: str, sidecar_data: Optional[bytes] = None) -> Any:
+    """
+    由JSON字符串还原对象
+
+    Args:
+        text: dumps/dump 生成的 JSON 文本
+        sidecar_data: 旁路二进制文件内容（仅旁路模式需要）
+
+    Returns:
+        还原的对象，数组为 np.ndarray
+    """
+    return json.loads(text, object_hook=_Decoder(sidecar_data).object_hook)
+
+
+def dump(obj: Any, filename: str, minify: bool = True, sidecar: bool = False,
+         array_threshold: int = ARRAY_THRESHOLD, records_threshold: int = RECORDS_THRESHOLD) -> Optional[str]:
+    """
+    编码并写入JSON文件
+
+    Args:
+        obj: 待编码对象
+        filename: 输出文件名
+        minify: 是否输出紧凑格式
+        sidecar: 大数组是否写入旁路二进制文件 filename + SIDECAR_SUFFIX（否则 base64 内嵌）
+        array_threshold, records_threshold: 见 dumps
+
+    Returns:
+        str: 旁路二进制文件名（无旁路数据时为 None）
+    """
+    encoder = _Encoder(array_threshold, records_threshold, sidecar=sidecar)
+    text = _serialize(encoder.encode(obj), minify)
+
+    sidecar_path = filename + SIDECAR_SUFFIX
+    if encoder.blobs:
+        with open(sidecar_path, 'wb') as f:
+            for blob in encoder.blobs:
+                f.write(blob)
+    elif os.path.exists(sidecar_path):
+        # 删除上次导出遗留的旁路文件，避免与新JSON不匹配
+        os.remove(sidecar_path)
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return sidecar_path if encoder.blobs else None
+
+
+def load(filename: str) -> Any:
+    """
+    读取 dump 写出的JSON文件（自动读取旁路二进制文件）
+
+    Args:
+        filename: JSON 文件名
+
+    Returns:
+        还原的对象
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    sidecar_data = None
+    sidecar_path = filename + SIDECAR_SUFFIX
+    if os.path.exists(sidecar_path):
+        with open(sidecar_path, 'rb') as f:
+            sidecar_data = f.read()
+    return loads(text, sidecar_data)
+
+
+def _serialize(obj, minify):
+    """写出JSON文本；非 NumPy 的其他类型（如日期）仍以字符串保存"""
+    if minify:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
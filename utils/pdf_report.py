@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+"""
+PDF报告生成
+按报告样式由计算结果组装封面、输入参数、计算结果表、统计与安全评估、计算简图及结果图、
+修正系数、工程建议和计算依据，使用 matplotlib 的 PDF 后端逐页写出（不依赖其他PDF库）；
+字体、标志图像、计算依据等模板静态内容按模板预先处理并缓存，批量报告的各项目共用
+"""
+
+import io
+import os
+import json
+import hashlib
+import functools
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+from utils.exporter import ResultExporter
+
+
+# 计算结果表表头（对应 ResultExporter._calculation_result_rows 的数据行）
+POINT_TABLE_HEADER = ['计算点', '坐标 (x, y)', '桩1沉降(mm)', '桩2沉降(mm)', '总沉降(mm)']
+
+# 结果图：(标题, ResultPlotter 方法)
+REPORT_PLOTS = (
+    ('沉降分析图', 'create_settlement_plot'),
+    ('等高线图', 'create_contour_plot'),
+)
+
+CHINESE_NUMERALS = '一二三四五六七八九十'
+
+# 纯ASCII表格行在PDF中使用的标准14字体（阅读器内置，不嵌入字体，不做逐字形排版）及其字符宽度 (em)
+CORE_MONO_FONT = 'Courier'
+CORE_MONO_CHAR_WIDTH = 0.6
+
+_static_cache = {}
+_static_cache_lock = threading.Lock()
+
+
+@dataclass
+class ReportTemplate:
+    """PDF报告模板"""
+    title: str = '高架桥桩基沉降影响范围计算报告'
+    software: str = '桥梁跨越工程安全性评估软件 1.0'
+    page_size: Tuple[float, float] = (8.27, 11.69)    # A4 (inch)
+    margin: float = 0.75                              # 页边距 (inch)
+    font_family: Tuple[str, ...] = ('SimHei', 'Microsoft YaHei', 'DejaVu Sans')   # 按顺序取第一个可用字体
+    mono_font_family: Tuple[str, ...] = ('DejaVu Sans Mono', 'monospace')
+    font_size: float = 9.0
+    line_spacing: float = 1.7
+    logo: Optional[str] = None                        # 封面及页眉标志图像文件
+    standards: Tuple[str, ...] = (
+        '《公路路基设计规范》JTG D30-2015',
+        'Boussinesq弹性理论',
+        'FLAC3D数值模拟修正',
+    )
+    footer: str = '本报告由计算软件自动生成'
+    plot_dpi: int = 150
+
+    def fingerprint(self) -> str:
+        """模板内容指纹（含标志文件的修改时间），用作静态内容缓存键"""
+        data = asdict(self)
+        if self.logo and os.path.exists(self.logo):
+            data['logo_mtime'] = os.path.getmtime(self.logo)
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class _StaticParts:
+    """模板静态内容：字体、标志图像、计算依据等（按模板缓存）"""
+    font: Any
+    bold_font: Any
+    mono_font: Any
+    core_mono_afm: str                                # 标准14字体度量文件
+    mono_char_width: float                            # 等宽字体字符宽度 (inch)
+    logo: Any = None
+    standards_blocks: List[Tuple] = field(default_factory=list)
+
+
+def get_static_parts(template: ReportTemplate) -> _StaticParts:
+    """获取模板的静态内容（首次使用时处理，之后直接取用缓存）"""
+    key = template.fingerprint()
+    with _static_cache_lock:
+        if key in _static_cache:
+            return _static_cache[key]
+
+    import matplotlib
+    import matplotlib.image
+    from matplotlib.font_manager import FontProperties, findfont
+
+    # 预先解析字体文件，页面文本直接使用字体文件，不再逐次按字族查找
+    family = list(template.font_family)
+    font = FontProperties(fname=findfont(FontProperties(family=family)), size=template.font_size)
+    bold_font = FontProperties(fname=findfont(FontProperties(family=family, weight='bold')),
+                               size=template.font_size, weight='bold')
+
+    # 纯ASCII表格行整行排版：PDF中使用标准14字体 Courier，其他输出使用等宽字体文件
+    mono_font = FontProperties(fname=findfont(FontProperties(family=list(template.mono_font_family))),
+                               size=template.font_size)
+    core_mono_afm = findfont(FontProperties(family=CORE_MONO_FONT, weight='medium'), fontext='afm')
+    mono_char_width = CORE_MONO_CHAR_WIDTH * template.font_size / 72
+
+    logo = None
+    if template.logo and os.path.exists(template.logo):
+        logo = matplotlib.image.imread(template.logo)
+
+    standards_blocks = [('text', f"{i}. {standard}") for i, standard in enumerate(template.standards, 1)]
+
+    parts = _StaticParts(font, bold_font, mono_font, core_mono_afm, mono_char_width, logo, standards_blocks)
+    with _static_cache_lock:
+        _static_cache[key] = parts
+    return parts
+
+
+@functools.lru_cache(maxsize=None)
+def _mono_lines_class():
+    """纯ASCII表格行图元类（matplotlib 延迟导入，首次使用时创建）"""
+    from matplotlib.artist import Artist
+    from matplotlib.backends.backend_pdf import Op, RendererPdf
+
+    class _MonoLines(Artist):
+        """
+        一页内全部纯ASCII表格行
+
+        PDF输出时以标准14字体在一个文本对象内逐行写出，省去逐字形排版、字形跟踪和字体子集嵌入；
+        其他输出（如预览）按等宽字体文件绘制。行坐标为基线位置 (inch)。
+        """
+
+        def __init__(self, static: _StaticParts):
+            super().__init__()
+            self.static = static
+            self.lines = []
+
+        def add(self, x, y, text):
+            self.lines.append((x, y, text))
+
+        def draw(self, renderer):
+            if not self.get_visible() or not self.lines:
+                return
+            gc = renderer.new_gc()
+            gc.set_foreground('black')
+            # PDF输出的渲染器由 MixedModeRenderer 包装，按其当前实际渲染器判断
+            target = getattr(renderer, '_renderer', renderer)
+            if isinstance(target, RendererPdf):
+                target.check_gc(gc, gc.get_rgb())
+                pdf = target.file
+                pdf.output(Op.begin_text, pdf.fontName(self.static.core_mono_afm),
+                           self.static.mono_font.get_size_in_points(), Op.selectfont)
+                last_x = last_y = 0.0
+                for x, y, text in self.lines:
+                    # 文本位置相对上一行起点给出
+                    pdf.output(x * 72 - last_x, y * 72 - last_y, Op.textpos,
+                               text.encode('cp1252', 'replace'), Op.show)
+                    last_x, last_y = x * 72, y * 72
+                pdf.output(Op.end_text)
+            else:
+                scale = renderer.points_to_pixels(72.0)
+                for x, y, text in self.lines:
+                    renderer.draw_text(gc, x * scale, y * scale, text, self.static.mono_font, 0.0)
+            gc.restore()
+            self.stale = False
+
+    return _MonoLines
+
+
+class _PageWriter:
+    """逐页排版写出：文本行、表格行、图像按页面可用高度自动分页"""
+
+    def __init__(self, pdf, template: ReportTemplate, static: _StaticParts, header: str):
+        self.pdf = pdf
+        self.template = template
+        self.static = static
+        self.header = header
+        self.width, self.height = template.page_size
+        self.line_height = template.font_size * template.line_spacing / 72
+        self.figure = None
+        self.mono_lines = None
+        self.page_count = 0
+        self.table_header = None
+        self.y = 0.0
+
+    def _new_page(self, repeat_table_header=True):
+        """结束当前页并开始新页（页眉、页脚、页码）"""
+        from matplotlib.figure import Figure
+
+        self.finish()
+        self.figure = Figure(figsize=self.template.page_size)
+        self.mono_lines = _mono_lines_class()(self.static)
+        self.figure.add_artist(self.mono_lines)
+        self.page_count += 1
+        template = self.template
+        top = self.height - template.margin
+
+        self._text(template.margin, top + 0.3, self.header, size=template.font_size - 1, color='gray')
+        self.figure.add_artist(self._rule(top + 0.22))
+        self._text(template.margin, template.margin - 0.35, template.footer, size=template.font_size - 1, color='gray')
+        self._text(self.width - template.margin, template.margin - 0.35, f"第 {self.page_count} 页",
+                   size=template.font_size - 1, color='gray', ha='right')
+        self.y = top
+        if repeat_table_header and self.table_header:
+            self._table_row(self.table_header, bold=True)
+
+    def finish(self):
+        """写出当前页"""
+        if self.figure is not None:
+            self.pdf.savefig(self.figure)
+            self.figure = None
+            self.mono_lines = None
+
+    def _ensure(self, height):
+        """当前页剩余高度不足时换页"""
+        if self.figure is None or self.y - height < self.template.margin:
+            self._new_page()
+
+    def _text(self, x, y, text, size=None, bold=False, color='black', ha='left'):
+        font = self.static.bold_font if bold else self.static.font
+        self.figure.text(x / self.width, y / self.height, text, fontproperties=font,
+                         fontsize=size or self.template.font_size, color=color, ha=ha, va='baseline')
+
+    def _rule(self, y, style='-'):
+        from matplotlib.lines import Line2D
+
+        x0 = self.template.margin / self.width
+        x1 = 1 - x0
+        return Line2D([x0, x1], [y / self.height] * 2, color='gray', linewidth=0.6, linestyle=style,
+                      transform=self.figure.transFigure)
+
+    def _column_width(self, columns):
+        """表格列宽 (inch)：取等宽字体字符宽度的整数倍，使整行排版与逐格排版对齐"""
+        usable = self.width - 2 * self.template.margin
+        return int(usable / columns / self.static.mono_char_width) * self.static.mono_char_width
+
+    def _table_row(self, values, bold=False):
+        values = [str(value) for value in values]
+        width = self._column_width(len(values))
+        self.y -= self.line_height
+        if not bold and all(value.isascii() for value in values):
+            # 纯ASCII行：按列宽补齐后整行作为一个等宽文本写出
+            chars = round(width / self.static.mono_char_width)
+            line = ''.join(value[:chars - 1].ljust(chars) for value in values).rstrip()
+            self.mono_lines.add(self.template.margin, self.y, line)
+        else:
+            for i, value in enumerate(values):
+                self._text(self.template.margin + width * i, self.y, value, bold=bold)
+        if bold:
+            self.figure.add_artist(self._rule(self.y - self.line_height * 0.3))
+
+    def write(self, block: Tuple):
+        """写出一个内容块"""
+        kind = block[0]
+        if kind == 'page_break':
+            self.table_header = None
+            self._new_page()
+        elif kind == 'heading':
+            self.table_header = None
+            self._ensure(self.line_height * 3)
+            self.y -= self.line_height * 1.8
+            self._text(self.template.margin, self.y, block[1], size=self.template.font_size + 3, bold=True)
+            self.y -= self.line_height * 0.4
+        elif kind == 'text':
+            self._ensure(self.line_height)
+            self.y -= self.line_height
+            self._text(self.template.margin, self.y, block[1])
+        elif kind == 'rule':
+            self._ensure(self.line_height)
+            self.y -= self.line_height * 0.5
+            self.figure.add_artist(self._rule(self.y, '--'))
+        elif kind == 'space':
+            self._ensure(self.line_height * block[1])
+            self.y -= self.line_height * block[1]
+        elif kind == 'table_header':
+            self.table_header = block[1]
+            self._ensure(self.line_height * 3)
+            self._table_row(block[1], bold=True)
+        elif kind == 'table_row':
+            if self.figure is None or self.y - self.line_height < self.template.margin:
+                self._new_page()
+            self._table_row(block[1])
+        elif kind == 'end_table':
+            self.table_header = None
+        elif kind == 'image':
+            self.table_header = None
+            self._image(block[1], block[2])
+        else:
+            raise ValueError(f"未知的内容块类型: {kind}")
+
+    def _image(self, image, max_height):
+        """按页面宽度等比缩放插入图像"""
+        usable = self.width - 2 * self.template.margin
+        rows, cols = image.shape[:2]
+        width = usable
+        height = width * rows / cols
+        if height > max_height:
+            height = max_height
+            width = height * cols / rows
+        self._ensure(height + self.line_height)
+        self.y -= height + self.line_height * 0.5
+        left = self.template.margin + (usable - width) / 2
+        ax = self.figure.add_axes([left / self.width, self.y / self.height, width / self.width, height / self.height])
+        ax.imshow(image, interpolation='antialiased')
+        ax.set_axis_off()
+
+    def cover(self, lines: List[str]):
+        """封面页"""
+        from matplotlib.figure import Figure
+
+        self.finish()
+        self.figure = Figure(figsize=self.template.page_size)
+        self.page_count += 1
+        if self.static.logo is not None:
+            ax = self.figure.add_axes([0.4, 0.72, 0.2, 0.12])
+            ax.imshow(self.static.logo)
+            ax.set_axis_off()
+        self._text(self.width / 2, self.height * 0.6, self.template.title, size=self.template.font_size + 11,
+                   bold=True, ha='center')
+        for i, line in enumerate(lines):
+            self._text(self.width / 2, self.height * 0.5 - i * self.line_height * 1.6, line,
+                       size=self.template.font_size + 2, ha='center')
+        self.finish()
+
+
+class PdfReportEngine:
+    """PDF报告生成类"""
+
+    def __init__(self, template: Optional[ReportTemplate] = None, exporter: Optional[ResultExporter] = None):
+        """
+        初始化报告生成
+
+        Args:
+            template: 报告模板，缺省为默认模板
+            exporter: 用于生成各表内容及计算简图的导出器（共用其计算简图缓存）
+        """
+        self.template = template or ReportTemplate()
+        self.exporter = exporter or ResultExporter()
+
+    def build_blocks(self, results: Dict[str, Any], include_plots: bool = True) -> Iterable[Tuple]:
+        """
+        由计算结果生成报告正文内容块（逐点生成，计算结果表不整体展开）
+
+        Args:
+            results: 计算结果字典
+            include_plots: 是否插入计算简图及结果图
+
+        Returns:
+            内容块迭代器
+        """
+        exporter = self.exporter
+        input_params = results.get('input_parameters', {})
+        recommendations = results.get('safety_assessment', {}).get('recommendations', [])
+        static = get_static_parts(self.template)
+
+        sections = [
+            ('输入参数', lambda: self._row_blocks(exporter._input_parameter_rows(input_params))),
+            ('计算结果', lambda: self._row_blocks(exporter._calculation_result_rows(results), POINT_TABLE_HEADER)),
+            ('统计分析', lambda: self._table_blocks(exporter._statistics_table(results))),
+            ('安全评估', lambda: self._safety_blocks(results)),
+            ('计算简图', lambda: self._image_blocks(results, input_params)),
+            ('修正系数', lambda: self._table_blocks(exporter._correction_table(results))),
+            ('工程建议', lambda: (('text', f"{i}. {item}") for i, item in enumerate(recommendations, 1))),
+            ('计算依据', lambda: iter(static.standards_blocks)),
+        ]
+        if not include_plots:
+            sections = [section for section in sections if section[0] != '计算简图']
+
+        for number, (title, blocks) in zip(CHINESE_NUMERALS, sections):
+            if title == '计算结果':
+                yield ('page_break',)
+            yield ('heading', f"{number}、{title}")
+            yield from blocks()
+
+    def _row_blocks(self, rows, table_header=None):
+        """(行号, 各列值) 行转换为内容块：单列为文本，多列为表格行，行号间隔为空行"""
+        previous = 0
+        in_table = False
+        for row, values in rows:
+            if row > previous + 1:
+                yield ('space', row - previous - 1)
+            previous = row
+            if len(values) > 1:
+                if not in_table:
+                    yield ('table_header', table_header or [''] * len(values))
+                    in_table = True
+                yield ('table_row', values)
+                continue
+            if in_table:
+                yield ('end_table',)
+                in_table = False
+            text = str(values[0]) if values else ''
+            yield ('rule',) if text.startswith('-----') else ('text', text)
+        if in_table:
+            yield ('end_table',)
+
+    def _table_blocks(self, table):
+        """首行为表头的表格转换为内容块"""
+        yield ('table_header', table[0])
+        for values in table[1:]:
+            yield ('table_row', values)
+        yield ('end_table',)
+
+    def _safety_blocks(self, results):
+        """安全评估表及建议事项表"""
+        for _, table in self.exporter._safety_tables(results):
+            yield from self._table_blocks(table)
+            yield ('space', 1)
+
+    def _image_blocks(self, results, input_params):
+        """计算简图（使用导出器的简图缓存）及结果图"""
+        import matplotlib.image
+        import matplotlib.pyplot as plt
+        from visualization.plotter import ResultPlotter
+
+        try:
+            diagram = self.exporter._render_calculation_diagram(results, input_params, dpi=self.template.plot_dpi)
+            yield ('image', matplotlib.image.imread(diagram), 4.5)
+        except Exception as e:
+            yield ('text', f"无法插入计算简图: {str(e)}")
+
+        plotter = ResultPlotter()
+        for title, method in REPORT_PLOTS:
+            try:
+                fig = getattr(plotter, method)(results)
+                try:
+                    buffer = io.BytesIO()
+                    fig.savefig(buffer, format='png', dpi=self.template.plot_dpi, bbox_inches='tight')
+                finally:
+                    plt.close(fig)
+                buffer.seek(0)
+                yield ('text', f"{title}:")
+                yield ('image', matplotlib.image.imread(buffer), 4.0)
+            except Exception as e:
+                yield ('text', f"无法插入{title}: {str(e)}")
+
+    def _cover_lines(self, results):
+        input_params = results.get('input_parameters', {})
+        return [
+            f"项目名称：{input_params.get('project_name', '高架桥桩基沉降分析项目')}",
+            f"项目类型：{input_params.get('project_type', '桥梁工程')}",
+            f"路线等级：{input_params.get('road_level', '')}",
+            f"计算时间：{datetime.now().strftime('%Y年%m月%d日')}",
+            f"软件版本：{self.template.software}",
+        ]
+
+    def _write_project(self, writer: _PageWriter, results, include_plots):
+        writer.header = f"{self.template.title} — {results.get('input_parameters', {}).get('project_name', '')}"
+        writer.cover(self._cover_lines(results))
+        for block in self.build_blocks(results, include_plots):
+            writer.write(block)
+        writer.finish()
+
+    def export(self, results: Dict[str, Any], filename: str, include_plots: bool = True) -> int:
+        """
+        生成单个项目的PDF报告
+
+        Args:
+            results: 计算结果字典
+            filename: 输出文件名
+            include_plots: 是否插入计算简图及结果图
+
+        Returns:
+            int: 页数
+        """
+        return self.export_batch([results], filename, include_plots)
+
+    def export_batch(self, results_list: Iterable[Dict[str, Any]], filename: str,
+                     include_plots: bool = True) -> int:
+        """
+        多个项目的报告合并为一个PDF（各项目依次为封面及正文）
+
+        Args:
+            results_list: 计算结果字典的可迭代对象（可为生成器，逐个处理）
+            filename: 输出文件名
+            include_plots: 是否插入计算简图及结果图
+
+        Returns:
+            int: 总页数
+        """
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        static = get_static_parts(self.template)
+        with PdfPages(filename, metadata={'Title': self.template.title, 'Creator': self.template.software}) as pdf:
+            writer = _PageWriter(pdf, self.template, static, self.template.title)
+            for results in results_list:
+                self._write_project(writer, results, include_plots)
+            return writer.page_count
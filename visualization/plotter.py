@@ -6,6 +6,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import math
+import json
+import hashlib
+import weakref
+from collections import OrderedDict
 from matplotlib.patches import Circle
 import matplotlib.patches as patches
 from mpl_toolkits.mplot3d import Axes3D
@@ -21,13 +25,123 @@ except ImportError:
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
+# 等高线图的沉降场按屏幕分辨率直接求值：每个采样点对应的像素数及单方向采样数上限
+CONTOUR_PIXELS_PER_SAMPLE = 2
+CONTOUR_MAX_SAMPLES = 600
+
+# 沉降场缓存的条目数（按计算参数、显示范围及采样数，最近最少使用淘汰）
+CONTOUR_FIELD_CACHE_SIZE = 16
+
+# 求沉降场所需的计算参数
+CONTOUR_FIELD_KEYS = ('pile1', 'pile2', 'road_level', 'road_params', 'soil_layers')
+
+# 图形缓存的图形数（最近最少使用淘汰，淘汰时关闭图形）
+FIGURE_CACHE_SIZE = 8
+
+# 图形缓存支持的图形类型：类型名到 (创建方法, 原位更新方法)
+# 有原位更新方法的类型，其创建方法返回 (图形, 图元)
+FIGURE_TYPES = {
+    'settlement': ('create_settlement_plot', None),
+    'contour': ('create_contour_plot', None),
+    'radar': ('_build_radar_plot', '_update_radar_plot'),
+    'waterfall': ('_build_waterfall_plot', '_update_waterfall_plot'),
+}
+
+# 图形内容所依赖的计算结果字段
+FIGURE_RESULT_KEYS = ('points', 'input_parameters', 'statistics', 'safety_assessment')
+
 
 class ResultPlotter:
     """结果绘图器类"""
     
     def __init__(self):
         """初始化绘图器"""
-        pass
+        self._contour_fields = OrderedDict()
+        self._figures = OrderedDict()
+        # 等高线图 -> 平移/缩放重新求值的绘制回调及已连接的画布回调表
+        self._contour_refresh = weakref.WeakKeyDictionary()
+    
+    def get_figure(self, plot_type, results, size=None):
+        """
+        获取图形（带缓存）
+        
+        图形按 (计算结果指纹, 图形类型, 尺寸) 缓存：切换图形类型后再切换回来时直接返回已有图形，
+        并恢复其初始显示范围；计算结果变化但计算点布局不变时，在已有图形上原位更新图元数据
+        （set_data、set_array 等）而不重新创建；缓存满时关闭并淘汰最近最少使用的图形
+        
+        参数:
+        plot_type: 图形类型，FIGURE_TYPES 中的类型名
+        results: 计算结果字典
+        size: 图形尺寸 (宽, 高)（英寸），None 为各图形的缺省尺寸
+        
+        返回:
+        Figure: 图形（由缓存管理，调用方不应关闭）
+        """
+        build_method, update_method = FIGURE_TYPES[plot_type]
+        size = tuple(size) if size is not None else None
+        key = (self.results_fingerprint(results), plot_type, size)
+        
+        entry = self._figures.get(key)
+        if entry is not None:
+            self._figures.move_to_end(key)
+            self._restore_views(entry)
+            return entry['figure']
+        
+        layout = self._layout_signature(results)
+        if update_method:
+            for old_key, old_entry in self._figures.items():
+                if old_key[1:] == key[1:] and old_entry['layout'] == layout and old_entry['artists']:
+                    # 计算点布局不变：原位更新图元数据
+                    del self._figures[old_key]
+                    getattr(self, update_method)(old_entry['artists'], results)
+                    for ax in old_entry['figure'].get_axes():
+                        ax.relim()
+                        ax.autoscale_view()
+                    old_entry['views'] = self._current_views(old_entry['figure'])
+                    self._figures[key] = old_entry
+                    return old_entry['figure']
+        
+        if update_method:
+            fig, artists = getattr(self, build_method)(results)
+        else:
+            fig, artists = getattr(self, build_method)(results), None
+        if size is not None:
+            fig.set_size_inches(size)
+        
+        self._figures[key] = {'figure': fig, 'artists': artists, 'layout': layout,
+                              'views': self._current_views(fig)}
+        while len(self._figures) > FIGURE_CACHE_SIZE:
+            _, evicted = self._figures.popitem(last=False)
+            plt.close(evicted['figure'])
+        return fig
+    
+    def clear_figure_cache(self):
+        """关闭并清空缓存的全部图形"""
+        while self._figures:
+            _, entry = self._figures.popitem()
+            plt.close(entry['figure'])
+    
+    def results_fingerprint(self, results):
+        """计算结果指纹：图形所依赖字段规范化编码的SHA-256"""
+        from utils import json_codec
+        
+        payload = json_codec.dumps([results.get(key) for key in FIGURE_RESULT_KEYS])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _layout_signature(self, results):
+        """计算点布局（各点坐标），布局相同时图形结构相同"""
+        return tuple((p.get('x'), p.get('y'), p.get('z')) for p in results.get('points', []))
+    
+    def _current_views(self, fig):
+        """图形各坐标轴的当前显示范围"""
+        return [(ax, ax.get_xlim(), ax.get_ylim()) for ax in fig.get_axes()]
+    
+    def _restore_views(self, entry):
+        """恢复缓存图形的初始显示范围（界面缩放/平移后再次显示时）"""
+        for ax, xlim, ylim in entry['views']:
+            if ax.get_xlim() != xlim or ax.get_ylim() != ylim:
+                ax.set_xlim(xlim)
+                ax.set_ylim(ylim)
         
     def get_settlement_color(self, settlement_mm, allowable_limit):
         """根据沉降值和容许值确定颜色
@@ -487,8 +601,13 @@ class ResultPlotter:
         return fig
         
     def create_contour_plot(self, results):
-        """创建等高线图 - 真正的等高线图而不是散点图"""
-        if griddata is None:
+        """创建等高线图 - 真正的等高线图而不是散点图
+        
+        有计算参数时在显示范围内按屏幕分辨率直接求沉降闭合解并绘制精确等高线，
+        平移/缩放后按新的显示范围重新求值；只有计算点时由计算点插值（需要scipy）
+        """
+        field_params = self._contour_params(results)
+        if griddata is None and field_params is None:
             fig, ax = plt.subplots(figsize=(12, 8))
             ax.text(0.5, 0.5, '绘制等高线图需要安装scipy库\n请运行: pip install scipy',
                    horizontalalignment='center', verticalalignment='center', transform=ax.transAxes,
@@ -550,18 +669,24 @@ class ResultPlotter:
         # 设置绘图范围
         x_min, x_max = min(x_coords) - 5, max(x_coords) + 5
         z_min, z_max = min(z_coords) - 5, max(z_coords) + 5
+        extent = (x_min, x_max, -z_max, -z_min)
         
-        # 创建网格用于插值
-        xi = np.linspace(x_min, x_max, 100)
-        zi = np.linspace(z_min, z_max, 100)
-        Xi, Zi = np.meshgrid(xi, zi)
-        
-        # 使用scipy的griddata进行插值
-        points = np.array(list(zip(x_coords, z_coords)))
-        values = np.array(settlements)
-        
-        # 插值生成等高线数据
-        Yi = griddata(points, values, (Xi, Zi), method='cubic', fill_value=0)
+        if field_params is not None:
+            # 在显示范围内直接求沉降场（纵轴为 -深度）
+            Xi, Zi, Yi = self.contour_field(field_params, extent, self._contour_samples(ax))
+        else:
+            # 创建网格用于插值
+            xi = np.linspace(x_min, x_max, 100)
+            zi = np.linspace(z_min, z_max, 100)
+            Xi, Zi = np.meshgrid(xi, zi)
+            Zi = -Zi
+            
+            # 使用scipy的griddata进行插值
+            points = np.array(list(zip(x_coords, z_coords)))
+            values = np.array(settlements)
+            
+            # 插值生成等高线数据
+            Yi = griddata(points, values, (Xi, -Zi), method='cubic', fill_value=0)
         
         # 绘制基础结构（路基和桩）
         # 绘制路基（地面）
@@ -596,14 +721,8 @@ class ResultPlotter:
         else:
             levels_contour = [min_settlement]
         
-        # 绘制填充等高线
-        contourf = ax.contourf(Xi, -Zi, Yi, levels=levels_contour, cmap='RdYlGn_r', alpha=0.6)
-        
-        # 绘制等高线线条
-        contour_lines = ax.contour(Xi, -Zi, Yi, levels=levels_contour, colors='black', linewidths=0.5, alpha=0.8)
-        
-        # 添加等高线标签
-        ax.clabel(contour_lines, inline=True, fontsize=8, fmt='%.1f')
+        # 绘制填充等高线、等高线线条及标签
+        contourf, contour_lines = self._draw_contours(ax, Xi, Zi, Yi, levels_contour)
         
         # 绘制计算点
         for i, p_data in enumerate(calc_points):
@@ -665,10 +784,127 @@ class ResultPlotter:
         
         # 调整布局 - 设置更大的边距确保标签完整显示
         plt.subplots_adjust(left=0.12, right=0.88, top=0.90, bottom=0.12, hspace=0.3, wspace=0.3)
+        
+        if field_params is not None:
+            self._attach_contour_refresh(ax, field_params, levels_contour, [contourf, contour_lines])
         return fig
+    
+    def _contour_params(self, results):
+        """求沉降场所用的计算参数，结果中没有完整计算参数时返回None"""
+        params = results.get('input_parameters') or {}
+        if all(key in params for key in CONTOUR_FIELD_KEYS):
+            return params
+        return None
+    
+    def _contour_samples(self, ax):
+        """按坐标轴的屏幕像素尺寸确定两个方向的采样数"""
+        bbox = ax.get_window_extent()
+        return tuple(int(min(CONTOUR_MAX_SAMPLES, max(20, size / CONTOUR_PIXELS_PER_SAMPLE)))
+                     for size in (bbox.width, bbox.height))
+    
+    def contour_field(self, params, extent, samples):
+        """
+        在显示范围内求沉降场
+        
+        结果按计算参数、显示范围及采样数缓存，重复绘制（如切换图形类型）时直接取用
+        
+        参数:
+        params: 计算参数字典（同 SettlementCalculator.calculate_settlement）
+        extent: 显示范围 (x_min, x_max, 纵轴下限, 纵轴上限)，纵轴为 -深度 (m)
+        samples: (横向采样数, 纵向采样数)
+        
+        返回:
+        (X, Y, settlement_mm): 网格坐标（Y 为 -深度）及沉降值 (mm)，地面以上为 NaN
+        """
+        payload = json.dumps([params, [round(float(v), 6) for v in extent], list(samples)],
+                             sort_keys=True, ensure_ascii=False, default=str)
+        key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        if key in self._contour_fields:
+            self._contour_fields.move_to_end(key)
+            return self._contour_fields[key]
+        
+        from calculation.settlement import SettlementCalculator
+        
+        x_min, x_max, y_min, y_max = extent
+        X, Y = np.meshgrid(np.linspace(x_min, x_max, samples[0]), np.linspace(y_min, y_max, samples[1]))
+        depth = -Y
+        field = SettlementCalculator().calculate_settlement_field(params, X, np.where(depth > 0, depth, np.nan))
+        field = np.where(depth > 0, field, np.nan)
+        
+        self._contour_fields[key] = (X, Y, field)
+        while len(self._contour_fields) > CONTOUR_FIELD_CACHE_SIZE:
+            self._contour_fields.popitem(last=False)
+        return X, Y, field
+    
+    def _draw_contours(self, ax, X, Y, values, levels):
+        """绘制填充等高线、等高线线条及标签，返回 (填充等高线, 等高线线条)"""
+        contourf = ax.contourf(X, Y, values, levels=levels, cmap='RdYlGn_r', alpha=0.6, extend='both')
+        contour_lines = ax.contour(X, Y, values, levels=levels, colors='black', linewidths=0.5, alpha=0.8)
+        ax.clabel(contour_lines, inline=True, fontsize=8, fmt='%.1f')
+        return contourf, contour_lines
+    
+    def _attach_contour_refresh(self, ax, params, levels, artists):
+        """
+        平移/缩放后按新的显示范围重新求沉降场并重绘等高线
+        
+        坐标轴范围变化时只做标记，下一次绘制完成后统一重新求值（缩放同时改变两个方向的范围，
+        只求值一次），等高线级别与颜色条保持不变
+        """
+        state = {'artists': artists, 'extent': ax.get_xlim() + ax.get_ylim(), 'stale': False}
+        
+        def on_limits_changed(_ax):
+            state['stale'] = True
+        
+        def on_draw(_event):
+            if not state['stale']:
+                return
+            state['stale'] = False
+            extent = ax.get_xlim() + ax.get_ylim()
+            if extent == state['extent']:
+                return
+            state['extent'] = extent
+            
+            for artist in state['artists']:
+                artist.remove()
+            X, Y, field = self.contour_field(params, extent, self._contour_samples(ax))
+            state['artists'] = list(self._draw_contours(ax, X, Y, field, levels))
+            # 保持用户设置的显示范围
+            ax.set_xlim(extent[:2])
+            ax.set_ylim(extent[2:])
+            state['stale'] = False
+            ax.figure.canvas.draw_idle()
+        
+        ax.callbacks.connect('xlim_changed', on_limits_changed)
+        ax.callbacks.connect('ylim_changed', on_limits_changed)
+        # 只保存弱引用：回调由已连接的回调表持有，避免图形无法释放
+        self._contour_refresh[ax.figure] = {'handler': weakref.ref(on_draw), 'registries': []}
+        self.attach_contour_refresh(ax.figure.canvas)
+    
+    def attach_contour_refresh(self, canvas):
+        """
+        将等高线图平移/缩放后的重新求值连接到画布的绘制事件
+        
+        界面以新画布（如 FigureCanvasTkAgg）包装图形后调用：matplotlib 3.3 的事件回调按画布保存，
+        更换画布后须重新连接；新版本同一图形的画布共用回调表，已连接的回调表不重复连接。
+        非等高线图不做处理
+        
+        参数:
+        canvas: 包装图形的画布
+        """
+        refresh = self._contour_refresh.get(canvas.figure)
+        if refresh is None or any(registry() is canvas.callbacks for registry in refresh['registries']):
+            return
+        handler = refresh['handler']()
+        if handler is not None:
+            canvas.mpl_connect('draw_event', handler)
+            refresh['registries'].append(weakref.ref(canvas.callbacks))
         
     def create_radar_plot(self, results):
         """创建雷达图"""
+        return self._build_radar_plot(results)[0]
+    
+    def _build_radar_plot(self, results):
+        """创建雷达图，返回 (图形, 可原位更新的图元)，无数据时图元为None"""
         points = results.get('points', [])
         if not points:
             fig, ax = plt.subplots(figsize=(12, 8))
@@ -677,15 +913,50 @@ class ResultPlotter:
             ax.set_title('沉降雷达分析图', fontsize=16, fontweight='bold')
             ax.set_xticks([])
             ax.set_yticks([])
-            return fig
+            return fig, None
             
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8), 
                                       subplot_kw=dict(projection='polar'))
         fig.suptitle('沉降雷达分析图', fontsize=16, fontweight='bold')
         
+        angles, layers, angles_2, settlements_2, distances = self._radar_series(points)
+        
         # 1. 按深度分层的雷达图
         ax1.set_title('分层沉降雷达图', pad=20, fontweight='bold')
         
+        colors = ['red', 'blue', 'green', 'orange', 'purple']
+        layer_artists = []
+        for i, (depth, settlements) in enumerate(layers):
+            line, = ax1.plot(angles, settlements, 'o-', linewidth=2, 
+                             label=f'深度 {depth}m', color=colors[i % len(colors)])
+            polygon, = ax1.fill(angles, settlements, alpha=0.25, color=colors[i % len(colors)])
+            layer_artists.append((line, polygon))
+        
+        ax1.set_rlabel_position(0)
+        ax1.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
+        
+        # 2. 距离-沉降雷达图
+        ax2.set_title('距离-沉降雷达图', pad=20, fontweight='bold')
+        
+        # 绘制雷达图
+        scatter = ax2.scatter(angles_2[:-1], settlements_2[:-1], c=distances, cmap='viridis', s=100, alpha=0.8)
+        
+        # 连接线
+        outline, = ax2.plot(angles_2, settlements_2, 'b-', alpha=0.5)
+        
+        ax2.set_rlabel_position(45)
+        
+        # 调整子图参数，确保标题和标签完全可见
+        plt.subplots_adjust(left=0.1, right=0.9, top=0.85, bottom=0.15, hspace=0.4, wspace=0.3)
+        return fig, {'layers': layer_artists, 'scatter': scatter, 'outline': outline}
+    
+    def _radar_series(self, points):
+        """
+        雷达图的数据序列
+        
+        返回:
+        (分层角度, [(深度, 闭合的沉降值)], 按方位角排序并闭合的角度, 对应沉降值, 对应水平距离)
+        """
         # 按深度分组
         depth_groups = {}
         for point in points:
@@ -697,20 +968,11 @@ class ResultPlotter:
         angles = np.linspace(0, 2*np.pi, len(points)//len(depth_groups), endpoint=False)
         angles = np.concatenate((angles, [angles[0]]))  # 闭合图形
         
-        colors = ['red', 'blue', 'green', 'orange', 'purple']
-        for i, (depth, group) in enumerate(sorted(depth_groups.items())):
+        layers = []
+        for depth, group in sorted(depth_groups.items()):
             settlements = [p.get('settlement_mm', 0) for p in group]
             settlements.append(settlements[0])  # 闭合图形
-            
-            ax1.plot(angles, settlements, 'o-', linewidth=2, 
-                    label=f'深度 {depth}m', color=colors[i % len(colors)])
-            ax1.fill(angles, settlements, alpha=0.25, color=colors[i % len(colors)])
-        
-        ax1.set_rlabel_position(0)
-        ax1.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
-        
-        # 2. 距离-沉降雷达图
-        ax2.set_title('距离-沉降雷达图', pad=20, fontweight='bold')
+            layers.append((depth, settlements))
         
         # 计算角度（基于计算点位置）
         angles_2 = []
@@ -731,22 +993,30 @@ class ResultPlotter:
         settlements_2 = [settlements_2[i] for i in sorted_indices]
         distances = [distances[i] for i in sorted_indices]
         
-        # 绘制雷达图
-        ax2.scatter(angles_2, settlements_2, c=distances, cmap='viridis', s=100, alpha=0.8)
-        
-        # 连接线
+        # 连接线闭合
         angles_2.append(angles_2[0])
         settlements_2.append(settlements_2[0])
-        ax2.plot(angles_2, settlements_2, 'b-', alpha=0.5)
-        
-        ax2.set_rlabel_position(45)
-        
-        # 调整子图参数，确保标题和标签完全可见
-        plt.subplots_adjust(left=0.1, right=0.9, top=0.85, bottom=0.15, hspace=0.4, wspace=0.3)
-        return fig
+        return angles, layers, angles_2, settlements_2, distances
+    
+    def _update_radar_plot(self, artists, results):
+        """原位更新雷达图的图元数据（计算点布局不变）"""
+        angles, layers, angles_2, settlements_2, distances = self._radar_series(results['points'])
+        
+        for (line, polygon), (_, settlements) in zip(artists['layers'], layers):
+            line.set_data(angles, settlements)
+            polygon.set_xy(np.column_stack([angles, settlements]))
+        
+        artists['scatter'].set_offsets(np.column_stack([angles_2[:-1], settlements_2[:-1]]))
+        artists['scatter'].set_array(np.asarray(distances))
+        artists['scatter'].autoscale()
+        artists['outline'].set_data(angles_2, settlements_2)
     
     def create_waterfall_plot(self, results):
         """创建瀑布图"""
+        return self._build_waterfall_plot(results)[0]
+    
+    def _build_waterfall_plot(self, results):
+        """创建瀑布图，返回 (图形, 可原位更新的图元)，无数据时图元为None"""
         points = results.get('points', [])
         if not points:
             fig, ax = plt.subplots(figsize=(12, 8))
@@ -755,35 +1025,17 @@ class ResultPlotter:
             ax.set_title('沉降瀑布分析图', fontsize=16, fontweight='bold')
             ax.set_xticks([])
             ax.set_yticks([])
-            return fig
+            return fig, None
             
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
         fig.suptitle('沉降瀑布分析图', fontsize=16, fontweight='bold')
         
         # 1. 按计算点顺序的瀑布图
-        settlements = [p['settlement_mm'] for p in points]
+        settlements, depths, avg_settlements = self._waterfall_series(results['points'])
         point_names = [f"W{i+1}" for i in range(len(points))]
         
-        # 计算累积值
-        cumulative = np.cumsum([0] + settlements)
-        
-        # 绘制瀑布图
-        for i in range(len(settlements)):
-            height = settlements[i]
-            bottom = cumulative[i]
-            color = 'green' if height < 10 else 'orange' if height < 20 else 'red'
-            
-            bar = ax1.bar(i, height, bottom=bottom, color=color, alpha=0.7, 
-                         edgecolor='black', linewidth=1)
-            
-            # 添加连接线
-            if i < len(settlements) - 1:
-                ax1.plot([i+0.4, i+1-0.4], [cumulative[i+1], cumulative[i+1]], 
-                        'k--', alpha=0.5)
-            
-            # 添加数值标签
-            ax1.text(i, bottom + height/2, f'{height:.2f}', 
-                    ha='center', va='center', fontweight='bold', fontsize=8)
+        point_artists = self._draw_waterfall(
+            ax1, settlements, [self._waterfall_color(height) for height in settlements], fontsize=8)
         
         ax1.set_title('计算点沉降瀑布图', fontweight='bold')
         ax1.set_xlabel('计算点')
@@ -792,7 +1044,25 @@ class ResultPlotter:
         ax1.set_xticklabels(point_names, rotation=45)
         ax1.grid(True, alpha=0.3)
         
-        # 2. 按深度分层的瀑布图
+        # 2. 按深度分层的瀑布图（颜色基于深度）
+        depth_artists = self._draw_waterfall(
+            ax2, avg_settlements, [plt.cm.viridis(i / len(depths)) for i in range(len(depths))], fontsize=9)
+        
+        ax2.set_title('深度分层平均沉降瀑布图', fontweight='bold')
+        ax2.set_xlabel('深度 (m)')
+        ax2.set_ylabel('平均沉降值 (mm)')
+        ax2.set_xticks(range(len(depths)))
+        ax2.set_xticklabels([f'{d}m' for d in depths])
+        ax2.grid(True, alpha=0.3)
+        
+        # 调整子图参数，确保标题和标签完全可见
+        plt.subplots_adjust(left=0.1, right=0.9, top=0.85, bottom=0.15, hspace=0.4, wspace=0.3)
+        return fig, {'points': point_artists, 'depths': depth_artists}
+    
+    def _waterfall_series(self, points):
+        """瀑布图的数据序列：(各点沉降值, 深度, 各深度平均沉降值)"""
+        settlements = [p['settlement_mm'] for p in points]
+        
         depth_groups = {}
         for point in points:
             depth = point['z']
@@ -802,39 +1072,61 @@ class ResultPlotter:
         
         depths = sorted(depth_groups.keys())
         avg_settlements = [np.mean(depth_groups[d]) for d in depths]
+        return settlements, depths, avg_settlements
+    
+    def _waterfall_color(self, height):
+        """计算点瀑布图的柱颜色"""
+        return 'green' if height < 10 else 'orange' if height < 20 else 'red'
+    
+    def _draw_waterfall(self, ax, heights, colors, fontsize):
+        """
+        绘制累积瀑布柱、连接线及数值标签
         
-        # 计算累积平均值
-        cumulative_avg = np.cumsum([0] + avg_settlements)
+        返回:
+        Dict: bars（柱）、links（连接线）、labels（数值标签），供原位更新
+        """
+        # 计算累积值
+        cumulative = np.cumsum([0] + list(heights))
         
-        for i, depth in enumerate(depths):
-            height = avg_settlements[i]
-            bottom = cumulative_avg[i]
-            
-            # 颜色基于深度
-            color = plt.cm.viridis(i / len(depths))
+        artists = {'bars': [], 'links': [], 'labels': []}
+        for i, height in enumerate(heights):
+            bottom = cumulative[i]
             
-            bar = ax2.bar(i, height, bottom=bottom, color=color, alpha=0.7, 
+            bar = ax.bar(i, height, bottom=bottom, color=colors[i], alpha=0.7, 
                          edgecolor='black', linewidth=1)
+            artists['bars'].append(bar.patches[0])
             
             # 添加连接线
-            if i < len(depths) - 1:
-                ax2.plot([i+0.4, i+1-0.4], [cumulative_avg[i+1], cumulative_avg[i+1]], 
-                        'k--', alpha=0.5)
+            if i < len(heights) - 1:
+                link, = ax.plot([i+0.4, i+1-0.4], [cumulative[i+1], cumulative[i+1]], 
+                                'k--', alpha=0.5)
+                artists['links'].append(link)
             
             # 添加数值标签
-            ax2.text(i, bottom + height/2, f'{height:.2f}', 
-                    ha='center', va='center', fontweight='bold', fontsize=9)
-        
-        ax2.set_title('深度分层平均沉降瀑布图', fontweight='bold')
-        ax2.set_xlabel('深度 (m)')
-        ax2.set_ylabel('平均沉降值 (mm)')
-        ax2.set_xticks(range(len(depths)))
-        ax2.set_xticklabels([f'{d}m' for d in depths])
-        ax2.grid(True, alpha=0.3)
-        
-        # 调整子图参数，确保标题和标签完全可见
-        plt.subplots_adjust(left=0.1, right=0.9, top=0.85, bottom=0.15, hspace=0.4, wspace=0.3)
-        return fig
+            artists['labels'].append(ax.text(i, bottom + height/2, f'{height:.2f}', 
+                                             ha='center', va='center', fontweight='bold', fontsize=fontsize))
+        return artists
+    
+    def _update_waterfall(self, artists, heights, colors=None):
+        """原位更新累积瀑布柱、连接线及数值标签"""
+        cumulative = np.cumsum([0] + list(heights))
+        for i, height in enumerate(heights):
+            bar = artists['bars'][i]
+            bar.set_y(cumulative[i])
+            bar.set_height(height)
+            if colors is not None:
+                bar.set_facecolor(colors[i])
+            if i < len(artists['links']):
+                artists['links'][i].set_ydata([cumulative[i+1], cumulative[i+1]])
+            artists['labels'][i].set_y(cumulative[i] + height/2)
+            artists['labels'][i].set_text(f'{height:.2f}')
+    
+    def _update_waterfall_plot(self, artists, results):
+        """原位更新瀑布图的图元数据（计算点布局不变）"""
+        settlements, _, avg_settlements = self._waterfall_series(results['points'])
+        self._update_waterfall(artists['points'], settlements,
+                               [self._waterfall_color(height) for height in settlements])
+        self._update_waterfall(artists['depths'], avg_settlements)
     
     def create_influence_zone_plot(self, results):
         """创建影响区域分析图"""